@@ -20,20 +20,202 @@ Usage:
 
     # Close multiple work items
     results = bulk.batch_close_work_items([771, 772, 773])
+
+    # Show what a batch would do, without doing it
+    plan = bulk.plan_updates(updates)
+    print(plan.requests, plan.estimated_seconds)
+
+Updates run on a worker pool (``concurrency`` workers) behind a shared
+rate limiter (``requests_per_second``). When the project has a .claude
+directory, each batch is journaled to .claude/bulk-operations/ before it
+runs and every finished operation is recorded, so rerunning the same
+batch after a crash only performs the operations that didn't finish.
 """
 
+import hashlib
+import json
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 # Import from canonical skills implementation
 from skills.azure_devops.cli_wrapper import AzureCLI
 
 
+JOURNAL_DIR = Path(".claude") / "bulk-operations"
+
+# Rough REST round trip, used for dry-run estimates
+ESTIMATED_REQUEST_SECONDS = 0.5
+
+
+class RateLimiter:
+    """Token bucket shared by worker threads."""
+
+    def __init__(self, requests_per_second: float, burst: Optional[int] = None):
+        """
+        Args:
+            requests_per_second: Sustained request rate (0 or less: unlimited)
+            burst: Requests allowed back to back (defaults to one second's worth)
+        """
+        self.rate = requests_per_second
+        self.capacity = burst or max(int(requests_per_second), 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, count: int = 1) -> None:
+        """
+        Block until ``count`` requests may be made.
+
+        A count larger than the bucket goes ahead once the bucket is full and
+        leaves it in debt, so later callers wait for the excess instead.
+        """
+        if self.rate <= 0:
+            return
+        needed = min(count, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= needed:
+                    self._tokens -= count
+                    return
+                wait = (needed - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class OperationJournal:
+    """
+    Append-only JSONL journal of a batch: the plan first, then one line per
+    finished operation. Journals are named by a hash of the plan, so the
+    same batch always maps to the same journal.
+    """
+
+    def __init__(self, directory: Path, operations: List[Dict[str, Any]]):
+        self.operations = operations
+        self.batch_id = hashlib.sha256(
+            json.dumps(operations, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        self.path = Path(directory) / f"{self.batch_id}.jsonl"
+        self.finished: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @property
+    def resumed(self) -> bool:
+        """Whether an earlier run of this batch left finished operations."""
+        return bool(self.finished)
+
+    def pending(self) -> List[int]:
+        """Indexes of operations not yet completed successfully."""
+        return [index for index in range(len(self.operations)) if index not in self.finished]
+
+    def start(self) -> None:
+        """Write the plan (once per batch) before any operation runs."""
+        if not self.path.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._append({"op": "plan", "operations": self.operations, "created_at": datetime.now().isoformat()})
+
+    def record(self, index: int, result: Dict[str, Any]) -> None:
+        """Record a finished operation (failures are recorded but retried on rerun)."""
+        self._append({
+            "op": "done" if result["success"] else "failed",
+            "index": index,
+            "result": result,
+            "finished_at": datetime.now().isoformat(),
+        })
+        if result["success"]:
+            self.finished[index] = result
+
+    def complete(self) -> Path:
+        """Mark the batch complete, so running it again starts afresh."""
+        completed = self.path.with_suffix(".completed.jsonl")
+        os.replace(self.path, completed)
+        return completed
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "rb") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # Torn last line from a crash
+            if entry.get("op") == "done":
+                self.finished[entry["index"]] = entry["result"]
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        line = (json.dumps(entry, default=str) + "\n").encode("utf-8")
+        with self._lock:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+
+
+@dataclass
+class BulkPlan:
+    """What a batch of updates would do."""
+    operations: int
+    pending: int  # Operations left after skipping ones a previous run finished
+    requests: int
+    concurrency: int
+    requests_per_second: float
+    estimated_seconds: float
+    journal: Optional[Path] = None
+
+    def describe(self) -> str:
+        lines = [
+            f"Operations: {self.operations} ({self.operations - self.pending} already done)",
+            f"Requests: {self.requests}",
+            f"Workers: {self.concurrency}, rate limit: "
+            + (f"{self.requests_per_second:g}/s" if self.requests_per_second > 0 else "none"),
+            f"Estimated time: {self.estimated_seconds:.1f}s",
+        ]
+        if self.journal:
+            lines.append(f"Journal: {self.journal}")
+        return "\n".join(lines)
+
+
 class AzureBulkOps:
     """Batch operations for Azure DevOps work items."""
 
-    def __init__(self):
-        """Initialize with Azure CLI wrapper."""
-        self.azure = AzureCLI()
+    def __init__(
+        self,
+        concurrency: int = 4,
+        requests_per_second: float = 10.0,
+        journal_dir: Optional[Path] = None,
+        azure: Optional[AzureCLI] = None
+    ):
+        """
+        Initialize with Azure CLI wrapper.
+
+        Args:
+            concurrency: Worker threads for batch updates
+            requests_per_second: Shared REST request rate limit (0: unlimited)
+            journal_dir: Where batch journals go. Defaults to
+                .claude/bulk-operations when the project has a .claude
+                directory; otherwise batches aren't journaled.
+            azure: Azure CLI wrapper to use (defaults to a new AzureCLI)
+        """
+        self.azure = azure or AzureCLI()
+        self.concurrency = max(concurrency, 1)
+        self.rate_limiter = RateLimiter(requests_per_second)
+        if journal_dir is None and Path(".claude").is_dir():
+            journal_dir = JOURNAL_DIR
+        self.journal_dir = Path(journal_dir) if journal_dir else None
 
     def batch_get_work_items(
         self,
@@ -88,15 +270,20 @@ class AzureBulkOps:
         self,
         updates: List[Dict[str, Any]],
         verify: bool = True,
-        show_progress: bool = True
+        show_progress: bool = True,
+        dry_run: bool = False
     ) -> List[Dict]:
         """
         Update multiple work items with verification.
 
+        Updates run concurrently, rate limited, and are journaled so that
+        rerunning an interrupted batch skips operations already done.
+
         Args:
             updates: List of dicts with keys: work_item_id, state, fields, etc.
             verify: Whether to verify each update
             show_progress: Whether to print progress messages
+            dry_run: Only print the plan (see plan_updates); nothing is updated
 
         Example:
             updates = [
@@ -106,73 +293,114 @@ class AzureBulkOps:
 
         Returns:
             List of result dicts with keys: work_item_id, success, result/error
+            (in the order of ``updates``; "resumed" is set on results from an
+            earlier run). Empty for a dry run.
         """
         if not updates:
             return []
 
-        if show_progress:
-            print(f"Updating {len(updates)} work items...")
+        plan = self.plan_updates(updates, verify=verify)
+        if dry_run:
+            print("Dry run - no work items will be updated")
+            print(plan.describe())
+            return []
 
-        results = []
-        success_count = 0
-        fail_count = 0
+        journal = OperationJournal(self.journal_dir, updates) if self.journal_dir else None
+        results: List[Optional[Dict[str, Any]]] = [None] * len(updates)
+        pending = list(range(len(updates)))
+        if journal:
+            for index, result in journal.finished.items():
+                results[index] = dict(result, resumed=True)
+            pending = journal.pending()
+            journal.start()
 
-        for i, update in enumerate(updates, 1):
-            work_item_id = update["work_item_id"]
+        if show_progress:
+            if journal and journal.resumed:
+                print(f"Resuming batch {journal.batch_id}: {len(updates) - len(pending)} already done")
+            print(f"Updating {len(pending)} work items ({self.concurrency} workers)...")
 
-            if show_progress:
-                print(f"  [{i}/{len(updates)}] Updating WI-{work_item_id}...", end=" ")
+        requests_per_update = 2 if verify else 1
+        finished = 0
 
+        def run(index: int) -> Dict[str, Any]:
+            update = updates[index]
+            self.rate_limiter.acquire(requests_per_update)
             try:
-                # Extract parameters
-                state = update.get("state")
-                fields = update.get("fields", {})
-                assigned_to = update.get("assigned_to")
-                description = update.get("description")
-                discussion = update.get("discussion")
-
-                # Call Azure CLI wrapper
                 result = self.azure.update_work_item(
-                    work_item_id=work_item_id,
-                    state=state,
-                    fields=fields,
-                    assigned_to=assigned_to,
-                    description=description,
-                    discussion=discussion,
+                    work_item_id=update["work_item_id"],
+                    state=update.get("state"),
+                    fields=update.get("fields", {}),
+                    assigned_to=update.get("assigned_to"),
+                    description=update.get("description"),
+                    discussion=update.get("discussion"),
                     verify=verify
                 )
-
-                results.append({
-                    "work_item_id": work_item_id,
-                    "success": True,
-                    "result": result
-                })
-                success_count += 1
-
-                if show_progress:
-                    print("✓")
-
+                return {"work_item_id": update["work_item_id"], "success": True, "result": result}
             except Exception as e:
-                results.append({
-                    "work_item_id": work_item_id,
-                    "success": False,
-                    "error": str(e)
-                })
-                fail_count += 1
-
+                return {"work_item_id": update["work_item_id"], "success": False, "error": str(e)}
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="bulk-ops") as executor:
+            futures = {executor.submit(run, index): index for index in pending}
+            for future in as_completed(futures):
+                index = futures[future]
+                result = future.result()
+                results[index] = result
+                if journal:
+                    journal.record(index, result)
+
+                finished += 1
                 if show_progress:
-                    print(f"✗ {e}")
+                    outcome = "✓" if result["success"] else f"✗ {result['error']}"
+                    print(f"  [{finished}/{len(pending)}] WI-{result['work_item_id']} {outcome}")
+
+        success_count = sum(1 for result in results if result["success"])
+        fail_count = len(results) - success_count
+        if journal and not fail_count:
+            journal.complete()
 
         if show_progress:
             print(f"\n✓ Updated: {success_count}, ✗ Failed: {fail_count}")
+            if journal and fail_count:
+                print(f"Rerun the same batch to retry the failures (journal: {journal.path})")
 
         return results
 
+    def plan_updates(self, updates: List[Dict[str, Any]], verify: bool = True) -> BulkPlan:
+        """
+        Plan a batch without running it.
+
+        Args:
+            updates: Updates as passed to batch_update_work_items
+            verify: Whether updates would be verified (one extra request each)
+
+        Returns:
+            BulkPlan with request count and estimated time, accounting for
+            operations a previous run of the same batch already finished
+        """
+        journal = OperationJournal(self.journal_dir, updates) if self.journal_dir else None
+        pending = len(journal.pending()) if journal else len(updates)
+        requests = pending * (2 if verify else 1)
+
+        # Limited by whichever is slower: the rate limit or the workers
+        rate = self.rate_limiter.rate
+        by_rate = requests / rate if rate > 0 else 0.0
+        by_workers = math.ceil(pending / self.concurrency) * (2 if verify else 1) * ESTIMATED_REQUEST_SECONDS
+        return BulkPlan(
+            operations=len(updates),
+            pending=pending,
+            requests=requests,
+            concurrency=self.concurrency,
+            requests_per_second=rate,
+            estimated_seconds=max(by_rate, by_workers),
+            journal=journal.path if journal else None,
+        )
+
     def batch_close_work_items(
         self,
         work_item_ids: List[int],
         verify: bool = True,
-        show_progress: bool = True
+        show_progress: bool = True,
+        dry_run: bool = False
     ) -> List[Dict]:
         """
         Close multiple work items.
@@ -181,6 +409,7 @@ class AzureBulkOps:
             work_item_ids: List of work item IDs to close
             verify: Whether to verify each closure
             show_progress: Whether to print progress messages
+            dry_run: Only print the plan
 
         Returns:
             List of result dicts
@@ -193,14 +422,16 @@ class AzureBulkOps:
         return self.batch_update_work_items(
             updates=updates,
             verify=verify,
-            show_progress=show_progress
+            show_progress=show_progress,
+            dry_run=dry_run
         )
 
     def batch_activate_work_items(
         self,
         work_item_ids: List[int],
         verify: bool = True,
-        show_progress: bool = True
+        show_progress: bool = True,
+        dry_run: bool = False
     ) -> List[Dict]:
         """
         Activate multiple work items.
@@ -209,6 +440,7 @@ class AzureBulkOps:
             work_item_ids: List of work item IDs to activate
             verify: Whether to verify each activation
             show_progress: Whether to print progress messages
+            dry_run: Only print the plan
 
         Returns:
             List of result dicts
@@ -221,7 +453,8 @@ class AzureBulkOps:
         return self.batch_update_work_items(
             updates=updates,
             verify=verify,
-            show_progress=show_progress
+            show_progress=show_progress,
+            dry_run=dry_run
         )
 
     def batch_tag_work_items(
@@ -229,7 +462,8 @@ class AzureBulkOps:
         work_item_ids: List[int],
         tags: str,
         verify: bool = True,
-        show_progress: bool = True
+        show_progress: bool = True,
+        dry_run: bool = False
     ) -> List[Dict]:
         """
         Add tags to multiple work items.
@@ -239,6 +473,7 @@ class AzureBulkOps:
             tags: Tags to add (semicolon-separated)
             verify: Whether to verify each update
             show_progress: Whether to print progress messages
+            dry_run: Only print the plan
 
         Returns:
             List of result dicts
@@ -254,7 +489,8 @@ class AzureBulkOps:
         return self.batch_update_work_items(
             updates=updates,
             verify=verify,
-            show_progress=show_progress
+            show_progress=show_progress,
+            dry_run=dry_run
         )
 
     def batch_assign_work_items(
@@ -262,7 +498,8 @@ class AzureBulkOps:
         work_item_ids: List[int],
         assigned_to: str,
         verify: bool = True,
-        show_progress: bool = True
+        show_progress: bool = True,
+        dry_run: bool = False
     ) -> List[Dict]:
         """
         Assign multiple work items to a user.
@@ -272,6 +509,7 @@ class AzureBulkOps:
             assigned_to: User email or display name
             verify: Whether to verify each assignment
             show_progress: Whether to print progress messages
+            dry_run: Only print the plan
 
         Returns:
             List of result dicts
@@ -287,7 +525,8 @@ class AzureBulkOps:
         return self.batch_update_work_items(
             updates=updates,
             verify=verify,
-            show_progress=show_progress
+            show_progress=show_progress,
+            dry_run=dry_run
         )
 
     def query_sprint_work_items(
@@ -405,10 +644,13 @@ if __name__ == "__main__":
     parser.add_argument("--tags", type=str, help="Tags to add (semicolon-separated)")
     parser.add_argument("--state", type=str, help="State filter for sprint query")
     parser.add_argument("--no-verify", action="store_true", help="Skip verification")
+    parser.add_argument("--concurrency", type=int, default=4, help="Parallel update workers (default: 4)")
+    parser.add_argument("--rate", type=float, default=10.0, help="Max REST requests per second (default: 10, 0: unlimited)")
+    parser.add_argument("--dry-run", action="store_true", help="Show request count and estimated time without updating")
 
     args = parser.parse_args()
 
-    bulk = AzureBulkOps()
+    bulk = AzureBulkOps(concurrency=args.concurrency, requests_per_second=args.rate)
 
     if args.operation == "get":
         if not args.ids:
@@ -425,7 +667,9 @@ if __name__ == "__main__":
             sys.exit(1)
 
         ids = [int(id.strip()) for id in args.ids.split(",")]
-        results = bulk.batch_close_work_items(ids, verify=not args.no_verify)
+        results = bulk.batch_close_work_items(ids, verify=not args.no_verify, dry_run=args.dry_run)
+        if args.dry_run:
+            sys.exit(0)
 
         success = sum(1 for r in results if r["success"])
         print(f"\nClosed {success}/{len(ids)} work items")
@@ -436,7 +680,9 @@ if __name__ == "__main__":
             sys.exit(1)
 
         ids = [int(id.strip()) for id in args.ids.split(",")]
-        results = bulk.batch_activate_work_items(ids, verify=not args.no_verify)
+        results = bulk.batch_activate_work_items(ids, verify=not args.no_verify, dry_run=args.dry_run)
+        if args.dry_run:
+            sys.exit(0)
 
         success = sum(1 for r in results if r["success"])
         print(f"\nActivated {success}/{len(ids)} work items")
@@ -447,7 +693,9 @@ if __name__ == "__main__":
             sys.exit(1)
 
         ids = [int(id.strip()) for id in args.ids.split(",")]
-        results = bulk.batch_tag_work_items(ids, args.tags, verify=not args.no_verify)
+        results = bulk.batch_tag_work_items(ids, args.tags, verify=not args.no_verify, dry_run=args.dry_run)
+        if args.dry_run:
+            sys.exit(0)
 
         success = sum(1 for r in results if r["success"])
         print(f"\nTagged {success}/{len(ids)} work items")
@@ -3,11 +3,14 @@ Agent registry and template rendering system.
 
 Loads and renders agent templates with project-specific configuration.
 """
+from functools import partial
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
+from jinja2 import Template, TemplateNotFound
 
 from config import FrameworkConfig
+from core.render_manifest import RenderJob, RenderResult, render_all
+from core.template_env import cached_render_context, config_hash, get_environment
 
 
 class AgentRegistry:
@@ -29,20 +32,23 @@ class AgentRegistry:
 
         self.templates_dir = Path(templates_dir)
 
-        # Setup Jinja2 environment
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        # Shared Jinja2 environment (bytecode-cached, precompiled templates)
+        self.env = get_environment(self.templates_dir)
 
     def _build_context(self) -> Dict[str, Any]:
         """
         Build template context from configuration.
 
+        Memoized by configuration hash, so rendering many templates builds
+        the context once.
+
         Returns:
             Dictionary of context variables for template rendering
         """
+        return cached_render_context(self.config, "agents", self._compute_context)
+
+    def _compute_context(self) -> Dict[str, Any]:
+        """Build the template context (uncached)."""
         # Build tech stack context text
         tech_stack_parts = []
         tech_stack_parts.append(f"**Project Type**: {self.config.project.type}")
@@ -230,6 +236,29 @@ class AgentRegistry:
 
         return output_file
 
+    def save_rendered_agents(
+        self,
+        agent_names: List[str],
+        output_dir: Path,
+        force: bool = False
+    ) -> List[RenderResult]:
+        """
+        Render and save several agents, skipping those whose inputs are unchanged.
+
+        Args:
+            agent_names: Agents to render
+            output_dir: Directory to save rendered agents
+            force: Re-render even if the render manifest says it's current
+
+        Returns:
+            One RenderResult per agent, in order
+        """
+        jobs = [
+            RenderJob(name, f"{name}.j2", Path(output_dir) / f"{name}.md", partial(self.render_agent, name))
+            for name in agent_names
+        ]
+        return render_all(jobs, self.env, config_hash(self.config), force=force)
+
     def _get_agent_model(self, agent_name: str) -> tuple[str, str]:
         """
         Get the model configuration for an agent.
@@ -340,6 +369,32 @@ class AgentRegistry:
 
         return output_file
 
+    def save_agent_slash_commands(
+        self,
+        agent_names: List[str],
+        output_dir: Path,
+        force: bool = False
+    ) -> List[RenderResult]:
+        """
+        Render and save slash commands for several agents, skipping unchanged ones.
+
+        Args:
+            agent_names: Agents to render commands for
+            output_dir: Directory to save slash commands
+            force: Re-render even if the render manifest says it's current
+
+        Returns:
+            One RenderResult per agent, in order
+        """
+        jobs = [
+            RenderJob(
+                name, "slash-command.j2", Path(output_dir) / f"{name}.md",
+                partial(self.render_agent_slash_command, name), context_key=name,
+            )
+            for name in agent_names
+        ]
+        return render_all(jobs, self.env, config_hash(self.config), force=force)
+
 
 # Convenience functions
 
@@ -7,6 +7,7 @@ from typing import Optional
 
 from config import load_config, save_config
 from agents import AgentRegistry
+from cli.render_output import echo_render_results
 
 
 @click.group(name="agent")
@@ -50,7 +51,7 @@ def list_agents(enabled_only: bool):
 def enable_agent(agent_name: str):
     """Enable an agent (use 'all' to enable all agents)."""
     try:
-        config = load_config()
+        config = load_config(mutable=True)
         registry = AgentRegistry(config)
 
         # Handle "all" to enable all agents
@@ -92,7 +93,7 @@ def enable_agent(agent_name: str):
 def disable_agent(agent_name: str):
     """Disable an agent."""
     try:
-        config = load_config()
+        config = load_config(mutable=True)
 
         # Check if agent is enabled
         if agent_name not in config.agent_config.enabled_agents:
@@ -126,9 +127,9 @@ def render_agent(agent_name: str, output: Optional[str], show: bool):
 
             click.echo(f"\n📝 Rendering {len(enabled_agents)} agents to {output_path}\n")
 
-            for agent in enabled_agents:
-                output_file = registry.save_rendered_agent(agent, output_path)
-                click.echo(f"  ✓ {agent} → {output_file}")
+            results = registry.save_rendered_agents(enabled_agents, output_path)
+            if not echo_render_results(results):
+                raise SystemExit(1)
 
             click.echo(f"\n✅ All agents rendered successfully.\n")
             return
@@ -162,8 +163,14 @@ def render_agent(agent_name: str, output: Optional[str], show: bool):
 @agent_command.command(name="render-all")
 @click.option("--output-dir", "-o", type=click.Path(), default=".claude/agents", help="Output directory")
 @click.option("--with-commands", is_flag=True, help="Also render agent slash commands to .claude/commands")
-def render_all_agents(output_dir: str, with_commands: bool):
-    """Render all available agents (regardless of enabled status)."""
+@click.option("--force", is_flag=True, help="Re-render even if templates and config are unchanged")
+def render_all_agents(output_dir: str, with_commands: bool, force: bool):
+    """
+    Render all available agents (regardless of enabled status).
+
+    Only agents whose template, included templates or config changed since
+    the last render are re-rendered (tracked in .claude/render-manifest.json).
+    """
     try:
         config = load_config()
         registry = AgentRegistry(config)
@@ -173,13 +180,9 @@ def render_all_agents(output_dir: str, with_commands: bool):
 
         click.echo(f"\n📝 Rendering {len(all_agents)} agents to {output_path}\n")
 
-        for agent_name in all_agents:
-            try:
-                output_file = registry.save_rendered_agent(agent_name, output_path)
-                click.echo(f"  ✓ {agent_name} → {output_file}")
-            except Exception as e:
-                click.echo(f"  ✗ {agent_name}: {type(e).__name__}: {e}")
-                raise
+        results = registry.save_rendered_agents(all_agents, output_path, force=force)
+        if not echo_render_results(results):
+            raise SystemExit(1)
 
         click.echo(f"\n✅ All agents rendered successfully.\n")
 
@@ -188,19 +191,17 @@ def render_all_agents(output_dir: str, with_commands: bool):
             commands_dir = Path(".claude/commands")
             click.echo(f"📝 Rendering agent slash commands to {commands_dir}\n")
 
-            for agent_name in all_agents:
-                try:
-                    output_file = registry.save_agent_slash_command(agent_name, commands_dir)
-                    click.echo(f"  ✓ /{agent_name} → {output_file}")
-                except Exception as e:
-                    click.echo(f"  ✗ /{agent_name}: {type(e).__name__}: {e}")
-                    raise
+            results = registry.save_agent_slash_commands(all_agents, commands_dir, force=force)
+            if not echo_render_results(results, prefix="/"):
+                raise SystemExit(1)
 
             click.echo(f"\n✅ Agent slash commands rendered successfully.\n")
 
     except FileNotFoundError as e:
         click.echo(f"❌ Error: {e}")
         raise SystemExit(1)
+    except SystemExit:
+        raise
     except Exception as e:
         click.echo(f"❌ Error: {type(e).__name__}: {e}")
         raise SystemExit(1)
@@ -208,8 +209,9 @@ def render_all_agents(output_dir: str, with_commands: bool):
 
 @agent_command.command(name="render-commands")
 @click.option("--output-dir", "-o", type=click.Path(), default=".claude/commands", help="Output directory")
-def render_agent_commands(output_dir: str):
-    """Render slash commands for all enabled agents."""
+@click.option("--force", is_flag=True, help="Re-render even if templates and config are unchanged")
+def render_agent_commands(output_dir: str, force: bool):
+    """Render slash commands for all enabled agents (unchanged ones are skipped)."""
     try:
         config = load_config()
         registry = AgentRegistry(config)
@@ -219,9 +221,9 @@ def render_agent_commands(output_dir: str):
 
         click.echo(f"\n📝 Rendering {len(enabled_agents)} agent slash commands to {output_path}\n")
 
-        for agent_name in enabled_agents:
-            output_file = registry.save_agent_slash_command(agent_name, output_path)
-            click.echo(f"  ✓ /{agent_name} → {output_file}")
+        results = registry.save_agent_slash_commands(enabled_agents, output_path, force=force)
+        if not echo_render_results(results, prefix="/"):
+            raise SystemExit(1)
 
         click.echo(f"\n✅ Agent slash commands rendered successfully.\n")
         click.echo("Use these slash commands in Claude Code to spawn agents with fresh context:")
@@ -17,7 +17,7 @@ def configure_command():
 def configure_azure_devops():
     """Configure Azure DevOps integration."""
     try:
-        config = load_config()
+        config = load_config(mutable=True)
 
         click.echo("\n🔧 Azure DevOps Configuration\n")
 
@@ -112,7 +112,7 @@ def configure_azure_devops():
 def configure_file_based():
     """Configure file-based work item tracking."""
     try:
-        config = load_config()
+        config = load_config(mutable=True)
 
         click.echo("\n📁 File-Based Work Tracking Configuration\n")
 
@@ -168,7 +168,7 @@ def configure_file_based():
 def configure_quality_standards():
     """Configure quality and security standards."""
     try:
-        config = load_config()
+        config = load_config(mutable=True)
 
         click.echo("\n📊 Quality Standards Configuration\n")
 
@@ -9,6 +9,9 @@ from pathlib import Path
 import yaml
 from datetime import datetime
 
+from core.context_index import ContextIndex, search_index_path, tokenize
+from core.repo_scanner import IgnoreRules, ScannedDirectory, find_files, scan_tree
+
 
 @click.group()
 def context():
@@ -24,101 +27,171 @@ def context():
 @context.command("index")
 @click.option("--output", "-o", type=click.Path(), default=".claude/context-index.yaml")
 @click.option("--root", "-r", type=click.Path(exists=True), default=".")
-def build_index(output: str, root: str):
+@click.option("--full", is_flag=True, help="Re-read every file instead of only changed ones")
+@click.option("--no-gitignore", is_flag=True, help="Index files even if .gitignore excludes them")
+@click.option("--watch", "-w", is_flag=True, help="Keep the index current by polling for changes")
+@click.option("--interval", type=float, default=2.0, help="Polling interval in seconds for --watch")
+def build_index(output: str, root: str, full: bool, no_gitignore: bool, watch: bool, interval: float):
     """
     Build or rebuild the context index.
 
     Scans the project for CLAUDE.md files and other context sources,
-    creating an index for fast context lookup.
+    creating an index for fast context lookup. A BM25 search index is
+    written to <root>/.claude/context-search-index.json for ranked
+    'context lookup' and 'context load' (--output only moves the YAML index).
+
+    Rebuilds are incremental: files whose mtime and size are unchanged
+    since the last run are not re-read. Ignored directories (node_modules,
+    .git, build outputs and anything in .gitignore) are never entered.
 
     Examples:
         trustable-ai context index
         trustable-ai context index -o .claude/context-index.yaml
+        trustable-ai context index --full
+        trustable-ai context index --watch
     """
     root_path = Path(root)
     output_path = Path(output)
+    index_path = search_index_path(root_path)
+    use_gitignore = not no_gitignore
 
     click.echo(f"Building context index from {root_path}...")
+    search_index = ContextIndex() if full else ContextIndex.load(index_path)
+    rules = IgnoreRules(root_path, use_gitignore=use_gitignore)
+    _update_index(root_path, output_path, search_index, rules)
 
-    # Find all CLAUDE.md files
-    claude_files = list(root_path.rglob("CLAUDE.md"))
-    claude_files.extend(root_path.rglob("claude.md"))
+    if not watch:
+        return
 
-    # Find README files
-    readme_files = list(root_path.rglob("README.md"))
+    import time
 
-    # Build index
-    index = {
-        "generated_at": datetime.now().isoformat(),
-        "root": str(root_path.absolute()),
-        "context_files": [],
-        "templates": [],
-        "keywords": {}
-    }
+    click.echo(f"\n👀 Watching {root_path} for changes (every {interval:g}s, Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(interval)
+            # The index and ignore rules stay in memory between ticks; rules
+            # are only rebuilt when a .gitignore they were read from changes
+            if rules.is_stale():
+                rules = IgnoreRules(root_path, use_gitignore=use_gitignore)
+            _update_index(root_path, output_path, search_index, rules, quiet=True)
+    except KeyboardInterrupt:
+        click.echo("\nStopped watching.")
+
+
+def _update_index(
+    root_path: Path,
+    output_path: Path,
+    search_index: ContextIndex,
+    rules: IgnoreRules,
+    quiet: bool = False
+) -> dict:
+    """
+    Synchronize the context index with the files under root_path.
 
-    click.echo(f"Found {len(claude_files)} CLAUDE.md files")
-    click.echo(f"Found {len(readme_files)} README.md files")
+    Re-extracts only added or changed files into search_index and rewrites
+    the index files when something changed.
 
-    # Index CLAUDE.md files
-    for file_path in claude_files:
-        relative_path = file_path.relative_to(root_path)
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            keywords = _extract_keywords(content)
-
-            entry = {
-                "path": str(relative_path),
-                "type": "claude_md",
-                "size": len(content),
-                "keywords": keywords[:20]  # Top 20 keywords
-            }
-            index["context_files"].append(entry)
-
-            # Build keyword index
-            for keyword in keywords:
-                index["keywords"].setdefault(keyword.lower(), []).append(str(relative_path))
-
-            click.echo(f"  ✓ {relative_path}")
-        except Exception as e:
-            click.echo(f"  ✗ {relative_path}: {e}")
+    Args:
+        root_path: Directory to index
+        output_path: Path of the YAML context index
+        search_index: Search index to update in place
+        rules: Ignore rules for root_path
+        quiet: Only report when files changed (used by --watch)
 
-    # Index README files (lower priority)
-    for file_path in readme_files:
-        if file_path.name == "CLAUDE.md":
-            continue
+    Returns:
+        Dict of changed paths from ContextIndex.sync
+    """
+    index_path = search_index_path(root_path)
+
+    claude_files = []
+    readme_files = []
+    for file_path in find_files(root_path, {"CLAUDE.md", "claude.md", "README.md"}, rules):
+        if file_path.name == "README.md":
+            # READMEs in hidden directories are tooling docs, not project context
+            relative_path = file_path.relative_to(root_path)
+            if not any(part.startswith(".") for part in relative_path.parts):
+                readme_files.append(file_path)
+        else:
+            claude_files.append(file_path)
 
-        relative_path = file_path.relative_to(root_path)
-        # Skip node_modules, venv, etc.
-        if any(part.startswith(".") or part in ["node_modules", "venv", "__pycache__"]
-               for part in relative_path.parts):
-            continue
+    if not quiet:
+        click.echo(f"Found {len(claude_files)} CLAUDE.md files")
+        click.echo(f"Found {len(readme_files)} README.md files")
 
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            keywords = _extract_keywords(content)
-
-            entry = {
-                "path": str(relative_path),
-                "type": "readme",
-                "size": len(content),
-                "keywords": keywords[:10]
-            }
-            index["context_files"].append(entry)
-        except Exception:
-            pass
+    changes = search_index.sync(
+        root_path,
+        [(f, "claude_md") for f in claude_files] + [(f, "readme") for f in readme_files]
+    )
 
-    # Create task templates
-    index["templates"] = _generate_templates(index["context_files"])
+    changed = changes["added"] or changes["updated"] or changes["removed"]
+    if not changed and changes["refreshed"]:
+        # Touched but identical files: persist their new signatures so they
+        # aren't re-read and re-hashed on every run
+        search_index.save(index_path)
+    if quiet and not changed:
+        return changes
+
+    for status, icon in (("added", "✓"), ("updated", "🔄"), ("removed", "✗")):
+        for path in changes[status]:
+            click.echo(f"  {icon} {path} ({status})")
+
+    if not changed and output_path.exists() and index_path.exists():
+        click.echo(f"\n✓ Context index is up to date ({len(search_index)} files)")
+        return changes
+
+    index = _build_index_data(root_path, search_index)
 
     # Save index
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w", encoding='utf-8') as f:
         yaml.dump(index, f, default_flow_style=False)
 
+    search_index.save(index_path)
+
     click.echo(f"\n✓ Context index saved to {output_path}")
-    click.echo(f"  Total files indexed: {len(index['context_files'])}")
-    click.echo(f"  Unique keywords: {len(index['keywords'])}")
-    click.echo(f"  Task templates: {len(index['templates'])}")
+    if not quiet:
+        click.echo(f"  Search index saved to {index_path}")
+        click.echo(f"  Total files indexed: {len(index['context_files'])}")
+        click.echo(f"  Re-extracted: {len(changes['added']) + len(changes['updated'])}, "
+                   f"unchanged: {len(changes['unchanged']) + len(changes['refreshed'])}, "
+                   f"removed: {len(changes['removed'])}")
+        click.echo(f"  Unique keywords: {len(index['keywords'])}")
+        click.echo(f"  Search terms: {len(search_index.postings)}")
+        click.echo(f"  Task templates: {len(index['templates'])}")
+
+    return changes
+
+
+def _build_index_data(root_path: Path, search_index: ContextIndex) -> dict:
+    """Build the YAML context index from the search index's documents."""
+    index = {
+        "generated_at": datetime.now().isoformat(),
+        "root": str(root_path.absolute()),
+        "context_files": [],
+        "templates": [],
+        "keywords": {}
+    }
+
+    for path in sorted(search_index.documents, key=lambda p: (search_index.documents[p]["type"], p)):
+        doc = search_index.documents[path]
+        is_claude_md = doc["type"] == "claude_md"
+        index["context_files"].append({
+            "path": path,
+            "type": doc["type"],
+            "size": doc.get("chars", 0),
+            "keywords": search_index.top_terms(path, 20 if is_claude_md else 10)
+        })
+
+    # Keyword index covers CLAUDE.md files only
+    for term, term_postings in search_index.postings.items():
+        paths = sorted(p for p in term_postings if search_index.documents[p]["type"] == "claude_md")
+        if paths:
+            index["keywords"][term] = paths
+
+    # Create task templates
+    index["templates"] = _generate_templates(index["context_files"])
+
+    return index
 
 
 @context.command("show")
@@ -189,6 +262,8 @@ def lookup_context(task_description: str, max_tokens: int):
         trustable-ai context lookup "implement user authentication"
         trustable-ai context lookup "fix database connection issue" -t 8000
     """
+    from core.context_server import ContextClient
+
     index_path = Path(".claude/context-index.yaml")
 
     if not index_path.exists():
@@ -196,37 +271,26 @@ def lookup_context(task_description: str, max_tokens: int):
         click.echo("Run 'trustable-ai context index' to build it.")
         return
 
-    with open(index_path) as f:
-        index = yaml.safe_load(f)
-
     # Extract keywords from task description
     task_keywords = _extract_keywords(task_description)
 
-    # Find matching files
-    matches = {}
-    for keyword in task_keywords:
-        keyword_lower = keyword.lower()
-        if keyword_lower in index.get("keywords", {}):
-            for file_path in index["keywords"][keyword_lower]:
-                matches[file_path] = matches.get(file_path, 0) + 1
+    # Rank matching files (served by the context server when it is running)
+    sorted_matches = ContextClient().rank(task_description)
 
-    if not matches:
+    if not sorted_matches:
         click.echo("No relevant context found.")
         click.echo("Try different keywords or rebuild the index.")
         return
 
-    # Sort by relevance
-    sorted_matches = sorted(matches.items(), key=lambda x: x[1], reverse=True)
-
     click.echo(f"Context for: {task_description}")
     click.echo("=" * 50)
     click.echo(f"Keywords extracted: {', '.join(task_keywords[:10])}")
-    click.echo(f"\nRelevant files (by match count):")
+    click.echo(f"\nRelevant files (by relevance):")
 
     total_tokens = 0
     selected_files = []
 
-    for file_path, count in sorted_matches:
+    for file_path, score in sorted_matches:
         # Estimate tokens (rough: 4 chars per token)
         path = Path(file_path)
         if path.exists():
@@ -236,11 +300,11 @@ def lookup_context(task_description: str, max_tokens: int):
             if total_tokens + estimated_tokens <= max_tokens:
                 selected_files.append(file_path)
                 total_tokens += estimated_tokens
-                click.echo(f"  ✓ {file_path} ({count} matches, ~{estimated_tokens} tokens)")
+                click.echo(f"  ✓ {file_path} (score {score:.2f}, ~{estimated_tokens} tokens)")
             else:
-                click.echo(f"  - {file_path} ({count} matches, skipped - token limit)")
+                click.echo(f"  - {file_path} (score {score:.2f}, skipped - token limit)")
         else:
-            click.echo(f"  - {file_path} ({count} matches, file not found)")
+            click.echo(f"  - {file_path} (score {score:.2f}, file not found)")
 
     click.echo(f"\nSelected {len(selected_files)} files (~{total_tokens} tokens)")
 
@@ -256,40 +320,24 @@ def load_context(task_description: str, output: str):
         trustable-ai context load "implement API endpoint"
         trustable-ai context load "fix authentication" -o context.md
     """
+    from core.context_server import ContextClient
+
     index_path = Path(".claude/context-index.yaml")
 
     if not index_path.exists():
         click.echo("Context index not found. Run 'trustable-ai context index' first.")
         return
 
-    with open(index_path) as f:
-        index = yaml.safe_load(f)
-
-    # Find relevant files
-    task_keywords = _extract_keywords(task_description)
-    matches = {}
-
-    for keyword in task_keywords:
-        keyword_lower = keyword.lower()
-        if keyword_lower in index.get("keywords", {}):
-            for file_path in index["keywords"][keyword_lower]:
-                matches[file_path] = matches.get(file_path, 0) + 1
+    # Find and read relevant files (served by the context server when it is running)
+    loaded = ContextClient().load_for_description(task_description, limit=5)
 
-    sorted_matches = sorted(matches.items(), key=lambda x: x[1], reverse=True)[:5]
-
-    # Load and combine content
+    # Combine content
     combined = [f"# Context for: {task_description}\n"]
     combined.append(f"*Generated: {datetime.now().isoformat()}*\n")
 
-    for file_path, count in sorted_matches:
-        path = Path(file_path)
-        if path.exists():
-            try:
-                content = path.read_text(encoding="utf-8")
-                combined.append(f"\n---\n## From: {file_path}\n")
-                combined.append(content)
-            except Exception as e:
-                combined.append(f"\n*Error loading {file_path}: {e}*\n")
+    for loaded_file in loaded["files"]:
+        combined.append(f"\n---\n## From: {loaded_file['path']}\n")
+        combined.append(loaded_file["content"])
 
     result = "\n".join(combined)
 
@@ -302,32 +350,10 @@ def load_context(task_description: str, output: str):
 
 
 def _extract_keywords(text: str) -> list:
-    """Extract keywords from text."""
-    import re
-
-    # Common stop words to exclude
-    stop_words = {
-        "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
-        "have", "has", "had", "do", "does", "did", "will", "would", "could",
-        "should", "may", "might", "must", "shall", "can", "need", "dare",
-        "ought", "used", "to", "of", "in", "for", "on", "with", "at", "by",
-        "from", "as", "into", "through", "during", "before", "after",
-        "above", "below", "between", "under", "again", "further", "then",
-        "once", "here", "there", "when", "where", "why", "how", "all",
-        "each", "few", "more", "most", "other", "some", "such", "no", "nor",
-        "not", "only", "own", "same", "so", "than", "too", "very", "just",
-        "and", "but", "if", "or", "because", "until", "while", "this",
-        "that", "these", "those", "it", "its", "you", "your", "we", "our"
-    }
-
-    # Extract words
-    words = re.findall(r'\b[a-zA-Z][a-zA-Z0-9_-]{2,}\b', text.lower())
-
-    # Filter and count
+    """Extract keywords from text, most frequent first."""
     word_counts = {}
-    for word in words:
-        if word not in stop_words and len(word) > 2:
-            word_counts[word] = word_counts.get(word, 0) + 1
+    for word in tokenize(text):
+        word_counts[word] = word_counts.get(word, 0) + 1
 
     # Sort by frequency
     sorted_words = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)
@@ -335,6 +361,37 @@ def _extract_keywords(text: str) -> list:
     return [word for word, count in sorted_words]
 
 
+@context.command("serve")
+@click.option("--port", "-p", type=int, default=0, help="Port to listen on (default: any free port)")
+@click.option("--poll-interval", type=float, default=1.0, help="Seconds between checks for changed files")
+def serve_context(port: int, poll_interval: float):
+    """
+    Run a local context server that keeps loaded context warm.
+
+    'context load', 'context lookup' and the context skill use the server
+    automatically while it runs, and load context in-process otherwise.
+    Cached files are re-read as soon as they change on disk.
+
+    Examples:
+        trustable-ai context serve
+        trustable-ai context serve --port 8765
+    """
+    from core.context_server import ContextServer
+
+    server = ContextServer(Path.cwd(), port=port, poll_interval=poll_interval)
+    server.start()
+    click.echo(f"🚀 Context server listening on {server.url}")
+    click.echo("   Press Ctrl+C to stop")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        click.echo("\n✓ Context server stopped")
+
+
 def _generate_templates(context_files: list) -> list:
     """Generate task templates based on context files."""
     templates = []
@@ -423,6 +480,8 @@ def directed_load(task_type: str, keywords: tuple, max_tokens: int, tree: bool,
     click.echo("=" * 50)
     click.echo(f"Files Loaded: {len(result['files_loaded'])}")
     click.echo(f"Tokens Used: ~{result['tokens_used']}")
+    if result.get('tokens_saved'):
+        click.echo(f"Tokens Saved (deduplication): ~{result['tokens_saved']}")
     click.echo("")
 
     click.echo("Files:")
@@ -512,8 +571,9 @@ def verify_context(root: str, fix: bool):
 
     click.echo(f"\n🔍 Verifying CLAUDE.md files in: {root_path}\n")
 
-    # Find all CLAUDE.md files
-    claude_files = list(root_path.rglob("CLAUDE.md"))
+    # Find all CLAUDE.md files, keeping each directory's listing for staleness checks
+    scanned_dirs = [d for d in scan_tree(root_path) if "CLAUDE.md" in d.files]
+    claude_files = [d.path / "CLAUDE.md" for d in scanned_dirs]
 
     if not claude_files:
         click.echo("❌ No CLAUDE.md files found.")
@@ -526,7 +586,10 @@ def verify_context(root: str, fix: bool):
     warnings = []
     passed = 0
 
-    for claude_file in claude_files:
+    source_extensions = (".py", ".js", ".ts", ".tsx", ".go", ".rs")
+
+    for scanned in scanned_dirs:
+        claude_file = scanned.path / "CLAUDE.md"
         relative = claude_file.relative_to(root_path)
 
         try:
@@ -588,15 +651,16 @@ def verify_context(root: str, fix: bool):
                             warnings.append(f"⚠️  {relative}: Child not found: {child_path_str}")
 
             # Check 7: Staleness (compare to source files)
-            dir_path = claude_file.parent
-            source_files = []
-            for ext in ["*.py", "*.js", "*.ts", "*.tsx", "*.go", "*.rs"]:
-                source_files.extend(dir_path.glob(ext))
+            source_mtimes = [
+                ((scanned.path / name).stat().st_mtime, name)
+                for name in scanned.files
+                if name.lower().endswith(source_extensions)
+            ]
 
-            if source_files:
-                newest_source = max(source_files, key=lambda p: p.stat().st_mtime)
-                if newest_source.stat().st_mtime > claude_file.stat().st_mtime:
-                    warnings.append(f"⚠️  {relative}: Stale (older than {newest_source.name})")
+            if source_mtimes:
+                newest_mtime, newest_name = max(source_mtimes)
+                if newest_mtime > claude_file.stat().st_mtime:
+                    warnings.append(f"⚠️  {relative}: Stale (older than {newest_name})")
 
             # All checks passed
             passed += 1
@@ -772,20 +836,35 @@ def _analyze_repository(root: Path, max_depth: int) -> dict:
         "frameworks": []
     }
 
+    # Directories to skip
+    skip_patterns = {
+        "node_modules", "venv", ".venv", "env", ".env",
+        "__pycache__", ".git", ".svn", ".hg",
+        "dist", "build", "out", "target", "bin", "obj",
+        ".idea", ".vscode", ".vs",
+        "coverage", ".coverage", "htmlcov",
+        ".pytest_cache", ".mypy_cache", ".ruff_cache",
+        "eggs", "*.egg-info", ".eggs",
+    }
+
+    # Scan the tree once, pruning skipped and gitignored directories
+    scanned_dirs = scan_tree(root, IgnoreRules(root, skip_dirs=skip_patterns), max_depth=max_depth)
+    root_files = set(scanned_dirs[0].files) if scanned_dirs else set()
+
     # Detect project type from files
-    if (root / "package.json").exists():
+    if "package.json" in root_files:
         analysis["languages"].append("JavaScript/TypeScript")
         analysis["project_type"] = "node"
-    if (root / "pyproject.toml").exists() or (root / "setup.py").exists():
+    if "pyproject.toml" in root_files or "setup.py" in root_files:
         analysis["languages"].append("Python")
         analysis["project_type"] = "python"
-    if (root / "go.mod").exists():
+    if "go.mod" in root_files:
         analysis["languages"].append("Go")
         analysis["project_type"] = "go"
-    if (root / "Cargo.toml").exists():
+    if "Cargo.toml" in root_files:
         analysis["languages"].append("Rust")
         analysis["project_type"] = "rust"
-    if (root / "pom.xml").exists() or (root / "build.gradle").exists():
+    if "pom.xml" in root_files or "build.gradle" in root_files:
         analysis["languages"].append("Java")
         analysis["project_type"] = "java"
 
@@ -834,61 +913,29 @@ def _analyze_repository(root: Path, max_depth: int) -> dict:
         "extensions": "extensions",
     }
 
-    # Directories to skip
-    skip_patterns = {
-        "node_modules", "venv", ".venv", "env", ".env",
-        "__pycache__", ".git", ".svn", ".hg",
-        "dist", "build", "out", "target", "bin", "obj",
-        ".idea", ".vscode", ".vs",
-        "coverage", ".coverage", "htmlcov",
-        ".pytest_cache", ".mypy_cache", ".ruff_cache",
-        "eggs", "*.egg-info", ".eggs",
-    }
-
-    # Always include root
-    root_info = _analyze_directory(root, root, "root")
-    analysis["directories"].append(root_info)
-
-    # Walk directory tree
-    for item in root.rglob("*"):
-        if not item.is_dir():
-            continue
-
-        # Check depth
-        relative = item.relative_to(root)
-        if len(relative.parts) > max_depth:
-            continue
-
-        # Skip ignored directories
-        if any(skip in relative.parts for skip in skip_patterns):
+    for scanned in scanned_dirs:
+        if scanned.depth == 0:
+            # Always include root
+            analysis["directories"].append(_analyze_directory(scanned, "root"))
             continue
 
         # Check if it's an important directory
-        dir_name = item.name.lower()
+        dir_name = scanned.name.lower()
         dir_type = important_patterns.get(dir_name)
 
-        if dir_type or _is_significant_directory(item):
-            dir_info = _analyze_directory(item, root, dir_type or "module")
+        if dir_type or _is_significant_directory(scanned):
+            dir_info = _analyze_directory(scanned, dir_type or "module")
             analysis["directories"].append(dir_info)
 
     return analysis
 
 
-def _analyze_directory(dir_path: Path, root: Path, dir_type: str) -> dict:
-    """Analyze a single directory."""
-    relative_path = dir_path.relative_to(root) if dir_path != root else Path(".")
-
-    # Count files by type
-    files = list(dir_path.glob("*"))
-    file_count = len([f for f in files if f.is_file()])
-
-    # Check for existing CLAUDE.md
-    has_claude_md = (dir_path / "CLAUDE.md").exists()
-
+def _analyze_directory(scanned: ScannedDirectory, dir_type: str) -> dict:
+    """Analyze a single directory from its scan results."""
     # Detect primary language/purpose
-    py_files = len(list(dir_path.glob("*.py")))
-    js_files = len(list(dir_path.glob("*.js"))) + len(list(dir_path.glob("*.ts")))
-    go_files = len(list(dir_path.glob("*.go")))
+    py_files = scanned.count(".py")
+    js_files = scanned.count(".js", ".ts")
+    go_files = scanned.count(".go")
 
     primary_lang = "mixed"
     if py_files > js_files and py_files > go_files:
@@ -899,29 +946,25 @@ def _analyze_directory(dir_path: Path, root: Path, dir_type: str) -> dict:
         primary_lang = "go"
 
     # Get subdirectories
-    subdirs = [d.name for d in dir_path.iterdir() if d.is_dir() and not d.name.startswith(".")]
+    subdirs = [d for d in scanned.subdirs if not d.startswith(".")]
 
     return {
-        "path": str(dir_path),
-        "relative_path": str(relative_path),
+        "path": str(scanned.path),
+        "relative_path": scanned.relative_path,
         "type": dir_type,
-        "file_count": file_count,
-        "has_claude_md": has_claude_md,
+        "file_count": len(scanned.files),
+        "has_claude_md": "CLAUDE.md" in scanned.files,
         "primary_language": primary_lang,
         "subdirectories": subdirs[:10],  # Limit to first 10
     }
 
 
-def _is_significant_directory(dir_path: Path) -> bool:
+def _is_significant_directory(scanned: ScannedDirectory) -> bool:
     """Check if a directory is significant enough to document."""
     # Must have at least some code files
     code_extensions = {".py", ".js", ".ts", ".go", ".rs", ".java", ".cpp", ".c", ".rb"}
 
-    code_files = 0
-    for ext in code_extensions:
-        code_files += len(list(dir_path.glob(f"*{ext}")))
-
-    return code_files >= 2
+    return scanned.count(*code_extensions) >= 2
 
 
 def _generate_front_matter(dir_info: dict, analysis: dict) -> str:
@@ -2,61 +2,210 @@
 Doctor command for Trustable AI CLI.
 
 Performs health checks on the framework installation and configuration.
+
+Checks are registered with ``@doctor_check`` and are independent of each
+other, so they run concurrently on a thread pool. Results are printed as
+each check finishes, with how long it took. A check that runs past its
+timeout is reported as timed out and doesn't hold up the others.
+
+Usage:
+    trustable-ai doctor
+    trustable-ai doctor --fix
+    trustable-ai doctor --json     # Machine-readable report; exits 1 on issues
 """
 
-import click
+import json
 import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable, Dict, List, Optional
 
+import click
 
-@click.command()
-@click.option("--fix", is_flag=True, help="Attempt to fix issues automatically")
-def doctor(fix: bool):
+
+# Default seconds a check may run before it's reported as timed out
+DEFAULT_CHECK_TIMEOUT = 15.0
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one health check."""
+    name: str
+    title: str
+    messages: List[str] = field(default_factory=list)
+    issues: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    duration: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def status(self) -> str:
+        """Overall status: error if there are issues, warning if warnings, else ok."""
+        if self.issues:
+            return "error"
+        if self.warnings:
+            return "warning"
+        return "ok"
+
+    def ok(self, message: str) -> None:
+        self.messages.append(f"✓ {message}")
+
+    def info(self, message: str) -> None:
+        self.messages.append(message)
+
+    def warn(self, message: str, warning: Optional[str] = None) -> None:
+        self.messages.append(f"! {message}")
+        self.warnings.append(warning or message)
+
+    def error(self, message: str, issue: Optional[str] = None) -> None:
+        self.messages.append(f"✗ {message}")
+        self.issues.append(issue or message)
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "title": self.title,
+            "status": self.status,
+            "duration": round(self.duration, 3),
+            "timed_out": self.timed_out,
+            "messages": self.messages,
+            "issues": self.issues,
+            "warnings": self.warnings,
+        }
+
+
+@dataclass
+class DoctorCheck:
+    """A registered health check."""
+    name: str
+    title: str
+    run: Callable[[CheckResult, bool], None]  # (result, fix)
+    timeout: float = DEFAULT_CHECK_TIMEOUT
+
+
+CHECKS: List[DoctorCheck] = []
+
+
+def doctor_check(name: str, title: str, timeout: float = DEFAULT_CHECK_TIMEOUT):
     """
-    Run health checks on Trustable AI installation.
+    Register a health check.
 
-    Checks:
-    - Python version and dependencies
-    - Configuration file validity
-    - Directory structure
-    - Azure CLI (if configured)
-    - Skills availability
+    The decorated function receives a CheckResult to report into and the
+    --fix flag.
+
+    Args:
+        name: Check identifier (used in --json output)
+        title: Human-readable title
+        timeout: Seconds before the check is reported as timed out
     """
-    click.echo("Trustable AI Health Check")
-    click.echo("=" * 50)
+    def register(func: Callable[[CheckResult, bool], None]) -> Callable[[CheckResult, bool], None]:
+        CHECKS.append(DoctorCheck(name, title, func, timeout))
+        return func
+    return register
+
+
+def _run_check(check: DoctorCheck, fix: bool) -> CheckResult:
+    result = CheckResult(check.name, check.title)
+    start = time.monotonic()
+    try:
+        check.run(result, fix)
+    except Exception as e:
+        result.error(f"Check failed: {e}", f"{check.title} check failed: {e}")
+    result.duration = time.monotonic() - start
+    return result
+
+
+def run_checks(
+    checks: List[DoctorCheck],
+    fix: bool = False,
+    max_workers: Optional[int] = None,
+    on_result: Optional[Callable[[CheckResult], None]] = None
+) -> List[CheckResult]:
+    """
+    Run checks concurrently.
+
+    Args:
+        checks: Checks to run
+        fix: Whether checks may fix what they find
+        max_workers: Thread pool size (defaults to one per check)
+        on_result: Called with each result as soon as it's available
+
+    Returns:
+        Results in the order of ``checks``
+    """
+    results: Dict[str, CheckResult] = {}
+    if not checks:
+        return []
+
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(checks), thread_name_prefix="doctor")
+    try:
+        started = time.monotonic()
+        pending = {executor.submit(_run_check, check, fix): check for check in checks}
+        while pending:
+            now = time.monotonic()
+            next_deadline = min(started + check.timeout for check in pending.values())
+            done, _ = wait(pending, timeout=max(next_deadline - now, 0), return_when=FIRST_COMPLETED)
 
-    issues = []
-    warnings = []
+            for future in done:
+                check = pending.pop(future)
+                results[check.name] = future.result()
+                if on_result:
+                    on_result(results[check.name])
 
-    # Check 1: Python version
-    click.echo("\n[1/7] Checking Python version...")
-    import sys
+            now = time.monotonic()
+            for future, check in list(pending.items()):
+                if now >= started + check.timeout:
+                    del pending[future]
+                    future.cancel()
+                    result = CheckResult(check.name, check.title, duration=now - started, timed_out=True)
+                    result.warn(f"Timed out after {check.timeout:g}s", f"{check.title} check timed out")
+                    results[check.name] = result
+                    if on_result:
+                        on_result(result)
+    finally:
+        # Don't wait for timed-out checks; their threads finish in the background
+        executor.shutdown(wait=False)
+
+    return [results[check.name] for check in checks]
+
+
+# Checks
+
+
+@doctor_check("python", "Python version")
+def _check_python(result: CheckResult, fix: bool) -> None:
     py_version = sys.version_info
     if py_version >= (3, 9):
-        click.echo(f"  ✓ Python {py_version.major}.{py_version.minor}.{py_version.micro}")
+        result.ok(f"Python {py_version.major}.{py_version.minor}.{py_version.micro}")
     else:
-        issues.append(f"Python 3.9+ required, found {py_version.major}.{py_version.minor}")
-        click.echo(f"  ✗ Python {py_version.major}.{py_version.minor} (3.9+ required)")
+        result.error(
+            f"Python {py_version.major}.{py_version.minor} (3.9+ required)",
+            f"Python 3.9+ required, found {py_version.major}.{py_version.minor}",
+        )
 
-    # Check 2: Configuration file
-    click.echo("\n[2/7] Checking configuration...")
+
+@doctor_check("configuration", "Configuration")
+def _check_configuration(result: CheckResult, fix: bool) -> None:
     config_path = Path(".claude/config.yaml")
-    if config_path.exists():
-        click.echo(f"  ✓ Configuration file found: {config_path}")
-        try:
-            from config.loader import load_config
-            config = load_config(config_path)
-            click.echo("  ✓ Configuration is valid")
-        except Exception as e:
-            issues.append(f"Configuration error: {e}")
-            click.echo(f"  ✗ Configuration error: {e}")
-    else:
-        issues.append("Configuration file not found")
-        click.echo(f"  ✗ Configuration file not found at {config_path}")
-        click.echo("    Run 'trustable-ai init' to create configuration")
+    if not config_path.exists():
+        result.error(f"Configuration file not found at {config_path}", "Configuration file not found")
+        result.info("  Run 'trustable-ai init' to create configuration")
+        return
 
-    # Check 3: Directory structure
-    click.echo("\n[3/7] Checking directory structure...")
+    result.ok(f"Configuration file found: {config_path}")
+    try:
+        from config.loader import load_config
+        load_config(config_path)
+        result.ok("Configuration is valid")
+    except Exception as e:
+        result.error(f"Configuration error: {e}")
+
+
+@doctor_check("directories", "Directory structure")
+def _check_directories(result: CheckResult, fix: bool) -> None:
     required_dirs = [
         ".claude",
         ".claude/agents",
@@ -66,83 +215,70 @@ def doctor(fix: bool):
     for dir_path in required_dirs:
         path = Path(dir_path)
         if path.exists():
-            click.echo(f"  ✓ {dir_path}/")
+            result.ok(f"{dir_path}/")
+        elif fix:
+            path.mkdir(parents=True, exist_ok=True)
+            result.ok(f"{dir_path}/ (created)")
         else:
-            if fix:
-                path.mkdir(parents=True, exist_ok=True)
-                click.echo(f"  ✓ {dir_path}/ (created)")
-            else:
-                warnings.append(f"Directory missing: {dir_path}")
-                click.echo(f"  ! {dir_path}/ (missing)")
-
-    # Check 4: Agent templates
-    click.echo("\n[4/7] Checking agent templates...")
+            result.warn(f"{dir_path}/ (missing)", f"Directory missing: {dir_path}")
+
+
+@doctor_check("agents", "Agent templates")
+def _check_agents(result: CheckResult, fix: bool) -> None:
     try:
         from agents.registry import AgentRegistry
         from config.loader import load_config
         config = load_config()
         registry = AgentRegistry(config)
         agents = registry.list_agents()
-        click.echo(f"  ✓ {len(agents)} agent templates available")
+        result.ok(f"{len(agents)} agent templates available")
         for agent in agents[:5]:
-            click.echo(f"    - {agent}")
+            result.info(f"  - {agent}")
         if len(agents) > 5:
-            click.echo(f"    ... and {len(agents) - 5} more")
+            result.info(f"  ... and {len(agents) - 5} more")
     except Exception as e:
-        warnings.append(f"Agent registry error: {e}")
-        click.echo(f"  ! Agent registry: {e}")
+        result.warn(f"Agent registry: {e}", f"Agent registry error: {e}")
 
-    # Check 5: Skills
-    click.echo("\n[5/7] Checking skills...")
+
+@doctor_check("skills", "Skills")
+def _check_skills(result: CheckResult, fix: bool) -> None:
     try:
         from skills import list_skills
         skills = list_skills()
-        click.echo(f"  ✓ {len(skills)} skills available")
+        result.ok(f"{len(skills)} skills available")
         for skill in skills:
-            click.echo(f"    - {skill}")
+            result.info(f"  - {skill}")
     except Exception as e:
-        warnings.append(f"Skills registry error: {e}")
-        click.echo(f"  ! Skills registry: {e}")
+        result.warn(f"Skills registry: {e}", f"Skills registry error: {e}")
+
 
-    # Check 6: Azure CLI (optional)
-    click.echo("\n[6/7] Checking Azure CLI (optional)...")
+@doctor_check("azure_cli", "Azure CLI (optional)", timeout=25.0)
+def _check_azure_cli(result: CheckResult, fix: bool) -> None:
     try:
-        result = subprocess.run(
-            ["az", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode == 0:
-            # Extract version from output
-            version_line = result.stdout.split("\n")[0]
-            click.echo(f"  ✓ Azure CLI installed: {version_line}")
-
-            # Check devops extension
-            result = subprocess.run(
-                ["az", "devops", "--help"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                click.echo("  ✓ Azure DevOps extension installed")
-            else:
-                warnings.append("Azure DevOps extension not installed")
-                click.echo("  ! Azure DevOps extension not installed")
-                click.echo("    Install with: az extension add --name azure-devops")
+        version = subprocess.run(["az", "--version"], capture_output=True, text=True, timeout=10)
+        if version.returncode != 0:
+            result.warn("Azure CLI not working properly")
+            return
+
+        # Extract version from output
+        version_line = version.stdout.split("\n")[0]
+        result.ok(f"Azure CLI installed: {version_line}")
+
+        extension = subprocess.run(["az", "devops", "--help"], capture_output=True, text=True, timeout=10)
+        if extension.returncode == 0:
+            result.ok("Azure DevOps extension installed")
         else:
-            warnings.append("Azure CLI not working properly")
-            click.echo("  ! Azure CLI not working properly")
+            result.warn("Azure DevOps extension not installed")
+            result.info("  Install with: az extension add --name azure-devops")
     except FileNotFoundError:
-        click.echo("  - Azure CLI not installed (optional)")
-        click.echo("    Install from: https://docs.microsoft.com/en-us/cli/azure/install-azure-cli")
+        result.info("- Azure CLI not installed (optional)")
+        result.info("  Install from: https://docs.microsoft.com/en-us/cli/azure/install-azure-cli")
     except subprocess.TimeoutExpired:
-        warnings.append("Azure CLI check timed out")
-        click.echo("  ! Azure CLI check timed out")
+        result.warn("Azure CLI check timed out")
 
-    # Check 7: Dependencies
-    click.echo("\n[7/7] Checking dependencies...")
+
+@doctor_check("dependencies", "Dependencies")
+def _check_dependencies(result: CheckResult, fix: bool) -> None:
     # Map package names to their import names
     required_packages = {
         "click": "click",
@@ -153,10 +289,53 @@ def doctor(fix: bool):
     for package_name, import_name in required_packages.items():
         try:
             __import__(import_name)
-            click.echo(f"  ✓ {package_name}")
+            result.ok(package_name)
         except ImportError:
-            issues.append(f"Missing package: {package_name}")
-            click.echo(f"  ✗ {package_name} (missing)")
+            result.error(f"{package_name} (missing)", f"Missing package: {package_name}")
+
+
+@click.command()
+@click.option("--fix", is_flag=True, help="Attempt to fix issues automatically")
+@click.option("--json", "as_json", is_flag=True, help="Output a JSON report (exits 1 if issues are found)")
+def doctor(fix: bool, as_json: bool):
+    """
+    Run health checks on Trustable AI installation.
+
+    Checks:
+    - Python version and dependencies
+    - Configuration file validity
+    - Directory structure
+    - Azure CLI (if configured)
+    - Skills availability
+    """
+    positions = {check.name: index for index, check in enumerate(CHECKS, 1)}
+
+    def echo_result(result: CheckResult) -> None:
+        click.echo(f"\n[{positions[result.name]}/{len(CHECKS)}] {result.title} ({result.duration:.2f}s)")
+        for message in result.messages:
+            click.echo(f"  {message}")
+
+    if not as_json:
+        click.echo("Trustable AI Health Check")
+        click.echo("=" * 50)
+
+    started = time.monotonic()
+    results = run_checks(CHECKS, fix=fix, on_result=None if as_json else echo_result)
+    issues = [issue for result in results for issue in result.issues]
+    warnings = [warning for result in results for warning in result.warnings]
+
+    if as_json:
+        report = {
+            "status": "error" if issues else "warning" if warnings else "ok",
+            "duration": round(time.monotonic() - started, 3),
+            "checks": [result.to_dict() for result in results],
+            "issues": issues,
+            "warnings": warnings,
+        }
+        click.echo(json.dumps(report, indent=2))
+        if issues:
+            raise SystemExit(1)
+        return
 
     # Summary
     click.echo("\n" + "=" * 50)
@@ -182,3 +361,4 @@ def doctor(fix: bool):
             click.echo("\nSome issues were automatically fixed.")
         else:
             click.echo("\nRun 'trustable-ai doctor --fix' to attempt automatic fixes.")
+    click.echo(f"\nCompleted in {time.monotonic() - started:.2f}s")
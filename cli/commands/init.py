@@ -17,6 +17,7 @@ from agents import AgentRegistry
 from workflows import WorkflowRegistry
 from cli.platform_detector import PlatformDetector
 from cli.permissions_generator import PermissionsTemplateGenerator
+from cli.render_output import echo_render_results
 from cli.config_generators.pytest_generator import PytestConfigGenerator
 from cli.config_generators.jest_generator import JestConfigGenerator
 
@@ -25,7 +26,7 @@ def _load_existing_config(config_file: Path) -> Optional[FrameworkConfig]:
     """Load existing configuration if it exists."""
     if config_file.exists():
         try:
-            return load_config(config_file)
+            return load_config(config_file, mutable=True)
         except Exception:
             return None
     return None
@@ -165,7 +166,7 @@ def _generate_permissions_config(claude_dir: Path) -> Dict[str, int]:
     settings_path = claude_dir / "settings.local.json"
 
     # Detect platform
-    detector = PlatformDetector()
+    detector = PlatformDetector.cached(claude_dir.parent)
     platform_info = detector.detect_platform()
 
     # Generate permissions
@@ -648,7 +649,7 @@ def init_command(
     # Generate permissions configuration
     click.echo("\n🔍 Detecting platform...")
     try:
-        detector = PlatformDetector()
+        detector = PlatformDetector.cached(claude_dir.parent)
         platform_info = detector.detect_platform()
         platform_desc = platform_info["os"]
         if platform_info.get("is_wsl"):
@@ -728,7 +729,7 @@ def init_command(
                 ctx.invoke(configure_azure_devops)
                 # Reload config after configuration
                 try:
-                    config = load_config(config_file)
+                    config = load_config(config_file, mutable=True)
                 except Exception:
                     pass
             else:
@@ -922,24 +923,18 @@ def init_command(
             agents_dir = claude_dir / "agents"
             agents_dir.mkdir(parents=True, exist_ok=True)
 
-            for agent_name in config.agent_config.enabled_agents:
-                try:
-                    output_file = registry.save_rendered_agent(agent_name, agents_dir)
-                    click.echo(f"   ✓ {agent_name} → {output_file.relative_to(Path.cwd())}")
-                except Exception as e:
-                    click.echo(f"   ✗ {agent_name}: {e}")
+            # Unchanged outputs are skipped via .claude/render-manifest.json,
+            # so re-running init doesn't rewrite them
+            results = registry.save_rendered_agents(config.agent_config.enabled_agents, agents_dir)
+            echo_render_results(results, indent="   ")
 
             # Render ALL workflows (no enable/disable for workflows)
             workflow_registry = WorkflowRegistry(config)
             workflows_dir = claude_dir / "commands"
             workflows_dir.mkdir(parents=True, exist_ok=True)
 
-            for workflow_name in workflow_registry.list_workflows():
-                try:
-                    output_file = workflow_registry.save_rendered_workflow(workflow_name, workflows_dir)
-                    click.echo(f"   ✓ /{workflow_name} → {output_file.relative_to(Path.cwd())}")
-                except Exception as e:
-                    click.echo(f"   ✗ /{workflow_name}: {e}")
+            results = workflow_registry.save_rendered_workflows(workflow_registry.list_workflows(), workflows_dir)
+            echo_render_results(results, prefix="/", indent="   ")
 
             click.echo(f"\n   ✅ Agents and workflows ready to use in Claude Code")
         except Exception as e:
@@ -6,8 +6,6 @@ Manage institutional knowledge captured during development.
 
 import click
 from pathlib import Path
-import yaml
-from datetime import datetime
 
 
 @click.group()
@@ -40,46 +38,16 @@ def capture(title: str, category: str, content: str, tags: tuple, source: str, w
             -m "Always use separate database for tests" \\
             -t testing -t database -s "Sprint 3 retro"
     """
-    learnings_dir = Path(".claude/learnings")
-    learnings_dir.mkdir(parents=True, exist_ok=True)
-
-    learning_id = f"{category}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-
-    learning = {
-        "id": learning_id,
-        "title": title,
-        "content": content,
-        "category": category,
-        "tags": list(tags) if tags else [],
-        "source": source,
-        "work_item_id": work_item,
-        "created_at": datetime.now().isoformat(),
-        "updated_at": datetime.now().isoformat()
-    }
-
-    # Save learning
-    learning_file = learnings_dir / f"{learning_id}.yaml"
-    with open(learning_file, "w", encoding="utf-8") as f:
-        yaml.dump(learning, f, default_flow_style=False)
-
-    # Update index
-    index_file = learnings_dir / "index.yaml"
-    if index_file.exists():
-        with open(index_file) as f:
-            index = yaml.safe_load(f) or {"learnings": [], "categories": {}}
-    else:
-        index = {"learnings": [], "categories": {}}
-
-    index["learnings"].append({
-        "id": learning_id,
-        "title": title,
-        "category": category,
-        "created_at": learning["created_at"]
-    })
-    index.setdefault("categories", {}).setdefault(category, []).append(learning_id)
-
-    with open(index_file, "w", encoding="utf-8") as f:
-        yaml.dump(index, f, default_flow_style=False)
+    skill = _get_skill()
+    learning = skill.capture(
+        title=title,
+        content=content,
+        category=category,
+        tags=list(tags) if tags else [],
+        source=source,
+        work_item_id=work_item,
+    )
+    learning_id = learning["id"]
 
     click.echo(f"✓ Learning captured: {learning_id}")
     click.echo(f"  Title: {title}")
@@ -99,51 +67,33 @@ def list_learnings(category: str, tag: str, limit: int):
         trustable-ai learnings list -c azure-devops
         trustable-ai learnings list -t security -n 5
     """
-    learnings_dir = Path(".claude/learnings")
-    index_file = learnings_dir / "index.yaml"
-
-    if not index_file.exists():
+    if not Path(".claude/learnings").exists():
         click.echo("No learnings captured yet.")
         click.echo("Use 'trustable-ai learnings capture' to add a learning.")
         return
 
-    with open(index_file) as f:
-        index = yaml.safe_load(f)
-
-    entries = index.get("learnings", [])
-
-    # Filter by category
-    if category:
-        entries = [e for e in entries if e.get("category") == category]
-
-    # Sort by date (newest first)
-    entries = sorted(entries, key=lambda x: x.get("created_at", ""), reverse=True)
+    skill = _get_skill()
+    total = skill.count()
+    if not total:
+        click.echo("No learnings captured yet.")
+        click.echo("Use 'trustable-ai learnings capture' to add a learning.")
+        return
 
-    # Limit results
-    entries = entries[:limit]
+    entries = skill.list_learnings(category=category, tag=tag, limit=limit)
 
     if not entries:
         click.echo("No learnings found matching criteria.")
         return
 
-    click.echo(f"Learnings ({len(entries)} of {len(index.get('learnings', []))})")
+    click.echo(f"Learnings ({len(entries)} of {total})")
     click.echo("-" * 50)
 
     for entry in entries:
-        learning_file = learnings_dir / f"{entry['id']}.yaml"
-        if learning_file.exists():
-            with open(learning_file) as f:
-                learning = yaml.safe_load(f)
-
-            # Filter by tag if specified
-            if tag and tag not in learning.get("tags", []):
-                continue
-
-            click.echo(f"\n[{learning['category']}] {learning['title']}")
-            click.echo(f"  ID: {learning['id']}")
-            click.echo(f"  Content: {learning['content'][:100]}...")
-            if learning.get("tags"):
-                click.echo(f"  Tags: {', '.join(learning['tags'])}")
+        click.echo(f"\n[{entry['category']}] {entry['title']}")
+        click.echo(f"  ID: {entry['id']}")
+        click.echo(f"  Content: {entry['summary'][:100]}...")
+        if entry.get("tags"):
+            click.echo(f"  Tags: {', '.join(entry['tags'])}")
 
 
 @learnings.command("show")
@@ -155,16 +105,14 @@ def show_learning(learning_id: str):
     Example:
         trustable-ai learnings show azure-devops-20250101120000
     """
-    learnings_dir = Path(".claude/learnings")
-    learning_file = learnings_dir / f"{learning_id}.yaml"
+    learning = None
+    if Path(".claude/learnings").exists():
+        learning = _get_skill().get(learning_id)
 
-    if not learning_file.exists():
+    if not learning:
         click.echo(f"Learning not found: {learning_id}")
         return
 
-    with open(learning_file) as f:
-        learning = yaml.safe_load(f)
-
     click.echo(f"Learning: {learning['title']}")
     click.echo("=" * 50)
     click.echo(f"ID: {learning['id']}")
@@ -183,34 +131,27 @@ def show_learning(learning_id: str):
 
 @learnings.command("search")
 @click.argument("query")
-def search_learnings(query: str):
+@click.option("--category", "-c", help="Filter by category")
+@click.option("--tag", "-t", multiple=True, help="Filter by tag (any match)")
+@click.option("--limit", "-n", type=int, default=20, help="Number of results")
+def search_learnings(query: str, category: str, tag: tuple, limit: int):
     """
     Search learnings by text.
 
-    Example:
+    Results must contain every search term and are ranked by relevance.
+    Use double quotes inside the query for exact phrases. Terms match the
+    start of words ("iter" finds "iteration"); unlike earlier versions,
+    text in the middle of a word ("ration") no longer matches.
+
+    Examples:
         trustable-ai learnings search "iteration path"
+        trustable-ai learnings search 'pipeline "variable group"' -c azure-devops
     """
-    learnings_dir = Path(".claude/learnings")
-
-    if not learnings_dir.exists():
+    if not Path(".claude/learnings").exists():
         click.echo("No learnings captured yet.")
         return
 
-    results = []
-    query_lower = query.lower()
-
-    for learning_file in learnings_dir.glob("*.yaml"):
-        if learning_file.name == "index.yaml":
-            continue
-
-        with open(learning_file) as f:
-            learning = yaml.safe_load(f)
-
-        title = learning.get("title", "").lower()
-        content = learning.get("content", "").lower()
-
-        if query_lower in title or query_lower in content:
-            results.append(learning)
+    results = _get_skill().search(query, category=category, tags=list(tag) or None, limit=limit)
 
     if not results:
         click.echo(f"No learnings found matching: {query}")
@@ -220,21 +161,11 @@ def search_learnings(query: str):
     click.echo("-" * 50)
 
     for learning in results:
-        click.echo(f"\n[{learning['category']}] {learning['title']}")
+        score = f" (score {learning['score']:.2f})" if "score" in learning else ""
+        click.echo(f"\n[{learning['category']}] {learning['title']}{score}")
         click.echo(f"  ID: {learning['id']}")
-
-        # Show snippet with match highlighted
-        content = learning.get("content", "")
-        if query_lower in content.lower():
-            idx = content.lower().find(query_lower)
-            start = max(0, idx - 30)
-            end = min(len(content), idx + len(query) + 30)
-            snippet = content[start:end]
-            if start > 0:
-                snippet = "..." + snippet
-            if end < len(content):
-                snippet = snippet + "..."
-            click.echo(f"  ...{snippet}...")
+        if learning.get("snippet"):
+            click.echo(f"  {learning['snippet']}")
 
 
 @learnings.command("categories")
@@ -242,17 +173,11 @@ def list_categories():
     """
     List all learning categories.
     """
-    learnings_dir = Path(".claude/learnings")
-    index_file = learnings_dir / "index.yaml"
-
-    if not index_file.exists():
+    if not Path(".claude/learnings").exists():
         click.echo("No learnings captured yet.")
         return
 
-    with open(index_file) as f:
-        index = yaml.safe_load(f)
-
-    categories = index.get("categories", {})
+    categories = _get_skill().category_counts()
 
     if not categories:
         click.echo("No categories found.")
@@ -261,8 +186,8 @@ def list_categories():
     click.echo("Learning Categories")
     click.echo("-" * 30)
 
-    for category, learning_ids in sorted(categories.items()):
-        click.echo(f"  {category}: {len(learning_ids)} learning(s)")
+    for category, count in sorted(categories.items()):
+        click.echo(f"  {category}: {count} learning(s)")
 
 
 @learnings.command("export")
@@ -282,12 +207,7 @@ def export_learnings(format: str, output: str):
         click.echo("No learnings to export.")
         return
 
-    all_learnings = []
-    for learning_file in learnings_dir.glob("*.yaml"):
-        if learning_file.name == "index.yaml":
-            continue
-        with open(learning_file) as f:
-            all_learnings.append(yaml.safe_load(f))
+    all_learnings = _get_skill().get_all()
 
     if not all_learnings:
         click.echo("No learnings to export.")
@@ -310,6 +230,30 @@ def export_learnings(format: str, output: str):
         click.echo(content)
 
 
+@learnings.command("context")
+@click.argument("task")
+@click.option("--max-tokens", type=int, default=1000, show_default=True, help="Token budget")
+@click.option("--category", "-c", multiple=True, help="Only include these categories")
+@click.option("--limit", "-n", type=int, default=20, help="Maximum number of learnings")
+def context_for_task(task: str, max_tokens: int, category: tuple, limit: int):
+    """
+    Print the learnings most relevant to a task, within a token budget.
+
+    Near-duplicate learnings are included once; long learnings are
+    shortened to their summary when their full text doesn't fit.
+
+    Examples:
+        trustable-ai learnings context "add a pipeline stage" --max-tokens 500
+    """
+    if not Path(".claude/learnings").exists():
+        click.echo("No learnings captured yet.")
+        return
+
+    click.echo(_get_skill().export_for_context(
+        categories=list(category) or None, max_entries=limit, task=task, max_tokens=max_tokens
+    ))
+
+
 def _export_markdown(learnings: list) -> str:
     """Export learnings as markdown."""
     lines = ["# Institutional Knowledge\n"]
@@ -334,3 +278,13 @@ def _export_markdown(learnings: list) -> str:
                 lines.append(f"*Source: {learning['source']}*\n")
 
     return "\n".join(lines)
+
+
+def _get_skill():
+    """Initialized learnings skill for .claude/learnings."""
+    from skills.learnings import LearningsSkill
+
+    skill = LearningsSkill({"learnings_dir": ".claude/learnings"})
+    if not skill.initialize():
+        raise click.ClickException(f"Could not open learnings: {getattr(skill, '_last_error', 'unknown error')}")
+    return skill
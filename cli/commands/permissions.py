@@ -8,9 +8,24 @@ import json
 from pathlib import Path
 from typing import Dict, List, Tuple, Set, Any
 
+from cli.permission_matcher import PermissionRules, dangerous_matcher, keyword_matcher
 from cli.platform_detector import PlatformDetector
 
 
+# Commands that should probably require approval rather than be auto-approved
+SHOULD_ASK_COMMANDS = (
+    "git push",
+    "npm publish",
+    "docker push",
+    "kubectl apply",
+    "terraform apply",
+    "az webapp",
+    "curl",
+    "wget",
+    "ssh",
+)
+
+
 class PermissionsValidator:
     """
     Validate Claude Code permissions configuration.
@@ -25,7 +40,7 @@ class PermissionsValidator:
 
     def __init__(self):
         """Initialize validator with platform detector."""
-        self._detector = PlatformDetector()
+        self._detector = PlatformDetector.cached()
         self._platform_info = self._detector.detect_platform()
 
     def validate_file(self, settings_path: Path) -> Tuple[bool, List[str], List[str]]:
@@ -255,27 +270,20 @@ class PermissionsValidator:
         """
         warnings: List[str] = []
 
-        # Get dangerous patterns from platform detector
-        dangerous_patterns = self._detector.get_dangerous_patterns()
+        # One automaton over the platform's dangerous commands, built once
+        matcher = dangerous_matcher(self._detector)
 
-        # Flatten all dangerous patterns
-        all_dangerous: List[str] = []
-        for category in dangerous_patterns.values():
-            all_dangerous.extend(category)
-
-        # Check if any dangerous patterns are in allow list
         for allowed_pattern in permissions["allow"]:
             # Skip non-string patterns (already reported as errors)
             if not isinstance(allowed_pattern, str):
                 continue
 
-            for dangerous_cmd in all_dangerous:
-                if dangerous_cmd in allowed_pattern:
-                    warnings.append(
-                        f"Unsafe pattern in allow list: '{allowed_pattern}' "
-                        f"(contains dangerous command: '{dangerous_cmd}')"
-                    )
-                    break
+            dangerous_cmd = matcher.first(allowed_pattern)
+            if dangerous_cmd:
+                warnings.append(
+                    f"Unsafe pattern in allow list: '{allowed_pattern}' "
+                    f"(contains dangerous command: '{dangerous_cmd}')"
+                )
 
         return warnings
 
@@ -292,32 +300,18 @@ class PermissionsValidator:
             List of warning messages
         """
         warnings: List[str] = []
-
-        # Patterns that should probably require approval
-        should_ask = [
-            "git push",
-            "npm publish",
-            "docker push",
-            "kubectl apply",
-            "terraform apply",
-            "az webapp",
-            "curl",
-            "wget",
-            "ssh",
-        ]
+        matcher = keyword_matcher(SHOULD_ASK_COMMANDS)
 
         for pattern in permissions["allow"]:
             # Skip non-string patterns (already reported as errors)
             if not isinstance(pattern, str):
                 continue
 
-            for risky_cmd in should_ask:
-                if risky_cmd in pattern:
-                    warnings.append(
-                        f"Overly permissive pattern in allow list: '{pattern}' "
-                        f"(consider moving to ask list for approval)"
-                    )
-                    break
+            if matcher.first(pattern):
+                warnings.append(
+                    f"Overly permissive pattern in allow list: '{pattern}' "
+                    f"(consider moving to ask list for approval)"
+                )
 
         return warnings
 
@@ -480,6 +474,68 @@ def validate_permissions(settings_path: Path = None):
         sys.exit(0)
 
 
+@click.command(name="check")
+@click.argument("commands", nargs=-1)
+@click.option(
+    "--file",
+    "-f",
+    "commands_file",
+    type=click.File("r"),
+    default=None,
+    help="Read commands from a file, one per line ('-' for stdin)",
+)
+@click.option(
+    "--settings-path",
+    type=click.Path(exists=False, path_type=Path),
+    default=None,
+    help="Path to settings.local.json (default: .claude/settings.local.json)",
+)
+def check_commands(commands: Tuple[str, ...], commands_file, settings_path: Path = None):
+    """
+    Show which permission rule decides each command.
+
+    Useful for auditing the commands in agent transcripts against the
+    configured rules. Deny beats ask beats allow; commands no rule matches
+    are asked about.
+
+    Examples:
+        trustable-ai permissions check "git status" "git push origin main"
+        trustable-ai permissions check --file commands.txt
+    """
+    import sys
+
+    if settings_path is None:
+        settings_path = Path.cwd() / ".claude" / "settings.local.json"
+
+    try:
+        with settings_path.open("r") as f:
+            permissions = json.load(f).get("permissions", {})
+    except (OSError, json.JSONDecodeError) as e:
+        click.echo(f"❌ Could not read permissions from {settings_path}: {e}")
+        sys.exit(2)
+
+    candidates = list(commands)
+    if commands_file:
+        candidates.extend(line.strip() for line in commands_file if line.strip())
+    if not candidates:
+        click.echo("No commands to check.")
+        return
+
+    rules = PermissionRules(permissions)
+    icons = {"allow": "✅", "ask": "❓", "deny": "⛔"}
+    totals = {"allow": 0, "ask": 0, "deny": 0}
+
+    for command in candidates:
+        match = rules.decide(command)
+        decision = match.decision if match else "ask"
+        totals[decision] += 1
+        source = match.rule if match else "no matching rule"
+        click.echo(f"{icons[decision]} {decision:<5} {command}  ({source})")
+
+    click.echo("")
+    click.echo(f"📊 {totals['allow']} allowed, {totals['ask']} ask, {totals['deny']} denied")
+
+
 # Create permissions command group
 @click.group(name="permissions")
 def permissions_command():
@@ -493,5 +549,6 @@ def permissions_command():
     pass
 
 
-# Register validate subcommand
+# Register subcommands
 permissions_command.add_command(validate_permissions)
+permissions_command.add_command(check_commands)
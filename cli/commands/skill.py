@@ -46,11 +46,13 @@ def list_skills(verbose: bool):
 
         for name in sorted(skill_names):
             if verbose:
-                info = registry.get_skill_info(name)
+                info = registry.get_skill_info(name, check_prerequisites=True)
                 if info:
                     click.echo(f"\n{name}")
                     click.echo(f"  Description: {info.get('description', 'N/A')}")
                     click.echo(f"  Version: {info.get('version', 'N/A')}")
+                    if info.get("source") not in (None, "builtin"):
+                        click.echo(f"  Provided by: {info['source']}")
 
                     prereqs = info.get("prerequisites", {})
                     if prereqs.get("satisfied"):
@@ -83,7 +85,7 @@ def skill_info(skill_name: str):
         from skills.registry import get_registry
 
         registry = get_registry()
-        info = registry.get_skill_info(skill_name)
+        info = registry.get_skill_info(skill_name, check_prerequisites=True)
 
         if not info:
             click.echo(f"Skill not found: {skill_name}")
@@ -94,6 +96,9 @@ def skill_info(skill_name: str):
         click.echo("=" * 50)
         click.echo(f"Description: {info.get('description', 'N/A')}")
         click.echo(f"Version: {info.get('version', 'N/A')}")
+        click.echo(f"Module: {info.get('module', 'N/A')}")
+        if info.get("source") not in (None, "builtin"):
+            click.echo(f"Provided by: {info['source']}")
         click.echo(f"Initialized: {info.get('initialized', False)}")
 
         # Show documentation path
@@ -14,7 +14,9 @@ import yaml
 @click.option("--workflows", is_flag=True, help="Show active workflows")
 @click.option("--sprints", is_flag=True, help="Show sprint status")
 @click.option("--all", "show_all", is_flag=True, help="Show all status information")
-def status(workflows: bool, sprints: bool, show_all: bool):
+@click.option("--refresh", is_flag=True,
+              help="Discard cached Azure DevOps metadata (sprints, repositories, pipelines, user) and fetch it again")
+def status(workflows: bool, sprints: bool, show_all: bool, refresh: bool):
     """
     Show Trustable AI status and active workflows.
 
@@ -23,6 +25,9 @@ def status(workflows: bool, sprints: bool, show_all: bool):
     - Enabled agents
     - Active workflows
     - Sprint status (if configured)
+
+    Azure DevOps sprints come from the wrapper's metadata cache in
+    .claude/cache/; --refresh fetches them again.
     """
     if show_all:
         workflows = sprints = True
@@ -37,18 +42,18 @@ def status(workflows: bool, sprints: bool, show_all: bool):
         return
 
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        from config import load_config
+        config = load_config()
     except Exception as e:
         click.echo(f"\n✗ Error loading config: {e}")
         return
 
     # Project info
-    project = config.get("project", {})
-    click.echo(f"\nProject: {project.get('name', 'Unknown')}")
-    click.echo(f"Type: {project.get('type', 'Unknown')}")
+    project = config.project
+    click.echo(f"\nProject: {project.name}")
+    click.echo(f"Type: {project.type}")
 
-    tech_stack = project.get("tech_stack", {})
+    tech_stack = project.tech_stack
     if tech_stack:
         languages = tech_stack.get("languages", [])
         frameworks = tech_stack.get("frameworks", [])
@@ -58,28 +63,34 @@ def status(workflows: bool, sprints: bool, show_all: bool):
             click.echo(f"Frameworks: {', '.join(frameworks)}")
 
     # Work tracking
-    work_tracking = config.get("work_tracking", {})
-    platform = work_tracking.get("platform", "file-based")
+    work_tracking = config.work_tracking
+    platform = work_tracking.platform
     click.echo(f"\nWork Tracking: {platform}")
     if platform == "azure-devops":
-        org = work_tracking.get("organization", "Not set")
-        project_name = work_tracking.get("project", "Not set")
-        click.echo(f"  Organization: {org}")
-        click.echo(f"  Project: {project_name}")
+        click.echo(f"  Organization: {work_tracking.organization or 'Not set'}")
+        click.echo(f"  Project: {work_tracking.project or 'Not set'}")
+
+    azure = None
+    if platform == "azure-devops" and (refresh or sprints):
+        try:
+            from skills.azure_devops.cli_wrapper import AzureCLI
+            azure = AzureCLI(refresh_metadata=refresh)
+            if refresh:
+                click.echo("  ✓ Cached metadata discarded; it will be fetched again")
+        except Exception as e:
+            click.echo(f"  ✗ Azure DevOps unavailable: {e}")
 
     # Enabled agents
-    agent_config = config.get("agent_config", {})
-    enabled_agents = agent_config.get("enabled_agents", [])
+    enabled_agents = config.agent_config.enabled_agents
     click.echo(f"\nEnabled Agents: {len(enabled_agents)}")
     for agent in enabled_agents:
         click.echo(f"  - {agent}")
 
     # Quality standards
-    quality = config.get("quality_standards", {})
-    if quality:
-        click.echo("\nQuality Standards:")
-        click.echo(f"  Test Coverage: {quality.get('test_coverage_min', 80)}% min")
-        click.echo(f"  Critical Vulns: {quality.get('critical_vulnerabilities_max', 0)} max")
+    quality = config.quality_standards
+    click.echo("\nQuality Standards:")
+    click.echo(f"  Test Coverage: {quality.test_coverage_min}% min")
+    click.echo(f"  Critical Vulns: {quality.critical_vulnerabilities_max} max")
 
     # Active workflows
     if workflows or show_all:
@@ -154,7 +165,9 @@ def status(workflows: bool, sprints: bool, show_all: bool):
                 click.echo("\n  No sprints directory")
         else:
             # Azure DevOps or not configured
-            if platform == "azure-devops":
+            if azure is not None:
+                _show_azure_sprints(azure)
+            elif platform == "azure-devops":
                 click.echo("\n  Use 'az boards iteration' to view sprints")
             else:
                 click.echo("\n  No work items configured")
@@ -167,3 +180,24 @@ def status(workflows: bool, sprints: bool, show_all: bool):
             click.echo(f"\nProfiling: {profile_count} profile(s) recorded")
 
     click.echo("")
+
+
+def _show_azure_sprints(azure) -> None:
+    """List Azure DevOps iterations with their dates."""
+    try:
+        iterations = azure.list_iterations()
+    except Exception as e:
+        click.echo(f"\n  ✗ Could not list sprints: {e}")
+        return
+
+    if not iterations:
+        click.echo("\n  No sprints defined")
+        return
+
+    for iteration in iterations:
+        click.echo(f"\n  {iteration.get('name', 'Unknown')}")
+        attributes = iteration.get("attributes") or {}
+        if attributes.get("startDate"):
+            click.echo(f"    Start: {attributes['startDate'][:10]}")
+        if attributes.get("finishDate"):
+            click.echo(f"    End: {attributes['finishDate'][:10]}")
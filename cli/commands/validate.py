@@ -11,13 +11,14 @@ from agents import AgentRegistry
 @click.command(name="validate")
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
 @click.option("--docs", is_flag=True, help="Validate CLAUDE.md documentation files")
-def validate_command(verbose: bool, docs: bool):
+@click.option("--changed-since", metavar="GIT_REF", help="With --docs, only validate documentation affected by changes since GIT_REF")
+def validate_command(verbose: bool, docs: bool, changed_since: str):
     """Validate framework configuration and setup."""
 
     # If --docs flag, validate documentation and exit
     if docs:
         from cli.commands.validate_docs import validate_documentation
-        exit_code = validate_documentation()
+        exit_code = validate_documentation(changed_since=changed_since)
         raise SystemExit(exit_code)
 
     click.echo("\n🔍 Validating Trustable AI setup\n")
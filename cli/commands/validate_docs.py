@@ -6,14 +6,41 @@ Validates CLAUDE.md files for:
 - Problem-focused language (not feature-focused)
 - Freshness (updated when code changes)
 - VISION.md references where applicable
+
+CLAUDE.md files are found with the pruned repository scanner, so ignored
+and dependency directories are never walked. A file's result is cached
+under .claude/cache/ keyed by its content hash and the mtimes of its
+Python siblings (what the freshness check depends on), so unchanged files
+are skipped. Files that do need validating are spread over a process pool
+when there are enough of them.
+
+Usage:
+    trustable-ai validate --docs
+    trustable-ai validate --docs --changed-since origin/main
 """
 
+import hashlib
+import json
+import os
 import re
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Any, List, Dict, Optional, Set, Tuple
 import yaml
 from datetime import datetime
 
+from core.repo_scanner import scan_tree
+
+
+CACHE_PATH = Path(".claude") / "cache" / "docs-validation.json"
+
+# Bump when validation rules change, so cached results are discarded
+CACHE_VERSION = 1
+
+# Below this many files to validate, a process pool costs more than it saves
+PARALLEL_THRESHOLD = 8
+
 
 class ValidationResult:
     """Result of a documentation validation check."""
@@ -40,22 +67,120 @@ class DocumentationValidator:
     # Required front matter fields
     REQUIRED_FIELDS = ["purpose", "problem_solved", "keywords", "task_types"]
 
-    def __init__(self, project_root: Path):
-        self.project_root = project_root
+    def __init__(self, project_root: Path, use_cache: bool = True, max_workers: Optional[int] = None):
+        """
+        Initialize validator.
+
+        Args:
+            project_root: Project to validate
+            use_cache: Reuse results for unchanged files (only when the
+                project has a .claude directory)
+            max_workers: Process pool size (defaults to the CPU count)
+        """
+        self.project_root = Path(project_root)
         self.results: List[ValidationResult] = []
-
-    def validate_all(self) -> List[ValidationResult]:
-        """Validate all CLAUDE.md files in the project."""
-        claude_files = list(self.project_root.glob("**/CLAUDE.md"))
-
-        for claude_file in claude_files:
-            result = self.validate_file(claude_file)
-            self.results.append(result)
-
+        self.use_cache = use_cache
+        self.max_workers = max_workers
+        self.cache_hits = 0
+
+    def validate_all(self, changed_since: Optional[str] = None) -> List[ValidationResult]:
+        """
+        Validate all CLAUDE.md files in the project.
+
+        Args:
+            changed_since: Git ref; only validate CLAUDE.md files that, or
+                whose Python siblings, changed since it (including
+                uncommitted and untracked changes)
+
+        Returns:
+            Results sorted by path
+
+        Raises:
+            RuntimeError: If changed_since is given and git can't diff against it
+        """
+        changed = self._changed_paths(changed_since) if changed_since else None
+
+        # path -> {python sibling name: mtime_ns}
+        targets: Dict[Path, Dict[str, int]] = {}
+        for directory in scan_tree(self.project_root):
+            if "CLAUDE.md" not in directory.files:
+                continue
+            siblings = [name for name in directory.files if name.endswith(".py")]
+            if changed is not None:
+                relative = "" if directory.relative_path == "." else directory.relative_path + "/"
+                if not any(relative + name in changed for name in siblings + ["CLAUDE.md"]):
+                    continue
+            targets[directory.path / "CLAUDE.md"] = self._mtimes(directory.path, siblings)
+
+        cache = self._load_cache()
+        entries = cache["files"] if cache is not None else {}
+        keys: Dict[Path, str] = {}
+        misses: List[Path] = []
+        results: Dict[Path, ValidationResult] = {}
+        for file_path, sibling_mtimes in targets.items():
+            relative = file_path.relative_to(self.project_root).as_posix()
+            keys[file_path] = self._cache_key(file_path, sibling_mtimes)
+            cached = entries.get(relative)
+            if cached and cached["key"] == keys[file_path]:
+                results[file_path] = ValidationResult(
+                    file_path, cached["passed"], cached["errors"], cached["warnings"]
+                )
+                self.cache_hits += 1
+            else:
+                misses.append(file_path)
+
+        for file_path, result in zip(misses, self._validate_many(misses, targets)):
+            results[file_path] = result
+            entries[file_path.relative_to(self.project_root).as_posix()] = {
+                "key": keys[file_path],
+                "passed": result.passed,
+                "errors": result.errors,
+                "warnings": result.warnings,
+            }
+
+        if cache is not None and misses:
+            self._save_cache(cache)
+
+        self.results.extend(results[file_path] for file_path in sorted(results))
         return self.results
 
-    def validate_file(self, file_path: Path) -> ValidationResult:
-        """Validate a single CLAUDE.md file."""
+    def _validate_many(
+        self,
+        file_paths: List[Path],
+        targets: Dict[Path, Dict[str, int]]
+    ) -> List[ValidationResult]:
+        """Validate files, on a process pool when there are enough of them."""
+        if len(file_paths) >= PARALLEL_THRESHOLD and self.max_workers != 1:
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    return list(executor.map(
+                        _validate_in_worker,
+                        [str(self.project_root)] * len(file_paths),
+                        [str(file_path) for file_path in file_paths],
+                        [targets[file_path] for file_path in file_paths],
+                        chunksize=max(len(file_paths) // (4 * (self.max_workers or os.cpu_count() or 1)), 1),
+                    ))
+            except (OSError, RuntimeError):
+                # No process support (e.g., restricted sandbox); validate here instead
+                pass
+        return [self.validate_file(file_path, targets[file_path]) for file_path in file_paths]
+
+    def validate_file(
+        self,
+        file_path: Path,
+        sibling_mtimes: Optional[Dict[str, int]] = None
+    ) -> ValidationResult:
+        """
+        Validate a single CLAUDE.md file.
+
+        Args:
+            file_path: CLAUDE.md to validate
+            sibling_mtimes: Python files next to it and their mtimes (ns),
+                if already known
+
+        Returns:
+            ValidationResult
+        """
         errors = []
         warnings = []
 
@@ -83,7 +208,7 @@ class DocumentationValidator:
             warnings.extend(vision_warnings)
 
             # Check freshness (if related code files modified recently)
-            freshness_warnings = self._check_freshness(file_path)
+            freshness_warnings = self._check_freshness(file_path, sibling_mtimes)
             warnings.extend(freshness_warnings)
 
         except Exception as e:
@@ -191,34 +316,98 @@ class DocumentationValidator:
 
         return warnings
 
-    def _check_freshness(self, claude_file: Path) -> List[str]:
+    def _check_freshness(self, claude_file: Path, sibling_mtimes: Optional[Dict[str, int]] = None) -> List[str]:
         """Check if CLAUDE.md is stale compared to related code files."""
         warnings = []
 
-        # Get directory containing this CLAUDE.md
-        directory = claude_file.parent
+        # Python files in the same directory, each stat'ed once
+        if sibling_mtimes is None:
+            directory = claude_file.parent
+            sibling_mtimes = self._mtimes(directory, [f.name for f in directory.glob("*.py")])
 
-        # Find Python files in same directory
-        py_files = list(directory.glob("*.py"))
-
-        if not py_files:
+        if not sibling_mtimes:
             return warnings
 
-        # Get modification times
-        claude_mtime = claude_file.stat().st_mtime
-        newest_py_mtime = max(f.stat().st_mtime for f in py_files)
+        newest_py_name = max(sibling_mtimes, key=sibling_mtimes.__getitem__)
+        claude_mtime = claude_file.stat().st_mtime_ns
 
         # If any Python file is newer than CLAUDE.md by more than 7 days, warn
-        time_diff_days = (newest_py_mtime - claude_mtime) / (60 * 60 * 24)
+        time_diff_days = (sibling_mtimes[newest_py_name] - claude_mtime) / (1e9 * 60 * 60 * 24)
 
         if time_diff_days > 7:
-            newest_py_file = max(py_files, key=lambda f: f.stat().st_mtime)
             warnings.append(
-                f"Potentially stale: {newest_py_file.name} modified {int(time_diff_days)} days after CLAUDE.md"
+                f"Potentially stale: {newest_py_name} modified {int(time_diff_days)} days after CLAUDE.md"
             )
 
         return warnings
 
+    @staticmethod
+    def _mtimes(directory: Path, names: List[str]) -> Dict[str, int]:
+        mtimes = {}
+        for name in names:
+            try:
+                mtimes[name] = (directory / name).stat().st_mtime_ns
+            except OSError:
+                continue
+        return mtimes
+
+    def _cache_key(self, file_path: Path, sibling_mtimes: Dict[str, int]) -> str:
+        """Hash of what a file's result depends on: its content, its mtime and its siblings' mtimes."""
+        digest = hashlib.sha256()
+        try:
+            digest.update(file_path.read_bytes())
+            digest.update(str(file_path.stat().st_mtime_ns).encode())
+        except OSError:
+            return ""
+        digest.update(json.dumps(sorted(sibling_mtimes.items())).encode())
+        return digest.hexdigest()
+
+    def _load_cache(self) -> Optional[Dict[str, Any]]:
+        """Cached results, or None when caching is off or there's no .claude directory."""
+        if not self.use_cache or not (self.project_root / ".claude").is_dir():
+            return None
+        try:
+            cache = json.loads((self.project_root / CACHE_PATH).read_text(encoding="utf-8"))
+            if cache.get("version") == CACHE_VERSION and isinstance(cache.get("files"), dict):
+                return cache
+        except (OSError, ValueError):
+            pass
+        return {"version": CACHE_VERSION, "files": {}}
+
+    def _save_cache(self, cache: Dict[str, Any]) -> None:
+        cache_path = self.project_root / CACHE_PATH
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    def _changed_paths(self, ref: str) -> Set[str]:
+        """
+        Project-relative paths changed since a git ref, plus untracked files.
+
+        Raises:
+            RuntimeError: If git fails (e.g., unknown ref or not a repository)
+        """
+        commands = [
+            ["git", "diff", "--name-only", "--relative", ref, "--"],
+            ["git", "ls-files", "--others", "--exclude-standard"],
+        ]
+        changed: Set[str] = set()
+        for command in commands:
+            try:
+                result = subprocess.run(
+                    command, cwd=self.project_root, capture_output=True, text=True, timeout=30
+                )
+            except (OSError, subprocess.TimeoutExpired) as e:
+                raise RuntimeError(f"Could not run git: {e}")
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.strip() or f"git failed: {' '.join(command)}")
+            changed.update(line.strip() for line in result.stdout.splitlines() if line.strip())
+        return changed
+
     def print_report(self):
         """Print validation report."""
         total = len(self.results)
@@ -231,6 +420,8 @@ class DocumentationValidator:
         print(f"\nTotal files: {total}")
         print(f"✅ Passed: {passed}")
         print(f"❌ Failed: {failed}")
+        if self.cache_hits:
+            print(f"♻️  Unchanged since last run: {self.cache_hits}")
 
         if failed > 0:
             print("\n" + "-" * 80)
@@ -272,10 +463,20 @@ class DocumentationValidator:
         print("=" * 80 + "\n")
 
 
-def validate_documentation(project_root: Path = None) -> int:
+def _validate_in_worker(project_root: str, file_path: str, sibling_mtimes: Dict[str, int]) -> ValidationResult:
+    """Process pool entry point: validate one file."""
+    return DocumentationValidator(Path(project_root)).validate_file(Path(file_path), sibling_mtimes)
+
+
+def validate_documentation(project_root: Path = None, changed_since: Optional[str] = None) -> int:
     """
     Validate all CLAUDE.md files in the project.
 
+    Args:
+        project_root: Project to validate (defaults to cwd)
+        changed_since: Git ref; only validate documentation affected by
+            changes since it
+
     Returns:
         int: Exit code (0 if all pass, 1 if any fail)
     """
@@ -283,7 +484,11 @@ def validate_documentation(project_root: Path = None) -> int:
         project_root = Path.cwd()
 
     validator = DocumentationValidator(project_root)
-    validator.validate_all()
+    try:
+        validator.validate_all(changed_since=changed_since)
+    except RuntimeError as e:
+        print(f"❌ Cannot determine changes since {changed_since}: {e}")
+        return 1
     validator.print_report()
 
     # Exit code: 0 if all passed, 1 if any failed
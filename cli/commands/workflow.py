@@ -7,6 +7,7 @@ from typing import Optional
 
 from config import load_config
 from workflows import WorkflowRegistry
+from cli.render_output import echo_render_results
 
 
 @click.group(name="workflow")
@@ -71,8 +72,14 @@ def render_workflow(workflow_name: str, output: Optional[str], show: bool):
 
 @workflow_command.command(name="render-all")
 @click.option("--output-dir", "-o", type=click.Path(), default=".claude/commands", help="Output directory")
-def render_all_workflows(output_dir: str):
-    """Render all workflows."""
+@click.option("--force", is_flag=True, help="Re-render even if templates and config are unchanged")
+def render_all_workflows(output_dir: str, force: bool):
+    """
+    Render all workflows.
+
+    Only workflows whose template, included templates or config changed
+    since the last render are re-rendered (tracked in .claude/render-manifest.json).
+    """
     try:
         config = load_config()
         registry = WorkflowRegistry(config)
@@ -82,9 +89,9 @@ def render_all_workflows(output_dir: str):
 
         click.echo(f"\n📝 Rendering {len(workflows)} workflows to {output_path}\n")
 
-        for workflow_name in workflows:
-            output_file = registry.save_rendered_workflow(workflow_name, output_path)
-            click.echo(f"  ✓ {workflow_name} → {output_file}")
+        results = registry.save_rendered_workflows(workflows, output_path, force=force)
+        if not echo_render_results(results):
+            raise SystemExit(1)
 
         click.echo(f"\n✅ All workflows rendered successfully.\n")
 
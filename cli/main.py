@@ -3,17 +3,87 @@ Main CLI entry point for Trustable AI.
 
 Provides commands for initializing, configuring, and managing AI-assisted
 software development workflows.
+
+Command modules are imported only when their command is invoked (agents
+shell out to this CLI many times per workflow, and the modules pull in
+jinja2, pydantic, yaml and the Azure DevOps wrapper). ``--help`` uses the
+short help recorded in LAZY_COMMANDS, so it imports none of them.
 """
+import importlib
+from typing import Dict, List, Optional, Tuple
+
 import click
-from pathlib import Path
-try:
-    from importlib.metadata import version
-except ImportError:
-    from importlib_metadata import version  # Python 3.7 compatibility
 
 
-@click.group()
-@click.version_option(version=version("trustable-ai"), prog_name="trustable-ai")
+# Command name -> (module relative to this package, attribute, short help)
+LAZY_COMMANDS: Dict[str, Tuple[str, str, str]] = {
+    "init": (".commands.init", "init_command", "Initialize Trustable AI in your project."),
+    "configure": (".commands.configure", "configure_command", "Configure work tracking and other settings."),
+    "agent": (".commands.agent", "agent_command", "Manage workflow agents (render templates for use with Claude Code)."),
+    "workflow": (".commands.workflow", "workflow_command", "Manage workflows (render templates for use with Claude Code)."),
+    "validate": (".commands.validate", "validate_command", "Validate framework configuration and setup."),
+    "doctor": (".commands.doctor", "doctor", "Run health checks on Trustable AI installation."),
+    "status": (".commands.status", "status", "Show Trustable AI status and active workflows."),
+    "learnings": (".commands.learnings", "learnings", "Manage institutional knowledge and learnings."),
+    "context": (".commands.context", "context", "Manage context index and optimization."),
+    "skill": (".commands.skill", "skill", "Manage framework skills."),
+    "permissions": (".commands.permissions", "permissions_command", "Manage Claude Code permissions configuration."),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module on first use."""
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, Tuple[str, str, str]]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = self._load(cmd_name)
+        return command
+
+    def _load(self, cmd_name: str) -> click.Command:
+        module_name, attribute, _ = self.lazy_commands[cmd_name]
+        command = getattr(importlib.import_module(module_name, __package__), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{module_name}.{attribute} is not a click command")
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """List commands without importing the ones that haven't been loaded."""
+        rows = []
+        limit = formatter.width - 6 - max(map(len, self.list_commands(ctx)), default=0)
+        for name in self.list_commands(ctx):
+            command = self.commands.get(name)
+            if command is not None:
+                if command.hidden:
+                    continue
+                help_text = command.get_short_help_str(limit=limit)
+            else:
+                help_text = _truncate(self.lazy_commands[name][2], limit)
+            rows.append((name, help_text))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten help text to limit characters at a word boundary, like Click's short help."""
+    if len(text) <= limit:
+        return text
+    words = text[:max(limit - 3, 0)].rsplit(" ", 1)[0]
+    return words.rstrip(" .,;:") + "..."
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
+@click.version_option(package_name="trustable-ai", prog_name="trustable-ai")
 def cli():
     """
     Trustable AI - AI-assisted software lifecycle automation.
@@ -34,25 +104,5 @@ def cli():
     pass
 
 
-# Import commands
-from .commands import init, configure, agent, workflow, validate
-from .commands import doctor, status, learnings, context, skill, permissions
-
-# Register core commands
-cli.add_command(init.init_command)
-cli.add_command(configure.configure_command)
-cli.add_command(agent.agent_command)
-cli.add_command(workflow.workflow_command)
-cli.add_command(validate.validate_command)
-
-# Register new commands
-cli.add_command(doctor.doctor)
-cli.add_command(status.status)
-cli.add_command(learnings.learnings)
-cli.add_command(context.context)
-cli.add_command(skill.skill)
-cli.add_command(permissions.permissions_command)
-
-
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,252 @@
+"""
+Compiled Permission Matching.
+
+Two matchers replace the nested pattern-by-keyword scans of permission
+validation and generation:
+
+- KeywordMatcher: an Aho-Corasick automaton over a keyword list (e.g., the
+  platform's dangerous commands). One pass over a text finds every
+  keyword it contains. Matchers are built once per keyword list and cached,
+  so each platform's dangerous-command list is compiled once.
+- PermissionRules: allow/deny/ask rules ("Bash(git push:*)") compiled into
+  a character trie. ``decide`` walks a command once and answers which rule
+  wins: deny beats ask beats allow, and within a list the longest prefix
+  wins. Rules with wildcards other than a trailing ``:*`` fall back to a
+  regex check.
+
+Usage:
+    from cli.permission_matcher import PermissionRules, dangerous_matcher
+
+    rules = PermissionRules(settings["permissions"])
+    match = rules.decide("git push origin main")
+    print(match.decision, match.rule)   # ask Bash(git push:*)
+
+    matcher = dangerous_matcher(PlatformDetector())
+    print(matcher.first("Bash(sudo rm -rf:*)"))   # rm -rf
+"""
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Sequence, Tuple
+
+
+# Later decisions in this tuple lose to earlier ones
+DECISION_PRECEDENCE = ("deny", "ask", "allow")
+
+RULE_PATTERN = re.compile(r"^Bash\((.*?)(:\*)?\)$", re.DOTALL)
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton finding every keyword in a text in one pass."""
+
+    def __init__(self, keywords: Sequence[str]):
+        """
+        Build the automaton.
+
+        Args:
+            keywords: Keywords to find; their order decides ``first``
+        """
+        self.keywords = list(keywords)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for index, keyword in enumerate(self.keywords):
+            if not keyword:
+                continue
+            node = 0
+            for char in keyword:
+                child = self._goto[node].get(char)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[node][char] = child
+                node = child
+            self._output[node].append(index)
+
+        # Breadth-first, so every node's failure link is final before its children's
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Yield every keyword occurrence in a text.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            (start offset, keyword index) pairs, in order of where they end
+        """
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for index in self._output[node]:
+                yield position - len(self.keywords[index]) + 1, index
+
+    def first(self, text: str) -> Optional[str]:
+        """
+        The earliest-listed keyword that occurs in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Keyword, or None if the text contains none
+        """
+        best: Optional[int] = None
+        for _, index in self.iter_matches(text):
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+        return self.keywords[best] if best is not None else None
+
+    def matches(self, text: str) -> List[str]:
+        """Every distinct keyword occurring in a text, in keyword order."""
+        return [self.keywords[index] for index in sorted({index for _, index in self.iter_matches(text)})]
+
+
+@lru_cache(maxsize=None)
+def keyword_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """
+    Shared matcher for a keyword list, built on first use.
+
+    Args:
+        keywords: Keywords (a tuple, so it can key the cache)
+
+    Returns:
+        KeywordMatcher
+    """
+    return KeywordMatcher(keywords)
+
+
+def dangerous_matcher(detector: Any) -> KeywordMatcher:
+    """
+    Matcher over every dangerous command pattern of the detector's platform.
+
+    Args:
+        detector: PlatformDetector
+
+    Returns:
+        KeywordMatcher with the patterns in category order
+    """
+    dangerous = detector.get_dangerous_patterns()
+    return keyword_matcher(tuple(command for commands in dangerous.values() for command in commands))
+
+
+@dataclass
+class RuleMatch:
+    """The rule that decides a command."""
+    decision: str  # "allow", "deny" or "ask"
+    rule: str
+    length: int  # Characters of the command the rule's prefix covers
+
+
+class _TrieNode:
+    __slots__ = ("children", "prefix_rules", "exact_rules")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.prefix_rules: Dict[str, str] = {}  # decision -> first rule with this prefix
+        self.exact_rules: Dict[str, str] = {}
+
+
+def _wildcard_regex(command: str, prefix: bool) -> Pattern:
+    body = ".*".join(re.escape(part) for part in command.split("*"))
+    return re.compile(body + (".*" if prefix else "") + r"\Z", re.DOTALL)
+
+
+class PermissionRules:
+    """Allow/deny/ask rules compiled for matching commands."""
+
+    def __init__(self, permissions: Dict[str, List[Any]]):
+        """
+        Compile rules.
+
+        Args:
+            permissions: Dict with "allow", "deny" and "ask" lists of
+                Claude Code rules. Non-Bash rules and non-strings are ignored.
+        """
+        self._root = _TrieNode()
+        self._wildcards: List[Tuple[Pattern, str, str, int]] = []
+
+        for decision in DECISION_PRECEDENCE:
+            for rule in permissions.get(decision) or []:
+                parsed = RULE_PATTERN.match(rule) if isinstance(rule, str) else None
+                if not parsed:
+                    continue
+                command, is_prefix = parsed.group(1), bool(parsed.group(2))
+                if "*" in command:
+                    literal = len(command.split("*", 1)[0])
+                    self._wildcards.append((_wildcard_regex(command, is_prefix), decision, rule, literal))
+                    continue
+
+                node = self._root
+                for char in command:
+                    node = node.children.setdefault(char, _TrieNode())
+                rules = node.prefix_rules if is_prefix else node.exact_rules
+                rules.setdefault(decision, rule)
+
+    def candidates(self, command: str) -> List[RuleMatch]:
+        """
+        Every rule matching a command.
+
+        Args:
+            command: Shell command
+
+        Returns:
+            Matching rules (unordered)
+        """
+        command = command.strip()
+        found: List[RuleMatch] = []
+
+        node = self._root
+        for depth in range(len(command) + 1):
+            for decision, rule in node.prefix_rules.items():
+                found.append(RuleMatch(decision, rule, depth))
+            if depth == len(command):
+                for decision, rule in node.exact_rules.items():
+                    found.append(RuleMatch(decision, rule, depth))
+                break
+            node = node.children.get(command[depth])
+            if node is None:
+                break
+
+        for regex, decision, rule, literal in self._wildcards:
+            if regex.match(command):
+                found.append(RuleMatch(decision, rule, literal))
+        return found
+
+    def decide(self, command: str) -> Optional[RuleMatch]:
+        """
+        The rule that wins for a command.
+
+        Deny beats ask beats allow; among rules of the same list, the one
+        covering more of the command wins.
+
+        Args:
+            command: Shell command
+
+        Returns:
+            Winning rule, or None if no rule matches (Claude Code then asks)
+        """
+        found = self.candidates(command)
+        if not found:
+            return None
+        return min(found, key=lambda match: (DECISION_PRECEDENCE.index(match.decision), -match.length))
@@ -20,9 +20,21 @@ import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 
+from cli.permission_matcher import keyword_matcher
 from cli.platform_detector import PlatformDetector
 
 
+# Markers of destructive commands that are denied outright (others are asked)
+DENY_MARKERS = (
+    "rm -rf /",  # Delete root
+    "--force",  # Force operations
+    "--hard",  # Hard resets
+    "delete",  # Deletions (work items, resources)
+    "/s /q",  # Windows recursive delete
+    "-Recurse -Force",  # PowerShell recursive force delete
+)
+
+
 class PermissionsTemplateGenerator:
     """
     Generate Claude Code permission templates based on platform and workflow mode.
@@ -240,21 +252,12 @@ class PermissionsTemplateGenerator:
         # Only include truly destructive operations in deny list
         # Other dangerous operations should be in "ask" list
         destructive_commands = dangerous_patterns.get("destructive", [])
+        matcher = keyword_matcher(DENY_MARKERS)
 
         for command in destructive_commands:
             # Include only the most dangerous destructive commands in deny
             # Others will be in "ask" for user discretion
-            if any(
-                dangerous in command
-                for dangerous in [
-                    "rm -rf /",  # Delete root
-                    "--force",  # Force operations
-                    "--hard",  # Hard resets
-                    "delete",  # Deletions (work items, resources)
-                    "/s /q",  # Windows recursive delete
-                    "-Recurse -Force",  # PowerShell recursive force delete
-                ]
-            ):
+            if matcher.first(command):
                 deny_patterns.append(f"Bash({command}:*)")
 
         # Sort and deduplicate
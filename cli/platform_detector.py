@@ -13,12 +13,50 @@ Usage:
 
     patterns = detector.get_command_patterns()
     # Returns: {"git": ["git status", "git diff"], ...}
+
+Probing reads /proc and checks interop binaries, so CLI commands use
+``PlatformDetector.cached()``: the detected platform is kept as a snapshot
+keyed by a fingerprint of the OS, kernel release, hostname, architecture
+and the environment variables detection depends on. Snapshots are shared
+within a process and, in projects with a .claude directory, stored in
+``.claude/cache/platform.json``. Command and dangerous patterns are
+memoized per platform.
+
+    detector = PlatformDetector.cached()
 """
 
+import hashlib
+import json
 import platform
 import os
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+
+SNAPSHOT_CACHE_PATH = Path(".claude") / "cache" / "platform.json"
+
+# Environment variables that change what detection reports
+SNAPSHOT_ENV_VARS = ("SHELL", "WSL_DISTRO_NAME", "WSL_INTEROP", "COMSPEC")
+
+_snapshots: Dict[str, Dict[str, Any]] = {}
+
+
+def platform_fingerprint() -> str:
+    """
+    Fingerprint of what platform detection depends on.
+
+    Returns:
+        Hex digest over OS, kernel release, hostname, architecture and
+        SNAPSHOT_ENV_VARS
+    """
+    data = [
+        platform.system(),
+        platform.release(),
+        platform.node(),
+        platform.machine(),
+        {name: os.environ.get(name) for name in SNAPSHOT_ENV_VARS},
+    ]
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
 
 
 class PlatformDetector:
@@ -32,10 +70,73 @@ class PlatformDetector:
     - Support platform-specific command pattern generation
     """
 
+    # (detector class, kind, os, is_wsl) -> patterns; the patterns only depend on these
+    _pattern_cache: Dict[Tuple[type, str, str, bool], Dict[str, List[str]]] = {}
+
     def __init__(self) -> None:
         """Initialize platform detector."""
         self._platform_info: Optional[Dict[str, Any]] = None
 
+    @classmethod
+    def cached(cls, project_root: Optional[Path] = None) -> "PlatformDetector":
+        """
+        Detector seeded from the platform snapshot, probing only on a miss.
+
+        Args:
+            project_root: Project whose .claude/cache holds the snapshot on
+                disk. Defaults to cwd; without a .claude directory the
+                snapshot is only kept for this process.
+
+        Returns:
+            PlatformDetector (a new instance; changing its platform info
+            doesn't affect other detectors)
+        """
+        fingerprint = platform_fingerprint()
+        snapshot = _snapshots.get(fingerprint)
+
+        cache_path = None
+        project_root = Path(project_root) if project_root else Path.cwd()
+        if (project_root / ".claude").is_dir():
+            cache_path = project_root / SNAPSHOT_CACHE_PATH
+
+        if snapshot is None and cache_path:
+            try:
+                data = json.loads(cache_path.read_text(encoding="utf-8"))
+                if data.get("fingerprint") == fingerprint:
+                    snapshot = data["platform"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+        if snapshot is None:
+            snapshot = cls()._probe()
+            if cache_path:
+                try:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = cache_path.with_suffix(".tmp")
+                    tmp_path.write_text(
+                        json.dumps({"fingerprint": fingerprint, "platform": snapshot}, indent=2),
+                        encoding="utf-8",
+                    )
+                    os.replace(tmp_path, cache_path)
+                except OSError:
+                    pass
+        _snapshots[fingerprint] = snapshot
+
+        detector = cls()
+        detector._platform_info = json.loads(json.dumps(snapshot))
+        return detector
+
+    def _memoized(self, kind: str, build) -> Dict[str, List[str]]:
+        """Patterns of a kind for this detector's platform, built once per platform."""
+        platform_info = self.detect_platform()
+        key = (type(self), kind, platform_info["os"], bool(platform_info.get("is_wsl")))
+        patterns = self._pattern_cache.get(key)
+        if patterns is None:
+            patterns = build(platform_info["os"], bool(platform_info.get("is_wsl")))
+            self._pattern_cache[key] = patterns
+        # Copies, so callers can't change the memoized lists
+        return {category: list(commands) for category, commands in patterns.items()}
+
     def detect_platform(self) -> Dict[str, Any]:
         """
         Detect current OS platform and environment.
@@ -52,9 +153,12 @@ class PlatformDetector:
             >>> detector.detect_platform()
             {"os": "Linux", "is_wsl": True, "shell": "bash", "platform_specific": {...}}
         """
-        if self._platform_info is not None:
-            return self._platform_info
+        if self._platform_info is None:
+            self._platform_info = self._probe()
+        return self._platform_info
 
+    def _probe(self) -> Dict[str, Any]:
+        """Inspect the running system (the uncached part of detect_platform)."""
         os_name = platform.system()
         is_wsl = self._is_wsl()
 
@@ -68,15 +172,13 @@ class PlatformDetector:
             # Linux/WSL
             shell = os.environ.get("SHELL", "/bin/bash").split("/")[-1]
 
-        self._platform_info = {
+        return {
             "os": os_name,
             "is_wsl": is_wsl,
             "shell": shell,
             "platform_specific": self._get_platform_specific_info(os_name, is_wsl),
         }
 
-        return self._platform_info
-
     def _is_wsl(self) -> bool:
         """
         Detect if running in Windows Subsystem for Linux.
@@ -181,10 +283,9 @@ class PlatformDetector:
             >>> patterns["git"]
             ["git status", "git diff", "git log", ...]
         """
-        platform_info = self.detect_platform()
-        os_name = platform_info["os"]
-        is_wsl = platform_info["is_wsl"]
+        return self._memoized("command", self._build_command_patterns)
 
+    def _build_command_patterns(self, os_name: str, is_wsl: bool) -> Dict[str, List[str]]:
         patterns: Dict[str, List[str]] = {}
 
         # Git patterns (safe read-only and local operations)
@@ -317,9 +418,9 @@ class PlatformDetector:
             >>> dangerous["destructive"]
             ["rm -rf", "git push --force", ...]
         """
-        platform_info = self.detect_platform()
-        os_name = platform_info["os"]
+        return self._memoized("dangerous", self._build_dangerous_patterns)
 
+    def _build_dangerous_patterns(self, os_name: str, is_wsl: bool) -> Dict[str, List[str]]:
         patterns: Dict[str, List[str]] = {
             "destructive": self._get_destructive_patterns(os_name),
             "production": self._get_production_patterns(),
@@ -0,0 +1,56 @@
+"""
+Render Output for TAID CLI.
+
+Prints the results of rendering agents, slash commands and workflows
+through the render manifest (core.render_manifest.render_all), so
+'agent', 'workflow' and 'init' report rendering the same way.
+
+Usage:
+    from cli.render_output import echo_render_results
+
+    results = registry.save_rendered_agents(agents, Path(".claude/agents"))
+    if not echo_render_results(results):
+        raise SystemExit(1)
+"""
+
+from pathlib import Path
+from typing import List
+
+import click
+
+from core.render_manifest import FAILED, WRITTEN, RenderResult
+
+
+def echo_render_results(results: List[RenderResult], prefix: str = "", indent: str = "  ") -> bool:
+    """
+    Print one line per render result and a summary.
+
+    Args:
+        results: Results from render_all (or a registry's save_* method)
+        prefix: Prefix for result names (e.g., "/" for slash commands)
+        indent: Indentation of each line
+
+    Returns:
+        True if every output rendered (or was already up to date)
+    """
+    written = 0
+    for result in results:
+        if result.status == FAILED:
+            click.echo(f"{indent}✗ {prefix}{result.name}: {type(result.error).__name__}: {result.error}")
+        elif result.status == WRITTEN:
+            written += 1
+            click.echo(f"{indent}✓ {prefix}{result.name} → {_display_path(result.output_path)}")
+        else:
+            click.echo(f"{indent}· {prefix}{result.name} (up to date)")
+
+    failed = sum(result.status == FAILED for result in results)
+    click.echo(f"\n{indent}{written} written, {len(results) - written - failed} up to date, {failed} failed")
+    return not failed
+
+
+def _display_path(path: Path) -> Path:
+    """Path relative to cwd when it's inside it."""
+    try:
+        return Path(path).resolve().relative_to(Path.cwd())
+    except ValueError:
+        return path
@@ -1,7 +1,7 @@
 """Configuration management for Trustable AI Workbench."""
 
-from .schema import FrameworkConfig, ProjectConfig, WorkTrackingConfig, QualityStandards
-from .loader import load_config, ConfigLoader, create_default_config, save_config
+from .schema import FrameworkConfig, ProjectConfig, WorkTrackingConfig, QualityStandards, FrozenConfigError
+from .loader import load_config, ConfigLoader, create_default_config, save_config, invalidate_config_cache
 from .test_taxonomy import (
     TEST_TAXONOMY,
     get_test_levels,
@@ -22,7 +22,9 @@ __all__ = [
     "ProjectConfig",
     "WorkTrackingConfig",
     "QualityStandards",
+    "FrozenConfigError",
     "load_config",
+    "invalidate_config_cache",
     "ConfigLoader",
     "create_default_config",
     "save_config",
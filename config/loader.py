@@ -2,11 +2,19 @@
 Configuration loader for Trustable AI Workbench.
 
 Loads configuration from YAML files with environment variable support.
+
+load_config() caches the validated configuration per process, keyed by the
+file's path, modification time and size and the values of the environment
+variables it references, so the many adapters, registries and commands
+that load configuration in one workflow parse and validate it once. The
+cached configuration is shared and frozen (see schema.py).
 """
 import os
 import re
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import yaml
 
 from .schema import FrameworkConfig
@@ -74,6 +82,18 @@ class ConfigLoader:
             FileNotFoundError: If config file doesn't exist
             yaml.YAMLError: If YAML is invalid
         """
+        return self.parse(self.read_text())
+
+    def read_text(self) -> str:
+        """
+        Read the configuration file.
+
+        Returns:
+            File content
+
+        Raises:
+            FileNotFoundError: If config file doesn't exist
+        """
         if not self.config_path.exists():
             raise FileNotFoundError(
                 f"Configuration file not found: {self.config_path}\n"
@@ -81,11 +101,37 @@ class ConfigLoader:
             )
 
         with open(self.config_path, "r") as f:
-            raw_config = yaml.safe_load(f)
+            return f.read()
+
+    def parse(self, text: str) -> Dict[str, Any]:
+        """
+        Parse configuration YAML and expand environment variables.
+
+        Args:
+            text: YAML content
+
+        Returns:
+            Raw configuration dictionary
+        """
+        raw_config = yaml.safe_load(text)
 
         # Expand environment variables
         return self._expand_env_vars(raw_config)
 
+    @classmethod
+    def referenced_env_vars(cls, text: str) -> Tuple[str, ...]:
+        """
+        Names of the environment variables a configuration references.
+
+        Args:
+            text: YAML content
+
+        Returns:
+            Sorted variable names
+        """
+        names = {match.split(":-", 1)[0].strip() for match in cls.ENV_VAR_PATTERN.findall(text)}
+        return tuple(sorted(names))
+
     def load(self) -> FrameworkConfig:
         """
         Load and validate configuration.
@@ -109,6 +155,7 @@ class ConfigLoader:
         """
         # Ensure directory exists
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        invalidate_config_cache(self.config_path)
 
         # Convert to dict and save
         config_dict = config.model_dump(exclude_none=True)
@@ -122,6 +169,8 @@ class ConfigLoader:
                 indent=2
             )
 
+        invalidate_config_cache(self.config_path)
+
     def merge_with_defaults(self, user_config: Dict[str, Any], defaults: Dict[str, Any]) -> Dict[str, Any]:
         """
         Merge user configuration with defaults.
@@ -146,12 +195,34 @@ class ConfigLoader:
         return merged
 
 
-def load_config(config_path: Optional[Path] = None) -> FrameworkConfig:
+@dataclass
+class _CachedConfig:
+    """A validated configuration and what it was loaded from."""
+    stamp: Tuple[int, int]          # (mtime_ns, size) of the file
+    env_vars: Tuple[str, ...]       # Referenced environment variables
+    env_values: Tuple[Optional[str], ...]
+    config: FrameworkConfig
+
+
+_config_cache: Dict[Path, _CachedConfig] = {}
+_config_cache_lock = threading.Lock()
+
+
+def _env_values(names: Tuple[str, ...]) -> Tuple[Optional[str], ...]:
+    return tuple(os.environ.get(name) for name in names)
+
+
+def load_config(config_path: Optional[Path] = None, mutable: bool = False) -> FrameworkConfig:
     """
     Load framework configuration.
 
+    The configuration is parsed and validated once per process and reused
+    until the file or a referenced environment variable changes.
+
     Args:
         config_path: Path to config.yaml (defaults to .claude/config.yaml)
+        mutable: Return an editable copy instead of the shared, frozen
+            configuration (use when changing and saving configuration)
 
     Returns:
         Validated FrameworkConfig instance
@@ -161,7 +232,44 @@ def load_config(config_path: Optional[Path] = None) -> FrameworkConfig:
         ValidationError: If configuration is invalid
     """
     loader = ConfigLoader(config_path)
-    return loader.load()
+    path = loader.config_path.resolve()
+
+    try:
+        stat = path.stat()
+    except OSError:
+        stat = None
+
+    config = None
+    if stat is not None:
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with _config_cache_lock:
+            cached = _config_cache.get(path)
+        if cached and cached.stamp == stamp and cached.env_values == _env_values(cached.env_vars):
+            config = cached.config
+
+    if config is None:
+        text = loader.read_text()
+        env_vars = loader.referenced_env_vars(text)
+        config = FrameworkConfig(**loader.parse(text)).freeze()
+        if stat is not None:
+            with _config_cache_lock:
+                _config_cache[path] = _CachedConfig(stamp, env_vars, _env_values(env_vars), config)
+
+    return config.mutable_copy() if mutable else config
+
+
+def invalidate_config_cache(config_path: Optional[Path] = None) -> None:
+    """
+    Drop cached configuration so the next load_config() re-reads it.
+
+    Args:
+        config_path: Configuration file to drop (None drops everything)
+    """
+    with _config_cache_lock:
+        if config_path is None:
+            _config_cache.clear()
+        else:
+            _config_cache.pop(Path(config_path).resolve(), None)
 
 
 def create_default_config(
@@ -2,13 +2,119 @@
 Configuration schema for Trustable AI.
 
 Defines Pydantic models for type-safe configuration validation.
+
+Configuration returned by load_config() is shared across the process and
+frozen: assigning a field, or mutating a list or dict inside it, raises
+FrozenConfigError. Use mutable_copy() (or load_config(mutable=True)) to
+get an editable copy before changing and saving configuration.
 """
+import copy
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from pathlib import Path
 
 
-class ProjectConfig(BaseModel):
+class FrozenConfigError(TypeError):
+    """Raised when modifying a frozen (shared) configuration."""
+
+
+def _frozen_error(*args, **kwargs):
+    raise FrozenConfigError(
+        "Configuration is shared and read-only; "
+        "use config.mutable_copy() or load_config(mutable=True) to modify it"
+    )
+
+
+class FrozenList(list):
+    """List that rejects modification; copies are plain lists."""
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _frozen_error
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _frozen_error
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(item, memo) for item in self]
+
+
+class FrozenDict(dict):
+    """Dict that rejects modification; copies are plain dicts."""
+
+    __setitem__ = __delitem__ = __ior__ = _frozen_error
+    clear = pop = popitem = setdefault = update = _frozen_error
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+
+def _freeze_value(value: Any) -> Any:
+    if isinstance(value, ConfigModel):
+        return value.freeze()
+    if isinstance(value, list):
+        return FrozenList(_freeze_value(item) for item in value)
+    if isinstance(value, dict):
+        return FrozenDict((key, _freeze_value(item)) for key, item in value.items())
+    return value
+
+
+class ConfigModel(BaseModel):
+    """Base for configuration models; instances can be frozen in place."""
+
+    _frozen: bool = PrivateAttr(default=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if not name.startswith("_") and self._frozen:
+            _frozen_error()
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if not name.startswith("_") and self._frozen:
+            _frozen_error()
+        super().__delattr__(name)
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether this configuration is read-only."""
+        return self._frozen
+
+    def freeze(self) -> "ConfigModel":
+        """
+        Make this configuration (and everything in it) read-only.
+
+        Returns:
+            self
+        """
+        for name, value in list(self.__dict__.items()):
+            self.__dict__[name] = _freeze_value(value)
+        if self.__pydantic_extra__:
+            for name, value in list(self.__pydantic_extra__.items()):
+                self.__pydantic_extra__[name] = _freeze_value(value)
+        self._frozen = True
+        return self
+
+    def mutable_copy(self) -> "ConfigModel":
+        """
+        Get an editable deep copy of this configuration.
+
+        Returns:
+            Unfrozen copy
+        """
+        duplicate = self.model_copy(deep=True)
+        duplicate._thaw()
+        return duplicate
+
+    def _thaw(self) -> None:
+        self._frozen = False
+        for value in list(self.__dict__.values()) + list((self.__pydantic_extra__ or {}).values()):
+            if isinstance(value, ConfigModel):
+                value._thaw()
+
+
+class ProjectConfig(ConfigModel):
     """Project-specific configuration."""
 
     name: str = Field(..., description="Project name")
@@ -43,7 +149,7 @@ class ProjectConfig(BaseModel):
         return v
 
 
-class WorkTrackingConfig(BaseModel):
+class WorkTrackingConfig(ConfigModel):
     """Work tracking platform configuration."""
 
     platform: str = Field(
@@ -107,7 +213,7 @@ class WorkTrackingConfig(BaseModel):
         return v
 
 
-class QualityStandards(BaseModel):
+class QualityStandards(ConfigModel):
     """Quality and security standards configuration."""
 
     # Test coverage
@@ -161,7 +267,7 @@ class QualityStandards(BaseModel):
     )
 
 
-class AgentConfig(BaseModel):
+class AgentConfig(ConfigModel):
     """Agent configuration."""
 
     # Model selection for different agent types
@@ -225,7 +331,7 @@ class AgentConfig(BaseModel):
     )
 
 
-class WorkflowConfig(BaseModel):
+class WorkflowConfig(ConfigModel):
     """Workflow execution configuration."""
 
     state_directory: str = Field(
@@ -256,7 +362,7 @@ class WorkflowConfig(BaseModel):
     )
 
 
-class DeploymentConfig(BaseModel):
+class DeploymentConfig(ConfigModel):
     """Deployment configuration."""
 
     environments: List[str] = Field(
@@ -282,7 +388,7 @@ class DeploymentConfig(BaseModel):
     )
 
 
-class FrameworkConfig(BaseModel):
+class FrameworkConfig(ConfigModel):
     """Complete framework configuration."""
 
     project: ProjectConfig
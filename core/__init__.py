@@ -15,6 +15,9 @@ from .context_loader import (
     get_context_summary
 )
 from .directed_loader import DirectedContextLoader
+from .context_index import ContextIndex
+from .context_pruner import ContextPruner
+from .usage_analytics import UsageAnalytics
 from .optimized_loader import OptimizedContextLoader
 
 __all__ = [
@@ -33,4 +36,7 @@ __all__ = [
     "get_context_summary",
     "DirectedContextLoader",
     "OptimizedContextLoader",
+    "ContextIndex",
+    "ContextPruner",
+    "UsageAnalytics",
 ]
@@ -0,0 +1,242 @@
+"""
+Context Deduplication
+
+Drops paragraphs and code blocks that were already emitted earlier in a
+combined context. CLAUDE.md files generated by ``context generate`` repeat
+the same tech-stack, conventions and boilerplate paragraphs at every level
+of the hierarchy; only the first copy is worth sending to an agent.
+
+Exact repeats are caught by a normalized fingerprint. Near-duplicates
+(reworded or lightly edited copies) are caught by MinHash signatures over
+word shingles, with locality-sensitive hashing bands so each paragraph is
+only compared against likely matches.
+
+Usage:
+    from core.context_dedup import ContentDeduplicator
+
+    dedup = ContentDeduplicator()
+    combined = [dedup.filter(text) for text in texts_root_to_leaf]
+    print(f"Saved ~{dedup.tokens_saved} tokens")
+"""
+
+import hashlib
+import random
+import re
+import zlib
+from typing import Dict, List, Set, Tuple
+
+
+FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+WORD_PATTERN = re.compile(r'\w+')
+
+# Paragraphs shorter than this are too generic (separators, short labels) to dedupe
+MIN_DEDUP_CHARS = 40
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def fingerprint(paragraph: str) -> str:
+    """Whitespace- and case-insensitive fingerprint of a paragraph."""
+    normalized = " ".join(paragraph.split()).lower()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """
+    Split markdown into paragraphs, keeping fenced code blocks whole.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        Paragraphs without surrounding blank lines
+    """
+    paragraphs = []
+    current: List[str] = []
+    in_fence = False
+
+    for line in text.splitlines():
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        if not in_fence and not line.strip():
+            if current:
+                paragraphs.append("\n".join(current))
+                current = []
+            continue
+        current.append(line)
+
+    if current:
+        paragraphs.append("\n".join(current))
+    return paragraphs
+
+
+class ContentDeduplicator:
+    """
+    Tracks emitted paragraphs and recognizes exact and near-duplicates.
+
+    A paragraph is a near-duplicate when the estimated Jaccard similarity
+    of its word shingles with an emitted paragraph reaches ``threshold``.
+    Paragraphs with fewer words than a shingle are only matched exactly.
+    """
+
+    CHARS_PER_TOKEN = 4.0
+
+    def __init__(
+        self,
+        threshold: float = 0.75,
+        shingle_size: int = 3,
+        num_permutations: int = 64,
+        bands: int = 16
+    ):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity for a near-duplicate
+            shingle_size: Words per shingle
+            num_permutations: MinHash signature length
+            bands: LSH bands (must divide num_permutations)
+        """
+        if num_permutations % bands:
+            raise ValueError("bands must divide num_permutations")
+
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.bands = bands
+        self.rows = num_permutations // bands
+
+        # Fixed seed so signatures are stable across runs
+        rng = random.Random(num_permutations)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_permutations)
+        ]
+
+        self._fingerprints: Set[str] = set()
+        self._signatures: List[Tuple[int, ...]] = []
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+
+        self.duplicates_removed = 0
+        self.tokens_saved = 0
+
+    def is_duplicate(self, paragraph: str) -> bool:
+        """
+        Check whether a paragraph repeats one already added.
+
+        Args:
+            paragraph: Paragraph or code block
+
+        Returns:
+            True for an exact or near-duplicate
+        """
+        if len(paragraph) < MIN_DEDUP_CHARS:
+            return False
+        if fingerprint(paragraph) in self._fingerprints:
+            return True
+
+        signature = self._signature(paragraph)
+        if signature is None:
+            return False
+
+        candidates = set()
+        for band in self._bands(signature):
+            candidates.update(self._buckets.get(band, ()))
+
+        return any(self._similarity(signature, self._signatures[i]) >= self.threshold for i in candidates)
+
+    def add(self, paragraph: str) -> None:
+        """
+        Record a paragraph as emitted.
+
+        Args:
+            paragraph: Paragraph or code block
+        """
+        if len(paragraph) < MIN_DEDUP_CHARS:
+            return
+        self._fingerprints.add(fingerprint(paragraph))
+
+        signature = self._signature(paragraph)
+        if signature is None:
+            return
+        self._signatures.append(signature)
+        for band in self._bands(signature):
+            self._buckets.setdefault(band, []).append(len(self._signatures) - 1)
+
+    def dedupe(self, text: str) -> Tuple[List[str], List[str]]:
+        """
+        Split text into new and duplicate paragraphs without recording anything.
+
+        Exact repeats within the text itself also count as duplicates.
+
+        Args:
+            text: Markdown text
+
+        Returns:
+            Tuple of (kept paragraphs, removed paragraphs)
+        """
+        kept, removed = [], []
+        local: Set[str] = set()
+        for paragraph in split_paragraphs(text):
+            key = fingerprint(paragraph) if len(paragraph) >= MIN_DEDUP_CHARS else None
+            if key in local or self.is_duplicate(paragraph):
+                removed.append(paragraph)
+                continue
+            if key:
+                local.add(key)
+            kept.append(paragraph)
+        return kept, removed
+
+    def record(self, kept: List[str], removed: List[str]) -> None:
+        """
+        Record the result of ``dedupe`` once its text is actually emitted.
+
+        Args:
+            kept: Paragraphs that were emitted
+            removed: Paragraphs that were dropped as duplicates
+        """
+        for paragraph in kept:
+            self.add(paragraph)
+        self.duplicates_removed += len(removed)
+        self.tokens_saved += sum(self.estimate_tokens(p + "\n\n") for p in removed)
+
+    def filter(self, text: str) -> str:
+        """
+        Remove paragraphs already emitted and record the rest.
+
+        Args:
+            text: Markdown text, processed in order after earlier calls
+
+        Returns:
+            Text without duplicate paragraphs
+        """
+        kept, removed = self.dedupe(text)
+        self.record(kept, removed)
+        return "\n\n".join(kept)
+
+    def estimate_tokens(self, text: str) -> int:
+        """Estimate tokens from character count."""
+        return int(len(text) / self.CHARS_PER_TOKEN)
+
+    def _signature(self, paragraph: str):
+        """MinHash signature of a paragraph's word shingles (None if too short)."""
+        words = WORD_PATTERN.findall(paragraph.lower())
+        if len(words) < self.shingle_size:
+            return None
+
+        hashes = {
+            zlib.crc32(" ".join(words[i:i + self.shingle_size]).encode("utf-8"))
+            for i in range(len(words) - self.shingle_size + 1)
+        }
+        return tuple(
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes) & _MAX_HASH
+            for a, b in self._permutations
+        )
+
+    def _bands(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    @staticmethod
+    def _similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        return sum(a == b for a, b in zip(first, second)) / len(first)
@@ -0,0 +1,461 @@
+"""
+Inverted Index for Context Lookup
+
+Maintains an on-disk inverted index over CLAUDE.md and README.md files so that
+context lookups rank files with BM25 instead of counting raw keyword hits.
+
+Each term maps to postings of ``{path: [positions]}``. Term frequency is the
+number of positions, and positions enable exact phrase matching. Documents can
+be added, replaced or removed individually, and each document records the
+mtime/size/hash of its source file so ``sync`` only re-reads changed files.
+
+Usage:
+    from core.context_index import ContextIndex
+
+    index = ContextIndex()
+    index.add_document("tests/CLAUDE.md", content, doc_type="claude_md")
+    index.save(Path(".claude/context-search-index.json"))
+
+    index = ContextIndex.load(Path(".claude/context-search-index.json"))
+    for path, score in index.search('write "integration test" fixtures', limit=5):
+        print(path, score)
+"""
+
+import hashlib
+import json
+import math
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+DEFAULT_INDEX_PATH = Path(".claude") / "context-search-index.json"
+
+STOP_WORDS = frozenset({
+    "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
+    "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "must", "shall", "can", "need", "dare",
+    "ought", "used", "to", "of", "in", "for", "on", "with", "at", "by",
+    "from", "as", "into", "through", "during", "before", "after",
+    "above", "below", "between", "under", "again", "further", "then",
+    "once", "here", "there", "when", "where", "why", "how", "all",
+    "each", "few", "more", "most", "other", "some", "such", "no", "nor",
+    "not", "only", "own", "same", "so", "than", "too", "very", "just",
+    "and", "but", "if", "or", "because", "until", "while", "this",
+    "that", "these", "those", "it", "its", "you", "your", "we", "our"
+})
+
+TOKEN_PATTERN = re.compile(r'\b[a-zA-Z][a-zA-Z0-9_-]{2,}\b')
+PHRASE_PATTERN = re.compile(r'"([^"]+)"')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase index terms, preserving order.
+
+    Stop words and tokens shorter than three characters are dropped.
+    Positions in the returned list are the positions stored in postings.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms in document order
+    """
+    return [
+        word for word in TOKEN_PATTERN.findall(text.lower())
+        if word not in STOP_WORDS
+    ]
+
+
+class ContextIndex:
+    """
+    Inverted index with BM25 ranking and phrase support.
+
+    Persisted as JSON with the structure:
+    ```json
+    {
+      "version": 1,
+      "documents": {"tests/CLAUDE.md": {"length": 120, "type": "claude_md"}},
+      "postings": {"pytest": {"tests/CLAUDE.md": [4, 17]}}
+    }
+    ```
+    """
+
+    VERSION = 1
+
+    # Standard Okapi BM25 parameters
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.postings: Dict[str, Dict[str, List[int]]] = {}
+        self._total_length = 0
+        self._norms: Optional[Dict[str, float]] = None
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.documents
+
+    @property
+    def average_length(self) -> float:
+        """Average document length in terms."""
+        if not self.documents:
+            return 0.0
+        return self._total_length / len(self.documents)
+
+    def add_document(
+        self,
+        path: str,
+        text: str,
+        doc_type: str = "claude_md",
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Add or replace a document in the index.
+
+        Args:
+            path: Document path relative to the indexed root
+            text: Document content
+            doc_type: Document type (e.g., "claude_md", "readme")
+            metadata: Extra fields stored with the document (e.g., file signature)
+        """
+        if path in self.documents:
+            self.remove_document(path)
+
+        terms = tokenize(text)
+        positions: Dict[str, List[int]] = {}
+        for position, term in enumerate(terms):
+            positions.setdefault(term, []).append(position)
+
+        for term, term_positions in positions.items():
+            self.postings.setdefault(term, {})[path] = term_positions
+
+        self.documents[path] = {
+            "length": len(terms),
+            "type": doc_type,
+            "terms": list(positions),
+            "chars": len(text),
+            **(metadata or {}),
+        }
+        self._total_length += len(terms)
+        self._norms = None
+
+    def remove_document(self, path: str) -> bool:
+        """
+        Remove a document from the index.
+
+        Args:
+            path: Document path
+
+        Returns:
+            True if the document was indexed
+        """
+        doc = self.documents.pop(path, None)
+        if doc is None:
+            return False
+
+        for term in doc.get("terms", []):
+            term_postings = self.postings.get(term)
+            if term_postings is None:
+                continue
+            term_postings.pop(path, None)
+            if not term_postings:
+                del self.postings[term]
+
+        self._total_length -= doc.get("length", 0)
+        self._norms = None
+        return True
+
+    def top_terms(self, path: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Most frequent terms of a document, ties in order of first occurrence.
+
+        Args:
+            path: Document path
+            limit: Maximum number of terms
+
+        Returns:
+            List of terms
+        """
+        doc = self.documents.get(path)
+        if doc is None:
+            return []
+        terms = sorted(doc["terms"], key=lambda t: len(self.postings[t][path]), reverse=True)
+        return terms[:limit] if limit else terms
+
+    def sync(self, root: Path, files: List[Tuple[Path, str]]) -> Dict[str, List[str]]:
+        """
+        Bring the index up to date with a set of files.
+
+        Files whose mtime and size match the indexed signature are skipped
+        without being read. Files that changed on disk but hash to the same
+        content only have their signature refreshed (reported as
+        "refreshed", so callers persist the new signature and don't re-hash
+        the file next time). Indexed documents that are no longer in
+        ``files`` are removed.
+
+        Args:
+            root: Root that document paths are relative to
+            files: (path, doc_type) tuples for every file that should be indexed
+
+        Returns:
+            Dict with "added", "updated", "refreshed", "removed" and
+            "unchanged" path lists
+        """
+        root = Path(root)
+        changes: Dict[str, List[str]] = {
+            "added": [], "updated": [], "refreshed": [], "removed": [], "unchanged": []
+        }
+        seen = set()
+
+        for file_path, doc_type in files:
+            relative = str(Path(file_path).relative_to(root))
+            seen.add(relative)
+            try:
+                stat = Path(file_path).stat()
+            except OSError:
+                continue
+
+            signature = {"mtime_ns": stat.st_mtime_ns, "bytes": stat.st_size}
+            doc = self.documents.get(relative)
+            if doc and doc.get("type") == doc_type and all(
+                doc.get(key) == value for key, value in signature.items()
+            ):
+                changes["unchanged"].append(relative)
+                continue
+
+            try:
+                data = Path(file_path).read_bytes()
+                text = data.decode("utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+
+            content_hash = hashlib.sha256(data).hexdigest()
+            if doc and doc.get("type") == doc_type and doc.get("hash") == content_hash:
+                doc.update(signature)
+                changes["refreshed"].append(relative)
+                continue
+
+            changes["updated" if doc else "added"].append(relative)
+            self.add_document(relative, text, doc_type, {**signature, "hash": content_hash})
+
+        for relative in [path for path in self.documents if path not in seen]:
+            self.remove_document(relative)
+            changes["removed"].append(relative)
+
+        return changes
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        doc_type: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank documents for a query using BM25.
+
+        Bare words are OR'ed together. Double-quoted phrases must appear
+        verbatim (as consecutive terms) in a document for it to match, and
+        the phrase frequency contributes to the score like a single term.
+
+        Args:
+            query: Query text, optionally containing "quoted phrases"
+            limit: Maximum number of results
+            doc_type: Only return documents of this type
+
+        Returns:
+            List of (path, score) tuples, best match first
+        """
+        phrases = [tokenize(p) for p in PHRASE_PATTERN.findall(query)]
+        phrases = [p for p in phrases if p]
+        terms = tokenize(PHRASE_PATTERN.sub(" ", query))
+
+        scores: Dict[str, float] = {}
+        norms = self._length_norms()
+        k1_plus_one = self.K1 + 1
+
+        for term in dict.fromkeys(terms):
+            term_postings = self.postings.get(term)
+            if not term_postings:
+                continue
+            idf = self._idf(len(term_postings))
+            for path, positions in term_postings.items():
+                frequency = len(positions)
+                weight = idf * frequency * k1_plus_one / (frequency + norms[path])
+                scores[path] = scores.get(path, 0.0) + weight
+
+        if phrases:
+            required: Optional[set] = None
+            for phrase in phrases:
+                matches = self._phrase_frequencies(phrase)
+                idf = self._idf(len(matches))
+                for path, frequency in matches.items():
+                    weight = idf * frequency * k1_plus_one / (frequency + norms[path])
+                    scores[path] = scores.get(path, 0.0) + weight
+                required = set(matches) if required is None else required & set(matches)
+            scores = {path: score for path, score in scores.items() if path in required}
+
+        if doc_type:
+            scores = {
+                path: score for path, score in scores.items()
+                if self.documents[path].get("type") == doc_type
+            }
+
+        ranked = sorted(scores.items(), key=lambda x: (-x[1], x[0]))
+        return ranked[:limit] if limit else ranked
+
+    def _idf(self, document_frequency: int) -> float:
+        """Inverse document frequency (BM25 variant, always positive)."""
+        n = len(self.documents)
+        return math.log(1 + (n - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def _length_norms(self) -> Dict[str, float]:
+        """
+        BM25 length normalization per document.
+
+        Computed once and reused until the index changes, so scoring a
+        posting is a single dict lookup.
+        """
+        if self._norms is None:
+            average = self.average_length or 1.0
+            self._norms = {
+                path: self.K1 * (1 - self.B + self.B * doc["length"] / average)
+                for path, doc in self.documents.items()
+            }
+        return self._norms
+
+    def _phrase_frequencies(self, phrase: List[str]) -> Dict[str, int]:
+        """
+        Count phrase occurrences per document using term positions.
+
+        Args:
+            phrase: Tokenized phrase
+
+        Returns:
+            Dict mapping path to number of phrase occurrences
+        """
+        first = self.postings.get(phrase[0])
+        if not first:
+            return {}
+
+        rest = []
+        for term in phrase[1:]:
+            term_postings = self.postings.get(term)
+            if not term_postings:
+                return {}
+            rest.append(term_postings)
+
+        frequencies = {}
+        for path, starts in first.items():
+            if not all(path in term_postings for term_postings in rest):
+                continue
+            following = [set(term_postings[path]) for term_postings in rest]
+            count = sum(
+                1 for start in starts
+                if all(start + offset + 1 in positions for offset, positions in enumerate(following))
+            )
+            if count:
+                frequencies[path] = count
+
+        return frequencies
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the index to a JSON-compatible dict."""
+        return {
+            "version": self.VERSION,
+            "documents": self.documents,
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ContextIndex":
+        """Create an index from a serialized dict."""
+        index = cls()
+        if data.get("version") != cls.VERSION:
+            return index
+        index.documents = data.get("documents", {})
+        index.postings = data.get("postings", {})
+        index._total_length = sum(d.get("length", 0) for d in index.documents.values())
+        return index
+
+    def save(self, path: Path = DEFAULT_INDEX_PATH) -> None:
+        """
+        Persist the index to disk.
+
+        Args:
+            path: Destination file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(self.to_dict(), separators=(",", ":")), encoding="utf-8")
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_INDEX_PATH) -> "ContextIndex":
+        """
+        Load an index from disk.
+
+        Args:
+            path: Index file
+
+        Returns:
+            Loaded index (empty if the file is missing or unreadable)
+        """
+        path = Path(path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls()
+        return cls.from_dict(data)
+
+
+_loaded_indexes: Dict[str, Tuple[Tuple[int, int], ContextIndex]] = {}
+
+
+def search_index_path(project_root: Optional[Path] = None) -> Path:
+    """
+    Location of a project's search index.
+
+    'context index' writes here and every loader reads from here, so the
+    index is always found for the root it was built from.
+
+    Args:
+        project_root: Project root directory. Defaults to cwd.
+
+    Returns:
+        Path of the search index file
+    """
+    return (Path(project_root) if project_root else Path.cwd()) / DEFAULT_INDEX_PATH
+
+
+def load_context_index(project_root: Optional[Path] = None) -> Optional[ContextIndex]:
+    """
+    Load the project's search index, reusing it while the file is unchanged.
+
+    Args:
+        project_root: Project root directory. Defaults to cwd.
+
+    Returns:
+        ContextIndex, or None if no index has been built
+    """
+    path = search_index_path(project_root)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    key = str(path.resolve())
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _loaded_indexes.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    index = ContextIndex.load(path)
+    _loaded_indexes[key] = (signature, index)
+    return index
@@ -17,8 +17,12 @@ Usage:
 from pathlib import Path
 from typing import List, Optional, Dict
 
+from .context_dedup import ContentDeduplicator
+from .context_index import load_context_index
+from .repo_scanner import find_files
 
-def load_hierarchical_context(working_dir: Path) -> str:
+
+def load_hierarchical_context(working_dir: Path, deduplicate: bool = True) -> str:
     """
     Load all relevant CLAUDE.md files for a given working directory.
 
@@ -27,6 +31,8 @@ def load_hierarchical_context(working_dir: Path) -> str:
 
     Args:
         working_dir: Directory to start from
+        deduplicate: Drop paragraphs that repeat (or nearly repeat) ones
+            already included from a file higher in the hierarchy
 
     Returns:
         Combined context from all CLAUDE.md files (root to specific)
@@ -56,17 +62,29 @@ def load_hierarchical_context(working_dir: Path) -> str:
     context.append(f"**Working Directory:** {working_dir}\n")
     context.append("")
 
+    dedup = ContentDeduplicator() if deduplicate else None
+
     for i, file in enumerate(context_files):
         level = "Root" if i == 0 else f"Level {i}"
         relative_path = file.relative_to(repo_root) if file.is_relative_to(repo_root) else file
 
+        content = file.read_text()
+        if dedup:
+            content = dedup.filter(content)
+
         context.append(f"## {level}: {relative_path}")
         context.append("")
-        context.append(file.read_text())
+        context.append(content)
         context.append("")
         context.append("---")
         context.append("")
 
+    if dedup and dedup.duplicates_removed:
+        context.append(
+            f"<!-- Deduplicated {dedup.duplicates_removed} repeated paragraphs, "
+            f"~{dedup.tokens_saved} tokens saved -->"
+        )
+
     return "\n".join(context)
 
 
@@ -74,8 +92,9 @@ def get_context_for_task(task_description: str) -> str:
     """
     Determine which CLAUDE.md files are relevant for a task.
 
-    Uses keyword matching to identify relevant directories and loads
-    their CLAUDE.md files.
+    Ranks CLAUDE.md files against the task with the BM25 search index
+    built by ``trustable-ai context index``. Without an index, falls back
+    to matching a fixed set of keywords.
 
     Args:
         task_description: Description of the task
@@ -130,12 +149,20 @@ def get_context_for_task(task_description: str) -> str:
     if root_file.exists():
         relevant_files.append(root_file)
 
-    # Find keyword matches
-    for keyword, path in keywords_to_paths.items():
-        if keyword in task_lower:
+    search_index = load_context_index()
+    if search_index:
+        # Ranked matches from the search index
+        for path, _score in search_index.search(task_description, limit=5, doc_type="claude_md"):
             file_path = Path(path)
             if file_path.exists() and file_path not in relevant_files:
                 relevant_files.append(file_path)
+    else:
+        # Find keyword matches
+        for keyword, path in keywords_to_paths.items():
+            if keyword in task_lower:
+                file_path = Path(path)
+                if file_path.exists() and file_path not in relevant_files:
+                    relevant_files.append(file_path)
 
     # Build context
     context = []
@@ -167,12 +194,8 @@ def list_available_contexts() -> Dict[str, Path]:
     repo_root = Path.cwd()
     contexts = {}
 
-    # Find all CLAUDE.md files
-    for claude_file in repo_root.rglob("CLAUDE.md"):
-        # Skip .git directory
-        if ".git" in claude_file.parts:
-            continue
-
+    # Find all CLAUDE.md files, skipping ignored directories
+    for claude_file in find_files(repo_root, {"CLAUDE.md"}):
         relative_path = claude_file.relative_to(repo_root)
         contexts[str(relative_path)] = claude_file
 
@@ -0,0 +1,351 @@
+"""
+Context Pruner
+
+Reduces the token cost of CLAUDE.md context before it is handed to an agent.
+Files are parsed into markdown sections, then pruned in stages:
+
+- Front matter (loader directives, not agent context) is removed
+- Optionally only essential sections (overview, purpose, conventions,
+  warnings, ...) are kept
+- Long code blocks are elided down to their first lines
+- Paragraphs already included from an earlier file (exact or near
+  copies, see context_dedup) are dropped, so boilerplate repeated across
+  CLAUDE.md files is only sent once
+- Each file is capped to a token budget, cutting at paragraph boundaries
+
+Usage:
+    from core.context_pruner import ContextPruner
+
+    pruner = ContextPruner()
+    content = pruner.prune_multiple_contexts([
+        {"path": Path("CLAUDE.md"), "essential_only": False, "max_tokens": 2000},
+        {"path": Path("tests/CLAUDE.md"), "essential_only": True, "max_tokens": 1000},
+    ], max_tokens=3000)
+    print(pruner.last_stats["tokens_saved"])
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .context_dedup import (
+    FENCE_PATTERN, MIN_DEDUP_CHARS, ContentDeduplicator, fingerprint, split_paragraphs
+)
+
+
+FRONT_MATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+
+# Section headings (lowercase substrings) that carry the essentials of a context file
+ESSENTIAL_HEADINGS = (
+    "overview", "purpose", "summary", "key", "important", "critical",
+    "convention", "rule", "guideline", "warning", "must", "requirement",
+    "architecture", "usage", "quick start",
+)
+
+TRUNCATION_MARKER = "<!-- Content truncated to fit token budget -->"
+
+@dataclass
+class Section:
+    """A markdown section: heading line (empty for leading text) and body."""
+    heading: str
+    level: int
+    body: str
+
+    @property
+    def title(self) -> str:
+        match = HEADING_PATTERN.match(self.heading)
+        return match.group(2) if match else ""
+
+    def text(self) -> str:
+        return f"{self.heading}\n{self.body}" if self.heading else self.body
+
+
+class ContextPruner:
+    """
+    Prunes context files to fit token budgets.
+
+    Parsed file contents are cached by (mtime_ns, size), so repeated
+    pruning of the same files doesn't re-read them.
+    """
+
+    CHARS_PER_TOKEN = 4.0
+
+    def __init__(self, max_code_block_lines: int = 15):
+        """
+        Initialize the pruner.
+
+        Args:
+            max_code_block_lines: Code blocks longer than this are elided
+                to their first lines
+        """
+        self.max_code_block_lines = max_code_block_lines
+        self.last_stats: Dict[str, Any] = {}
+        self._files: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+    def prune_multiple_contexts(
+        self,
+        context_configs: List[Dict[str, Any]],
+        max_tokens: int
+    ) -> str:
+        """
+        Prune and combine several context files within a total budget.
+
+        Files are processed in order; paragraphs repeated from an earlier
+        file are dropped. After a call, ``last_stats`` holds tokens before
+        and after pruning, tokens saved, and which files were included;
+        files left out entirely don't count towards the savings.
+
+        Args:
+            context_configs: Dicts with "path" and optional "name",
+                "essential_only" and per-file "max_tokens"
+            max_tokens: Total token budget
+
+        Returns:
+            Combined pruned content
+        """
+        seen = ContentDeduplicator()
+        parts = []
+        included = []
+        tokens_before = 0
+        tokens_after = 0
+
+        for config in context_configs:
+            path = Path(config["path"])
+            content = self._read(path)
+            if content is None:
+                continue
+
+            remaining = max_tokens - tokens_after
+            file_budget = min(config.get("max_tokens") or remaining, remaining)
+            if file_budget <= 0:
+                break
+
+            pruned = self.prune_content(
+                content,
+                essential_only=config.get("essential_only", False),
+                max_tokens=file_budget,
+                seen=seen,
+            )
+            if not pruned.strip():
+                continue
+
+            name = config.get("name", str(path))
+            parts.append(f"# Context: {name}\n{pruned}")
+            included.append(name)
+            tokens_before += self._estimate_tokens(content)
+            tokens_after += self._estimate_tokens(pruned)
+
+        self.last_stats = {
+            "tokens_before": tokens_before,
+            "tokens_after": tokens_after,
+            "tokens_saved": max(tokens_before - tokens_after, 0),
+            "included": included,
+        }
+        return "\n\n---\n\n".join(parts)
+
+    def prune_content(
+        self,
+        content: str,
+        essential_only: bool = False,
+        max_tokens: Optional[int] = None,
+        seen: Optional[ContentDeduplicator] = None
+    ) -> str:
+        """
+        Prune a single context file's content.
+
+        Args:
+            content: Raw file content (front matter allowed)
+            essential_only: Keep only the leading text and essential sections
+            max_tokens: Token cap for the result
+            seen: Deduplicator holding paragraphs already included
+                elsewhere; updated with the paragraphs this file contributes
+
+        Returns:
+            Pruned content
+        """
+        content = FRONT_MATTER_PATTERN.sub("", content, count=1)
+        sections = self.split_sections(content)
+        if essential_only:
+            sections = [s for s in sections if self._is_essential(s)]
+
+        # (text, original paragraph) pairs; headings have no original
+        entries: List[Tuple[str, Optional[str]]] = []
+        fingerprints: Set[str] = set()
+        for section in sections:
+            paragraphs = []
+            for paragraph in split_paragraphs(section.body):
+                if seen is not None and len(paragraph) >= MIN_DEDUP_CHARS:
+                    key = fingerprint(paragraph)
+                    if key in fingerprints or seen.is_duplicate(paragraph):
+                        continue
+                    fingerprints.add(key)
+                paragraphs.append((self._elide_code_block(paragraph), paragraph))
+
+            if paragraphs or not section.heading:
+                if section.heading:
+                    entries.append((section.heading, None))
+                entries.extend(paragraphs)
+
+        kept = len(entries)
+        if max_tokens is not None:
+            kept = self._fit(entries, max_tokens)
+
+        # Only paragraphs that are actually included count as seen
+        if seen is not None:
+            for _, paragraph in entries[:kept]:
+                if paragraph:
+                    seen.add(paragraph)
+
+        pruned = "\n\n".join(text for text, _ in entries[:kept])
+        if kept < len(entries):
+            if not kept and max_tokens > 0:
+                # Nothing fits whole; keep the start of the first paragraph
+                budget = max_tokens - self._estimate_tokens(TRUNCATION_MARKER + "\n\n")
+                pruned = entries[0][0][:max(int(budget * self.CHARS_PER_TOKEN), 0)]
+            pruned = f"{pruned}\n\n{TRUNCATION_MARKER}" if pruned else ""
+        return pruned
+
+    def split_sections(self, content: str) -> List[Section]:
+        """
+        Split markdown into sections at headings outside code blocks.
+
+        Args:
+            content: Markdown text
+
+        Returns:
+            Sections in document order; text before the first heading is a
+            section with an empty heading
+        """
+        sections = [Section(heading="", level=0, body="")]
+        body: List[str] = []
+        in_fence = False
+
+        for line in content.splitlines():
+            if FENCE_PATTERN.match(line):
+                in_fence = not in_fence
+            match = None if in_fence else HEADING_PATTERN.match(line)
+            if match:
+                sections[-1].body = "\n".join(body).strip("\n")
+                sections.append(Section(heading=line, level=len(match.group(1)), body=""))
+                body = []
+            else:
+                body.append(line)
+
+        sections[-1].body = "\n".join(body).strip("\n")
+        return [s for s in sections if s.heading or s.body]
+
+    def analyze_context_usage(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Report where a context file's tokens go and what pruning would save.
+
+        Args:
+            file_path: Path to a context file
+
+        Returns:
+            Dict with total tokens, per-section breakdown, code block cost,
+            tokens after essential-only pruning, and suggestions
+        """
+        content = self._read(Path(file_path))
+        if content is None:
+            return {"error": f"Cannot read context file: {file_path}"}
+
+        body = FRONT_MATTER_PATTERN.sub("", content, count=1)
+        sections = self.split_sections(body)
+        code_blocks = [p for p in split_paragraphs(body) if FENCE_PATTERN.match(p)]
+
+        total_tokens = self._estimate_tokens(content)
+        pruned_tokens = self._estimate_tokens(self.prune_content(content))
+        essential_tokens = self._estimate_tokens(self.prune_content(content, essential_only=True))
+        code_tokens = sum(self._estimate_tokens(block) for block in code_blocks)
+
+        suggestions = []
+        largest = max(sections, key=lambda s: len(s.text()), default=None)
+        if largest and self._estimate_tokens(largest.text()) > total_tokens / 2 and len(sections) > 1:
+            suggestions.append(
+                f"Section '{largest.title or '(intro)'}' is over half the file; consider moving it to a child CLAUDE.md"
+            )
+        if code_tokens > total_tokens / 3:
+            suggestions.append("Code blocks are over a third of the file; link to source files instead")
+        if not any(self._is_essential(s) for s in sections if s.heading):
+            suggestions.append("No essential sections (e.g., Overview, Conventions); essential-only loads keep just the intro")
+
+        return {
+            "path": str(file_path),
+            "total_tokens": total_tokens,
+            "pruned_tokens": pruned_tokens,
+            "essential_tokens": essential_tokens,
+            "code_blocks": len(code_blocks),
+            "code_block_tokens": code_tokens,
+            "sections": [
+                {
+                    "title": section.title or "(intro)",
+                    "tokens": self._estimate_tokens(section.text()),
+                    "essential": self._is_essential(section),
+                }
+                for section in sections
+            ],
+            "suggestions": suggestions,
+        }
+
+    def _is_essential(self, section: Section) -> bool:
+        """Leading text, the document title and sections with essential headings."""
+        if section.level <= 1:
+            return True
+        title = section.title.lower()
+        return any(keyword in title for keyword in ESSENTIAL_HEADINGS)
+
+    def _elide_code_block(self, paragraph: str) -> str:
+        """Shorten a fenced code block to its first lines."""
+        if not FENCE_PATTERN.match(paragraph):
+            return paragraph
+
+        lines = paragraph.splitlines()
+        # First line is the opening fence, last is the closing one
+        body = lines[1:-1] if len(lines) > 1 and FENCE_PATTERN.match(lines[-1]) else lines[1:]
+        if len(body) <= self.max_code_block_lines:
+            return paragraph
+
+        elided = len(body) - self.max_code_block_lines
+        return "\n".join(
+            [lines[0], *body[:self.max_code_block_lines], f"... ({elided} more lines)", lines[0].strip()[:3]]
+        )
+
+    def _fit(self, entries: List[Tuple[str, Optional[str]]], max_tokens: int) -> int:
+        """Number of leading entries that fit a token budget (with room for the truncation marker)."""
+        texts = [text for text, _ in entries]
+        if self._estimate_tokens("\n\n".join(texts)) <= max_tokens:
+            return len(texts)
+
+        budget = max_tokens - self._estimate_tokens(TRUNCATION_MARKER + "\n\n")
+        tokens = 0
+        for count, text in enumerate(texts):
+            tokens += self._estimate_tokens(text + "\n\n")
+            if tokens > budget:
+                return count
+        return len(texts)
+
+    def _read(self, path: Path) -> Optional[str]:
+        """Read a file, reusing the cached content while it is unchanged."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        key = str(path.resolve())
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._files.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        try:
+            content = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+        self._files[key] = (signature, content)
+        return content
+
+    def _estimate_tokens(self, text: str) -> int:
+        """Estimate tokens from character count."""
+        return int(len(text) / self.CHARS_PER_TOKEN)
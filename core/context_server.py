@@ -0,0 +1,386 @@
+"""
+Context Server
+
+A long-lived local process that keeps context loading state warm between
+agent spawns. Workflows that need context would otherwise start a fresh
+Python process, import the loaders, parse the search index and re-read every
+CLAUDE.md on each call; the server does that once and answers requests over
+localhost HTTP in milliseconds.
+
+The server writes its address to ``.claude/context-server.json``. The thin
+``ContextClient`` reads that file, sends requests to the server, and falls
+back to an in-process ``ContextService`` when no server is running, so
+callers get the same results either way.
+
+Usage:
+    # Terminal 1
+    trustable-ai context serve
+
+    # Anywhere in the project
+    from core.context_server import ContextClient
+
+    client = ContextClient()
+    result = client.load_for_task(task_type="sprint-planning", keywords=["azure"])
+    print(result["content"])
+"""
+
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from .context_index import load_context_index, tokenize
+from .directed_loader import DirectedContextLoader
+
+
+SERVER_INFO_PATH = Path(".claude") / "context-server.json"
+YAML_INDEX_PATH = Path(".claude") / "context-index.yaml"
+
+
+class ContextService:
+    """
+    Context loading state shared by the server and in-process fallback.
+
+    Holds a DirectedContextLoader and a content cache keyed by file mtime,
+    and tracks which files each cached entry came from so that ``refresh``
+    can invalidate only what changed on disk.
+    """
+
+    CHARS_PER_TOKEN = 4.0
+
+    def __init__(self, project_root: Optional[Path] = None):
+        """
+        Initialize the service.
+
+        Args:
+            project_root: Root directory of the project. Defaults to cwd.
+        """
+        self.project_root = Path(project_root) if project_root else Path.cwd()
+        self.loader = DirectedContextLoader(self.project_root)
+        self._files: Dict[str, Tuple[int, int, str]] = {}
+        self._loaded_signatures: Dict[Path, Optional[Tuple[int, int]]] = {}
+        self._lock = threading.RLock()
+
+    def load_for_task(
+        self,
+        task_type: Optional[str] = None,
+        keywords: Optional[List[str]] = None,
+        max_tokens: int = 8000
+    ) -> Dict[str, Any]:
+        """
+        Load directed context for a task (see DirectedContextLoader.load_for_task).
+
+        Returns:
+            Dict with content, files_loaded, tokens_used, tokens_saved and a JSON-friendly
+            "contexts" list of {path, tokens_estimated, priority}
+        """
+        with self._lock:
+            result = self.loader.load_for_task(task_type, keywords, max_tokens)
+            for path in self.loader.cached_paths():
+                if path not in self._loaded_signatures:
+                    self._loaded_signatures[path] = _signature(path)
+
+        return {
+            "content": result["content"],
+            "files_loaded": result["files_loaded"],
+            "tokens_used": result["tokens_used"],
+            "tokens_saved": result["tokens_saved"],
+            "contexts": [
+                {"path": str(ctx.path), "tokens_estimated": ctx.tokens_estimated, "priority": ctx.priority}
+                for ctx in result["contexts"]
+            ],
+        }
+
+    def rank(self, task_description: str) -> List[Tuple[str, float]]:
+        """
+        Rank indexed context files for a task, best match first.
+
+        Uses the BM25 search index when it has been built; indexes created
+        by older versions only have the keyword map, so fall back to match
+        counts.
+
+        Returns:
+            List of (path, score) tuples
+        """
+        search_index = load_context_index(self.project_root)
+        if search_index:
+            return search_index.search(task_description)
+
+        try:
+            with open(self.project_root / YAML_INDEX_PATH, encoding="utf-8") as f:
+                keyword_map = (yaml.safe_load(f) or {}).get("keywords", {})
+        except (OSError, yaml.YAMLError):
+            return []
+
+        matches: Dict[str, float] = {}
+        for keyword in dict.fromkeys(tokenize(task_description)):
+            for file_path in keyword_map.get(keyword, []):
+                matches[file_path] = matches.get(file_path, 0) + 1
+
+        return sorted(matches.items(), key=lambda x: x[1], reverse=True)
+
+    def load_for_description(
+        self,
+        task_description: str,
+        limit: int = 5,
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Load the best-ranked context files for a free-text task description.
+
+        Args:
+            task_description: Task description (may contain "quoted phrases")
+            limit: Maximum number of files to load
+            max_tokens: Optional token budget; files that don't fit are skipped
+
+        Returns:
+            Dict with "files" (path, score, tokens, content) and "tokens_used"
+        """
+        files = []
+        total_tokens = 0
+
+        for path, score in self.rank(task_description):
+            if len(files) >= limit:
+                break
+            content = self.read_file(path)
+            if content is None:
+                continue
+            tokens = int(len(content) / self.CHARS_PER_TOKEN)
+            if max_tokens is not None and total_tokens + tokens > max_tokens:
+                continue
+            files.append({"path": path, "score": score, "tokens": tokens, "content": content})
+            total_tokens += tokens
+
+        return {"files": files, "tokens_used": total_tokens}
+
+    def read_file(self, relative_path: str) -> Optional[str]:
+        """
+        Read a context file, reusing the cached text while it is unchanged.
+
+        Args:
+            relative_path: Path relative to the project root
+
+        Returns:
+            File content, or None if it can't be read
+        """
+        path = self.project_root / relative_path
+        signature = _signature(path)
+        if signature is None:
+            self._files.pop(relative_path, None)
+            return None
+
+        cached = self._files.get(relative_path)
+        if cached and cached[:2] == signature:
+            return cached[2]
+
+        try:
+            content = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        self._files[relative_path] = (*signature, content)
+        return content
+
+    def refresh(self) -> List[Path]:
+        """
+        Invalidate cached directed-loader entries whose files changed.
+
+        Returns:
+            Paths that were invalidated
+        """
+        changed = []
+        with self._lock:
+            for path, signature in list(self._loaded_signatures.items()):
+                if _signature(path) != signature:
+                    self.loader.invalidate(path)
+                    del self._loaded_signatures[path]
+                    changed.append(path)
+        return changed
+
+
+def _signature(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """JSON-over-HTTP handler dispatching to the server's ContextService."""
+
+    METHODS = {"load_for_task", "load_for_description", "rank"}
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._reply(200, {"status": "ok", "pid": os.getpid()})
+        else:
+            self._reply(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        method = self.path.strip("/")
+        if method not in self.METHODS:
+            self._reply(404, {"error": f"Unknown method: {method}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            params = json.loads(self.rfile.read(length) or b"{}")
+            result = getattr(self.server.service, method)(**params)
+        except Exception as e:
+            self._reply(400, {"error": str(e)})
+            return
+
+        self._reply(200, {"result": result})
+
+    def _reply(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        """Keep the server quiet; requests are frequent and uninteresting."""
+        pass
+
+
+class ContextServer(ThreadingHTTPServer):
+    """
+    Localhost HTTP server answering context requests from a warm ContextService.
+
+    A background thread polls the files behind cached contexts and
+    invalidates them as soon as they change.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        port: int = 0,
+        poll_interval: float = 1.0
+    ):
+        """
+        Initialize the server (bound to 127.0.0.1).
+
+        Args:
+            project_root: Root directory of the project. Defaults to cwd.
+            port: Port to listen on; 0 picks a free port
+            poll_interval: Seconds between file-change checks
+        """
+        super().__init__(("127.0.0.1", port), _RequestHandler)
+        self.service = ContextService(project_root)
+        self.poll_interval = poll_interval
+        self.info_path = self.service.project_root / SERVER_INFO_PATH
+        self._stop = threading.Event()
+        self._watcher = threading.Thread(target=self._watch, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """Publish the server address and start watching for changes."""
+        self.info_path.parent.mkdir(parents=True, exist_ok=True)
+        self.info_path.write_text(json.dumps({"url": self.url, "pid": os.getpid()}), encoding="utf-8")
+        self._watcher.start()
+
+    def stop(self) -> None:
+        """Stop watching and remove the published address."""
+        self._stop.set()
+        try:
+            info = json.loads(self.info_path.read_text(encoding="utf-8"))
+            if info.get("url") == self.url:
+                self.info_path.unlink()
+        except (OSError, ValueError):
+            pass
+        self.server_close()
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            self.service.refresh()
+
+
+class ContextClient:
+    """
+    Thin client for the context server with in-process fallback.
+
+    Each call goes to the running server if ``.claude/context-server.json``
+    points at one; otherwise (or if the server doesn't answer) the request is
+    served by a local ContextService. ``last_source`` records which was used.
+    """
+
+    def __init__(self, project_root: Optional[Path] = None, timeout: float = 2.0):
+        """
+        Initialize the client.
+
+        Args:
+            project_root: Root directory of the project. Defaults to cwd.
+            timeout: Seconds to wait for the server before falling back
+        """
+        self.project_root = Path(project_root) if project_root else Path.cwd()
+        self.timeout = timeout
+        self.last_source: Optional[str] = None
+        self._local: Optional[ContextService] = None
+
+    def load_for_task(
+        self,
+        task_type: Optional[str] = None,
+        keywords: Optional[List[str]] = None,
+        max_tokens: int = 8000
+    ) -> Dict[str, Any]:
+        """Load directed context for a task (see ContextService.load_for_task)."""
+        return self._call("load_for_task", task_type=task_type, keywords=keywords, max_tokens=max_tokens)
+
+    def load_for_description(
+        self,
+        task_description: str,
+        limit: int = 5,
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Load ranked context files for a description (see ContextService.load_for_description)."""
+        return self._call(
+            "load_for_description", task_description=task_description, limit=limit, max_tokens=max_tokens
+        )
+
+    def rank(self, task_description: str) -> List[Tuple[str, float]]:
+        """Rank indexed context files for a task (see ContextService.rank)."""
+        return [tuple(match) for match in self._call("rank", task_description=task_description)]
+
+    def _call(self, method: str, **params) -> Any:
+        url = self._server_url()
+        if url:
+            request = urllib.request.Request(
+                f"{url}/{method}",
+                data=json.dumps(params).encode("utf-8"),
+                headers={"Content-Type": "application/json"},
+            )
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    body = json.loads(response.read())
+                self.last_source = "server"
+                return body["result"]
+            except (urllib.error.URLError, OSError, ValueError, KeyError):
+                pass
+
+        if self._local is None:
+            self._local = ContextService(self.project_root)
+        self.last_source = "in-process"
+        return getattr(self._local, method)(**params)
+
+    def _server_url(self) -> Optional[str]:
+        try:
+            info = json.loads((self.project_root / SERVER_INFO_PATH).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return info.get("url")
@@ -24,6 +24,9 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Set
 from dataclasses import dataclass, field
 
+from .context_dedup import ContentDeduplicator
+from .context_index import load_context_index
+
 
 @dataclass
 class ContextDirective:
@@ -111,7 +114,8 @@ class DirectedContextLoader:
         task_type: Optional[str] = None,
         keywords: Optional[List[str]] = None,
         max_tokens: int = 8000,
-        include_all_high_priority: bool = True
+        include_all_high_priority: bool = True,
+        deduplicate: bool = True
     ) -> Dict[str, Any]:
         """
         Load relevant context for a task.
@@ -124,12 +128,15 @@ class DirectedContextLoader:
             keywords: Keywords describing the task
             max_tokens: Maximum total tokens to load
             include_all_high_priority: Always include high-priority contexts
+            deduplicate: Drop paragraphs that repeat (or nearly repeat) ones
+                already included from an earlier file
 
         Returns:
             Dict containing:
                 - content: Combined context content
                 - files_loaded: List of files that were loaded
                 - tokens_used: Estimated token count
+                - tokens_saved: Estimated tokens removed by deduplication
                 - contexts: List of LoadedContext objects
         """
         keywords = keywords or []
@@ -168,33 +175,76 @@ class DirectedContextLoader:
                 include_all_high_priority
             )
 
-        # Sort by priority: high first, then medium, then low
+        # Sort by priority: high first, then medium, then low.
+        # Within a priority, more relevant files (by BM25) come first so the
+        # token budget drops the weakest matches.
         priority_order = {"high": 0, "medium": 1, "low": 2}
-        loaded_contexts.sort(key=lambda c: priority_order.get(c.priority, 1))
-
-        # Build combined content within token budget
+        relevance = self._rank_by_index(keywords_lower)
+        loaded_contexts.sort(key=lambda c: (
+            priority_order.get(c.priority, 1),
+            -relevance.get(self._relative_path(c.path), 0.0)
+        ))
+
+        # Build combined content within token budget. Paragraphs already
+        # included from an earlier (higher-priority) file are dropped first,
+        # so a file's cost is what it adds.
         combined_parts = []
         total_tokens = 0
         final_files = []
+        dedup = ContentDeduplicator() if deduplicate else None
 
         for ctx in loaded_contexts:
-            if total_tokens + ctx.tokens_estimated <= max_tokens:
-                combined_parts.append(f"<!-- Context: {ctx.path} -->\n{ctx.content}")
-                total_tokens += ctx.tokens_estimated
-                final_files.append(str(ctx.path))
+            content = ctx.content
+            tokens = ctx.tokens_estimated
+            if dedup:
+                kept, removed = dedup.dedupe(content)
+                if removed:
+                    content = "\n\n".join(kept)
+                    tokens = int(len(content) / self.CHARS_PER_TOKEN)
+
+            if total_tokens + tokens <= max_tokens:
+                combined_parts.append(f"<!-- Context: {ctx.path} -->\n{content}")
             elif include_all_high_priority and ctx.priority == "high":
                 # Always include high priority, even if over budget
-                combined_parts.append(f"<!-- Context: {ctx.path} (high priority) -->\n{ctx.content}")
-                total_tokens += ctx.tokens_estimated
-                final_files.append(str(ctx.path))
+                combined_parts.append(f"<!-- Context: {ctx.path} (high priority) -->\n{content}")
+            else:
+                continue
+
+            total_tokens += tokens
+            final_files.append(str(ctx.path))
+            if dedup:
+                dedup.record(kept, removed)
 
         return {
             "content": "\n\n---\n\n".join(combined_parts),
             "files_loaded": final_files,
             "tokens_used": total_tokens,
+            "tokens_saved": dedup.tokens_saved if dedup else 0,
             "contexts": loaded_contexts,
         }
 
+    def _rank_by_index(self, keywords: Set[str]) -> Dict[str, float]:
+        """
+        Score indexed files against keywords using the BM25 search index.
+
+        Args:
+            keywords: Keywords to match
+
+        Returns:
+            Dict mapping relative path to score (empty if no index is built)
+        """
+        search_index = load_context_index(self.project_root)
+        if not search_index or not keywords:
+            return {}
+        return dict(search_index.search(" ".join(sorted(keywords))))
+
+    def _relative_path(self, file_path: Path) -> str:
+        """Path of a context file relative to the project root."""
+        try:
+            return str(file_path.relative_to(self.project_root))
+        except ValueError:
+            return str(file_path)
+
     def _load_recursive(
         self,
         file_path: Path,
@@ -366,6 +416,22 @@ class DirectedContextLoader:
         """Clear the file cache."""
         self._cache.clear()
 
+    def invalidate(self, file_path: Path) -> bool:
+        """
+        Drop a single file from the cache so it is re-read on next load.
+
+        Args:
+            file_path: Path of the changed file
+
+        Returns:
+            True if the file was cached
+        """
+        return self._cache.pop(str(Path(file_path).resolve()), None) is not None
+
+    def cached_paths(self) -> List[Path]:
+        """Paths of all files currently held in the cache."""
+        return [Path(key) for key in self._cache]
+
     def get_context_tree(self) -> Dict[str, Any]:
         """
         Get the full context tree starting from root.
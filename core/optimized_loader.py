@@ -12,16 +12,18 @@ from datetime import datetime, timedelta
 from functools import lru_cache
 import json
 
+from .context_index import load_context_index
+
 # Import the context pruner
 try:
-    from context_pruner import ContextPruner
+    from .context_pruner import ContextPruner
     PRUNER_AVAILABLE = True
 except ImportError:
     PRUNER_AVAILABLE = False
 
 # Import usage analytics
 try:
-    from usage_analytics import UsageAnalytics
+    from .usage_analytics import UsageAnalytics
     ANALYTICS_AVAILABLE = True
 except ImportError:
     ANALYTICS_AVAILABLE = False
@@ -41,7 +43,10 @@ class OptimizedContextLoader:
         self.cache_timestamps = {}
         self.usage_log = []
         self.pruner = ContextPruner() if PRUNER_AVAILABLE else None
-        self.analytics = UsageAnalytics() if (ANALYTICS_AVAILABLE and enable_analytics) else None
+        self.analytics = (
+            UsageAnalytics(self.project_root / ".claude" / "context-analytics.json")
+            if (ANALYTICS_AVAILABLE and enable_analytics) else None
+        )
 
     def _load_index(self) -> Dict[str, Any]:
         """Load the context index file."""
@@ -210,6 +215,18 @@ class OptimizedContextLoader:
                         context_scores[context_name] = 0
                     context_scores[context_name] += 1
 
+        # Rank indexed context files against the keywords with BM25
+        search_index = load_context_index(self.project_root)
+        if search_index:
+            contexts_by_path = {
+                context_info.get("path"): context_name
+                for context_name, context_info in self.index.get("contexts", {}).items()
+            }
+            for path, score in search_index.search(" ".join(keywords)):
+                context_name = contexts_by_path.get(path)
+                if context_name:
+                    context_scores[context_name] = context_scores.get(context_name, 0) + score
+
         # Sort by score
         sorted_contexts = sorted(context_scores.items(), key=lambda x: x[1], reverse=True)
 
@@ -241,6 +258,7 @@ class OptimizedContextLoader:
                     essential_only = priority == "low" and len(contexts_to_load) > 3
 
                     context_configs.append({
+                        'name': context_name,
                         'path': context_path,
                         'essential_only': essential_only,
                         'max_tokens': max_tokens // len(contexts_to_load)
@@ -251,8 +269,9 @@ class OptimizedContextLoader:
                 pruned_content = self.pruner.prune_multiple_contexts(context_configs, max_tokens)
                 return {
                     "content": pruned_content,
-                    "contexts_used": contexts_to_load,
-                    "tokens_used": self.pruner._estimate_tokens(pruned_content) if self.pruner else len(pruned_content) // 4
+                    "contexts_used": self.pruner.last_stats["included"],
+                    "tokens_used": self.pruner._estimate_tokens(pruned_content),
+                    "tokens_saved": self.pruner.last_stats["tokens_saved"]
                 }
 
         # Fallback to original loading method if pruner not available
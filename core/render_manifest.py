@@ -0,0 +1,240 @@
+"""
+Incremental Template Rendering
+
+Renders agent, slash-command and workflow templates to files, skipping
+outputs whose inputs haven't changed since the last run.
+
+A manifest in ``.claude/render-manifest.json`` records, for each output
+file, a hash of its inputs (the template source, every template it
+includes/imports/extends, and the render context) and a hash of the
+output that was written. An output is re-rendered only when the inputs
+hash differs or the file on disk no longer matches what was written.
+Rendered content identical to the existing file is not rewritten, so
+unchanged outputs keep their mtimes.
+
+Independent templates are rendered on a thread pool.
+
+Usage:
+    from core.render_manifest import RenderJob, render_all
+
+    jobs = [
+        RenderJob(name, f"{name}.j2", out_dir / f"{name}.md", partial(registry.render_agent, name))
+        for name in registry.list_agents()
+    ]
+    for result in render_all(jobs, registry.env, context_key=config_hash(config)):
+        print(result.name, result.status)
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+from jinja2 import Environment, TemplateNotFound
+
+
+DEFAULT_MANIFEST_PATH = Path(".claude") / "render-manifest.json"
+
+# Static template references; anything else (e.g. a variable) is dynamic
+REFERENCE_PATTERN = re.compile(r'\{%-?\s*(?:include|import|from|extends)\s+([^\s%]+)')
+LITERAL_PATTERN = re.compile(r'^["\']([^"\']+)["\']$')
+
+# Result statuses
+WRITTEN = "written"        # Rendered and written (new or changed content)
+UNCHANGED = "unchanged"    # Rendered, but content matched the existing file
+SKIPPED = "skipped"        # Inputs unchanged; not rendered
+FAILED = "failed"
+
+
+@dataclass
+class RenderJob:
+    """One template rendered to one output file."""
+    name: str
+    template_name: str
+    output_path: Path
+    render: Callable[[], str]
+    context_key: str = ""  # Extra per-job render inputs (e.g., agent name)
+
+
+@dataclass
+class RenderResult:
+    """Outcome of a RenderJob."""
+    name: str
+    output_path: Path
+    status: str
+    error: Optional[Exception] = None
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class RenderManifest:
+    """Persistent record of rendered outputs and the inputs they came from."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Load the manifest.
+
+        Args:
+            path: Manifest file (defaults to .claude/render-manifest.json)
+        """
+        self.path = Path(path) if path else DEFAULT_MANIFEST_PATH
+        try:
+            self.entries: Dict[str, Dict[str, str]] = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+        self._lock = threading.Lock()
+
+    def is_current(self, output_path: Path, inputs_hash: str) -> bool:
+        """
+        Check whether an output is up to date.
+
+        Args:
+            output_path: Rendered file
+            inputs_hash: Hash of the inputs it would be rendered from
+
+        Returns:
+            True if inputs are unchanged and the file still holds what was written
+        """
+        entry = self.entries.get(str(output_path))
+        if not entry or entry.get("inputs") != inputs_hash:
+            return False
+        try:
+            return _hash(output_path.read_text(encoding="utf-8")) == entry.get("output")
+        except (OSError, UnicodeDecodeError):
+            return False
+
+    def record(self, output_path: Path, inputs_hash: str, content: str) -> None:
+        """Record the inputs and content of a written output."""
+        with self._lock:
+            self.entries[str(output_path)] = {"inputs": inputs_hash, "output": _hash(content)}
+
+    def save(self) -> None:
+        """Write the manifest (atomically)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.entries, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+class TemplateHasher:
+    """Hashes a template together with every template it references."""
+
+    def __init__(self, env: Environment):
+        self.env = env
+        self._sources: Dict[str, Optional[str]] = {}
+
+    def _source(self, name: str) -> Optional[str]:
+        if name not in self._sources:
+            try:
+                self._sources[name] = self.env.loader.get_source(self.env, name)[0]
+            except TemplateNotFound:
+                self._sources[name] = None
+        return self._sources[name]
+
+    def dependencies(self, name: str) -> Set[str]:
+        """
+        Names of the template and all templates it (transitively) references.
+
+        A non-literal reference could be any template, so it makes every
+        template in the environment a dependency.
+        """
+        found: Set[str] = set()
+        pending = [name]
+        while pending:
+            current = pending.pop()
+            if current in found:
+                continue
+            found.add(current)
+            for reference in REFERENCE_PATTERN.findall(self._source(current) or ""):
+                literal = LITERAL_PATTERN.match(reference)
+                if literal:
+                    pending.append(literal.group(1))
+                else:
+                    return set(self.env.loader.list_templates()) | found
+        return found
+
+    def inputs_hash(self, name: str, context_key: str) -> str:
+        """
+        Hash of everything a render of this template depends on.
+
+        Args:
+            name: Template name
+            context_key: Identifies the render context (e.g., a config hash)
+
+        Returns:
+            Hex digest
+        """
+        parts = [f"context:{context_key}"]
+        for dependency in sorted(self.dependencies(name)):
+            source = self._source(dependency)
+            parts.append(f"{dependency}:{_hash(source) if source is not None else 'missing'}")
+        return _hash("\n".join(parts))
+
+
+def render_all(
+    jobs: List[RenderJob],
+    env: Environment,
+    context_key: str,
+    manifest: Optional[RenderManifest] = None,
+    force: bool = False,
+    max_workers: Optional[int] = None
+) -> List[RenderResult]:
+    """
+    Render jobs whose inputs changed, in parallel, and update the manifest.
+
+    Args:
+        jobs: Templates to render
+        env: Environment the templates are loaded from
+        context_key: Identifies the shared render context (e.g., config hash)
+        manifest: Render manifest (defaults to .claude/render-manifest.json,
+            which is only saved when .claude exists)
+        force: Re-render every job regardless of the manifest
+        max_workers: Thread pool size
+
+    Returns:
+        Results in job order
+    """
+    persist = manifest is not None or DEFAULT_MANIFEST_PATH.parent.is_dir()
+    manifest = manifest or RenderManifest()
+    hasher = TemplateHasher(env)
+    inputs = {
+        id(job): hasher.inputs_hash(job.template_name, f"{context_key}:{job.context_key}")
+        for job in jobs
+    }
+
+    def run(job: RenderJob) -> RenderResult:
+        inputs_hash = inputs[id(job)]
+        if not force and manifest.is_current(job.output_path, inputs_hash):
+            return RenderResult(job.name, job.output_path, SKIPPED)
+
+        try:
+            content = job.render()
+            try:
+                existing = job.output_path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                existing = None
+
+            status = UNCHANGED
+            if content != existing:
+                job.output_path.parent.mkdir(parents=True, exist_ok=True)
+                job.output_path.write_text(content, encoding="utf-8")
+                status = WRITTEN
+        except Exception as e:
+            return RenderResult(job.name, job.output_path, FAILED, e)
+
+        manifest.record(job.output_path, inputs_hash, content)
+        return RenderResult(job.name, job.output_path, status)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(run, jobs))
+
+    if persist:
+        manifest.save()
+    return results
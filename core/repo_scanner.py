@@ -0,0 +1,340 @@
+"""
+Repository Scanner
+
+Walks a repository while pruning ignored directories before descending into
+them, instead of walking everything and filtering afterwards. Honors a fixed
+set of build/dependency directories plus the repository's .gitignore files.
+
+Each directory is read exactly once with os.scandir, producing its file
+names and per-extension counts, and sibling subtrees are scanned on a thread
+pool. Context generation, verification and indexing all share this scanner.
+
+Usage:
+    from core.repo_scanner import IgnoreRules, find_files, scan_tree
+
+    for directory in scan_tree(Path("."), max_depth=3):
+        print(directory.relative_path, directory.extension_counts)
+
+    for path in find_files(Path("."), {"CLAUDE.md", "README.md"}):
+        print(path)
+"""
+
+import fnmatch
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Pattern, Set, Tuple
+
+
+# Directories that never contain project context
+DEFAULT_SKIP_DIRS = frozenset({
+    ".git", ".svn", ".hg",
+    "node_modules", "venv", ".venv", "__pycache__",
+    ".pytest_cache", ".mypy_cache", ".ruff_cache", ".tox", ".nox",
+    "dist", "build", "htmlcov", ".eggs", "*.egg-info",
+    ".idea", ".vscode", ".vs",
+})
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore glob (without anchoring) to a regex fragment."""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            parts.append("(?:/.*)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                parts.append(re.escape(pattern[i]))
+                i += 1
+            else:
+                parts.append(pattern[i:end + 1])
+                i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(parts)
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class IgnoreRules:
+    """
+    Decides which paths a repository walk should skip.
+
+    Combines a set of directory-name patterns (always skipped) with rules
+    parsed from .gitignore files. Nested .gitignore files apply only below
+    their own directory, and later rules override earlier ones, as in git.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        skip_dirs: Optional[Set[str]] = None,
+        use_gitignore: bool = True
+    ):
+        """
+        Initialize ignore rules.
+
+        Args:
+            root: Repository root that relative paths are resolved against
+            skip_dirs: Directory names (glob patterns) to always skip.
+                Defaults to DEFAULT_SKIP_DIRS.
+            use_gitignore: Whether to honor .gitignore files
+        """
+        self.root = Path(root)
+        self.skip_dirs = set(DEFAULT_SKIP_DIRS if skip_dirs is None else skip_dirs)
+        self.use_gitignore = use_gitignore
+        self._rules: List[Tuple[Pattern, bool, bool]] = []
+        self._sources: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._lock = threading.Lock()
+        if use_gitignore:
+            self.load_gitignore("")
+
+    def load_gitignore(self, relative_dir: str) -> None:
+        """
+        Load rules from the .gitignore in a directory, if present.
+
+        Each directory's .gitignore is loaded at most once, so the same
+        rules can be reused across repeated scans.
+
+        Args:
+            relative_dir: Directory relative to root ("" for the root)
+        """
+        gitignore = self.root / relative_dir / ".gitignore"
+        with self._lock:
+            if relative_dir in self._sources:
+                return
+            self._sources[relative_dir] = _file_signature(gitignore)
+
+        try:
+            lines = gitignore.read_text(encoding="utf-8").splitlines()
+        except (OSError, UnicodeDecodeError):
+            return
+
+        base = f"{relative_dir}/" if relative_dir else ""
+        rules = [rule for rule in (self._parse_rule(line, base) for line in lines) if rule]
+        with self._lock:
+            # Replace rather than extend, so readers holding the previous
+            # list keep iterating a list that doesn't change under them
+            self._rules = self._rules + rules
+
+    def is_stale(self) -> bool:
+        """
+        Check whether any loaded .gitignore changed, appeared or was deleted.
+
+        .gitignore files in directories not scanned yet are picked up by the
+        next scan; a stale rule set has to be rebuilt.
+
+        Returns:
+            True if the rules no longer match the .gitignore files on disk
+        """
+        with self._lock:
+            sources = dict(self._sources)
+        return any(
+            _file_signature(self.root / relative_dir / ".gitignore") != signature
+            for relative_dir, signature in sources.items()
+        )
+
+    def _parse_rule(self, line: str, base: str) -> Optional[Tuple[Pattern, bool, bool]]:
+        """Parse one .gitignore line into (regex, negate, dir_only)."""
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            return None
+
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            return None
+
+        # A slash anywhere but the end anchors the pattern to this directory
+        anchored = "/" in line
+        line = line.lstrip("/")
+
+        prefix = re.escape(base) if anchored else re.escape(base) + "(?:.*/)?"
+        regex = re.compile(f"^{prefix}{_glob_to_regex(line)}$")
+        return regex, negate, dir_only
+
+    def is_ignored(self, relative_path: str, is_dir: bool = False) -> bool:
+        """
+        Check whether a path should be skipped.
+
+        Args:
+            relative_path: Path relative to root, using "/" separators
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the path is ignored
+        """
+        name = relative_path.rsplit("/", 1)[-1]
+        if is_dir and any(fnmatch.fnmatch(name, pattern) for pattern in self.skip_dirs):
+            return True
+
+        with self._lock:
+            rules = self._rules
+
+        ignored = False
+        for regex, negate, dir_only in rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(relative_path):
+                ignored = not negate
+        return ignored
+
+
+@dataclass
+class ScannedDirectory:
+    """One directory read by scan_tree."""
+    path: Path
+    relative_path: str  # "." for the root, "/"-separated otherwise
+    depth: int
+    files: List[str] = field(default_factory=list)
+    subdirs: List[str] = field(default_factory=list)
+    extension_counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    def count(self, *extensions: str) -> int:
+        """Number of files with any of the given extensions (e.g., ".py")."""
+        return sum(self.extension_counts.get(ext, 0) for ext in extensions)
+
+
+def _scan_directory(
+    root: Path,
+    relative_dir: str,
+    depth: int,
+    rules: IgnoreRules
+) -> Optional[ScannedDirectory]:
+    """Read a single directory, classifying its entries and pruning ignored subdirectories."""
+    try:
+        with os.scandir(root / relative_dir) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return None
+
+    if relative_dir and rules.use_gitignore and any(e.name == ".gitignore" for e in entries):
+        rules.load_gitignore(relative_dir)
+
+    scanned = ScannedDirectory(
+        path=root / relative_dir if relative_dir else root,
+        relative_path=relative_dir or ".",
+        depth=depth,
+    )
+    for entry in entries:
+        relative = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+
+        if is_dir:
+            if not rules.is_ignored(relative, is_dir=True):
+                scanned.subdirs.append(entry.name)
+        elif not rules.is_ignored(relative):
+            scanned.files.append(entry.name)
+            ext = os.path.splitext(entry.name)[1].lower()
+            scanned.extension_counts[ext] = scanned.extension_counts.get(ext, 0) + 1
+
+    return scanned
+
+
+def scan_tree(
+    root: Path,
+    rules: Optional[IgnoreRules] = None,
+    max_depth: Optional[int] = None,
+    max_workers: Optional[int] = None
+) -> List[ScannedDirectory]:
+    """
+    Scan a directory tree, pruning ignored directories before descent.
+
+    Directories are scanned level by level; all directories of a level are
+    read concurrently on a thread pool.
+
+    Args:
+        root: Directory to scan
+        rules: Ignore rules. Defaults to IgnoreRules(root).
+        max_depth: Deepest directory level to scan (root is depth 0).
+            None scans the whole tree.
+        max_workers: Thread pool size (defaults to ThreadPoolExecutor's default)
+
+    Returns:
+        Scanned directories sorted by relative path, root first
+    """
+    root = Path(root)
+    rules = rules or IgnoreRules(root)
+
+    root_scan = _scan_directory(root, "", 0, rules)
+    if root_scan is None:
+        return []
+
+    results = [root_scan]
+    level = [root_scan]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while level:
+            children = [
+                (f"{d.relative_path}/{name}" if d.depth else name, d.depth + 1)
+                for d in level
+                if max_depth is None or d.depth < max_depth
+                for name in d.subdirs
+            ]
+            level = [
+                scanned for scanned in executor.map(
+                    lambda child: _scan_directory(root, child[0], child[1], rules), children
+                )
+                if scanned is not None
+            ]
+            results.extend(level)
+
+    results.sort(key=lambda d: (d.depth > 0, d.relative_path))
+    return results
+
+
+def find_files(
+    root: Path,
+    names: Set[str],
+    rules: Optional[IgnoreRules] = None
+) -> Iterator[Path]:
+    """
+    Find files with the given names, pruning ignored directories.
+
+    Args:
+        root: Directory to search
+        names: File names to match exactly (e.g., {"CLAUDE.md"})
+        rules: Ignore rules. Defaults to IgnoreRules(root).
+
+    Yields:
+        Paths of matching files (root-prefixed, like Path.rglob)
+    """
+    for directory in scan_tree(root, rules):
+        for name in directory.files:
+            if name in names:
+                yield directory.path / name
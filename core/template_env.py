@@ -0,0 +1,208 @@
+"""
+Shared Jinja2 Environment for Agent and Workflow Rendering
+
+Agent and workflow registries render the same templates on every CLI run.
+This module keeps that cheap:
+
+- One Environment per templates directory, shared by every registry in
+  the process
+- A FileSystemBytecodeCache under ``.claude/cache/jinja2`` so templates
+  are compiled once per change instead of once per run
+- Precompiled template modules (``__compiled__`` next to the templates,
+  produced by ``compile_templates`` when the wheel is built), used while
+  their recorded source hash still matches the template on disk
+- Render contexts memoized by a hash of the configuration
+
+Usage:
+    from core.template_env import cached_render_context, get_environment
+
+    env = get_environment(Path("agents/templates"))
+    context = cached_render_context(config, "agents", build_context)
+    print(env.get_template("engineer.j2").render(**context))
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from jinja2 import (
+    BaseLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, ModuleLoader, TemplateNotFound
+)
+
+
+COMPILED_DIR_NAME = "__compiled__"
+MANIFEST_NAME = "manifest.json"
+BYTECODE_CACHE_PATH = Path(".claude") / "cache" / "jinja2"
+
+# Options shared by every environment (and by compiled templates)
+ENVIRONMENT_OPTIONS = {"trim_blocks": True, "lstrip_blocks": True}
+
+_environments: Dict[Tuple[str, str], Environment] = {}
+_render_contexts: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_lock = threading.Lock()
+
+
+class PrecompiledLoader(BaseLoader):
+    """
+    Loads templates from precompiled modules while they are up to date.
+
+    A manifest records the source hash each module was compiled from; if
+    the template on disk differs (or was never compiled), the template is
+    loaded from source instead, going through the bytecode cache.
+
+    Precompiled templates carry the source file's ``uptodate`` check, so
+    the environment's auto-reload notices when a ``.j2`` file is edited in
+    a long-lived process (e.g., the context server).
+    """
+
+    def __init__(self, templates_dir: Path):
+        self.source_loader = FileSystemLoader(str(templates_dir))
+        compiled_dir = templates_dir / COMPILED_DIR_NAME
+        try:
+            self.manifest = json.loads((compiled_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.manifest = {}
+        self.module_loader = ModuleLoader(str(compiled_dir)) if self.manifest else None
+
+    def get_source(self, environment, template):
+        return self.source_loader.get_source(environment, template)
+
+    def list_templates(self):
+        return self.source_loader.list_templates()
+
+    def load(self, environment, name, globals=None):
+        if self.module_loader and name in self.manifest:
+            try:
+                source, _, uptodate = self.source_loader.get_source(environment, name)
+            except TemplateNotFound:
+                source = None
+            if source is not None and _source_hash(source) == self.manifest[name]:
+                template = self.module_loader.load(environment, name, globals)
+                # ModuleLoader templates never report themselves stale
+                template._uptodate = uptodate
+                return template
+        return self.source_loader.load(environment, name, globals)
+
+
+def _source_hash(source: str) -> str:
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def get_environment(templates_dir: Path, project_root: Optional[Path] = None) -> Environment:
+    """
+    Get the shared environment for a templates directory.
+
+    The bytecode cache is only used when the project has a ``.claude``
+    directory, so rendering outside an initialized project leaves no files.
+
+    Args:
+        templates_dir: Directory containing .j2 templates
+        project_root: Project whose .claude directory holds the bytecode
+            cache. Defaults to cwd.
+
+    Returns:
+        Jinja2 Environment (shared; don't mutate its globals or filters)
+    """
+    templates_dir = Path(templates_dir).resolve()
+    project_root = Path(project_root) if project_root else Path.cwd()
+    claude_dir = project_root / ".claude"
+    cache_dir = project_root / BYTECODE_CACHE_PATH if claude_dir.is_dir() else None
+
+    key = (str(templates_dir), str(cache_dir))
+    with _lock:
+        env = _environments.get(key)
+        if env is None:
+            bytecode_cache = None
+            if cache_dir:
+                try:
+                    cache_dir.mkdir(parents=True, exist_ok=True)
+                    bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+                except OSError:
+                    pass
+
+            env = Environment(
+                loader=PrecompiledLoader(templates_dir),
+                bytecode_cache=bytecode_cache,
+                **ENVIRONMENT_OPTIONS,
+            )
+            _environments[key] = env
+    return env
+
+
+def compile_templates(templates_dir: Path, target_dir: Optional[Path] = None) -> int:
+    """
+    Precompile every template in a directory to Python modules.
+
+    Writes the modules and a manifest of source hashes to
+    ``<target_dir or templates_dir>/__compiled__``. Run at build time so
+    installed packages never compile the bundled templates.
+
+    Args:
+        templates_dir: Directory containing .j2 templates
+        target_dir: Directory to place ``__compiled__`` in (defaults to
+            templates_dir, e.g. the build tree when packaging)
+
+    Returns:
+        Number of templates compiled
+    """
+    templates_dir = Path(templates_dir)
+    compiled_dir = Path(target_dir or templates_dir) / COMPILED_DIR_NAME
+    compiled_dir.mkdir(parents=True, exist_ok=True)
+
+    env = Environment(loader=FileSystemLoader(str(templates_dir)), **ENVIRONMENT_OPTIONS)
+    names = env.list_templates(extensions=["j2"])
+    env.compile_templates(str(compiled_dir), zip=None, ignore_errors=False, filter_func=lambda n: n in names)
+
+    manifest = {name: _source_hash(env.loader.get_source(env, name)[0]) for name in names}
+    (compiled_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    return len(names)
+
+
+def config_hash(config: Any) -> str:
+    """
+    Stable hash of a configuration object.
+
+    Args:
+        config: Pydantic model (e.g., FrameworkConfig) or JSON-compatible value
+
+    Returns:
+        Hex digest
+    """
+    if hasattr(config, "model_dump_json"):
+        data = config.model_dump_json()
+    else:
+        data = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def cached_render_context(
+    config: Any,
+    kind: str,
+    build: Callable[[], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Build a render context once per configuration.
+
+    Args:
+        config: Configuration the context is derived from
+        kind: Context flavor (e.g., "agents", "workflows")
+        build: Builds the context on a cache miss
+
+    Returns:
+        A shallow copy of the cached context, safe for callers to update
+    """
+    key = (kind, config_hash(config))
+    context = _render_contexts.get(key)
+    if context is None:
+        context = build()
+        _render_contexts[key] = context
+    return dict(context)
+
+
+def clear_caches() -> None:
+    """Drop shared environments and memoized render contexts."""
+    with _lock:
+        _environments.clear()
+        _render_contexts.clear()
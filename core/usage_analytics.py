@@ -0,0 +1,327 @@
+"""
+Context Usage Analytics
+
+Persists aggregate statistics about optimized context loads so that
+OptimizedContextLoader can report hit rates across sessions and suggest
+index and template changes.
+
+Statistics are stored in ``.claude/context-analytics.json``: request and
+cache-hit totals, per-context load counts, per-template usage, keywords of
+tasks that matched no template (bounded), and a bounded list of recent
+events. Logged loads are buffered in memory and written every
+``flush_every`` loads and at interpreter exit, so loading context doesn't
+rewrite the file each time.
+
+Usage:
+    from core.usage_analytics import UsageAnalytics
+
+    analytics = UsageAnalytics()
+    analytics.log_usage(
+        task="implement login feature",
+        task_hash="ab12...",
+        contexts_loaded=["root", "auth"],
+        template_used="implement_feature",
+        tokens_used=1800,
+        cache_hit=False,
+        execution_time_ms=12,
+    )
+    print(analytics.generate_report())
+    analytics.flush()
+"""
+
+import atexit
+import json
+import os
+import weakref
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .context_index import tokenize
+
+
+DEFAULT_ANALYTICS_PATH = Path(".claude") / "context-analytics.json"
+
+
+class UsageAnalytics:
+    """
+    Aggregate context usage statistics, persisted in batches.
+    """
+
+    VERSION = 1
+
+    # Thresholds for suggestions
+    MIN_REQUESTS = 10
+    LOW_CACHE_HIT_RATE = 0.2
+    ALWAYS_LOADED_RATE = 0.8
+    HIGH_UNTEMPLATED_RATE = 0.3
+    HEAVY_TEMPLATE_TOKENS = 3000
+
+    # Untemplated keywords kept; when exceeded, the least frequent half is dropped
+    MAX_UNTEMPLATED_KEYWORDS = 500
+
+    def __init__(
+        self,
+        storage_path: Optional[Path] = None,
+        max_events: int = 500,
+        flush_every: int = 20
+    ):
+        """
+        Initialize analytics, loading existing statistics.
+
+        Args:
+            storage_path: JSON file to persist to. Defaults to
+                .claude/context-analytics.json under the working directory.
+            max_events: Number of recent events to keep
+            flush_every: Logged loads to buffer before writing the file
+        """
+        self.storage_path = Path(storage_path) if storage_path else DEFAULT_ANALYTICS_PATH
+        self.max_events = max_events
+        self.flush_every = max(flush_every, 1)
+        self.data = self._load()
+        self._pending = 0
+        _live_instances.add(self)
+
+    def log_usage(
+        self,
+        task: str,
+        task_hash: str,
+        contexts_loaded: List[str],
+        template_used: Optional[str],
+        tokens_used: Optional[int],
+        cache_hit: bool,
+        execution_time_ms: int,
+        success: bool = True
+    ) -> None:
+        """
+        Record one context load.
+
+        The file is written once ``flush_every`` loads are pending; call
+        flush() to write earlier.
+
+        Args:
+            task: Task description
+            task_hash: Hash identifying the task
+            contexts_loaded: Context names that were loaded
+            template_used: Matched template, if any
+            tokens_used: Tokens in the loaded content
+            cache_hit: Whether the result came from the loader's cache
+            execution_time_ms: Time taken to load
+            success: Whether loading succeeded
+        """
+        tokens_used = tokens_used or 0
+        totals = self.data["totals"]
+        totals["requests"] += 1
+        totals["cache_hits"] += int(cache_hit)
+        totals["tokens_used"] += tokens_used
+        totals["execution_time_ms"] += execution_time_ms
+        totals["failures"] += int(not success)
+
+        for name in contexts_loaded:
+            stats = self.data["contexts"].setdefault(name, {"loads": 0, "cache_hits": 0})
+            stats["loads"] += 1
+            stats["cache_hits"] += int(cache_hit)
+
+        if template_used:
+            stats = self.data["templates"].setdefault(template_used, {"uses": 0, "tokens_used": 0})
+            stats["uses"] += 1
+            stats["tokens_used"] += tokens_used
+        elif not cache_hit:
+            totals["untemplated"] += 1
+            keywords = self.data["untemplated_keywords"]
+            for keyword in set(tokenize(task)):
+                keywords[keyword] = keywords.get(keyword, 0) + 1
+            if len(keywords) > self.MAX_UNTEMPLATED_KEYWORDS:
+                keep = sorted(keywords.items(), key=lambda x: x[1], reverse=True)
+                self.data["untemplated_keywords"] = dict(keep[:self.MAX_UNTEMPLATED_KEYWORDS // 2])
+
+        self.data["events"].append({
+            "timestamp": datetime.now().isoformat(),
+            "task": task[:100],
+            "task_hash": task_hash,
+            "contexts": contexts_loaded,
+            "template": template_used,
+            "tokens_used": tokens_used,
+            "cache_hit": cache_hit,
+            "execution_time_ms": execution_time_ms,
+            "success": success,
+        })
+        del self.data["events"][:-self.max_events]
+
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.save()
+
+    def hit_rates(self) -> Dict[str, Any]:
+        """
+        Cache hit rate and the share of requests that loaded each context.
+
+        Returns:
+            Dict with "cache" rate and "contexts" {name: rate}
+        """
+        requests = self.data["totals"]["requests"]
+        if not requests:
+            return {"cache": 0.0, "contexts": {}}
+
+        return {
+            "cache": self.data["totals"]["cache_hits"] / requests,
+            "contexts": {
+                name: stats["loads"] / requests
+                for name, stats in self.data["contexts"].items()
+            },
+        }
+
+    def get_optimization_suggestions(self) -> List[Dict[str, Any]]:
+        """
+        Suggest index and template changes based on recorded usage.
+
+        Returns:
+            List of suggestion dicts with "type", "priority" and "message"
+        """
+        totals = self.data["totals"]
+        requests = totals["requests"]
+        if requests < self.MIN_REQUESTS:
+            return []
+
+        suggestions = []
+        rates = self.hit_rates()
+
+        if rates["cache"] < self.LOW_CACHE_HIT_RATE:
+            suggestions.append({
+                "type": "cache",
+                "priority": "medium",
+                "message": (
+                    f"Cache hit rate is {rates['cache']:.0%}; increase loading_rules.cache_ttl_minutes "
+                    "or reuse a loader across tasks"
+                ),
+            })
+
+        for name, rate in sorted(rates["contexts"].items(), key=lambda x: x[1], reverse=True):
+            if rate >= self.ALWAYS_LOADED_RATE:
+                suggestions.append({
+                    "type": "context",
+                    "priority": "low",
+                    "context": name,
+                    "message": f"Context '{name}' is loaded by {rate:.0%} of tasks; keep it short or mark it high priority",
+                })
+
+        untemplated_rate = totals["untemplated"] / requests
+        if untemplated_rate >= self.HIGH_UNTEMPLATED_RATE:
+            top_keywords = sorted(
+                self.data["untemplated_keywords"].items(), key=lambda x: x[1], reverse=True
+            )[:5]
+            suggestions.append({
+                "type": "template",
+                "priority": "high",
+                "keywords": [keyword for keyword, _ in top_keywords],
+                "message": (
+                    f"{untemplated_rate:.0%} of tasks match no template; consider a template for: "
+                    + ", ".join(keyword for keyword, _ in top_keywords)
+                ),
+            })
+
+        for name, stats in self.data["templates"].items():
+            average = stats["tokens_used"] / stats["uses"]
+            if average > self.HEAVY_TEMPLATE_TOKENS:
+                suggestions.append({
+                    "type": "template",
+                    "priority": "medium",
+                    "template": name,
+                    "message": f"Template '{name}' averages {average:.0f} tokens; load low-priority contexts essential-only",
+                })
+
+        return suggestions
+
+    def generate_report(self) -> str:
+        """
+        Markdown report of recorded usage and suggestions.
+
+        Returns:
+            Report text
+        """
+        totals = self.data["totals"]
+        requests = totals["requests"]
+        if not requests:
+            return "No context usage recorded yet."
+
+        rates = self.hit_rates()
+        lines = [
+            "# Context Usage Report",
+            "",
+            f"- Requests: {requests}",
+            f"- Cache hit rate: {rates['cache']:.0%}",
+            f"- Average tokens per request: {totals['tokens_used'] / requests:.0f}",
+            f"- Average load time: {totals['execution_time_ms'] / requests:.1f} ms",
+            f"- Failures: {totals['failures']}",
+            "",
+            "## Most Loaded Contexts",
+            "",
+        ]
+        for name, rate in sorted(rates["contexts"].items(), key=lambda x: x[1], reverse=True)[:10]:
+            lines.append(f"- {name}: {self.data['contexts'][name]['loads']} loads ({rate:.0%} of requests)")
+
+        if self.data["templates"]:
+            lines.extend(["", "## Templates", ""])
+            for name, stats in sorted(self.data["templates"].items(), key=lambda x: x[1]["uses"], reverse=True):
+                lines.append(f"- {name}: {stats['uses']} uses, ~{stats['tokens_used'] / stats['uses']:.0f} tokens each")
+
+        suggestions = self.get_optimization_suggestions()
+        if suggestions:
+            lines.extend(["", "## Suggestions", ""])
+            lines.extend(f"- [{s['priority']}] {s['message']}" for s in suggestions)
+
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Discard all recorded statistics."""
+        self.data = self._empty()
+        self.save()
+
+    def flush(self) -> None:
+        """Write buffered statistics, if any loads were logged since the last write."""
+        if self._pending:
+            self.save()
+
+    def save(self) -> None:
+        """Write statistics to the storage file (atomically)."""
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.storage_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.data, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.storage_path)
+        self._pending = 0
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self.storage_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self._empty()
+        if data.get("version") != self.VERSION:
+            return self._empty()
+        return data
+
+    def _empty(self) -> Dict[str, Any]:
+        return {
+            "version": self.VERSION,
+            "totals": {
+                "requests": 0, "cache_hits": 0, "tokens_used": 0,
+                "execution_time_ms": 0, "failures": 0, "untemplated": 0,
+            },
+            "contexts": {},
+            "templates": {},
+            "untemplated_keywords": {},
+            "events": [],
+        }
+
+
+# Instances still alive at interpreter exit get their buffered statistics written
+_live_instances: "weakref.WeakSet[UsageAnalytics]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    """Write every live instance's buffered statistics at interpreter exit."""
+    for analytics in list(_live_instances):
+        try:
+            analytics.flush()
+        except OSError:
+            pass
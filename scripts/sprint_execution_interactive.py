@@ -13,15 +13,27 @@ Use cases for interactive mode:
 
 Usage:
     python3 scripts/sprint_execution_interactive.py --sprint "Sprint 7"
+
+    # Prepare the next 3 tasks while you work on the current one
+    python3 scripts/sprint_execution_interactive.py --sprint "Sprint 7" --prefetch 3
+
+While a Claude session runs, background threads prepare the next tasks:
+the full work item, its comments, linked work items and relevant project
+context (via the directed context loader) are fetched and the task's
+context file is written, so it's ready as soon as you move on.
 """
 
 import os
+import re
 import sys
 import json
+import time
+import threading
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -29,6 +41,12 @@ sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / '.claude' / 'skills'))
 
 from work_tracking import get_adapter
+from core.context_index import tokenize
+from core.directed_loader import DirectedContextLoader
+
+
+# Token budget for project context included in a task's context file
+TASK_CONTEXT_MAX_TOKENS = 4000
 
 
 class SprintExecutionInteractive:
@@ -38,11 +56,16 @@ class SprintExecutionInteractive:
     Demonstrates MODE 3: Interactive AI for collaborative work.
     """
 
-    def __init__(self, sprint_name: str):
+    def __init__(self, sprint_name: str, prefetch: int = 2):
         self.sprint_name = sprint_name
         self.adapter = get_adapter()
         self.tasks_completed: List[int] = []
         self.start_time = datetime.now()
+        self.prefetch = max(prefetch, 0)
+        self._prepared: Dict[Any, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._context_loader = DirectedContextLoader(project_root)
+        self._loader_lock = threading.Lock()
 
     def execute(self) -> bool:
         """Execute sprint tasks interactively with Claude."""
@@ -74,18 +97,24 @@ class SprintExecutionInteractive:
 
             print("\n" + "─" * 70)
 
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(self.prefetch, 1), thread_name_prefix="task-prefetch"
+            )
+
             # Process each task interactively
-            for item in in_progress:
+            for index, item in enumerate(in_progress):
                 task_id = item['id']
                 title = item.get('fields', {}).get('System.Title', 'Untitled')
-                description = item.get('fields', {}).get('System.Description', '')
+
+                # Prepare this task and the next ones in the background
+                self._schedule_prefetch(in_progress[index:index + self.prefetch + 1])
 
                 # Ask if user wants to work on this task
                 if not self._confirm_work_on_task(task_id, title):
                     continue
 
                 # Interactive Claude session for the task
-                completed = self._work_on_task_with_claude(task_id, title, description)
+                completed = self._work_on_task_with_claude(task_id, title, self._wait_for_context(item))
 
                 if completed:
                     # Ask if task should be marked Done
@@ -112,6 +141,10 @@ class SprintExecutionInteractive:
             import traceback
             traceback.print_exc()
             return False
+        finally:
+            if self._executor:
+                # Don't hold up exit for tasks that won't be worked on
+                self._executor.shutdown(wait=False, cancel_futures=True)
 
     def _confirm_work_on_task(self, task_id: int, title: str) -> bool:
         """Ask user if they want to work on this task."""
@@ -132,12 +165,12 @@ class SprintExecutionInteractive:
             else:
                 print("Please enter 'yes', 'skip', or 'quit'")
 
-    def _work_on_task_with_claude(self, task_id: int, title: str, description: str) -> bool:
+    def _work_on_task_with_claude(self, task_id: int, title: str, context_file: Path) -> bool:
         """
         MODE 3: Interactive Claude session.
 
         This is where the interactive pattern shines:
-        - Script writes context for Claude
+        - Script has written context for Claude (prepared in the background)
         - Spawns interactive Claude session
         - User collaborates with Claude on implementation
         - User exits Claude when done (Ctrl+D or 'exit')
@@ -147,54 +180,6 @@ class SprintExecutionInteractive:
         print("🤖 OPENING INTERACTIVE CLAUDE SESSION")
         print("─" * 70)
 
-        # Write context file for Claude
-        context_file = Path(f'.claude/tasks/task-{task_id}-context.md')
-        context_file.parent.mkdir(parents=True, exist_ok=True)
-
-        context_content = f"""# Task #{task_id}: {title}
-
-## Description
-{description or 'No description provided'}
-
-## Sprint
-{self.sprint_name}
-
-## Your Mission
-
-Work with the user to complete this task. You have full access to:
-- Read tool (examine code)
-- Write tool (create/modify files)
-- Edit tool (make precise changes)
-- Bash tool (run tests, build, etc.)
-
-## Instructions
-
-1. **Understand the task**: Read the description carefully
-2. **Ask questions**: If requirements are unclear, ask the user
-3. **Plan approach**: Discuss implementation strategy
-4. **Implement**: Write code, tests, documentation
-5. **Verify**: Run tests, check quality
-6. **Write summary**: When done, write results to task-{task_id}-results.md
-
-## How To Exit
-
-When task is complete (or you want to pause):
-- Type `exit` or press Ctrl+D to close this Claude session
-- The script will resume and ask if task should be marked Done
-
-## Notes
-
-- Take your time - quality over speed
-- Ask user for guidance when needed
-- Write tests for new functionality
-- Document what you built
-
-Good luck! 🚀
-"""
-
-        with open(context_file, 'w', encoding='utf-8') as f:
-            f.write(context_content)
-
         # Prepare results file
         results_file = Path(f'.claude/tasks/task-{task_id}-results.md')
         if results_file.exists():
@@ -284,6 +269,177 @@ Include:
         except Exception as e:
             print(f"❌ Error marking task Done: {e}")
 
+    def _schedule_prefetch(self, items: List[Dict[str, Any]]):
+        """Start preparing context for tasks that aren't already being prepared."""
+        for item in items:
+            if item['id'] not in self._prepared:
+                self._prepared[item['id']] = self._executor.submit(self._prepare_task_context, item)
+
+    def _wait_for_context(self, item: Dict[str, Any]) -> Path:
+        """Context file for a task, waiting for (or doing) its preparation."""
+        future = self._prepared.get(item['id'])
+        if future is None:
+            future = self._prepared[item['id']] = self._executor.submit(self._prepare_task_context, item)
+
+        if future.done():
+            print("\n⚡ Task context prepared in the background")
+        else:
+            print("\n⏳ Preparing task context...")
+            started = time.monotonic()
+            wait([future])
+            print(f"✓ Task context ready ({time.monotonic() - started:.1f}s)")
+
+        try:
+            return future.result()
+        except Exception as e:
+            # Fall back to the sprint query's data if the prefetch failed
+            print(f"⚠️  Could not fetch full task details: {e}")
+            return self._write_context_file(item, [], [], None)
+
+    def _prepare_task_context(self, item: Dict[str, Any]) -> Path:
+        """
+        Fetch everything a task's session needs and write its context file.
+
+        Runs on a background thread: the full work item (with comments and
+        links), linked work items and relevant project context.
+        """
+        task_id = item['id']
+        full_item = self.adapter.get_work_item(task_id) or item
+        # Keep fields from the sprint query the full item doesn't have
+        full_item.setdefault('fields', {})
+        for name, value in item.get('fields', {}).items():
+            full_item['fields'].setdefault(name, value)
+
+        comments = full_item.get('comments') or []
+
+        linked = []
+        for relation, linked_id in self._linked_ids(full_item):
+            try:
+                linked_item = self.adapter.get_work_item(linked_id)
+            except Exception:
+                linked_item = None
+            linked.append((relation, linked_id, linked_item))
+
+        fields = full_item['fields']
+        keywords = tokenize(f"{fields.get('System.Title', '')} {fields.get('System.Tags', '')}")
+        with self._loader_lock:
+            project_context = self._context_loader.load_for_task(
+                task_type="implementation",
+                keywords=keywords,
+                max_tokens=TASK_CONTEXT_MAX_TOKENS
+            )
+
+        return self._write_context_file(full_item, comments, linked, project_context)
+
+    @staticmethod
+    def _linked_ids(item: Dict[str, Any]) -> List[tuple]:
+        """(relation, id) pairs for an item's links, from Azure DevOps relations or file-based parent/child ids."""
+        links = []
+        for relation in item.get('relations') or []:
+            match = re.search(r'/workItems/(\d+)$', relation.get('url', ''), re.IGNORECASE)
+            if match:
+                name = relation.get('attributes', {}).get('name') or relation.get('rel', 'Related')
+                links.append((name, int(match.group(1))))
+        if item.get('parent_id'):
+            links.append(('Parent', item['parent_id']))
+        for child_id in item.get('child_ids') or []:
+            links.append(('Child', child_id))
+        return links
+
+    def _write_context_file(
+        self,
+        item: Dict[str, Any],
+        comments: List[Dict[str, Any]],
+        linked: List[tuple],
+        project_context: Optional[Dict[str, Any]]
+    ) -> Path:
+        """Write a task's context file for Claude."""
+        fields = item.get('fields', {})
+        task_id = item['id']
+        title = fields.get('System.Title', 'Untitled')
+        description = fields.get('System.Description', '')
+
+        context_file = Path(f'.claude/tasks/task-{task_id}-context.md')
+        context_file.parent.mkdir(parents=True, exist_ok=True)
+
+        context_content = f"""# Task #{task_id}: {title}
+
+## Description
+{description or 'No description provided'}
+
+## Sprint
+{self.sprint_name}
+{self._format_related(comments, linked, project_context)}
+## Your Mission
+
+Work with the user to complete this task. You have full access to:
+- Read tool (examine code)
+- Write tool (create/modify files)
+- Edit tool (make precise changes)
+- Bash tool (run tests, build, etc.)
+
+## Instructions
+
+1. **Understand the task**: Read the description carefully
+2. **Ask questions**: If requirements are unclear, ask the user
+3. **Plan approach**: Discuss implementation strategy
+4. **Implement**: Write code, tests, documentation
+5. **Verify**: Run tests, check quality
+6. **Write summary**: When done, write results to task-{task_id}-results.md
+
+## How To Exit
+
+When task is complete (or you want to pause):
+- Type `exit` or press Ctrl+D to close this Claude session
+- The script will resume and ask if task should be marked Done
+
+## Notes
+
+- Take your time - quality over speed
+- Ask user for guidance when needed
+- Write tests for new functionality
+- Document what you built
+
+Good luck! 🚀
+"""
+
+        # Write to a temporary file first, so a half-written context is never read
+        tmp_file = context_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(context_content)
+        os.replace(tmp_file, context_file)
+        return context_file
+
+    @staticmethod
+    def _format_related(
+        comments: List[Dict[str, Any]],
+        linked: List[tuple],
+        project_context: Optional[Dict[str, Any]]
+    ) -> str:
+        """Comments, linked work items and project context sections (empty ones left out)."""
+        sections = []
+        if comments:
+            lines = [
+                f"- {comment.get('author') or 'unknown'} ({comment.get('created_at', '')}): "
+                f"{comment.get('text', '')}"
+                for comment in comments
+            ]
+            sections.append("## Comments\n" + "\n".join(lines))
+        if linked:
+            lines = []
+            for relation, linked_id, linked_item in linked:
+                if linked_item:
+                    linked_fields = linked_item.get('fields', {})
+                    title = linked_fields.get('System.Title') or linked_item.get('title', 'Untitled')
+                    state = linked_fields.get('System.State') or linked_item.get('state', '')
+                    lines.append(f"- {relation}: #{linked_id} {title} [{state}]")
+                else:
+                    lines.append(f"- {relation}: #{linked_id}")
+            sections.append("## Linked Work Items\n" + "\n".join(lines))
+        if project_context and project_context.get('content'):
+            sections.append("## Relevant Project Context\n" + project_context['content'])
+        return "".join(f"\n{section}\n" for section in sections)
+
 
 def main():
     import argparse
@@ -292,10 +448,16 @@ def main():
         description='Sprint Execution with Interactive Claude Sessions'
     )
     parser.add_argument('--sprint', required=True, help='Sprint name (e.g., "Sprint 7")')
+    parser.add_argument(
+        '--prefetch',
+        type=int,
+        default=2,
+        help='Number of upcoming tasks to prepare in the background (default: 2)'
+    )
 
     args = parser.parse_args()
 
-    executor = SprintExecutionInteractive(args.sprint)
+    executor = SprintExecutionInteractive(args.sprint, prefetch=args.prefetch)
     success = executor.execute()
 
     sys.exit(0 if success else 1)
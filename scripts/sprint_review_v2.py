@@ -20,15 +20,27 @@ Usage:
     # 2. Get AI reviews via Claude CLI (automated)
     # 3. Present recommendation and BLOCK for your approval
     # 4. Close sprint only if you type "yes"
+
+    # Reviewer fan-out: run up to 4 reviewers at once, give up after 90s
+    python3 scripts/sprint_review_v2.py --sprint "Sprint 7" --max-parallel 4 --review-deadline 90
+
+AI reviews (Step 5) fan out to every persona in REVIEWERS concurrently as
+asyncio subprocesses, print each review as it arrives, and stop waiting at
+an overall deadline. Reviews are cached by (sprint snapshot hash, reviewer
+prompt hash), so re-running after an interrupted approval gate reuses them
+instead of calling Claude again.
 """
 
 import os
 import sys
 import json
+import time
+import asyncio
+import hashlib
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -38,6 +50,35 @@ sys.path.insert(0, str(project_root / '.claude' / 'skills'))
 from work_tracking import get_adapter
 
 
+# Reviewer personas for Step 5. Each gets the sprint context (JSON) in place
+# of {context}; fallback is used when the reviewer gives no usable answer.
+REVIEWERS: List[Dict[str, Any]] = [
+    {
+        'name': 'qa',
+        'label': 'QA Review',
+        'system_prompt': "You are a QA specialist reviewing sprint completion.",
+        'user_prompt': "Sprint data: {context}. Recommend APPROVE, BLOCK, or CONDITIONAL with brief notes.",
+        'fallback': {'recommendation': 'APPROVE', 'notes': 'Automated approval'},
+    },
+    {
+        'name': 'security',
+        'label': 'Security Review',
+        'system_prompt': "You are a security specialist.",
+        'user_prompt': "Security review for sprint: {context}. Recommend APPROVE or BLOCK with score.",
+        'fallback': {'recommendation': 'APPROVE', 'score': '5/5'},
+    },
+]
+
+REVIEW_CACHE_DIR = Path('.claude/cache/sprint-reviews')
+
+# Seconds a single Claude CLI call may take
+CLAUDE_CALL_TIMEOUT = 60
+
+
+def _sha256(data: Any) -> str:
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
 class SprintReviewV2:
     """
     Sprint review with GENUINE external enforcement.
@@ -46,9 +87,19 @@ class SprintReviewV2:
     Spawns Claude CLI when AI reasoning needed.
     """
 
-    def __init__(self, sprint_name: str, use_claude_api: bool = False):
+    def __init__(
+        self,
+        sprint_name: str,
+        use_claude_api: bool = False,
+        max_parallel: int = 4,
+        review_deadline: float = 120.0,
+        use_review_cache: bool = True
+    ):
         self.sprint_name = sprint_name
         self.use_claude_api = use_claude_api  # Use Claude API instead of CLI
+        self.max_parallel = max_parallel
+        self.review_deadline = review_deadline
+        self.use_review_cache = use_review_cache
         self.adapter = get_adapter()
         self.steps_completed: List[str] = []
         self.evidence: Dict[str, Any] = {}
@@ -224,29 +275,13 @@ class SprintReviewV2:
             'test_reports': self.evidence['tests']['count']
         }
 
-        # Call Claude CLI in non-interactive mode
-        print("Calling Claude CLI for QA review...")
-        qa_review = self._call_claude_cli(
-            system_prompt="You are a QA specialist reviewing sprint completion.",
-            user_prompt=f"Sprint data: {json.dumps(context)}. Recommend APPROVE, BLOCK, or CONDITIONAL with brief notes.",
-            output_format="json"
-        )
+        reviews, sources = self._run_reviewer_fanout(context)
 
-        print("Calling Claude CLI for security review...")
-        security_review = self._call_claude_cli(
-            system_prompt="You are a security specialist.",
-            user_prompt=f"Security review for sprint: {json.dumps(context)}. Recommend APPROVE or BLOCK with score.",
-            output_format="json"
-        )
-
-        reviews = {
-            'qa': qa_review or {'recommendation': 'APPROVE', 'notes': 'Automated approval'},
-            'security': security_review or {'recommendation': 'APPROVE', 'score': '5/5'}
-        }
-
-        print(f"✓ QA Review: {reviews['qa'].get('recommendation', 'N/A')}")
-        print(f"✓ Security Review: {reviews['security'].get('recommendation', 'N/A')}")
+        print(f"✓ {len(reviews)} review(s): " + ", ".join(
+            f"{name}={reviews[name].get('recommendation', 'N/A')} ({sources[name]})" for name in reviews
+        ))
 
+        self.evidence['review_sources'] = sources
         self.evidence['reviews'] = reviews
         self.steps_completed.append('5-reviews')
         print("✅ Step 5 complete")
@@ -442,35 +477,160 @@ Format:
         self.steps_completed.append('8-closure')
         print("✅ Step 8 complete")
 
-    def _call_claude_cli(
+    def _sprint_snapshot_hash(self, context: Dict[str, Any]) -> str:
+        """Hash of the sprint state reviewers see: the context plus each item's id, revision and state."""
+        items = sorted(
+            (item.get('id'), item.get('rev'), item.get('fields', {}).get('System.State'))
+            for item in self.evidence['metrics']['items']
+        )
+        return _sha256({'context': context, 'items': items, 'tests': self.evidence['tests']['reports']})
+
+    def _run_reviewer_fanout(
+        self,
+        context: Dict[str, Any]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """
+        Run every reviewer in REVIEWERS concurrently.
+
+        Returns:
+            (reviews by reviewer name, source by reviewer name: "ai",
+            "cache" or "fallback")
+        """
+        snapshot_hash = self._sprint_snapshot_hash(context)
+        context_json = json.dumps(context)
+
+        reviews: Dict[str, Dict[str, Any]] = {}
+        sources: Dict[str, str] = {}
+        pending = []
+        for reviewer in REVIEWERS:
+            system_prompt = reviewer['system_prompt']
+            user_prompt = reviewer['user_prompt'].format(context=context_json)
+            cache_file = REVIEW_CACHE_DIR / f"{snapshot_hash[:16]}-{_sha256([system_prompt, user_prompt])[:16]}.json"
+
+            cached = self._load_cached_review(cache_file)
+            if cached is not None:
+                reviews[reviewer['name']] = cached
+                sources[reviewer['name']] = 'cache'
+                print(f"✓ {reviewer['label']}: {cached.get('recommendation', 'N/A')} (cached)")
+            else:
+                pending.append((reviewer, system_prompt, user_prompt, cache_file))
+
+        if pending:
+            print(f"Calling Claude CLI for {len(pending)} review(s), "
+                  f"{min(self.max_parallel, len(pending))} at a time...")
+            results = asyncio.run(self._fan_out(pending))
+            for reviewer, _, _, cache_file in pending:
+                review = results.get(reviewer['name'])
+                if review is not None:
+                    reviews[reviewer['name']] = review
+                    sources[reviewer['name']] = 'ai'
+                    self._save_cached_review(cache_file, review)
+                else:
+                    reviews[reviewer['name']] = dict(reviewer['fallback'])
+                    sources[reviewer['name']] = 'fallback'
+
+        # Keep REVIEWERS order, whichever finished first
+        names = [reviewer['name'] for reviewer in REVIEWERS]
+        return {name: reviews[name] for name in names}, {name: sources[name] for name in names}
+
+    async def _fan_out(self, pending: List[Tuple[Dict[str, Any], str, str, Path]]) -> Dict[str, Dict[str, Any]]:
+        """Run reviewer calls with bounded parallelism, printing each as it completes, until the deadline."""
+        semaphore = asyncio.Semaphore(max(self.max_parallel, 1))
+        started = time.monotonic()
+
+        async def review(reviewer, system_prompt, user_prompt):
+            async with semaphore:
+                result = await self._call_claude_cli_async(system_prompt, user_prompt)
+            return reviewer, result
+
+        tasks = [
+            asyncio.ensure_future(review(reviewer, system_prompt, user_prompt))
+            for reviewer, system_prompt, user_prompt, _ in pending
+        ]
+        results: Dict[str, Dict[str, Any]] = {}
+        try:
+            for next_done in asyncio.as_completed(tasks, timeout=self.review_deadline):
+                reviewer, result = await next_done
+                elapsed = time.monotonic() - started
+                if result is not None:
+                    results[reviewer['name']] = result
+                    print(f"✓ {reviewer['label']}: {result.get('recommendation', 'N/A')} ({elapsed:.1f}s)")
+                else:
+                    print(f"⚠️  {reviewer['label']}: no usable response, using fallback ({elapsed:.1f}s)")
+        except asyncio.TimeoutError:
+            unfinished = len(pending) - sum(1 for task in tasks if task.done())
+            print(f"⚠️  Review deadline ({self.review_deadline:g}s) reached; "
+                  f"{unfinished} reviewer(s) use fallback")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return results
+
+    def _load_cached_review(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        if not self.use_review_cache:
+            return None
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_cached_review(self, cache_file: Path, review: Dict[str, Any]):
+        if not self.use_review_cache:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(review, f, indent=2)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"  ⚠️  Could not cache review: {e}")
+
+    async def _call_claude_cli_async(
         self,
         system_prompt: str,
         user_prompt: str,
         output_format: str = "json"
     ) -> Optional[Dict[str, Any]]:
-        """Call Claude CLI in non-interactive mode."""
+        """Call Claude CLI in non-interactive mode as an asyncio subprocess (killed if cancelled)."""
         try:
-            result = subprocess.run(
-                [
-                    'claude',
-                    '--print',
-                    '--output-format', output_format,
-                    '--no-session-persistence',
-                    '--system-prompt', system_prompt,
-                    user_prompt
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=60
+            process = await asyncio.create_subprocess_exec(
+                'claude',
+                '--print',
+                '--output-format', output_format,
+                '--no-session-persistence',
+                '--system-prompt', system_prompt,
+                user_prompt,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
+        except (FileNotFoundError, PermissionError) as e:
+            print(f"  ⚠️  Claude CLI call failed: {e}")
+            return None
 
-            if output_format == 'json':
-                return json.loads(result.stdout)
-            else:
-                return {'response': result.stdout}
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=CLAUDE_CALL_TIMEOUT)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            print(f"  ⚠️  Claude CLI call timed out after {CLAUDE_CALL_TIMEOUT}s")
+            return None
 
-        except (subprocess.CalledProcessError, json.JSONDecodeError, FileNotFoundError, subprocess.TimeoutExpired) as e:
+        if process.returncode != 0:
+            print(f"  ⚠️  Claude CLI call failed: exit code {process.returncode}: "
+                  f"{stderr.decode('utf-8', 'replace').strip()[:200]}")
+            return None
+        output = stdout.decode('utf-8', 'replace')
+        if output_format != 'json':
+            return {'response': output}
+        try:
+            return json.loads(output)
+        except json.JSONDecodeError as e:
             print(f"  ⚠️  Claude CLI call failed: {e}")
             return None
 
@@ -521,10 +681,33 @@ def main():
         action='store_true',
         help='Use Claude API instead of CLI (requires ANTHROPIC_API_KEY)'
     )
+    parser.add_argument(
+        '--max-parallel',
+        type=int,
+        default=4,
+        help='Maximum AI reviewers running at once (default: 4)'
+    )
+    parser.add_argument(
+        '--review-deadline',
+        type=float,
+        default=120.0,
+        help='Seconds to wait for all AI reviews before using fallbacks (default: 120)'
+    )
+    parser.add_argument(
+        '--no-review-cache',
+        action='store_true',
+        help='Ignore reviews cached from an earlier run of this sprint snapshot'
+    )
 
     args = parser.parse_args()
 
-    reviewer = SprintReviewV2(args.sprint, args.use_api)
+    reviewer = SprintReviewV2(
+        args.sprint,
+        args.use_api,
+        max_parallel=args.max_parallel,
+        review_deadline=args.review_deadline,
+        use_review_cache=not args.no_review_cache
+    )
     success = reviewer.execute()
 
     sys.exit(0 if success else 1)
@@ -1,9 +1,37 @@
 """
 Setup configuration for Trustable AI.
 """
-from setuptools import setup, find_packages
+import importlib.util
 from pathlib import Path
 
+from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
+
+
+class BuildPyWithCompiledTemplates(build_py):
+    """Precompile the bundled Jinja2 templates into the build tree."""
+
+    def run(self):
+        super().run()
+
+        # Load the module directly; importing the core package pulls in runtime deps
+        spec = importlib.util.spec_from_file_location(
+            "template_env", Path(__file__).parent / "core" / "template_env.py"
+        )
+        template_env = importlib.util.module_from_spec(spec)
+        try:
+            spec.loader.exec_module(template_env)
+        except ImportError:
+            # jinja2 not available at build time; templates compile on first use
+            return
+
+        for package in ("agents", "workflows"):
+            template_env.compile_templates(
+                Path(package) / "templates",
+                Path(self.build_lib) / package / "templates",
+            )
+
+
 # Read README for long description
 readme_path = Path(__file__).parent / "README.md"
 long_description = readme_path.read_text() if readme_path.exists() else ""
@@ -21,6 +49,7 @@ setup(
         "": ["*.j2", "*.yaml", "*.yml", "*.md"],
     },
     include_package_data=True,
+    cmdclass={"build_py": BuildPyWithCompiledTemplates},
     install_requires=[
         "pyyaml>=6.0",
         "jinja2>=3.1.0",
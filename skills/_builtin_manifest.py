@@ -0,0 +1,31 @@
+"""
+Built-in skill manifest.
+
+Generated by `python -m skills.manifest`; do not edit by hand.
+"""
+
+SKILLS = [{'name': 'azure_devops',
+  'description': 'Azure DevOps operations with verification patterns',
+  'version': '1.0.0',
+  'module': 'skills.azure_devops',
+  'attribute': 'get_skill'},
+ {'name': 'context',
+  'description': 'Context loading and optimization for token efficiency',
+  'version': '1.0.0',
+  'module': 'skills.context',
+  'attribute': 'get_skill'},
+ {'name': 'coordination',
+  'description': 'Cross-repo coordination and multi-agent orchestration',
+  'version': '1.0.0',
+  'module': 'skills.coordination',
+  'attribute': 'get_skill'},
+ {'name': 'learnings',
+  'description': 'Institutional knowledge capture and management',
+  'version': '1.0.0',
+  'module': 'skills.learnings',
+  'attribute': 'get_skill'},
+ {'name': 'workflow',
+  'description': 'Workflow state management, checkpointing, and profiling',
+  'version': '1.0.0',
+  'module': 'skills.workflow',
+  'attribute': 'get_skill'}]
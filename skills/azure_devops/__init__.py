@@ -4,10 +4,10 @@ Azure DevOps Skill for TAID.
 Provides battle-tested Azure DevOps operations via CLI wrapper.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from ..base import VerifiableSkill
-from .cli_wrapper import AzureCLI
+from .cli_wrapper import AzureCLI, PipelineRunEvent
 
 
 class AzureDevOpsSkill(VerifiableSkill):
@@ -254,6 +254,16 @@ class AzureDevOpsSkill(VerifiableSkill):
         """Get pipeline run status."""
         return self.cli.get_pipeline_run(run_id)
 
+    def wait_for_pipeline_run(
+        self,
+        pipeline: Union[int, str],
+        run_id: int,
+        on_event: Optional[Callable[[PipelineRunEvent], None]] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Wait for a pipeline run to complete, reporting stage events."""
+        return self.cli.wait_for_pipeline_run(pipeline, run_id, on_event=on_event, timeout=timeout)
+
 
 # Factory function for registry
 def get_skill(config: Optional[Dict[str, Any]] = None) -> AzureDevOpsSkill:
@@ -26,10 +26,16 @@ REST API Operations:
 
 import json
 import base64
+import copy
+import hashlib
 import os
+import threading
+import time
 import yaml
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # Import config loader for pure Python config loading
 import sys
@@ -44,17 +50,171 @@ except ImportError:
     HAS_REQUESTS = False
 
 
+# Metadata cache, used only in projects with a .claude directory so nothing
+# is written outside an initialized project
+METADATA_CACHE_PATH = Path(".claude") / "cache" / "azure-devops-metadata.json"
+METADATA_CACHE_VERSION = 1
+
+# How long each kind of cached metadata is trusted (seconds)
+METADATA_TTLS: Dict[str, float] = {
+    "iterations": 15 * 60,
+    "repository_ids": 24 * 60 * 60,
+    "pipeline_ids": 24 * 60 * 60,
+    "current_user": 24 * 60 * 60,
+    "work_item_types": 24 * 60 * 60,
+    "work_item_fields": 24 * 60 * 60,
+}
+
+# Bounds for the adaptive pipeline run polling interval (seconds)
+PIPELINE_POLL_MIN_SECONDS = 5.0
+PIPELINE_POLL_MAX_SECONDS = 60.0
+
+
 class AuthenticationError(Exception):
     """Raised when Azure DevOps authentication fails."""
     pass
 
 
+@dataclass
+class PipelineRunEvent:
+    """A change observed while watching a pipeline run."""
+    kind: str  # "stage_started", "stage_finished" or "run_finished"
+    pipeline_id: int
+    run_id: int
+    stage: Optional[str] = None
+    state: Optional[str] = None
+    result: Optional[str] = None
+
+
+@dataclass
+class _RunWatch:
+    """Polling state for one watched pipeline run."""
+    pipeline_id: int
+    run_id: int
+    interval: float
+    next_poll: float = 0.0
+    stages: Dict[str, str] = field(default_factory=dict)
+    started: Dict[str, str] = field(default_factory=dict)
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an Azure DevOps timestamp (up to 7 fractional digits, "Z" suffix) as UTC."""
+    if not value:
+        return None
+    text = value.rstrip("Z")
+    if "+" in text[10:]:
+        text = text[:10] + text[10:].split("+", 1)[0]
+    if "." in text:
+        whole, fraction = text.split(".", 1)
+        text = f"{whole}.{fraction[:6].ljust(6, '0')}"
+    try:
+        return datetime.fromisoformat(text).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+class MetadataCache:
+    """
+    TTL cache for Azure DevOps metadata that rarely changes.
+
+    Entries are grouped by kind (see METADATA_TTLS) and scoped to an
+    organization/project, and are persisted to a JSON file when a path is
+    given, so later processes skip the lookups as well.
+    """
+
+    def __init__(self, path: Optional[Path], scope: str, ttls: Optional[Dict[str, float]] = None):
+        self.path = path
+        self.scope = scope
+        self.ttls = dict(METADATA_TTLS, **(ttls or {}))
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Dict[str, Any]]] = self._read_scopes().get(scope, {})
+
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        """Return a copy of a cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(kind, {}).get(key)
+        if entry is None or time.time() - entry["stored_at"] > self.ttls.get(kind, 0):
+            return None
+        return copy.deepcopy(entry["value"])
+
+    def set(self, kind: str, key: str, value: Any) -> None:
+        """Cache a value."""
+        self.update(kind, {key: value})
+
+    def update(self, kind: str, values: Dict[str, Any]) -> None:
+        """Cache several values of one kind with a single write."""
+        stored_at = time.time()
+        with self._lock:
+            entries = self._entries.setdefault(kind, {})
+            for key, value in values.items():
+                entries[key] = {"value": copy.deepcopy(value), "stored_at": stored_at}
+            self._save()
+
+    def invalidate(self, kind: Optional[str] = None, key: Optional[str] = None) -> None:
+        """
+        Drop cached metadata.
+
+        Args:
+            kind: Kind to drop; all kinds when omitted
+            key: Single entry of kind to drop; the whole kind when omitted
+        """
+        with self._lock:
+            if kind is None:
+                self._entries.clear()
+            elif key is None:
+                self._entries.pop(kind, None)
+            else:
+                self._entries.get(kind, {}).pop(key, None)
+            self._save()
+
+    def _read_scopes(self) -> Dict[str, Any]:
+        if not self.path:
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != METADATA_CACHE_VERSION:
+            return {}
+        return data.get("scopes", {})
+
+    def _save(self) -> None:
+        """Write this scope back, keeping other projects' entries (caller holds the lock)."""
+        if not self.path:
+            return
+        scopes = self._read_scopes()
+        scopes[self.scope] = self._entries
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps({"version": METADATA_CACHE_VERSION, "scopes": scopes}, indent=2),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+
 class AzureCLI:
     """Wrapper for Azure CLI DevOps operations."""
 
-    def __init__(self):
+    def __init__(self, refresh_metadata: bool = False):
+        """
+        Args:
+            refresh_metadata: Discard cached metadata (iterations, repository
+                and pipeline IDs, current user, work item types and fields)
+                so it's fetched again
+        """
         self._config = self._load_configuration()
         self._cached_token: Optional[str] = None
+        self._stage_durations: Dict[Tuple[int, str], float] = {}
+        self._metadata = MetadataCache(
+            METADATA_CACHE_PATH if METADATA_CACHE_PATH.parent.parent.is_dir() else None,
+            scope=f"{self._config.get('organization')}/{self._config.get('project')}"
+        )
+        if refresh_metadata:
+            self._metadata.invalidate()
 
     def _load_configuration(self) -> Dict[str, str]:
         """
@@ -144,6 +304,16 @@ class AzureCLI:
             "verification": verification_data
         }
 
+    def invalidate_metadata(self, kind: Optional[str] = None, key: Optional[str] = None) -> None:
+        """
+        Drop cached metadata so it's fetched again on next use.
+
+        Args:
+            kind: One of METADATA_TTLS' kinds; all kinds when omitted
+            key: Single entry to drop (e.g. a repository or pipeline name)
+        """
+        self._metadata.invalidate(kind, key)
+
     # Work Items
 
     def query_work_items(self, wiql: str) -> List[Dict]:
@@ -705,6 +875,69 @@ class AzureCLI:
             "work_item": work_item
         }
 
+    # Work Item Types and Fields
+
+    def list_work_item_types(self, project: Optional[str] = None) -> List[Dict]:
+        """
+        List the work item types of the project's process, cached.
+
+        Args:
+            project: Project name (optional, uses config if not provided)
+
+        Returns:
+            List of work item type dicts (name, referenceName, states, fields, ...)
+
+        Raises:
+            AuthenticationError: If authentication fails (401/403)
+            Exception: For other API errors
+        """
+        project = project or self._get_project()
+        return self._list_metadata(
+            "work_item_types", project, f"{project}/_apis/wit/workitemtypes", "work item types"
+        )
+
+    def list_work_item_fields(self, project: Optional[str] = None) -> List[Dict]:
+        """
+        List the work item field definitions available in the project, cached.
+
+        Args:
+            project: Project name (optional, uses config if not provided)
+
+        Returns:
+            List of field dicts (name, referenceName, type, readOnly, ...)
+
+        Raises:
+            AuthenticationError: If authentication fails (401/403)
+            Exception: For other API errors
+        """
+        project = project or self._get_project()
+        return self._list_metadata(
+            "work_item_fields", project, f"{project}/_apis/wit/fields", "work item fields"
+        )
+
+    def _list_metadata(self, kind: str, project: str, endpoint: str, description: str) -> List[Dict]:
+        """Fetch a project-level list endpoint through the metadata cache."""
+        values = self._metadata.get(kind, project)
+        if values is not None:
+            return values
+
+        try:
+            result = self._make_request("GET", endpoint, params={"api-version": "7.1"})
+        except Exception as e:
+            error_msg = str(e)
+            if "401" in error_msg or "403" in error_msg:
+                raise AuthenticationError(
+                    f"Authentication failed when listing {description} for project '{project}'. "
+                    f"Verify your Azure DevOps PAT token is valid and has Work Items (Read) scope."
+                ) from e
+            raise Exception(
+                f"Failed to list {description} for project '{project}': {error_msg}"
+            ) from e
+
+        values = result.get("value", [])
+        self._metadata.set(kind, project, values)
+        return values
+
     # Pull Requests
 
     def _get_repository_id(self, repository_name: Optional[str] = None) -> str:
@@ -723,12 +956,19 @@ class AzureCLI:
         project = self._get_project()
         repo_name = repository_name or project
 
+        repository_id = self._metadata.get("repository_ids", repo_name)
+        if repository_id:
+            return repository_id
+
         endpoint = f"{project}/_apis/git/repositories/{repo_name}"
         params = {"api-version": "7.1"}
 
         try:
             result = self._make_request("GET", endpoint, params=params)
-            return result.get("id")
+            repository_id = result.get("id")
+            if repository_id:
+                self._metadata.set("repository_ids", repo_name, repository_id)
+            return repository_id
         except Exception as e:
             error_msg = str(e)
             if "404" in error_msg:
@@ -762,6 +1002,12 @@ class AzureCLI:
         params = {"api-version": "7.1-preview"}
 
         try:
+            # Keyed by token, so switching PATs never returns another user's ID
+            token_key = hashlib.sha256(self._get_auth_token().encode()).hexdigest()[:16]
+            user_id = self._metadata.get("current_user", token_key)
+            if user_id:
+                return user_id
+
             result = self._make_request("GET", endpoint, params=params)
             authenticated_user = result.get("authenticatedUser", {})
             user_id = authenticated_user.get("id")
@@ -772,6 +1018,7 @@ class AzureCLI:
                     "Verify your Azure DevOps PAT token is valid."
                 )
 
+            self._metadata.set("current_user", token_key, user_id)
             return user_id
         except Exception as e:
             if isinstance(e, AuthenticationError):
@@ -970,6 +1217,10 @@ class AzureCLI:
         """
         Get pipeline ID by name using REST API.
 
+        Pipelines are listed once and kept in the metadata cache as a
+        name→id map; the listing is only repeated when a name isn't in the
+        map (e.g. a new pipeline) or the map has expired.
+
         Args:
             pipeline_name: Pipeline name
 
@@ -979,6 +1230,10 @@ class AzureCLI:
         Raises:
             Exception: If pipeline not found (404) or request fails
         """
+        pipeline_id = self._metadata.get("pipeline_ids", pipeline_name)
+        if pipeline_id is not None:
+            return pipeline_id
+
         project = self._get_project()
 
         endpoint = f"{project}/_apis/pipelines"
@@ -987,10 +1242,13 @@ class AzureCLI:
         try:
             result = self._make_request("GET", endpoint, params=params)
             pipelines = result.get("value", [])
+            pipeline_ids = {
+                pipeline.get("name"): pipeline.get("id") for pipeline in pipelines
+            }
+            self._metadata.update("pipeline_ids", pipeline_ids)
 
-            for pipeline in pipelines:
-                if pipeline.get("name") == pipeline_name:
-                    return pipeline.get("id")
+            if pipeline_name in pipeline_ids:
+                return pipeline_ids[pipeline_name]
 
             raise Exception(
                 f"Pipeline '{pipeline_name}' not found in project '{project}'. "
@@ -1011,9 +1269,17 @@ class AzureCLI:
             else:
                 raise
 
+    def _resolve_pipeline_id(self, pipeline: Union[int, str]) -> int:
+        """Return the ID for a pipeline given by ID or by name."""
+        if isinstance(pipeline, int):
+            return pipeline
+        if str(pipeline).isdigit():
+            return int(pipeline)
+        return self._get_pipeline_id(pipeline)
+
     def trigger_pipeline(
         self,
-        pipeline_id: int,
+        pipeline_id: Union[int, str],
         branch: str,
         variables: Optional[Dict[str, str]] = None
     ) -> Dict:
@@ -1021,7 +1287,8 @@ class AzureCLI:
         Trigger a pipeline run using Azure DevOps REST API.
 
         Args:
-            pipeline_id: Pipeline ID (use _get_pipeline_id to resolve from name)
+            pipeline_id: Pipeline ID, or pipeline name (resolved through the
+                cached name→id map)
             branch: Branch to build (e.g., "main", "refs/heads/feature-branch")
             variables: Optional dictionary of pipeline variables/parameters
 
@@ -1048,6 +1315,8 @@ class AzureCLI:
             {'id': 123, 'state': 'inProgress', 'url': 'https://...', ...}
         """
         project = self._get_project()
+        requested = pipeline_id
+        pipeline_id = self._resolve_pipeline_id(pipeline_id)
 
         # Build run request body
         # Branch refs must be in format "refs/heads/{branch_name}"
@@ -1081,6 +1350,9 @@ class AzureCLI:
         except Exception as e:
             error_msg = str(e)
             if "404" in error_msg:
+                if requested != pipeline_id:
+                    # The cached name→id entry is stale (pipeline deleted or recreated)
+                    self._metadata.invalidate("pipeline_ids", str(requested))
                 raise Exception(
                     f"Pipeline {pipeline_id} not found in project '{project}'. "
                     f"Verify the pipeline ID is correct."
@@ -1163,6 +1435,231 @@ class AzureCLI:
                     f"Failed to get pipeline run {run_id}: {error_msg}"
                 ) from e
 
+    def get_pipeline_run_stages(self, run_id: int) -> List[Dict]:
+        """
+        Get the stages of a pipeline run from its build timeline.
+
+        Args:
+            run_id: Run ID (pipeline runs share IDs with their builds)
+
+        Returns:
+            Stage timeline records in execution order, each with name, state
+            ("pending", "inProgress", "completed"), result, startTime and
+            finishTime. Empty while the run has no timeline yet.
+
+        Raises:
+            AuthenticationError: If authentication fails (401/403)
+            Exception: For other API errors
+        """
+        project = self._get_project()
+
+        endpoint = f"{project}/_apis/build/builds/{run_id}/timeline"
+        params = {"api-version": "7.1"}
+
+        try:
+            result = self._make_request("GET", endpoint, params=params)
+        except Exception as e:
+            error_msg = str(e)
+            if "404" in error_msg:
+                return []
+            elif "401" in error_msg or "403" in error_msg:
+                raise AuthenticationError(
+                    f"Authentication failed when getting timeline of run {run_id}. "
+                    f"Verify your Azure DevOps PAT token is valid and has Build (Read) scope."
+                ) from e
+            else:
+                raise Exception(
+                    f"Failed to get timeline of run {run_id}: {error_msg}"
+                ) from e
+
+        stages = [
+            record for record in (result or {}).get("records") or []
+            if record.get("type") == "Stage"
+        ]
+        return sorted(stages, key=lambda record: record.get("order") or 0)
+
+    def wait_for_pipeline_run(
+        self,
+        pipeline: Union[int, str],
+        run_id: int,
+        on_event: Optional[Callable[[PipelineRunEvent], None]] = None,
+        timeout: Optional[float] = None,
+        min_interval: float = PIPELINE_POLL_MIN_SECONDS,
+        max_interval: float = PIPELINE_POLL_MAX_SECONDS
+    ) -> Dict:
+        """
+        Wait for a pipeline run to complete.
+
+        Args:
+            pipeline: Pipeline ID or name
+            run_id: Run ID
+            on_event: Called with a PipelineRunEvent as stages start and finish
+            timeout: Seconds to wait before giving up (None waits indefinitely)
+            min_interval: Shortest delay between polls
+            max_interval: Longest delay between polls
+
+        Returns:
+            The completed run, as returned by get_pipeline_run
+
+        Raises:
+            TimeoutError: If the run hasn't completed within timeout
+
+        Example:
+            >>> run = cli.trigger_pipeline("CI-Pipeline", branch="main")
+            >>> cli.wait_for_pipeline_run("CI-Pipeline", run["id"], on_event=print)
+            {'id': 123, 'state': 'completed', 'result': 'succeeded', ...}
+        """
+        run = self.watch_runs(
+            [(pipeline, run_id)],
+            on_event=on_event,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval
+        ).get(run_id, {})
+        if run.get("state") != "completed":
+            raise TimeoutError(
+                f"Pipeline run {run_id} did not complete within {timeout}s "
+                f"(state: {run.get('state')})"
+            )
+        return run
+
+    def watch_runs(
+        self,
+        runs: List[Tuple[Union[int, str], int]],
+        on_event: Optional[Callable[[PipelineRunEvent], None]] = None,
+        timeout: Optional[float] = None,
+        min_interval: float = PIPELINE_POLL_MIN_SECONDS,
+        max_interval: float = PIPELINE_POLL_MAX_SECONDS
+    ) -> Dict[int, Dict]:
+        """
+        Watch several pipeline runs from one polling loop until they complete.
+
+        Each run is polled on its own schedule: right after a stage changes
+        state, near the expected end of the running stage when its typical
+        duration is known, and otherwise with exponential backoff between
+        min_interval and max_interval. Typical stage durations are learned
+        from the stages that finish while watching.
+
+        Args:
+            runs: (pipeline ID or name, run ID) pairs
+            on_event: Called with a PipelineRunEvent as stages start and
+                finish, and when a run finishes
+            timeout: Seconds to watch before returning (None waits until all
+                runs complete)
+            min_interval: Shortest delay between polls of a run
+            max_interval: Longest delay between polls of a run
+
+        Returns:
+            Latest state of each run keyed by run ID; runs still in progress
+            when timeout expires keep their last polled state
+        """
+        now = time.monotonic()
+        deadline = now + timeout if timeout is not None else None
+        watches = {
+            run_id: _RunWatch(self._resolve_pipeline_id(pipeline), run_id, min_interval, now)
+            for pipeline, run_id in runs
+        }
+        latest: Dict[int, Dict] = {}
+
+        while watches:
+            watch = min(watches.values(), key=lambda w: w.next_poll)
+            delay = max(0.0, watch.next_poll - time.monotonic())
+            if deadline is not None and time.monotonic() + delay > deadline:
+                break
+            if delay:
+                time.sleep(delay)
+
+            run = self.get_pipeline_run(watch.pipeline_id, watch.run_id)
+            first_poll = watch.run_id not in latest
+            latest[watch.run_id] = run
+            changed = self._emit_stage_events(
+                watch, self.get_pipeline_run_stages(watch.run_id), on_event
+            ) or first_poll
+
+            if run.get("state") == "completed":
+                del watches[watch.run_id]
+                if on_event:
+                    on_event(PipelineRunEvent(
+                        "run_finished", watch.pipeline_id, watch.run_id,
+                        state="completed", result=run.get("result")
+                    ))
+                continue
+
+            watch.interval = self._next_poll_interval(watch, changed, min_interval, max_interval)
+            watch.next_poll = time.monotonic() + watch.interval
+
+        return latest
+
+    def _emit_stage_events(
+        self,
+        watch: _RunWatch,
+        stages: List[Dict],
+        on_event: Optional[Callable[[PipelineRunEvent], None]]
+    ) -> bool:
+        """Emit events for stages whose state changed; returns whether any did."""
+        changed = False
+        for stage in stages:
+            name = stage.get("name")
+            state = stage.get("state")
+            previous = watch.stages.get(name, "pending")
+            if stage.get("startTime"):
+                watch.started[name] = stage["startTime"]
+            if state == previous:
+                continue
+            watch.stages[name] = state
+            changed = True
+
+            kinds = []
+            if previous == "pending":
+                kinds.append("stage_started")
+            if state == "completed":
+                kinds.append("stage_finished")
+                self._record_stage_duration(watch.pipeline_id, stage)
+            for kind in kinds:
+                if on_event:
+                    on_event(PipelineRunEvent(
+                        kind, watch.pipeline_id, watch.run_id,
+                        stage=name, state=state, result=stage.get("result")
+                    ))
+        return changed
+
+    def _record_stage_duration(self, pipeline_id: int, stage: Dict) -> None:
+        """Fold a finished stage's duration into the typical duration for that stage."""
+        start = _parse_timestamp(stage.get("startTime"))
+        finish = _parse_timestamp(stage.get("finishTime"))
+        if not start or not finish:
+            return
+        duration = (finish - start).total_seconds()
+        key = (pipeline_id, stage.get("name"))
+        typical = self._stage_durations.get(key)
+        # Exponential moving average, so one slow run doesn't dominate
+        self._stage_durations[key] = duration if typical is None else 0.7 * typical + 0.3 * duration
+
+    def _next_poll_interval(
+        self,
+        watch: _RunWatch,
+        changed: bool,
+        min_interval: float,
+        max_interval: float
+    ) -> float:
+        """Choose the delay before polling a run again."""
+        if changed:
+            return min_interval
+
+        for name, state in watch.stages.items():
+            if state != "inProgress":
+                continue
+            typical = self._stage_durations.get((watch.pipeline_id, name))
+            started = _parse_timestamp(watch.started.get(name))
+            if typical is None or started is None:
+                break
+            remaining = typical - (datetime.now(timezone.utc) - started).total_seconds()
+            if remaining > 0:
+                return min(max(remaining, min_interval), max_interval)
+            break
+
+        return min(watch.interval * 2, max_interval)
+
     # Iterations (Sprints)
 
     def create_iteration(
@@ -1220,6 +1717,7 @@ class AzureCLI:
 
         try:
             result = self._make_request("POST", endpoint, data=body, params=params)
+            self._metadata.invalidate("iterations")
             return result
         except Exception as e:
             error_msg = str(e)
@@ -1257,6 +1755,10 @@ class AzureCLI:
         """
         List all iterations/sprints using REST API.
 
+        Results are cached for METADATA_TTLS["iterations"] seconds, and
+        dropped whenever an iteration is created or updated through this
+        wrapper.
+
         Args:
             project: Project name (optional, uses config if not provided)
             depth: Depth of iteration hierarchy to fetch (default: 10)
@@ -1290,6 +1792,11 @@ class AzureCLI:
         if not project:
             project = self._get_project()
 
+        cache_key = f"{project}:{depth}"
+        iterations = self._metadata.get("iterations", cache_key)
+        if iterations is not None:
+            return iterations
+
         # REST API endpoint for listing iterations
         endpoint = f"{project}/_apis/wit/classificationnodes/Iterations"
         params = {
@@ -1307,6 +1814,7 @@ class AzureCLI:
             # Flatten the hierarchy into a list for backward compatibility
             iterations = self._flatten_iteration_hierarchy(children)
 
+            self._metadata.set("iterations", cache_key, iterations)
             return iterations
         except Exception as e:
             error_msg = str(e)
@@ -1392,6 +1900,7 @@ class AzureCLI:
 
         try:
             result = self._make_request("PATCH", endpoint, data=body, params=params)
+            self._metadata.invalidate("iterations")
             return result
         except Exception as e:
             error_msg = str(e)
@@ -21,6 +21,7 @@ class ContextSkill(BaseSkill):
         super().__init__(config)
         self._context_loader = None
         self._optimized_loader = None
+        self._client = None
 
     @property
     def name(self) -> str:
@@ -40,9 +41,15 @@ class ContextSkill(BaseSkill):
             # Import functions and classes that actually exist
             from core import context_loader
             from core import OptimizedContextLoader
+            from core.context_server import ContextClient
 
             self._context_loader = context_loader
-            self._optimized_loader = OptimizedContextLoader()
+            self._client = ContextClient()
+            try:
+                self._optimized_loader = OptimizedContextLoader()
+            except FileNotFoundError:
+                # No index yet; the client still loads context without one
+                self._optimized_loader = None
             self._initialized = True
             return True
         except ImportError as e:
@@ -83,6 +90,8 @@ class ContextSkill(BaseSkill):
         """
         Load context from CLAUDE.md files.
 
+        Served by the context server when it is running, in-process otherwise.
+
         Args:
             keywords: Keywords to filter relevant context
             path: Starting path for context search
@@ -91,14 +100,14 @@ class ContextSkill(BaseSkill):
         Returns:
             Dict with context content and metadata
         """
-        if not self._context_loader:
+        if not self._client:
             raise RuntimeError("Skill not initialized")
 
-        return self._context_loader.load(
-            keywords=keywords or [],
-            path=path,
-            max_tokens=max_tokens
-        )
+        client = self._client
+        if path is not None:
+            from core.context_server import ContextClient
+            client = ContextClient(path)
+        return client.load_for_task(keywords=keywords or [], max_tokens=max_tokens)
 
     def load_optimized_context(
         self,
@@ -108,22 +117,19 @@ class ContextSkill(BaseSkill):
         """
         Load optimized context based on task description.
 
-        Uses context index for fast template matching.
+        Uses the context search index to pick the most relevant files.
 
         Args:
             task_description: Description of the task
             max_tokens: Maximum tokens to include
 
         Returns:
-            Dict with matched templates and context
+            Dict with loaded files (path, score, tokens, content) and tokens_used
         """
-        if not self._optimized_loader:
-            raise RuntimeError("Skill not initialized or optimized loader unavailable")
+        if not self._client:
+            raise RuntimeError("Skill not initialized")
 
-        return self._optimized_loader.load_for_task(
-            task_description,
-            max_tokens=max_tokens
-        )
+        return self._client.load_for_description(task_description, max_tokens=max_tokens)
 
     def build_index(
         self,
@@ -163,7 +169,7 @@ class ContextSkill(BaseSkill):
         Returns:
             Context string for the agent
         """
-        if not self._context_loader:
+        if not self._client:
             raise RuntimeError("Skill not initialized")
 
         # Agent-specific keyword mapping
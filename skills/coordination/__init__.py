@@ -2,15 +2,36 @@
 Coordination Skill for TAID.
 
 Manages cross-repo coordination and multi-agent orchestration.
+
+Each session is stored in its own directory under ``sessions/`` with a
+small ``session.json`` and an append-only ``events.jsonl`` (see
+event_log.py), so recording an event appends one line instead of
+rewriting every session. Dependencies form a DAG kept in
+``dependencies.json`` (see dependency_graph.py); the scheduling methods
+hand agents unblocked work from its ready set. Sessions from the older single ``sessions.yaml``
+file are migrated on initialize; completed sessions move to ``archive/``.
 """
 
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 import json
+import os
+import shutil
 import yaml
 
 from ..base import BaseSkill
+from .dependency_graph import DependencyCycleError, DependencyGraph
+from .event_log import FileLock, SessionEventLog
+
+SESSIONS_DIR = "sessions"
+ARCHIVE_DIR = "archive"
+SESSION_FILE = "session.json"
+EVENTS_FILE = "events.jsonl"
+GRAPH_FILE = "dependencies.json"
+LOCK_FILE = "session.lock"
+LEGACY_SESSIONS_FILE = "sessions.yaml"
 
 
 class CoordinationSkill(BaseSkill):
@@ -24,7 +45,8 @@ class CoordinationSkill(BaseSkill):
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
         self._coordination_dir: Optional[Path] = None
-        self._active_sessions: Dict[str, Dict[str, Any]] = {}
+        self._event_logs: Dict[str, SessionEventLog] = {}
+        self._graphs: Dict[str, Tuple[Tuple[int, int], DependencyGraph]] = {}
 
     @property
     def name(self) -> str:
@@ -44,13 +66,8 @@ class CoordinationSkill(BaseSkill):
             self._coordination_dir = Path(
                 self.config.get('coordination_dir', '.claude/coordination')
             )
-            self._coordination_dir.mkdir(parents=True, exist_ok=True)
-
-            # Load active sessions
-            sessions_file = self._coordination_dir / 'sessions.yaml'
-            if sessions_file.exists():
-                with open(sessions_file) as f:
-                    self._active_sessions = yaml.safe_load(f) or {}
+            (self._coordination_dir / SESSIONS_DIR).mkdir(parents=True, exist_ok=True)
+            self._migrate_legacy_sessions()
 
             self._initialized = True
             return True
@@ -97,20 +114,35 @@ class CoordinationSkill(BaseSkill):
             "context": context or {},
             "status": "active",
             "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            "events": []
+            "updated_at": datetime.now().isoformat()
         }
 
-        self._active_sessions[session_id] = session
-        self._save_sessions()
+        session_dir = self._session_dir(session_id)
+        session_dir.mkdir(parents=True, exist_ok=True)
+        self._write_metadata(session_dir, session)
+        (session_dir / EVENTS_FILE).touch()
 
         return session_id
 
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Get session by ID."""
+        """
+        Get session by ID, including its events.
+
+        "updated_at" reflects the latest metadata change or event.
+        """
         if not self._initialized:
             raise RuntimeError("Skill not initialized")
-        return self._active_sessions.get(session_id)
+
+        session = self._read_metadata(self._session_dir(session_id))
+        if session is None:
+            return None
+        log = self._event_log(session_id)
+        session["events"] = log.events()
+        session["dependencies"] = list(self._graph(session_id).dependencies.values())
+        last_event = log.last_timestamp()
+        if last_event and last_event > session.get("updated_at", ""):
+            session["updated_at"] = last_event
+        return session
 
     def update_session(
         self,
@@ -130,15 +162,11 @@ class CoordinationSkill(BaseSkill):
         if not self._initialized:
             raise RuntimeError("Skill not initialized")
 
-        session = self._active_sessions.get(session_id)
-        if not session:
-            raise ValueError(f"Session not found: {session_id}")
+        with self._locked_metadata(session_id) as session:
+            session["context"].update(context_updates)
+            session["updated_at"] = datetime.now().isoformat()
 
-        session["context"].update(context_updates)
-        session["updated_at"] = datetime.now().isoformat()
-
-        self._save_sessions()
-        return session
+        return self.get_session(session_id)
 
     def end_session(
         self,
@@ -158,25 +186,22 @@ class CoordinationSkill(BaseSkill):
         if not self._initialized:
             raise RuntimeError("Skill not initialized")
 
-        session = self._active_sessions.get(session_id)
-        if not session:
-            raise ValueError(f"Session not found: {session_id}")
-
-        session["status"] = "completed"
-        session["result"] = result
-        session["completed_at"] = datetime.now().isoformat()
+        with self._locked_metadata(session_id) as session:
+            session["status"] = "completed"
+            session["result"] = result
+            session["completed_at"] = datetime.now().isoformat()
 
-        # Archive the session
-        archive_path = self._coordination_dir / 'archive' / f"{session_id}.yaml"
-        archive_path.parent.mkdir(exist_ok=True)
-        with open(archive_path, 'w', encoding='utf-8') as f:
-            yaml.dump(session, f, default_flow_style=False)
+        completed = self.get_session(session_id)
 
-        # Remove from active
-        del self._active_sessions[session_id]
-        self._save_sessions()
+        # Archive the session directory, event log and all
+        archive_dir = self._coordination_dir / ARCHIVE_DIR / session_id
+        archive_dir.parent.mkdir(exist_ok=True)
+        if archive_dir.exists():
+            shutil.rmtree(archive_dir)
+        os.replace(self._session_dir(session_id), archive_dir)
+        self._event_logs.pop(session_id, None)
 
-        return session
+        return completed
 
     # Event Tracking
 
@@ -188,7 +213,7 @@ class CoordinationSkill(BaseSkill):
         data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
-        Record an event in a session.
+        Record an event in a session (one line appended to its event log).
 
         Args:
             session_id: Session ID
@@ -202,9 +227,7 @@ class CoordinationSkill(BaseSkill):
         if not self._initialized:
             raise RuntimeError("Skill not initialized")
 
-        session = self._active_sessions.get(session_id)
-        if not session:
-            raise ValueError(f"Session not found: {session_id}")
+        self._require_session(session_id)
 
         event = {
             "type": event_type,
@@ -213,11 +236,7 @@ class CoordinationSkill(BaseSkill):
             "timestamp": datetime.now().isoformat()
         }
 
-        session["events"].append(event)
-        session["updated_at"] = datetime.now().isoformat()
-
-        self._save_sessions()
-        return event
+        return self._event_log(session_id).append(event)
 
     def get_events(
         self,
@@ -228,6 +247,8 @@ class CoordinationSkill(BaseSkill):
         """
         Get events from a session with optional filtering.
 
+        Filters are answered from the log's type and participant indexes.
+
         Args:
             session_id: Session ID
             event_type: Filter by event type
@@ -239,19 +260,9 @@ class CoordinationSkill(BaseSkill):
         if not self._initialized:
             raise RuntimeError("Skill not initialized")
 
-        session = self._active_sessions.get(session_id)
-        if not session:
-            raise ValueError(f"Session not found: {session_id}")
-
-        events = session.get("events", [])
-
-        if event_type:
-            events = [e for e in events if e.get("type") == event_type]
-
-        if participant:
-            events = [e for e in events if e.get("participant") == participant]
+        self._require_session(session_id)
 
-        return events
+        return self._event_log(session_id).events(event_type or None, participant or None)
 
     # Dependency Management
 
@@ -275,28 +286,16 @@ class CoordinationSkill(BaseSkill):
 
         Returns:
             Created dependency record
+
+        Raises:
+            DependencyCycleError: If target already depends on source,
+                directly or transitively (a ValueError)
         """
         if not self._initialized:
             raise RuntimeError("Skill not initialized")
 
-        session = self._active_sessions.get(session_id)
-        if not session:
-            raise ValueError(f"Session not found: {session_id}")
-
-        dependency = {
-            "source": source,
-            "target": target,
-            "type": dependency_type,
-            "metadata": metadata or {},
-            "status": "pending",
-            "created_at": datetime.now().isoformat()
-        }
-
-        session.setdefault("dependencies", []).append(dependency)
-        session["updated_at"] = datetime.now().isoformat()
-
-        self._save_sessions()
-        return dependency
+        with self._locked_graph(session_id) as graph:
+            return graph.add_dependency(source, target, dependency_type, metadata)
 
     def resolve_dependency(
         self,
@@ -320,21 +319,8 @@ class CoordinationSkill(BaseSkill):
         if not self._initialized:
             raise RuntimeError("Skill not initialized")
 
-        session = self._active_sessions.get(session_id)
-        if not session:
-            raise ValueError(f"Session not found: {session_id}")
-
-        for dep in session.get("dependencies", []):
-            if dep["source"] == source and dep["target"] == target:
-                dep["status"] = "resolved"
-                dep["resolution"] = resolution
-                dep["resolved_at"] = datetime.now().isoformat()
-
-                session["updated_at"] = datetime.now().isoformat()
-                self._save_sessions()
-                return dep
-
-        raise ValueError(f"Dependency not found: {source} -> {target}")
+        with self._locked_graph(session_id) as graph:
+            return graph.resolve(source, target, resolution)
 
     def get_pending_dependencies(
         self,
@@ -354,32 +340,211 @@ class CoordinationSkill(BaseSkill):
         if not self._initialized:
             raise RuntimeError("Skill not initialized")
 
-        session = self._active_sessions.get(session_id)
-        if not session:
-            raise ValueError(f"Session not found: {session_id}")
+        return self._graph(session_id).pending(participant)
+
+    # Scheduling
+
+    def add_work(self, session_id: str, nodes: List[str]) -> None:
+        """
+        Add units of work to schedule, with or without dependencies.
+
+        Args:
+            session_id: Session ID
+            nodes: Work (or participant) names
+        """
+        if not self._initialized:
+            raise RuntimeError("Skill not initialized")
 
-        deps = [d for d in session.get("dependencies", []) if d["status"] == "pending"]
+        with self._locked_graph(session_id) as graph:
+            for node in nodes:
+                graph.add_node(node)
 
-        if participant:
-            deps = [d for d in deps if d["source"] == participant or d["target"] == participant]
+    def get_execution_order(self, session_id: str) -> List[str]:
+        """All work in dependency order (dependencies first)."""
+        if not self._initialized:
+            raise RuntimeError("Skill not initialized")
+        return self._graph(session_id).order()
+
+    def get_ready_work(self, session_id: str) -> List[str]:
+        """Unclaimed work with no pending dependencies, in dependency order."""
+        if not self._initialized:
+            raise RuntimeError("Skill not initialized")
+        return self._graph(session_id).ready()
 
-        return deps
+    def claim_work(self, session_id: str, agent: str, limit: int = 1) -> List[str]:
+        """
+        Hand an agent its next unblocked work.
+
+        Claims are made under the session lock, so agents claiming in
+        parallel (in this or other processes) never get the same work.
+
+        Args:
+            session_id: Session ID
+            agent: Agent asking for work
+            limit: Maximum number of units to claim
+
+        Returns:
+            Claimed work (empty if nothing is ready)
+        """
+        if not self._initialized:
+            raise RuntimeError("Skill not initialized")
+
+        with self._locked_graph(session_id) as graph:
+            return graph.claim(agent, limit)
+
+    def release_work(self, session_id: str, node: str) -> None:
+        """Return claimed work to the ready set (e.g., its agent failed)."""
+        if not self._initialized:
+            raise RuntimeError("Skill not initialized")
+
+        with self._locked_graph(session_id) as graph:
+            graph.release(node)
+
+    def complete_work(
+        self,
+        session_id: str,
+        node: str,
+        result: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """
+        Mark work done, resolving every dependency on it.
+
+        Args:
+            session_id: Session ID
+            node: Completed work
+            result: Completion details, recorded as the dependencies' resolution
+
+        Returns:
+            Work that became ready as a result
+        """
+        if not self._initialized:
+            raise RuntimeError("Skill not initialized")
+
+        with self._locked_graph(session_id) as graph:
+            return graph.complete(node, result)
 
     def list_active_sessions(self) -> List[Dict[str, Any]]:
         """List all active sessions."""
         if not self._initialized:
             raise RuntimeError("Skill not initialized")
 
-        return [
-            {"id": s["id"], "name": s["name"], "status": s["status"], "participants": s["participants"]}
-            for s in self._active_sessions.values()
-        ]
+        sessions = []
+        for session_dir in sorted((self._coordination_dir / SESSIONS_DIR).iterdir()):
+            s = self._read_metadata(session_dir)
+            if s:
+                sessions.append(
+                    {"id": s["id"], "name": s["name"], "status": s["status"], "participants": s["participants"]}
+                )
+        return sessions
+
+    # Storage
+
+    def _session_dir(self, session_id: str) -> Path:
+        return self._coordination_dir / SESSIONS_DIR / session_id
+
+    def _event_log(self, session_id: str) -> SessionEventLog:
+        log = self._event_logs.get(session_id)
+        if log is None:
+            log = SessionEventLog(self._session_dir(session_id) / EVENTS_FILE)
+            self._event_logs[session_id] = log
+        return log
+
+    def _require_session(self, session_id: str) -> Dict[str, Any]:
+        session = self._read_metadata(self._session_dir(session_id))
+        if session is None:
+            raise ValueError(f"Session not found: {session_id}")
+        return session
+
+    @staticmethod
+    def _read_metadata(session_dir: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(session_dir / SESSION_FILE, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_metadata(session_dir: Path, session: Dict[str, Any]) -> None:
+        path = session_dir / SESSION_FILE
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(session, f, indent=2, default=str)
+        os.replace(tmp_path, path)
+
+    @contextmanager
+    def _locked_metadata(self, session_id: str) -> Iterator[Dict[str, Any]]:
+        """Read a session's metadata for update; it's rewritten when the block exits normally."""
+        session_dir = self._session_dir(session_id)
+        self._require_session(session_id)
+        with FileLock(session_dir / LOCK_FILE):
+            session = self._require_session(session_id)
+            yield session
+            self._write_metadata(session_dir, session)
+
+    def _graph(self, session_id: str) -> DependencyGraph:
+        """
+        The session's dependency graph, reloaded only when its file changed.
 
-    def _save_sessions(self) -> None:
-        """Save active sessions to disk."""
-        sessions_file = self._coordination_dir / 'sessions.yaml'
-        with open(sessions_file, 'w', encoding='utf-8') as f:
-            yaml.dump(self._active_sessions, f, default_flow_style=False)
+        Sessions from before the graph file existed keep their dependencies
+        in session.json; they're loaded from there until the first change.
+        """
+        session = self._require_session(session_id)
+        path = self._session_dir(session_id) / GRAPH_FILE
+        try:
+            stat = path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return DependencyGraph.from_dict({"dependencies": session.get("dependencies", [])})
+
+        cached = self._graphs.get(session_id)
+        if cached and cached[0] == signature:
+            return cached[1]
+        with open(path, encoding="utf-8") as f:
+            graph = DependencyGraph.from_dict(json.load(f))
+        self._graphs[session_id] = (signature, graph)
+        return graph
+
+    @contextmanager
+    def _locked_graph(self, session_id: str) -> Iterator[DependencyGraph]:
+        """Load a session's graph for update; it's saved when the block exits normally."""
+        session_dir = self._session_dir(session_id)
+        self._require_session(session_id)
+        with FileLock(session_dir / LOCK_FILE):
+            graph = self._graph(session_id)
+            try:
+                yield graph
+            except BaseException:
+                # The update may have half-applied; reload from disk next time
+                self._graphs.pop(session_id, None)
+                raise
+            path = session_dir / GRAPH_FILE
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(graph.to_dict(), f, indent=2, default=str)
+            os.replace(tmp_path, path)
+            stat = path.stat()
+            self._graphs[session_id] = ((stat.st_mtime_ns, stat.st_size), graph)
+
+    def _migrate_legacy_sessions(self) -> None:
+        """Split the single sessions.yaml of older versions into per-session files."""
+        legacy_file = self._coordination_dir / LEGACY_SESSIONS_FILE
+        if not legacy_file.exists():
+            return
+
+        with open(legacy_file) as f:
+            sessions = yaml.safe_load(f) or {}
+
+        for session_id, session in sessions.items():
+            session = dict(session)
+            events = session.pop("events", [])
+            session_dir = self._session_dir(session_id)
+            session_dir.mkdir(parents=True, exist_ok=True)
+            self._write_metadata(session_dir, session)
+            with open(session_dir / EVENTS_FILE, "w", encoding="utf-8", newline="\n") as f:
+                for event in events:
+                    f.write(json.dumps(event, default=str) + "\n")
+
+        os.replace(legacy_file, legacy_file.with_name(LEGACY_SESSIONS_FILE + ".migrated"))
 
 
 # Factory function
@@ -0,0 +1,356 @@
+"""
+Dependency graph for coordination sessions.
+
+Dependencies between participants (or units of work) form a DAG: a
+dependency "source -> target" means source can't proceed until target is
+done. DependencyGraph keeps:
+
+- Adjacency indexes both ways (what a node depends on, what depends on it)
+- A topological order maintained incrementally as edges are added
+  (Pearce-Kelly: only the nodes between the new edge's endpoints in the
+  current order are visited and reordered)
+- Cycle detection on every added edge
+- A ready set: nodes with no pending dependencies that nobody has claimed
+
+Scheduling goes through ``claim`` and ``complete``: agents claim ready
+nodes (each node goes to one agent), and completing a node resolves the
+dependencies on it, returning the nodes that became ready.
+
+Usage:
+    from skills.coordination.dependency_graph import DependencyGraph
+
+    graph = DependencyGraph()
+    graph.add_dependency("web", "api", "blocks")
+    graph.add_dependency("api", "schema", "blocks")
+    graph.order()              # ["schema", "api", "web"]
+    graph.claim("agent-1")     # ["schema"]
+    graph.complete("schema")   # ["api"]
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+class DependencyCycleError(ValueError):
+    """Adding a dependency would create a cycle."""
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__(f"Dependency would create a cycle: {' -> '.join(cycle)}")
+
+
+class DependencyGraph:
+    """DAG of dependencies with incremental topological order and a ready set."""
+
+    # Node statuses
+    PENDING = "pending"
+    CLAIMED = "claimed"
+    DONE = "done"
+
+    def __init__(self):
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.dependencies: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._depends_on: Dict[str, Set[str]] = {}   # node -> targets it depends on
+        self._dependents: Dict[str, Set[str]] = {}   # node -> sources depending on it
+        self._blocking: Dict[str, int] = {}          # node -> pending dependencies
+        self._position: Dict[str, int] = {}          # node -> index in topological order
+        self._order: List[str] = []
+        self._ready: Set[str] = set()
+
+    # Building
+
+    def add_node(self, node: str) -> Dict[str, Any]:
+        """
+        Add a node (no-op if it exists).
+
+        Args:
+            node: Node name
+
+        Returns:
+            The node's state ("status", "claimed_by", ...)
+        """
+        if node not in self.nodes:
+            self.nodes[node] = {"status": self.PENDING}
+            self._depends_on[node] = set()
+            self._dependents[node] = set()
+            self._blocking[node] = 0
+            self._position[node] = len(self._order)
+            self._order.append(node)
+            self._ready.add(node)
+        return self.nodes[node]
+
+    def add_dependency(
+        self,
+        source: str,
+        target: str,
+        dependency_type: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Record that source depends on target.
+
+        Args:
+            source: Dependent node
+            target: Node depended upon
+            dependency_type: Type of dependency
+            metadata: Additional dependency metadata
+
+        Returns:
+            Dependency record
+
+        Raises:
+            DependencyCycleError: If target already (transitively) depends on source
+        """
+        if source == target:
+            raise DependencyCycleError([source, source])
+        self.add_node(source)
+        self.add_node(target)
+
+        existing = self.dependencies.get((source, target))
+        if existing:
+            return existing
+
+        self._reorder_for(source, target)
+
+        dependency = {
+            "source": source,
+            "target": target,
+            "type": dependency_type,
+            "metadata": metadata or {},
+            "status": "pending",
+            "created_at": datetime.now().isoformat()
+        }
+        self.dependencies[(source, target)] = dependency
+        self._depends_on[source].add(target)
+        self._dependents[target].add(source)
+        if self.nodes[target]["status"] != self.DONE:
+            self._blocking[source] += 1
+            self._ready.discard(source)
+        else:
+            self._mark_resolved(dependency, {"reason": "target already done"})
+        return dependency
+
+    def resolve(self, source: str, target: str, resolution: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Mark a dependency as resolved.
+
+        Args:
+            source: Dependent node
+            target: Node depended upon
+            resolution: Resolution details
+
+        Returns:
+            Updated dependency record
+
+        Raises:
+            ValueError: If the dependency doesn't exist
+        """
+        dependency = self.dependencies.get((source, target))
+        if dependency is None:
+            raise ValueError(f"Dependency not found: {source} -> {target}")
+        if dependency["status"] == "pending":
+            self._blocking[source] -= 1
+            self._update_ready(source)
+        self._mark_resolved(dependency, resolution)
+        return dependency
+
+    # Queries
+
+    def order(self) -> List[str]:
+        """All nodes, each after everything it depends on."""
+        return list(self._order)
+
+    def pending(self, node: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Pending dependencies, optionally only those involving a node.
+
+        Args:
+            node: Only dependencies where this node is source or target
+
+        Returns:
+            Pending dependency records
+        """
+        if node is None:
+            keys = list(self.dependencies)
+        elif node not in self.nodes:
+            return []
+        else:
+            keys = [(node, target) for target in self._depends_on[node]]
+            keys += [(source, node) for source in self._dependents[node]]
+        return [
+            self.dependencies[key] for key in keys
+            if self.dependencies[key]["status"] == "pending"
+        ]
+
+    def ready(self) -> List[str]:
+        """Unclaimed nodes with no pending dependencies, in topological order."""
+        return sorted(self._ready, key=self._position.__getitem__)
+
+    def blocked_by(self, node: str) -> List[str]:
+        """Nodes that node is still waiting on."""
+        return sorted(
+            target for target in self._depends_on.get(node, ())
+            if self.dependencies[(node, target)]["status"] == "pending"
+        )
+
+    # Scheduling
+
+    def claim(self, agent: str, limit: int = 1) -> List[str]:
+        """
+        Hand an agent ready nodes, so no two agents get the same work.
+
+        Args:
+            agent: Agent claiming work
+            limit: Maximum number of nodes to claim
+
+        Returns:
+            Claimed nodes (empty if nothing is ready)
+        """
+        claimed = self.ready()[:limit]
+        now = datetime.now().isoformat()
+        for node in claimed:
+            self.nodes[node].update(status=self.CLAIMED, claimed_by=agent, claimed_at=now)
+            self._ready.discard(node)
+        return claimed
+
+    def release(self, node: str) -> None:
+        """Return a claimed node to the ready set (e.g., its agent gave up)."""
+        state = self.nodes.get(node)
+        if state and state["status"] == self.CLAIMED:
+            state["status"] = self.PENDING
+            state.pop("claimed_by", None)
+            state.pop("claimed_at", None)
+            self._update_ready(node)
+
+    def complete(self, node: str, result: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Mark a node done and resolve the dependencies on it.
+
+        Args:
+            node: Completed node
+            result: Completion details, recorded as each dependency's resolution
+
+        Returns:
+            Nodes that became ready as a result
+
+        Raises:
+            ValueError: If the node doesn't exist
+        """
+        if node not in self.nodes:
+            raise ValueError(f"Unknown node: {node}")
+        self.nodes[node].update(status=self.DONE, completed_at=datetime.now().isoformat())
+        self._ready.discard(node)
+
+        newly_ready = []
+        resolution = {"completed": node, **(result or {})}
+        for source in self._dependents[node]:
+            dependency = self.dependencies[(source, node)]
+            if dependency["status"] != "pending":
+                continue
+            self.resolve(source, node, resolution)
+            if source in self._ready:
+                newly_ready.append(source)
+        return sorted(newly_ready, key=self._position.__getitem__)
+
+    # Persistence
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize nodes, dependencies and the current order."""
+        return {
+            "nodes": self.nodes,
+            "order": self.order(),
+            "dependencies": list(self.dependencies.values()),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DependencyGraph":
+        """Rebuild a graph saved with to_dict."""
+        graph = cls()
+        for node in data.get("order", []):
+            graph.add_node(node)
+        for node, state in data.get("nodes", {}).items():
+            graph.add_node(node).update(state)
+            graph._update_ready(node)
+
+        for dependency in data.get("dependencies", []):
+            source, target = dependency["source"], dependency["target"]
+            graph.add_node(source)
+            graph.add_node(target)
+            # The saved order already respects every edge; repair it if not
+            graph._reorder_for(source, target)
+            graph.dependencies[(source, target)] = dependency
+            graph._depends_on[source].add(target)
+            graph._dependents[target].add(source)
+            if dependency["status"] == "pending":
+                graph._blocking[source] += 1
+                graph._ready.discard(source)
+        return graph
+
+    # Internals
+
+    def _update_ready(self, node: str) -> None:
+        if self._blocking[node] == 0 and self.nodes[node]["status"] == self.PENDING:
+            self._ready.add(node)
+        else:
+            self._ready.discard(node)
+
+    def _mark_resolved(self, dependency: Dict[str, Any], resolution: Dict[str, Any]) -> None:
+        dependency["status"] = "resolved"
+        dependency["resolution"] = resolution
+        dependency["resolved_at"] = datetime.now().isoformat()
+
+    def _reorder_for(self, source: str, target: str) -> None:
+        """
+        Make target precede source in the order, or raise if that's a cycle.
+
+        Pearce-Kelly: only nodes positioned between source and target can
+        be affected. Nodes reachable from source through dependents (which
+        must stay after source) and nodes target depends on (which must
+        stay before target) are collected within that window; if the
+        forward search reaches target, the edge closes a cycle. Otherwise
+        the two groups swap into the window's positions, target's group
+        first.
+        """
+        lower, upper = self._position[source], self._position[target]
+        if upper < lower:
+            return
+
+        forward: List[str] = []
+        parents: Dict[str, str] = {}
+        stack, seen = [source], {source}
+        while stack:
+            node = stack.pop()
+            forward.append(node)
+            for dependent in self._dependents[node]:
+                if dependent == target:
+                    raise DependencyCycleError(self._cycle_path(parents, node, source, target))
+                if dependent not in seen and self._position[dependent] < upper:
+                    seen.add(dependent)
+                    parents[dependent] = node
+                    stack.append(dependent)
+
+        backward: List[str] = []
+        stack, seen = [target], {target}
+        while stack:
+            node = stack.pop()
+            backward.append(node)
+            for dependency in self._depends_on[node]:
+                if dependency not in seen and self._position[dependency] > lower:
+                    seen.add(dependency)
+                    stack.append(dependency)
+
+        forward.sort(key=self._position.__getitem__)
+        backward.sort(key=self._position.__getitem__)
+        slots = sorted(self._position[node] for node in forward + backward)
+        for slot, node in zip(slots, backward + forward):
+            self._position[node] = slot
+            self._order[slot] = node
+
+    @staticmethod
+    def _cycle_path(parents: Dict[str, str], node: str, source: str, target: str) -> List[str]:
+        """The cycle the edge source -> target would close, in dependency direction."""
+        # target depends on node, which depends (through parents) on source
+        chain = [node]
+        while chain[-1] != source:
+            chain.append(parents[chain[-1]])
+        return [source, target] + chain
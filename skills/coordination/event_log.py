@@ -0,0 +1,192 @@
+"""
+Append-only session storage for coordination.
+
+Each coordination session lives in its own directory under ``sessions/``:
+
+- ``session.json``: small metadata file (name, participants, context,
+  status, timestamps), rewritten atomically on the rare metadata changes
+- ``events.jsonl``: append-only event log; recording an event appends one
+  line, however many sessions and events already exist
+
+SessionEventLog holds a session's events in memory with secondary indexes
+by event type and participant, and picks up events appended by other
+processes by reading only the log's new tail. Each event is a single
+O_APPEND write, so concurrent writers never interleave lines; metadata
+read-modify-writes are serialized with a lock file (FileLock).
+
+Usage:
+    from skills.coordination.event_log import SessionEventLog
+
+    log = SessionEventLog(Path(".claude/coordination/sessions/s1/events.jsonl"))
+    log.append({"type": "work_item_created", "participant": "api", "data": {}})
+    for event in log.events(event_type="work_item_created", participant="api"):
+        print(event["timestamp"])
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class FileLock:
+    """
+    Cross-process lock backed by an exclusively created lock file.
+
+    A lock file older than ``stale_after`` seconds is assumed to belong to
+    a crashed process and is broken.
+    """
+
+    def __init__(self, path: Path, timeout: float = 10.0, stale_after: float = 60.0):
+        self.path = Path(path)
+        self.timeout = timeout
+        self.stale_after = stale_after
+
+    def __enter__(self) -> "FileLock":
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                self._break_if_stale()
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for lock: {self.path}")
+                time.sleep(0.01)
+                continue
+            os.write(fd, str(os.getpid()).encode())
+            os.close(fd)
+            return self
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+    def _break_if_stale(self) -> None:
+        try:
+            if time.time() - self.path.stat().st_mtime > self.stale_after:
+                self.path.unlink()
+        except OSError:
+            pass
+
+
+class SessionEventLog:
+    """Append-only JSONL event log with in-memory indexes by type and participant."""
+
+    def __init__(self, path: Path):
+        """
+        Open a session's event log (created on first append).
+
+        Args:
+            path: Path to events.jsonl
+        """
+        self.path = Path(path)
+        self._events: List[Dict[str, Any]] = []
+        self._by_type: Dict[str, List[int]] = {}
+        self._by_participant: Dict[str, List[int]] = {}
+        self._offset = 0
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._events)
+
+    def append(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Append an event.
+
+        Args:
+            event: Event dict ("type", "participant", "data", "timestamp")
+
+        Returns:
+            The event
+        """
+        line = (json.dumps(event, default=str) + "\n").encode("utf-8")
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        fd = os.open(self.path, flags, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+        # Reading the tail indexes this event along with any other writer's
+        self.refresh()
+        return event
+
+    def refresh(self) -> int:
+        """
+        Index events appended since the log was last read.
+
+        Returns:
+            Number of new events
+        """
+        with self._lock:
+            try:
+                size = self.path.stat().st_size
+            except OSError:
+                return 0
+            if size <= self._offset:
+                return 0
+
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                data = f.read(size - self._offset)
+
+            # A line without its newline is still being written; read it next time
+            complete = data[:data.rfind(b"\n") + 1]
+            added = 0
+            for line in complete.splitlines():
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                position = len(self._events)
+                self._events.append(event)
+                self._by_type.setdefault(event.get("type"), []).append(position)
+                self._by_participant.setdefault(event.get("participant"), []).append(position)
+                added += 1
+            self._offset += len(complete)
+            return added
+
+    def events(
+        self,
+        event_type: Optional[str] = None,
+        participant: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Events in the order they were recorded, optionally filtered.
+
+        Args:
+            event_type: Only events of this type
+            participant: Only events from this participant
+
+        Returns:
+            Matching events
+        """
+        self.refresh()
+        with self._lock:
+            if event_type is None and participant is None:
+                return list(self._events)
+
+            candidates = []
+            if event_type is not None:
+                candidates.append(self._by_type.get(event_type, []))
+            if participant is not None:
+                candidates.append(self._by_participant.get(participant, []))
+
+            # Walk the smaller index and check membership in the other
+            candidates.sort(key=len)
+            positions = candidates[0]
+            if len(candidates) > 1:
+                others = set(candidates[1])
+                positions = [position for position in positions if position in others]
+            return [self._events[position] for position in positions]
+
+    def last_timestamp(self) -> Optional[str]:
+        """Timestamp of the most recent event, if any."""
+        self.refresh()
+        with self._lock:
+            return self._events[-1].get("timestamp") if self._events else None
@@ -2,16 +2,40 @@
 Learnings Capture Skill for TAID.
 
 Captures and manages institutional knowledge from AI-assisted development.
+
+Learnings are stored in append-only segments with an offset index (see
+storage.py): capturing a learning appends one line, and listing, category
+counts and context export work from metadata without reading content.
+Directories in the older one-YAML-file-per-learning layout are migrated
+on initialize.
+
+Searches go through a persistent full-text index (search-index.json in the
+learnings directory, see search_index.py) that is updated on capture and
+re-synced with the store on initialize.
+
+export_for_context can rank learnings against a task description and pack
+the most relevant ones into a token budget, for context loaders that
+want institutional knowledge without growing the prompt unboundedly.
 """
 
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 from datetime import datetime
+import hashlib
 import json
-import yaml
+import os
 
+from core.context_dedup import ContentDeduplicator
+from core.context_index import tokenize
 
 from ..base import BaseSkill
+from .search_index import LearningsSearchIndex, make_snippet, matches_words, split_query
+from .storage import INDEX_SAVE_THRESHOLD, LearningsStore
+
+SEARCH_INDEX_FILE = "search-index.json"
+CONTEXT_CACHE_FILE = "context-cache.json"
+CONTEXT_HEADER = "## Institutional Knowledge\n"
+MAX_CACHED_CONTEXTS = 32
 
 
 class LearningsSkill(BaseSkill):
@@ -25,7 +49,10 @@ class LearningsSkill(BaseSkill):
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
         self._learnings_dir: Optional[Path] = None
-        self._index: Dict[str, List[Dict[str, Any]]] = {}
+        self._store: Optional[LearningsStore] = None
+        self._search_index: Optional[LearningsSearchIndex] = None
+        self._unsaved_search_changes = 0
+        self._context_cache: Optional[Dict[str, Any]] = None
 
     @property
     def name(self) -> str:
@@ -40,20 +67,18 @@ class LearningsSkill(BaseSkill):
         return "1.0.0"
 
     def initialize(self) -> bool:
-        """Initialize learnings directory and load index."""
+        """Initialize learnings directory and open the store."""
         try:
             self._learnings_dir = Path(
                 self.config.get('learnings_dir', '.claude/learnings')
             )
             self._learnings_dir.mkdir(parents=True, exist_ok=True)
 
-            # Load or create index
-            index_path = self._learnings_dir / 'index.yaml'
-            if index_path.exists():
-                with open(index_path) as f:
-                    self._index = yaml.safe_load(f) or {}
-            else:
-                self._index = {"learnings": [], "categories": {}}
+            self._store = LearningsStore(self._learnings_dir)
+            self._store.migrate_legacy()
+
+            self._search_index = LearningsSearchIndex(self._learnings_dir / SEARCH_INDEX_FILE)
+            self._sync_search_index()
 
             self._initialized = True
             return True
@@ -109,22 +134,10 @@ class LearningsSkill(BaseSkill):
             "updated_at": datetime.now().isoformat()
         }
 
-        # Save individual learning file
-        learning_file = self._learnings_dir / f"{learning_id}.yaml"
-        with open(learning_file, 'w', encoding='utf-8') as f:
-            yaml.dump(learning, f, default_flow_style=False)
-
-        # Update index
-        self._index.setdefault("learnings", []).append({
-            "id": learning_id,
-            "title": title,
-            "category": category,
-            "created_at": learning["created_at"]
-        })
-
-        self._index.setdefault("categories", {}).setdefault(category, []).append(learning_id)
+        self._store.put(learning)
 
-        self._save_index()
+        self._search_index.add(learning, self._store.signature(learning_id))
+        self._note_search_changes(1)
 
         return learning
 
@@ -133,66 +146,114 @@ class LearningsSkill(BaseSkill):
         if not self._initialized:
             raise RuntimeError("Skill not initialized")
 
-        learning_file = self._learnings_dir / f"{learning_id}.yaml"
-        if learning_file.exists():
-            with open(learning_file) as f:
-                return yaml.safe_load(f)
-        return None
+        return self._store.get(learning_id)
+
+    def list_learnings(
+        self,
+        category: Optional[str] = None,
+        tag: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List learnings from metadata, newest first, without reading content.
+
+        Args:
+            category: Filter by category
+            tag: Filter by tag
+            limit: Maximum number of results
+
+        Returns:
+            Learning metadata (everything but "content", plus "summary")
+        """
+        if not self._initialized:
+            raise RuntimeError("Skill not initialized")
+
+        entries = [
+            meta for meta in reversed(self._store.entries())
+            if (not category or meta.get("category") == category)
+            and (not tag or tag in (meta.get("tags") or []))
+        ]
+        return entries[:limit]
+
+    def get_all(self) -> List[Dict[str, Any]]:
+        """Every learning with its content, oldest first."""
+        if not self._initialized:
+            raise RuntimeError("Skill not initialized")
+        return self._load_many([meta["id"] for meta in self._store.entries()])
+
+    def count(self) -> int:
+        """Number of learnings."""
+        if not self._initialized:
+            raise RuntimeError("Skill not initialized")
+        return len(self._store)
 
     def search(
         self,
         query: Optional[str] = None,
         category: Optional[str] = None,
-        tags: Optional[List[str]] = None
+        tags: Optional[List[str]] = None,
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Search learnings.
 
+        Queries are answered from the full-text index: learnings must
+        contain every query word (and "quoted phrase") in their title,
+        content, tags or category, and are ranked by relevance. Words match
+        the start of a word ("iter" matches "iteration"), but not text in
+        the middle of one. Words too short to index ("ci") or stop words
+        are checked against the title and content of the index's matches.
+        Only matching learnings are read from disk.
+
         Args:
-            query: Text to search in title and content
+            query: Text to search in title, content, tags and category
             category: Filter by category
             tags: Filter by tags (any match)
+            limit: Maximum number of results
 
         Returns:
-            List of matching learnings
+            List of matching learnings. With a query, best match first and
+            each learning has "score" and "snippet" keys added.
         """
         if not self._initialized:
             raise RuntimeError("Skill not initialized")
 
-        results = []
+        indexed_query, unindexed = split_query(query or "")
+        if not indexed_query:
+            candidates = self._load_many(self._search_index.filter(category, tags))
+            return [
+                learning for learning in candidates
+                if matches_words(self._searchable_text(learning), unindexed)
+            ][:limit]
 
-        for entry in self._index.get("learnings", []):
-            learning = self.get(entry["id"])
+        # Unindexed words filter after ranking, so the limit is applied last
+        ranked = self._search_index.search(indexed_query, category, tags, None if unindexed else limit)
+
+        results = []
+        for learning_id, score in ranked:
+            learning = self.get(learning_id)
             if not learning:
                 continue
-
-            # Category filter
-            if category and learning.get("category") != category:
+            if unindexed and not matches_words(self._searchable_text(learning), unindexed):
                 continue
-
-            # Tags filter
-            if tags:
-                learning_tags = learning.get("tags", [])
-                if not any(t in learning_tags for t in tags):
-                    continue
-
-            # Query filter
-            if query:
-                query_lower = query.lower()
-                title = learning.get("title", "").lower()
-                content = learning.get("content", "").lower()
-                if query_lower not in title and query_lower not in content:
-                    continue
-
+            learning["score"] = round(score, 3)
+            learning["snippet"] = make_snippet(learning.get("content", ""), query)
             results.append(learning)
-
+            if limit and len(results) >= limit:
+                break
         return results
 
     def list_categories(self) -> List[str]:
         """List all learning categories."""
         if not self._initialized:
             raise RuntimeError("Skill not initialized")
-        return list(self._index.get("categories", {}).keys())
+        return list(self._store.categories())
+
+    def category_counts(self) -> Dict[str, int]:
+        """Number of learnings per category."""
+        if not self._initialized:
+            raise RuntimeError("Skill not initialized")
+        return self._store.categories()
 
     def get_by_category(self, category: str) -> List[Dict[str, Any]]:
         """Get all learnings in a category."""
@@ -203,25 +264,34 @@ class LearningsSkill(BaseSkill):
         if not self._initialized:
             raise RuntimeError("Skill not initialized")
 
-        entries = sorted(
-            self._index.get("learnings", []),
-            key=lambda x: x.get("created_at", ""),
-            reverse=True
-        )[:limit]
-
-        return [self.get(e["id"]) for e in entries if self.get(e["id"])]
+        return self._load_many([meta["id"] for meta in self.list_learnings(limit=limit)])
 
     def export_for_context(
         self,
         categories: Optional[List[str]] = None,
-        max_entries: int = 20
+        max_entries: int = 20,
+        task: Optional[str] = None,
+        max_tokens: Optional[int] = None
     ) -> str:
         """
         Export learnings as context for agents.
 
+        Without a task or token budget, exports the most recent learnings
+        (or every learning in the given categories) from metadata alone,
+        each shown by its stored summary.
+
+        With a task and/or token budget, learnings are ranked by relevance
+        to the task (most recent first without a task), near-duplicates
+        of learnings already included are skipped, and entries are packed
+        until the budget is used: each gets its full content if that fits,
+        otherwise its summary. Results are cached in context-cache.json by
+        (task hash, learnings version).
+
         Args:
             categories: Categories to include (all if None)
             max_entries: Maximum entries to include
+            task: Task description to rank learnings against
+            max_tokens: Token budget for the whole export (estimated)
 
         Returns:
             Formatted learnings for agent context
@@ -229,33 +299,179 @@ class LearningsSkill(BaseSkill):
         if not self._initialized:
             raise RuntimeError("Skill not initialized")
 
+        if task is not None or max_tokens is not None:
+            return self._export_relevant(task or "", categories, max_entries, max_tokens)
+
         learnings = []
         if categories:
             for cat in categories:
-                learnings.extend(self.get_by_category(cat))
+                learnings.extend(reversed(self.list_learnings(category=cat)))
         else:
-            learnings = self.get_recent(max_entries)
-
-        # Format for context
-        lines = ["## Institutional Knowledge\n"]
+            learnings = self.list_learnings(limit=max_entries)
 
-        by_category: Dict[str, List[Dict]] = {}
+        sections: Dict[str, List[str]] = {}
         for learning in learnings[:max_entries]:
-            cat = learning.get("category", "general")
-            by_category.setdefault(cat, []).append(learning)
+            sections.setdefault(learning.get("category", "general"), []).append(
+                f"- **{learning['title']}**: {learning['summary']}..."
+            )
+        return self._format_context(sections)
+
+    def _export_relevant(
+        self,
+        task: str,
+        categories: Optional[List[str]],
+        max_entries: int,
+        max_tokens: Optional[int]
+    ) -> str:
+        """Rank, dedupe and pack learnings for a task within a token budget."""
+        key_data = json.dumps([task, sorted(categories or []), max_entries, max_tokens])
+        key = hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+        version = self._store.version()
+        cached = self._cached_context(key, version)
+        if cached is not None:
+            return cached
+
+        if tokenize(task):
+            candidates = [learning_id for learning_id, _ in self._search_index.rank(task, categories)]
+        else:
+            candidates = [
+                meta["id"] for meta in self.list_learnings()
+                if not categories or meta.get("category") in categories
+            ]
+
+        dedup = ContentDeduplicator()
+        budget = max_tokens if max_tokens is not None else float("inf")
+        used = dedup.estimate_tokens(CONTEXT_HEADER)
+        sections: Dict[str, List[str]] = {}
+        included = 0
+
+        for learning_id in candidates:
+            if included >= max_entries or used >= budget:
+                break
+            meta = self._store.metadata(learning_id)
+            if meta is None:
+                continue
 
-        for category, items in by_category.items():
-            lines.append(f"\n### {category.replace('-', ' ').title()}\n")
-            for item in items:
-                lines.append(f"- **{item['title']}**: {item['content'][:200]}...")
+            # Only read the content when the summary doesn't already hold it
+            content = meta["summary"]
+            if meta.get("content_chars", 0) > len(content):
+                learning = self._store.get(learning_id)
+                content = learning.get("content", "") if learning else content
+            if dedup.is_duplicate(content):
+                continue
 
+            category = meta.get("category") or "general"
+            heading = "" if category in sections else self._category_heading(category)
+            bodies = [content.strip()]
+            if len(content) > len(meta["summary"]):
+                bodies.append(meta["summary"].strip() + "...")
+
+            for body in bodies:
+                entry = f"- **{meta['title']}**: " + body.replace("\n", "\n  ")
+                cost = dedup.estimate_tokens(f"{heading}\n{entry}")
+                if used + cost <= budget:
+                    sections.setdefault(category, []).append(entry)
+                    dedup.add(content)
+                    used += cost
+                    included += 1
+                    break
+
+        context = self._format_context(sections)
+        self._store_context(key, version, context)
+        return context
+
+    @staticmethod
+    def _category_heading(category: str) -> str:
+        return f"\n### {category.replace('-', ' ').title()}\n"
+
+    def _format_context(self, sections: Dict[str, List[str]]) -> str:
+        """Join context entries under category headings."""
+        lines = [CONTEXT_HEADER]
+        for category, entries in sections.items():
+            lines.append(self._category_heading(category))
+            lines.extend(entries)
         return "\n".join(lines)
 
-    def _save_index(self) -> None:
-        """Save the learnings index."""
-        index_path = self._learnings_dir / 'index.yaml'
-        with open(index_path, 'w', encoding='utf-8') as f:
-            yaml.dump(self._index, f, default_flow_style=False)
+    def _cached_context(self, key: str, version: str) -> Optional[str]:
+        """A cached export for this key, if the learnings haven't changed since."""
+        if self._context_cache is None:
+            try:
+                self._context_cache = json.loads(
+                    (self._learnings_dir / CONTEXT_CACHE_FILE).read_text(encoding="utf-8")
+                )
+            except (OSError, ValueError):
+                self._context_cache = {}
+        if self._context_cache.get("version") != version:
+            self._context_cache = {"version": version, "entries": {}}
+        return self._context_cache["entries"].get(key)
+
+    def _store_context(self, key: str, version: str, context: str) -> None:
+        """Cache an export (the oldest entries are dropped past MAX_CACHED_CONTEXTS)."""
+        entries = self._context_cache["entries"]
+        entries[key] = context
+        while len(entries) > MAX_CACHED_CONTEXTS:
+            entries.pop(next(iter(entries)))
+
+        cache_path = self._learnings_dir / CONTEXT_CACHE_FILE
+        tmp_path = cache_path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(self._context_cache), encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    def _load_many(self, learning_ids: List[str]) -> List[Dict[str, Any]]:
+        """Load learnings by ID, skipping any whose file is missing."""
+        learnings = []
+        for learning_id in learning_ids:
+            learning = self.get(learning_id)
+            if learning:
+                learnings.append(learning)
+        return learnings
+
+    @staticmethod
+    def _searchable_text(learning: Dict[str, Any]) -> str:
+        """Title and content, for words the search index doesn't hold."""
+        return f"{learning.get('title', '')}\n{learning.get('content', '')}"
+
+    def _sync_search_index(self) -> None:
+        """
+        Bring the search index up to date with the store.
+
+        Only learnings that are new or changed since they were indexed are
+        read; removed learnings are dropped.
+        """
+        indexed = set(self._search_index.ids())
+        current = set(self._store.ids())
+        changes = 0
+
+        for learning_id in current:
+            signature = self._store.signature(learning_id)
+            if self._search_index.is_current(learning_id, signature):
+                continue
+            learning = self._store.get(learning_id)
+            if learning:
+                self._search_index.add(learning, signature)
+                changes += 1
+
+        for learning_id in indexed - current:
+            self._search_index.remove(learning_id)
+            changes += 1
+
+        self._note_search_changes(changes)
+
+    def _note_search_changes(self, changes: int) -> None:
+        """
+        Save the search index once enough changes are pending.
+
+        Like the store's offset index, the search index isn't rewritten on
+        every capture; unsaved learnings are re-indexed on the next
+        initialize, which only reads those few records.
+        """
+        self._unsaved_search_changes += changes
+        if self._unsaved_search_changes >= INDEX_SAVE_THRESHOLD:
+            self._search_index.save()
+            self._unsaved_search_changes = 0
 
 
 # Factory function
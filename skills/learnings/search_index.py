@@ -0,0 +1,252 @@
+"""
+Full-text search index for learnings.
+
+Keeps a persistent inverted index (core.context_index.ContextIndex, BM25
+ranked) over each learning's title, content, tags and category, so
+searching doesn't read every learning's content. Category, tags,
+title and creation time are stored with each indexed document, so
+filtering by category or tag is answered from the index as well.
+
+Each document records the store's signature of the learning it was built
+from; ``is_current`` lets the skill re-index only learnings that changed.
+
+Query words match indexed words they start. Words the index drops (under
+three characters, stop words) are returned by ``split_query`` so the skill
+can require them against the matched learnings' text.
+
+Usage:
+    from skills.learnings.search_index import LearningsSearchIndex
+
+    index = LearningsSearchIndex(Path(".claude/learnings/search-index.json"))
+    index.add(learning)
+    index.save()
+
+    for learning_id, score in index.search("iteration path", category="azure-devops"):
+        print(learning_id, score)
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from core.context_index import PHRASE_PATTERN, ContextIndex, tokenize
+
+
+DOC_TYPE = "learning"
+WORD_PATTERN = re.compile(r"[a-z0-9][a-z0-9_-]*")
+SNIPPET_CHARS = 160
+
+
+class LearningsSearchIndex:
+    """Persistent, ranked full-text index over learnings."""
+
+    def __init__(self, path: Path):
+        """
+        Load the index.
+
+        Args:
+            path: Index file (created on first save)
+        """
+        self.path = Path(path)
+        self.index = ContextIndex.load(self.path)
+        self.dirty = False
+
+    def __contains__(self, learning_id: str) -> bool:
+        return learning_id in self.index
+
+    def ids(self) -> List[str]:
+        """IDs of every indexed learning."""
+        return list(self.index.documents)
+
+    def is_current(self, learning_id: str, signature: Dict[str, Any]) -> bool:
+        """
+        Check whether a learning is indexed from its current revision.
+
+        Args:
+            learning_id: Learning ID
+            signature: The store's signature for the learning (see
+                LearningsStore.signature)
+
+        Returns:
+            True if the indexed copy matches the signature
+        """
+        doc = self.index.documents.get(learning_id)
+        return bool(doc) and all(doc.get(key) == value for key, value in signature.items())
+
+    def add(self, learning: Dict[str, Any], signature: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Add or replace a learning.
+
+        Args:
+            learning: Learning dict (id, title, content, category, tags, created_at)
+            signature: The store's signature for the learning, if any
+        """
+        tags = [str(tag) for tag in learning.get("tags") or []]
+        title = learning.get("title") or ""
+        # Title terms count twice so title matches outrank passing mentions
+        text = "\n".join([title, title, learning.get("category") or "", " ".join(tags), learning.get("content") or ""])
+
+        self.index.add_document(learning["id"], text, DOC_TYPE, {
+            "title": title,
+            "category": learning.get("category"),
+            "tags": tags,
+            "created_at": str(learning.get("created_at") or ""),
+            **(signature or {}),
+        })
+        self.dirty = True
+
+    def remove(self, learning_id: str) -> None:
+        """Remove a learning from the index."""
+        if self.index.remove_document(learning_id):
+            self.dirty = True
+
+    def filter(self, category: Optional[str] = None, tags: Optional[List[str]] = None) -> List[str]:
+        """
+        IDs of learnings in a category and/or having any of the tags.
+
+        Args:
+            category: Category to match
+            tags: Tags, any of which must be present
+
+        Returns:
+            Matching IDs, oldest first
+        """
+        matches = [
+            (doc.get("created_at", ""), learning_id)
+            for learning_id, doc in self.index.documents.items()
+            if self._matches(doc, category, tags)
+        ]
+        return [learning_id for _, learning_id in sorted(matches)]
+
+    def search(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank learnings matching every query term (and "quoted phrase").
+
+        Terms match indexed words they are a prefix of ("iter" matches
+        "iteration"). Words the index can't hold (shorter than three
+        characters or stop words) are ignored here; see split_query.
+
+        Args:
+            query: Search text
+            category: Only return learnings in this category
+            tags: Only return learnings with any of these tags
+            limit: Maximum number of results
+
+        Returns:
+            List of (learning_id, score), best match first
+        """
+        expansions = [self._expand(term) for term in dict.fromkeys(tokenize(PHRASE_PATTERN.sub(" ", query)))]
+        if not all(expansions):
+            return []
+
+        phrases = " ".join(f'"{phrase}"' for phrase in PHRASE_PATTERN.findall(query))
+        expanded_query = " ".join(sorted(set().union(*expansions))) + " " + phrases
+
+        results = []
+        for learning_id, score in self.index.search(expanded_query, doc_type=DOC_TYPE):
+            doc = self.index.documents[learning_id]
+            doc_terms = set(doc.get("terms", ()))
+            if not all(doc_terms & expansion for expansion in expansions):
+                continue
+            if not self._matches(doc, category, tags):
+                continue
+            results.append((learning_id, score))
+            if limit and len(results) >= limit:
+                break
+        return results
+
+    def rank(self, text: str, categories: Optional[List[str]] = None) -> List[Tuple[str, float]]:
+        """
+        Rank learnings by relevance to free text (e.g., a task description).
+
+        Unlike search, words are OR'ed: a learning only has to share some
+        of the text's words to be ranked.
+
+        Args:
+            text: Text to rank against (quotes are ignored)
+            categories: Only rank learnings in these categories
+
+        Returns:
+            List of (learning_id, score), most relevant first
+        """
+        return [
+            (learning_id, score)
+            for learning_id, score in self.index.search(text.replace('"', " "), doc_type=DOC_TYPE)
+            if not categories or self.index.documents[learning_id].get("category") in categories
+        ]
+
+    def save(self) -> None:
+        """Persist the index if it changed."""
+        if self.dirty:
+            self.index.save(self.path)
+            self.dirty = False
+
+    def _expand(self, term: str) -> Set[str]:
+        """Indexed terms starting with term (learnings are few, so a vocabulary scan is cheap)."""
+        return {indexed for indexed in self.index.postings if indexed.startswith(term)}
+
+    @staticmethod
+    def _matches(doc: Dict[str, Any], category: Optional[str], tags: Optional[List[str]]) -> bool:
+        if category and doc.get("category") != category:
+            return False
+        if tags and not any(tag in doc.get("tags", ()) for tag in tags):
+            return False
+        return True
+
+
+def split_query(query: str) -> Tuple[str, List[str]]:
+    """
+    Split a query into what the index can answer and words it can't.
+
+    The index drops words shorter than three characters and stop words
+    ("ci", "qa", "to"); those are returned separately so callers can
+    still require them, via matches_words.
+
+    Args:
+        query: Search text
+
+    Returns:
+        (query for LearningsSearchIndex.search, lowercase unindexed words)
+    """
+    phrases = PHRASE_PATTERN.findall(query)
+    words = WORD_PATTERN.findall(PHRASE_PATTERN.sub(" ", query).lower())
+    indexed = [word for word in words if tokenize(word)]
+    unindexed = [word for word in words if not tokenize(word)]
+    return " ".join(indexed + [f'"{phrase}"' for phrase in phrases]), unindexed
+
+
+def matches_words(text: str, words: List[str]) -> bool:
+    """Whether every word starts a word in text (case-insensitive)."""
+    text = text.lower()
+    return all(re.search(r"(?<![a-z0-9])" + re.escape(word), text) for word in words)
+
+
+def make_snippet(content: str, query: str, width: int = SNIPPET_CHARS) -> str:
+    """
+    Excerpt of content around the first query term, with matches in **bold**.
+
+    Args:
+        content: Learning content
+        query: Search text
+        width: Approximate snippet length in characters
+
+    Returns:
+        Snippet, with "..." where content was cut
+    """
+    terms = sorted(set(tokenize(query)), key=len, reverse=True)
+    if not terms:
+        return content[:width] + ("..." if len(content) > width else "")
+
+    pattern = re.compile(r"\b(" + "|".join(re.escape(term) for term in terms) + r")\w*", re.IGNORECASE)
+    match = pattern.search(content)
+    start = max(0, match.start() - width // 3) if match else 0
+    end = min(len(content), start + width)
+
+    snippet = pattern.sub(lambda m: f"**{m.group(0)}**", content[start:end].replace("\n", " "))
+    return ("..." if start > 0 else "") + snippet + ("..." if end < len(content) else "")
@@ -0,0 +1,581 @@
+"""
+Segmented storage for learnings.
+
+Learnings are appended as JSON lines to segment files under
+``segments/`` in the learnings directory, and an offset index
+(``store-index.json``) maps each learning ID to the segment, byte offset
+and length of its latest record, together with its metadata (everything
+but the content body, plus a short summary). Capturing a learning is a
+single append; listing, category counts and context export read only the
+metadata, and a learning's content is read with one seek when asked for.
+
+The offset index is saved lazily: on open, records past the indexed end of
+each segment are replayed, and the index is rewritten only once enough
+records have accumulated. Superseded and deleted records are dropped by
+compaction, which rewrites sealed segments into one new segment, in the
+background once enough of the store is dead.
+
+Segment files are named ``<number>-<generation>.jsonl``. Compaction writes
+the live records of the sealed segments to the highest sealed number with
+the next generation, saves the index and then deletes the old files; on
+open, unindexed files that sort below the newest indexed segment are
+leftovers of an interrupted compaction and are removed.
+
+The per-file layout (one YAML file per learning plus ``index.yaml``) is
+migrated on first open; the old files are moved to ``legacy-yaml/``.
+
+Usage:
+    from skills.learnings.storage import LearningsStore
+
+    store = LearningsStore(Path(".claude/learnings"))
+    store.migrate_legacy()
+    store.put(learning)
+
+    for meta in store.entries():
+        print(meta["id"], meta["title"], meta["summary"])
+
+    print(store.get(learning_id)["content"])
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+
+SEGMENTS_DIR = "segments"
+INDEX_FILE = "store-index.json"
+LEGACY_DIR = "legacy-yaml"
+COMPACT_LOCK_FILE = "compact.lock"
+
+SUMMARY_CHARS = 200
+
+# Roll over to a new segment past this size
+SEGMENT_MAX_BYTES = 1024 * 1024
+# Save the offset index once this many records are only in segment tails
+INDEX_SAVE_THRESHOLD = 64
+# Compact once at least this many bytes, and half the store, are dead
+COMPACT_MIN_DEAD_BYTES = 256 * 1024
+COMPACT_DEAD_RATIO = 0.5
+# A compaction lock older than this is from a crashed process
+COMPACT_LOCK_STALE_SECONDS = 600
+
+
+def segment_name(number: int, generation: int = 0) -> str:
+    """File name of a segment; names sort in replay order."""
+    return f"{number:06d}-{generation:03d}.jsonl"
+
+
+def _parse_segment_name(name: str) -> Optional[Tuple[int, int]]:
+    try:
+        number, generation = name[:-len(".jsonl")].split("-")
+        return int(number), int(generation)
+    except ValueError:
+        return None
+
+
+def learning_metadata(learning: Dict[str, Any]) -> Dict[str, Any]:
+    """Everything about a learning except its content, plus a short summary."""
+    content = learning.get("content") or ""
+    metadata = {key: value for key, value in learning.items() if key != "content"}
+    metadata["summary"] = content[:SUMMARY_CHARS]
+    metadata["content_chars"] = len(content)
+    return metadata
+
+
+class LearningsStore:
+    """Append-only, segmented learnings store with an offset index."""
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        directory: Path,
+        segment_max_bytes: int = SEGMENT_MAX_BYTES,
+        background_compaction: bool = True
+    ):
+        """
+        Open the store, replaying records the saved index doesn't cover.
+
+        Args:
+            directory: Learnings directory
+            segment_max_bytes: Size at which a new segment is started
+            background_compaction: Compact in a background thread when
+                enough of the store is dead (compact() is always available)
+        """
+        self.directory = Path(directory)
+        self.segments_dir = self.directory / SEGMENTS_DIR
+        self.index_path = self.directory / INDEX_FILE
+        self.segment_max_bytes = segment_max_bytes
+        self.background_compaction = background_compaction
+
+        self._lock = threading.RLock()
+        self._compaction: Optional[threading.Thread] = None
+        self._load()
+
+    # Reading
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, learning_id: str) -> bool:
+        return learning_id in self._entries
+
+    def ids(self) -> List[str]:
+        """IDs of all learnings."""
+        with self._lock:
+            return list(self._entries)
+
+    def metadata(self, learning_id: str) -> Optional[Dict[str, Any]]:
+        """A learning's metadata (no content), or None."""
+        with self._lock:
+            entry = self._entries.get(learning_id)
+            return dict(entry["meta"]) if entry else None
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Metadata of every learning, oldest first."""
+        with self._lock:
+            metas = [dict(entry["meta"]) for entry in self._entries.values()]
+        return sorted(metas, key=lambda meta: str(meta.get("created_at") or ""))
+
+    def categories(self) -> Dict[str, int]:
+        """Number of learnings per category."""
+        counts: Dict[str, int] = {}
+        with self._lock:
+            for entry in self._entries.values():
+                category = entry["meta"].get("category") or "general"
+                counts[category] = counts.get(category, 0) + 1
+        return counts
+
+    def signature(self, learning_id: str) -> Optional[Dict[str, Any]]:
+        """
+        What identifies the stored revision of a learning.
+
+        Unlike the record's offset, this survives compaction, so caches
+        keyed on it (e.g., the search index) stay valid.
+        """
+        with self._lock:
+            entry = self._entries.get(learning_id)
+            if entry is None:
+                return None
+            return {"updated_at": str(entry["meta"].get("updated_at") or ""), "bytes": entry["length"]}
+
+    def version(self) -> str:
+        """Token that changes whenever a record is appended or segments are compacted."""
+        with self._lock:
+            state = json.dumps(sorted(self._segments.items()))
+        return hashlib.sha256(state.encode("utf-8")).hexdigest()[:16]
+
+    def get(self, learning_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a learning, including its content.
+
+        Args:
+            learning_id: Learning ID
+
+        Returns:
+            Learning dict, or None if it doesn't exist
+        """
+        for attempt in range(2):
+            with self._lock:
+                entry = self._entries.get(learning_id)
+                if entry is None:
+                    return None
+                record = self._read_record(entry)
+            if record is not None and record.get("id") == learning_id:
+                return record.get("learning")
+            # Another process compacted the segments under us; reload once
+            if attempt == 0:
+                with self._lock:
+                    self._load()
+        return None
+
+    # Writing
+
+    def put(self, learning: Dict[str, Any]) -> None:
+        """
+        Add or replace a learning (one appended line).
+
+        Args:
+            learning: Learning dict with at least "id"
+        """
+        self._append({"op": "put", "id": learning["id"], "learning": learning})
+        self.maybe_compact()
+
+    def delete(self, learning_id: str) -> bool:
+        """
+        Delete a learning.
+
+        Args:
+            learning_id: Learning ID
+
+        Returns:
+            True if the learning existed
+        """
+        if learning_id not in self._entries:
+            return False
+        self._append({"op": "delete", "id": learning_id})
+        self.maybe_compact()
+        return True
+
+    def flush(self) -> None:
+        """Save the offset index if records were added since it was last saved."""
+        with self._lock:
+            if self._unsaved:
+                self._save_index()
+
+    # Compaction
+
+    def dead_bytes(self) -> int:
+        """Bytes of superseded or deleted records in sealed and active segments."""
+        with self._lock:
+            live = sum(entry["length"] for entry in self._entries.values())
+            return max(self._total_bytes() - live, 0)
+
+    def maybe_compact(self) -> Optional[threading.Thread]:
+        """
+        Start a background compaction if enough of the store is dead.
+
+        Returns:
+            The compaction thread, if one was started
+        """
+        if not self.background_compaction:
+            return None
+        with self._lock:
+            if self._compaction and self._compaction.is_alive():
+                return None
+            if not self._needs_compaction():
+                return None
+            self._compaction = threading.Thread(
+                target=self._compact_while_needed, name="learnings-compaction", daemon=True
+            )
+            self._compaction.start()
+            return self._compaction
+
+    def _needs_compaction(self) -> bool:
+        dead = self.dead_bytes()
+        return dead >= COMPACT_MIN_DEAD_BYTES and dead >= self._total_bytes() * COMPACT_DEAD_RATIO
+
+    def _compact_while_needed(self) -> None:
+        # Records superseded while compacting aren't reclaimed by that pass.
+        # The thread deregisters under the lock, so a put racing its exit
+        # starts a new one instead of finding this one still alive.
+        while True:
+            reclaimed = self.compact()
+            with self._lock:
+                if not reclaimed or not self._needs_compaction():
+                    self._compaction = None
+                    return
+
+    def compact(self) -> int:
+        """
+        Rewrite sealed segments with only their live records.
+
+        The active segment is sealed first, so appends carry on in a new
+        segment while sealed ones are rewritten. Only one process compacts
+        at a time (a lock file guards it).
+
+        Returns:
+            Bytes reclaimed (0 if nothing was compacted)
+        """
+        if not self._acquire_compaction_lock():
+            return 0
+        try:
+            with self._lock:
+                self._replay()
+                sealed = list(self._segments)
+                if not sealed:
+                    return 0
+                before = sum(self._segments.values())
+                self._start_segment()  # Seal the active segment
+                snapshot = {
+                    learning_id: dict(entry) for learning_id, entry in self._entries.items()
+                    if entry["segment"] in sealed
+                }
+
+            number, generation = _parse_segment_name(sealed[-1])
+            target = segment_name(number, generation + 1)
+            tmp_path = self.segments_dir / (target + ".tmp")
+            moved: Dict[str, Tuple[int, int]] = {}
+            with open(tmp_path, "wb") as out:
+                for learning_id, entry in sorted(snapshot.items(), key=lambda item: (item[1]["segment"], item[1]["offset"])):
+                    line = self._read_line(entry)
+                    if line is None:
+                        continue
+                    moved[learning_id] = (out.tell(), len(line))
+                    out.write(line)
+                out.flush()
+                os.fsync(out.fileno())
+
+            with self._lock:
+                os.replace(tmp_path, self.segments_dir / target)
+                for learning_id, (offset, length) in moved.items():
+                    entry = self._entries.get(learning_id)
+                    # Skip learnings rewritten in the new active segment meanwhile
+                    if entry and entry["segment"] == snapshot[learning_id]["segment"] \
+                            and entry["offset"] == snapshot[learning_id]["offset"]:
+                        entry.update(segment=target, offset=offset, length=length)
+                for name in sealed:
+                    self._segments.pop(name, None)
+                self._segments[target] = (self.segments_dir / target).stat().st_size
+                self._segments = dict(sorted(self._segments.items()))
+                self._save_index()
+                after = self._segments[target]
+
+            for name in sealed:
+                try:
+                    (self.segments_dir / name).unlink()
+                except OSError:
+                    pass
+            return max(before - after, 0)
+        finally:
+            self._release_compaction_lock()
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> None:
+        """Wait for a running background compaction to finish."""
+        thread = self._compaction
+        if thread:
+            thread.join(timeout)
+
+    # Migration
+
+    def migrate_legacy(self) -> int:
+        """
+        Import learnings from the per-file YAML layout.
+
+        Each ``<id>.yaml`` next to the store (except ``index.yaml``) is
+        appended, oldest first, and the YAML files are moved to
+        ``legacy-yaml/``. Does nothing once the directory has no YAML
+        learnings left.
+
+        Returns:
+            Number of learnings migrated
+        """
+        legacy_files = [
+            path for path in sorted(self.directory.glob("*.yaml"))
+            if path.name != "index.yaml"
+        ]
+        if not legacy_files:
+            return 0
+
+        learnings = []
+        for path in legacy_files:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    learning = yaml.safe_load(f)
+            except (OSError, yaml.YAMLError):
+                continue
+            if isinstance(learning, dict):
+                learning.setdefault("id", path.stem)
+                learnings.append(learning)
+
+        for learning in sorted(learnings, key=lambda item: str(item.get("created_at") or "")):
+            # YAML parses ISO timestamps into datetimes; keep them as strings
+            for key in ("created_at", "updated_at"):
+                if key in learning and not isinstance(learning[key], str) and learning[key] is not None:
+                    learning[key] = learning[key].isoformat()
+            self._append({"op": "put", "id": learning["id"], "learning": learning})
+        self._save_index()
+
+        legacy_dir = self.directory / LEGACY_DIR
+        legacy_dir.mkdir(exist_ok=True)
+        for path in legacy_files + [self.directory / "index.yaml"]:
+            if path.exists():
+                os.replace(path, legacy_dir / path.name)
+        return len(learnings)
+
+    # Internals
+
+    def _load(self) -> None:
+        """Load the saved index and replay the segment tails it doesn't cover."""
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._segments: Dict[str, int] = {}  # Segment name -> bytes covered by _entries
+        self._unsaved = 0
+
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") == self.VERSION:
+            self._entries = data.get("entries", {})
+            self._segments = data.get("segments", {})
+
+        on_disk = sorted(
+            path.name for path in self.segments_dir.glob("*.jsonl")
+            if _parse_segment_name(path.name)
+        )
+        newest_indexed = max(self._segments, default=None)
+        # While another process compacts, its output isn't indexed yet
+        compacting = (self.directory / COMPACT_LOCK_FILE).exists()
+        for name in on_disk:
+            if compacting:
+                break
+            if name not in self._segments and newest_indexed and name < newest_indexed:
+                # Left over from an interrupted compaction
+                try:
+                    (self.segments_dir / name).unlink()
+                except OSError:
+                    pass
+        for name in list(self._segments):
+            if name not in on_disk:
+                self._segments.pop(name)
+                self._entries = {k: v for k, v in self._entries.items() if v["segment"] != name}
+
+        self._replay()
+        if self._unsaved >= INDEX_SAVE_THRESHOLD:
+            self._save_index()
+
+    def _replay(self) -> None:
+        """Apply records appended after the indexed end of each segment."""
+        names = sorted(
+            path.name for path in self.segments_dir.glob("*.jsonl")
+            if _parse_segment_name(path.name)
+        )
+        for name in names:
+            path = self.segments_dir / name
+            start = self._segments.get(name, 0)
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            if size <= start:
+                self._segments.setdefault(name, start)
+                continue
+
+            with open(path, "rb") as f:
+                f.seek(start)
+                data = f.read()
+
+            offset = start
+            for line in data.splitlines(keepends=True):
+                if not line.endswith(b"\n"):
+                    break  # Torn write; left for the writer (or truncated below)
+                self._apply(line, name, offset)
+                offset += len(line)
+            if offset < size:
+                self._truncate_torn_tail(path, offset)
+            self._segments[name] = offset
+
+    def _apply(self, line: bytes, segment: str, offset: int) -> None:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return
+        learning_id = record.get("id")
+        if not learning_id:
+            return
+        if record.get("op") == "delete":
+            self._entries.pop(learning_id, None)
+        elif record.get("op") == "put" and isinstance(record.get("learning"), dict):
+            self._entries[learning_id] = {
+                "segment": segment,
+                "offset": offset,
+                "length": len(line),
+                "meta": learning_metadata(record["learning"]),
+            }
+        self._unsaved += 1
+
+    def _truncate_torn_tail(self, path: Path, offset: int) -> None:
+        """Drop a partial last line so the next append starts on a fresh line."""
+        try:
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+        except OSError:
+            pass
+
+    def _active_segment(self) -> str:
+        if not self._segments:
+            return self._start_segment()
+        name = max(self._segments)
+        try:
+            if (self.segments_dir / name).stat().st_size >= self.segment_max_bytes:
+                return self._start_segment()
+        except OSError:
+            return self._start_segment()
+        return name
+
+    def _start_segment(self) -> str:
+        newest = max(self._segments, default=None)
+        number = _parse_segment_name(newest)[0] + 1 if newest else 1
+        name = segment_name(number)
+        (self.segments_dir / name).touch()
+        self._segments[name] = 0
+        return name
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        line = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+        with self._lock:
+            name = self._active_segment()
+            path = self.segments_dir / name
+            # O_APPEND and a single write keep concurrent appenders' lines whole
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+            try:
+                os.write(fd, line)
+                offset = os.lseek(fd, 0, os.SEEK_CUR) - len(line)
+            finally:
+                os.close(fd)
+
+            if offset == self._segments.get(name, 0):
+                # Contiguous with what's indexed: no one else wrote in between
+                self._apply(line, name, offset)
+                self._segments[name] = offset + len(line)
+            else:
+                self._replay()
+
+            if self._unsaved >= INDEX_SAVE_THRESHOLD:
+                self._save_index()
+
+    def _read_line(self, entry: Dict[str, Any]) -> Optional[bytes]:
+        try:
+            with open(self.segments_dir / entry["segment"], "rb") as f:
+                f.seek(entry["offset"])
+                line = f.read(entry["length"])
+        except OSError:
+            return None
+        return line if len(line) == entry["length"] else None
+
+    def _read_record(self, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        line = self._read_line(entry)
+        if line is None:
+            return None
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
+
+    def _total_bytes(self) -> int:
+        return sum(self._segments.values())
+
+    def _save_index(self) -> None:
+        data = {"version": self.VERSION, "segments": self._segments, "entries": self._entries}
+        tmp_path = self.index_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, separators=(",", ":"), default=str), encoding="utf-8")
+        os.replace(tmp_path, self.index_path)
+        self._unsaved = 0
+
+    def _acquire_compaction_lock(self) -> bool:
+        lock_path = self.directory / COMPACT_LOCK_FILE
+        try:
+            if time.time() - lock_path.stat().st_mtime > COMPACT_LOCK_STALE_SECONDS:
+                lock_path.unlink()
+        except OSError:
+            pass
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        return True
+
+    def _release_compaction_lock(self) -> None:
+        try:
+            (self.directory / COMPACT_LOCK_FILE).unlink()
+        except OSError:
+            pass
@@ -0,0 +1,293 @@
+"""
+Skill Manifest for TAID.
+
+Declares available skills without importing them, so listing skills and
+showing their metadata stays cheap. Skills come from two sources:
+
+- Built-in skills, recorded in the generated ``_builtin_manifest.py``
+  (regenerate with ``python -m skills.manifest`` after adding or changing
+  a skill under ``skills/``)
+- Third-party skills, registered by any installed distribution under the
+  ``trustable_ai.skills`` entry point group::
+
+      [project.entry-points."trustable_ai.skills"]
+      my_skill = "my_package.skill:get_skill"
+
+  The entry point may name a factory taking the config dict, a BaseSkill
+  subclass, or a module following the built-in layout (``get_skill``,
+  ``Skill`` or a BaseSkill subclass). Its description and version come
+  from the distribution's metadata.
+
+A skill's module is only imported by ``SkillSpec.load``.
+
+Usage:
+    from skills.manifest import load_specs
+
+    for name, spec in load_specs().items():
+        print(name, spec.version, spec.description)
+
+    skill = load_specs()["learnings"].load({"learnings_dir": ".claude/learnings"})
+"""
+
+import ast
+import importlib
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from pprint import pformat
+from typing import Any, Dict, List, Optional
+
+from .base import BaseSkill
+
+
+ENTRY_POINT_GROUP = "trustable_ai.skills"
+ENTRY_POINT_VALUE = re.compile(r"(?P<module>[\w.]+)\s*(?::\s*(?P<attr>[\w.]+))?")
+BUILTIN_SOURCE = "builtin"
+DEFAULT_VERSION = "1.0.0"  # BaseSkill.version
+GENERATED_MANIFEST_PATH = Path(__file__).parent / "_builtin_manifest.py"
+
+
+@dataclass
+class SkillSpec:
+    """Metadata needed to list a skill and, later, to load it."""
+    name: str
+    description: str
+    version: str
+    module: str
+    attribute: Optional[str] = None  # Factory or class in module; None to look it up
+    source: str = BUILTIN_SOURCE     # "builtin" or the providing distribution
+
+    @property
+    def documentation_path(self) -> Optional[Path]:
+        """SKILL.md of a built-in skill, if it exists."""
+        if self.source != BUILTIN_SOURCE:
+            return None
+        skill_md = Path(__file__).parent / self.module.rsplit(".", 1)[-1] / "SKILL.md"
+        return skill_md if skill_md.exists() else None
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> Optional[BaseSkill]:
+        """
+        Import the skill's module and create an instance.
+
+        Args:
+            config: Optional configuration for the skill
+
+        Returns:
+            Skill instance, or None if the module provides no skill
+
+        Raises:
+            ImportError: If the module can't be imported
+        """
+        module = importlib.import_module(self.module)
+        if self.attribute:
+            return getattr(module, self.attribute)(config)
+        return instantiate_from_module(module, config)
+
+
+def _skill_class(module: Any) -> Optional[type]:
+    """First BaseSkill subclass defined in or exported by a module."""
+    for attr_name in dir(module):
+        attr = getattr(module, attr_name)
+        if isinstance(attr, type) and issubclass(attr, BaseSkill) and attr is not BaseSkill:
+            return attr
+    return None
+
+
+def instantiate_from_module(module: Any, config: Optional[Dict[str, Any]]) -> Optional[BaseSkill]:
+    """Create a skill using the module's get_skill, Skill or BaseSkill subclass."""
+    if hasattr(module, "get_skill"):
+        return module.get_skill(config)
+    if hasattr(module, "Skill"):
+        return module.Skill(config)
+    skill_class = _skill_class(module)
+    return skill_class(config) if skill_class else None
+
+
+def load_builtin_specs() -> List[SkillSpec]:
+    """
+    Specs of the skills shipped with the framework.
+
+    Returns:
+        Specs from the generated manifest (empty if it hasn't been generated)
+    """
+    try:
+        from ._builtin_manifest import SKILLS
+    except ImportError:
+        return []
+    return [SkillSpec(**entry) for entry in SKILLS]
+
+
+def load_entry_point_specs() -> List[SkillSpec]:
+    """
+    Specs of skills registered by installed distributions.
+
+    Only distribution metadata is read; nothing is imported. Distributions
+    are walked directly (rather than through ``entry_points(group=...)``
+    and ``EntryPoint.dist``, which need Python 3.10) so this works on 3.9.
+
+    Returns:
+        Specs for each ``trustable_ai.skills`` entry point
+    """
+    from importlib.metadata import distributions
+
+    specs = []
+    seen_dists = set()
+    for dist in distributions():
+        dist_name = dist.metadata["Name"] or "unknown"
+        # The same distribution can be found on several sys.path entries
+        if dist_name.lower() in seen_dists:
+            continue
+        seen_dists.add(dist_name.lower())
+
+        for entry_point in dist.entry_points:
+            if entry_point.group != ENTRY_POINT_GROUP:
+                continue
+            match = ENTRY_POINT_VALUE.match(entry_point.value)
+            if not match:
+                continue
+            specs.append(SkillSpec(
+                name=entry_point.name,
+                description=dist.metadata["Summary"] or "",
+                version=dist.version or "unknown",
+                module=match.group("module"),
+                attribute=match.group("attr"),
+                source=dist_name,
+            ))
+    return specs
+
+
+def load_specs() -> Dict[str, SkillSpec]:
+    """
+    All available skills by name.
+
+    Built-in skills take precedence over third-party skills of the same name.
+
+    Returns:
+        Dict mapping skill name to SkillSpec
+    """
+    specs: Dict[str, SkillSpec] = {}
+    for spec in load_builtin_specs() + load_entry_point_specs():
+        specs.setdefault(spec.name, spec)
+    return specs
+
+
+def _static_spec(name: str, module_name: str, init_path: Path) -> Optional[SkillSpec]:
+    """
+    Read a skill's metadata from its source without importing it.
+
+    Works for the usual layout: a skill class whose ``description`` (and
+    optionally ``version``) properties return string literals, plus an
+    optional module-level ``get_skill`` factory. Importing some skills has
+    side effects (the Azure DevOps wrapper loads its configuration), so the
+    manifest is generated this way whenever possible.
+
+    Returns:
+        SkillSpec, or None if the metadata isn't statically readable
+    """
+    try:
+        tree = ast.parse(init_path.read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return None
+
+    attribute = None
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "get_skill":
+            attribute = "get_skill"
+
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        literals = {}
+        for item in node.body:
+            body = [stmt for stmt in getattr(item, "body", []) if not (
+                isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant)
+            )]
+            if (
+                isinstance(item, ast.FunctionDef)
+                and len(body) == 1
+                and isinstance(body[0], ast.Return)
+                and isinstance(body[0].value, ast.Constant)
+                and isinstance(body[0].value.value, str)
+            ):
+                literals[item.name] = body[0].value.value
+        if "description" in literals:
+            return SkillSpec(
+                name=name,
+                description=literals["description"],
+                version=literals.get("version", DEFAULT_VERSION),
+                module=module_name,
+                attribute=attribute,
+            )
+    return None
+
+
+def build_builtin_specs(skills_dir: Optional[Path] = None) -> List[SkillSpec]:
+    """
+    Build specs for every skill package under ``skills/``.
+
+    Metadata is read from source where possible; skills it can't be read
+    from are imported. Only used to (re)generate the manifest.
+
+    Args:
+        skills_dir: Skills package directory (defaults to this package)
+
+    Returns:
+        Specs sorted by name
+    """
+    skills_dir = skills_dir or Path(__file__).parent
+    specs = []
+    for item in sorted(skills_dir.iterdir()):
+        if not item.is_dir() or item.name.startswith("_") or not (item / "__init__.py").exists():
+            continue
+
+        module_name = f"{__package__}.{item.name}"
+        spec = _static_spec(item.name, module_name, item / "__init__.py")
+        if spec is not None:
+            specs.append(spec)
+            continue
+
+        module = importlib.import_module(module_name)
+        skill = instantiate_from_module(module, None)
+        if skill is None:
+            continue
+
+        attribute = "get_skill" if hasattr(module, "get_skill") else None
+        specs.append(SkillSpec(
+            name=item.name,
+            description=skill.description,
+            version=skill.version,
+            module=module_name,
+            attribute=attribute,
+        ))
+    return specs
+
+
+def write_builtin_manifest(path: Optional[Path] = None) -> List[SkillSpec]:
+    """
+    Regenerate ``_builtin_manifest.py``.
+
+    Args:
+        path: Output file (defaults to the package's generated manifest)
+
+    Returns:
+        The specs written
+    """
+    specs = build_builtin_specs()
+    entries = [
+        {key: value for key, value in asdict(spec).items() if key != "source"}
+        for spec in specs
+    ]
+    content = (
+        '"""\n'
+        "Built-in skill manifest.\n\n"
+        "Generated by `python -m skills.manifest`; do not edit by hand.\n"
+        '"""\n\n'
+        f"SKILLS = {pformat(entries, sort_dicts=False)}\n"
+    )
+    (path or GENERATED_MANIFEST_PATH).write_text(content, encoding="utf-8")
+    return specs
+
+
+if __name__ == "__main__":
+    for written in write_builtin_manifest():
+        print(f"{written.name} ({written.module})")
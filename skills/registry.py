@@ -2,14 +2,16 @@
 Skill Registry for TAID.
 
 Manages discovery, loading, and access to skills.
+
+Discovery reads the skill manifest (see manifest.py) and imports nothing;
+a skill's module is imported the first time the skill is requested.
 """
 
-from pathlib import Path
 from typing import Dict, List, Optional, Type, Any
 import importlib
-import pkgutil
 
 from .base import BaseSkill
+from .manifest import SkillSpec, instantiate_from_module, load_specs
 
 
 class SkillRegistry:
@@ -23,49 +25,37 @@ class SkillRegistry:
         """Initialize the skill registry."""
         self._skills: Dict[str, BaseSkill] = {}
         self._skill_classes: Dict[str, Type[BaseSkill]] = {}
+        self._specs: Dict[str, SkillSpec] = {}
         self._discovered = False
 
     def discover_skills(self) -> List[str]:
         """
-        Discover available skills in the skills directory.
+        Discover available skills from the skill manifest.
+
+        Built-in skills and skills registered by installed packages (the
+        ``trustable_ai.skills`` entry point group) are found without
+        importing them.
 
         Returns:
             List of discovered skill names
         """
-        skills_dir = Path(__file__).parent
-        discovered = []
-
-        for item in skills_dir.iterdir():
-            if item.is_dir() and not item.name.startswith("_"):
-                # Check if it has an __init__.py
-                init_file = item / "__init__.py"
-                if init_file.exists():
-                    # Verify it's actually a skill by checking if it can be loaded
-                    try:
-                        module_name = f"skills.{item.name}"
-                        module = importlib.import_module(module_name)
-
-                        # Check if module has skill pattern
-                        has_skill = (
-                            hasattr(module, "get_skill") or
-                            hasattr(module, "Skill") or
-                            any(
-                                isinstance(getattr(module, attr_name), type) and
-                                issubclass(getattr(module, attr_name), BaseSkill) and
-                                getattr(module, attr_name) is not BaseSkill
-                                for attr_name in dir(module)
-                                if not attr_name.startswith("_")
-                            )
-                        )
-
-                        if has_skill:
-                            discovered.append(item.name)
-                    except Exception:
-                        # Skip modules that can't be imported or don't have skills
-                        pass
-
+        self._specs = load_specs()
         self._discovered = True
-        return discovered
+        return list(self._specs)
+
+    def get_spec(self, name: str) -> Optional[SkillSpec]:
+        """
+        Get a skill's manifest entry.
+
+        Args:
+            name: Skill name
+
+        Returns:
+            SkillSpec or None if the skill isn't in the manifest
+        """
+        if not self._discovered:
+            self.discover_skills()
+        return self._specs.get(name)
 
     def register_skill(self, name: str, skill_class: Type[BaseSkill]) -> None:
         """
@@ -122,24 +112,14 @@ class SkillRegistry:
         if name in self._skill_classes:
             return self._skill_classes[name](config)
 
-        # Try to import from the skill module
         try:
-            module_name = f"skills.{name}"
-            module = importlib.import_module(module_name)
-
-            # Look for a get_skill function or a default skill class
-            if hasattr(module, "get_skill"):
-                return module.get_skill(config)
-            elif hasattr(module, "Skill"):
-                return module.Skill(config)
-            else:
-                # Look for any BaseSkill subclass
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (isinstance(attr, type) and
-                        issubclass(attr, BaseSkill) and
-                        attr is not BaseSkill):
-                        return attr(config)
+            spec = self.get_spec(name)
+            if spec:
+                return spec.load(config)
+
+            # Not in the manifest; fall back to a package under skills/
+            module = importlib.import_module(f"skills.{name}")
+            return instantiate_from_module(module, config)
 
         except ImportError as e:
             print(f"Warning: Could not load skill '{name}': {e}")
@@ -156,31 +136,60 @@ class SkillRegistry:
         if not self._discovered:
             self.discover_skills()
 
-        return self.discover_skills()
+        return list(self._specs)
 
-    def get_skill_info(self, name: str) -> Optional[Dict[str, Any]]:
+    def get_skill_info(self, name: str, check_prerequisites: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get information about a skill.
 
+        Metadata comes from the manifest, so the skill isn't imported unless
+        prerequisites are requested (or the skill is only known through
+        register_skill).
+
         Args:
             name: Skill name
+            check_prerequisites: Load the skill and include its prerequisite check
 
         Returns:
-            Dict with skill info (name, description, version, doc_path)
-        """
-        skill = self.get_skill(name)
-        if not skill:
-            return None
-
-        return {
-            "name": skill.name,
-            "description": skill.description,
-            "version": skill.version,
-            "documentation_path": str(skill.get_documentation_path()) if skill.get_documentation_path() else None,
-            "initialized": skill.is_initialized,
-            "prerequisites": skill.verify_prerequisites()
+            Dict with skill info (name, description, version, doc_path,
+            module, source, initialized and, if requested, prerequisites)
+        """
+        spec = self.get_spec(name)
+        if spec is None:
+            skill = self.get_skill(name)
+            if not skill:
+                return None
+            doc_path = skill.get_documentation_path()
+            spec = SkillSpec(
+                name=skill.name,
+                description=skill.description,
+                version=skill.version,
+                module=type(skill).__module__,
+                source="registered",
+            )
+        else:
+            doc_path = spec.documentation_path
+
+        info = {
+            "name": spec.name,
+            "description": spec.description,
+            "version": spec.version,
+            "documentation_path": str(doc_path) if doc_path else None,
+            "module": spec.module,
+            "source": spec.source,
+            "initialized": name in self._skills and self._skills[name].is_initialized,
         }
 
+        if check_prerequisites:
+            skill = self.get_skill(name)
+            info["prerequisites"] = skill.verify_prerequisites() if skill else {
+                "satisfied": False,
+                "missing": [f"skill module {spec.module} could not be loaded"],
+                "warnings": [],
+            }
+
+        return info
+
     def initialize_all(self) -> Dict[str, bool]:
         """
         Initialize all discovered skills.
@@ -7,6 +7,7 @@ import pytest
 from pathlib import Path
 import tempfile
 import shutil
+import sys
 from typing import Dict, Any
 
 from config.schema import (
@@ -146,6 +147,25 @@ def sample_framework_config(
     )
 
 
+@pytest.fixture(autouse=True)
+def isolated_azure_metadata_cache(monkeypatch, tmp_path_factory):
+    """
+    Keep AzureCLI's metadata cache in memory.
+
+    The cache is persisted whenever the cwd has a .claude directory, which
+    would let IDs cached by one test answer another test's lookups. Only
+    applies once the wrapper is imported: importing it creates an AzureCLI,
+    which needs Azure DevOps configuration most tests don't have.
+    """
+    cli_wrapper = sys.modules.get("skills.azure_devops.cli_wrapper")
+    if cli_wrapper is None:
+        return
+    outside_project = tmp_path_factory.getbasetemp() / "no-project"
+    monkeypatch.setattr(
+        cli_wrapper, "METADATA_CACHE_PATH", outside_project / ".claude" / "cache" / "azure-devops-metadata.json"
+    )
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for testing."""
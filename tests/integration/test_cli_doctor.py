@@ -0,0 +1,128 @@
+"""
+Integration tests for CLI doctor command.
+
+Tests the check runner (concurrency, timeouts, streamed results) and the
+doctor command's human and JSON output.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from cli.main import cli
+from cli.commands.doctor import DoctorCheck, run_checks
+
+
+def _sleeping_check(name, seconds, timeout=5.0):
+    def run(result, fix):
+        time.sleep(seconds)
+        result.ok(f"{name} done")
+    return DoctorCheck(name, name.title(), run, timeout)
+
+
+@pytest.mark.integration
+class TestRunChecks:
+    """Test suite for the doctor check runner."""
+
+    def test_checks_run_concurrently(self):
+        """Test independent checks overlap instead of running in sequence."""
+        checks = [_sleeping_check(f"check{i}", 0.25) for i in range(4)]
+
+        start = time.monotonic()
+        results = run_checks(checks)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.75  # 1s if run in sequence
+        assert [result.name for result in results] == ["check0", "check1", "check2", "check3"]
+        assert all(result.status == "ok" and result.duration >= 0.25 for result in results)
+
+    def test_results_stream_as_they_finish(self):
+        """Test on_result is called in completion order."""
+        checks = [_sleeping_check("slow", 0.3), _sleeping_check("fast", 0.0)]
+        streamed = []
+
+        results = run_checks(checks, on_result=lambda result: streamed.append(result.name))
+
+        assert streamed == ["fast", "slow"]
+        assert [result.name for result in results] == ["slow", "fast"]
+
+    def test_timed_out_check_does_not_block(self):
+        """Test a check past its timeout is reported without waiting for it."""
+        release = threading.Event()
+
+        def hang(result, fix):
+            release.wait(5)
+
+        checks = [DoctorCheck("hang", "Hang", hang, timeout=0.2), _sleeping_check("fast", 0.0)]
+        start = time.monotonic()
+        results = run_checks(checks)
+        release.set()
+
+        assert time.monotonic() - start < 1.0
+        assert results[0].timed_out
+        assert results[0].status == "warning"
+        assert results[0].warnings == ["Hang check timed out"]
+        assert results[1].status == "ok"
+
+    def test_check_exception_becomes_issue(self):
+        """Test a check raising is reported as an issue, not a crash."""
+        def broken(result, fix):
+            raise RuntimeError("boom")
+
+        result, = run_checks([DoctorCheck("broken", "Broken", broken)])
+
+        assert result.status == "error"
+        assert result.issues == ["Broken check failed: boom"]
+
+    def test_fix_flag_passed_to_checks(self):
+        """Test checks receive the --fix flag."""
+        seen = []
+        run_checks([DoctorCheck("fix", "Fix", lambda result, fix: seen.append(fix))], fix=True)
+        assert seen == [True]
+
+
+@pytest.mark.integration
+class TestDoctorCommand:
+    """Test suite for trustable-ai doctor command."""
+
+    def test_reports_every_check_with_duration(self):
+        """Test human output has each check's block, timing and a summary."""
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            result = runner.invoke(cli, ["doctor"])
+
+        assert result.exit_code == 0
+        for position in range(1, 8):
+            assert f"[{position}/7]" in result.output
+        assert "Python version (" in result.output
+        assert "Configuration file not found" in result.output
+        assert "Completed in" in result.output
+
+    def test_json_report(self):
+        """Test --json prints a parseable report and exits 1 on issues."""
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            result = runner.invoke(cli, ["doctor", "--json"])
+
+        assert result.exit_code == 1
+        report = json.loads(result.output)
+        assert report["status"] == "error"
+        assert [check["name"] for check in report["checks"]] == [
+            "python", "configuration", "directories", "agents", "skills", "azure_cli", "dependencies"
+        ]
+        assert "Configuration file not found" in report["issues"]
+        assert all("duration" in check for check in report["checks"])
+
+    def test_fix_creates_directories(self):
+        """Test --fix creates missing directories."""
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            result = runner.invoke(cli, ["doctor", "--fix", "--json"])
+            report = json.loads(result.output)
+            directories = next(check for check in report["checks"] if check["name"] == "directories")
+
+            assert directories["status"] == "ok"
+            assert "✓ .claude/workflow-state/ (created)" in directories["messages"]
@@ -62,6 +62,22 @@ class TestInitCommand:
             assert config.project.name == 'My Project'  # Default
             assert config.project.type == 'api'  # Default
 
+    def test_init_rerun_skips_unchanged_renders(self):
+        """Test re-running init leaves unchanged agents and workflows alone."""
+        runner = CliRunner()
+
+        with runner.isolated_filesystem():
+            runner.invoke(cli, ['init', '--no-interactive'])
+            agent_file = next(Path('.claude/agents').glob('*.md'))
+            mtime = agent_file.stat().st_mtime_ns
+
+            result = runner.invoke(cli, ['init', '--no-interactive'])
+
+            assert result.exit_code == 0
+            assert '(up to date)' in result.output
+            assert ' 0 written' in result.output
+            assert agent_file.stat().st_mtime_ns == mtime
+
     def test_init_custom_config_path(self):
         """Test initialization with custom config path."""
         runner = CliRunner()
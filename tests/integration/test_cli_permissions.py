@@ -542,3 +542,31 @@ class TestEdgeCases:
             assert result.exit_code == 1  # Warning
             assert "invalid format" in result.output.lower()
             assert "expected format" in result.output.lower()
+
+
+@pytest.mark.integration
+class TestPermissionsCheckCommand:
+    """Test suite for trustable-ai permissions check command."""
+
+    def test_check_reports_winning_rules(self):
+        """Test each command is shown with the rule that decides it."""
+        runner = CliRunner()
+
+        with runner.isolated_filesystem():
+            Path(".claude").mkdir()
+            Path(".claude/settings.local.json").write_text(json.dumps({
+                "permissions": {
+                    "allow": ["Bash(git:*)"],
+                    "deny": ["Bash(git push --force:*)"],
+                    "ask": ["Bash(git push:*)"],
+                }
+            }))
+            Path("commands.txt").write_text("git push --force\n\nrm file\n")
+
+            result = runner.invoke(cli, ["permissions", "check", "git status", "--file", "commands.txt"])
+
+            assert result.exit_code == 0
+            assert "allow git status  (Bash(git:*))" in result.output
+            assert "deny  git push --force  (Bash(git push --force:*))" in result.output
+            assert "ask   rm file  (no matching rule)" in result.output
+            assert "1 allowed, 1 ask, 1 denied" in result.output
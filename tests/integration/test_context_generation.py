@@ -185,6 +185,92 @@ Integrates with OAuth providers.
             keyword_list = list(keywords.keys())
             assert any("auth" in k for k in keyword_list)
 
+    def test_context_index_is_incremental(self):
+        """Test re-indexing only re-extracts changed files."""
+        runner = CliRunner()
+
+        with runner.isolated_filesystem():
+            Path(".claude").mkdir()
+            Path("CLAUDE.md").write_text("# Project\nPython project")
+            Path("src").mkdir()
+            Path("src/CLAUDE.md").write_text("# Source\nContains API code")
+
+            runner.invoke(cli, ['context', 'index'])
+
+            result = runner.invoke(cli, ['context', 'index'])
+            assert result.exit_code == 0
+            assert 'up to date' in result.output
+
+            Path("src/CLAUDE.md").write_text("# Source\nContains database models")
+            result = runner.invoke(cli, ['context', 'index'])
+            assert result.exit_code == 0
+            assert 'updated' in result.output
+            assert 'Re-extracted: 1, unchanged: 1' in result.output
+
+            with open(".claude/context-index.yaml") as f:
+                index = yaml.safe_load(f)
+            assert "database" in index["keywords"]
+            assert "api" not in index["keywords"]
+
+    def test_context_index_saves_refreshed_signatures(self):
+        """Test touching a file without changing it is persisted, not re-hashed every run."""
+        import os
+        from core.context_index import ContextIndex
+
+        runner = CliRunner()
+
+        with runner.isolated_filesystem():
+            Path(".claude").mkdir()
+            Path("CLAUDE.md").write_text("# Project\nPython project")
+            runner.invoke(cli, ['context', 'index'])
+
+            stat = Path("CLAUDE.md").stat()
+            os.utime("CLAUDE.md", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            result = runner.invoke(cli, ['context', 'index'])
+            assert result.exit_code == 0
+            assert 'up to date' in result.output
+
+            saved = ContextIndex.load(Path(".claude/context-search-index.json"))
+            assert saved.documents["CLAUDE.md"]["mtime_ns"] == stat.st_mtime_ns + 10**9
+
+    def test_context_index_respects_gitignore(self):
+        """Test ignored directories are not indexed."""
+        runner = CliRunner()
+
+        with runner.isolated_filesystem():
+            Path(".claude").mkdir()
+            Path(".gitignore").write_text("vendor/\n")
+            Path("CLAUDE.md").write_text("# Project")
+            Path("vendor").mkdir()
+            Path("vendor/CLAUDE.md").write_text("# Vendored")
+            Path("node_modules/pkg").mkdir(parents=True)
+            Path("node_modules/pkg/CLAUDE.md").write_text("# Dependency")
+
+            result = runner.invoke(cli, ['context', 'index'])
+            assert result.exit_code == 0
+
+            with open(".claude/context-index.yaml") as f:
+                index = yaml.safe_load(f)
+            assert [f["path"] for f in index["context_files"]] == ["CLAUDE.md"]
+
+    def test_context_index_search_index_found_from_root(self):
+        """Test a custom --output still writes the search index where lookups read it."""
+        from core.context_index import load_context_index
+
+        runner = CliRunner()
+
+        with runner.isolated_filesystem():
+            Path("project").mkdir()
+            Path("project/CLAUDE.md").write_text("# Project\nPayment gateway integration")
+
+            result = runner.invoke(cli, ['context', 'index', '--root', 'project', '-o', 'out/index.yaml'])
+            assert result.exit_code == 0
+            assert Path("out/index.yaml").exists()
+
+            search_index = load_context_index(Path("project"))
+            assert search_index is not None
+            assert search_index.search("payment")[0][0] == "CLAUDE.md"
+
 
 @pytest.mark.integration
 class TestContextLookup:
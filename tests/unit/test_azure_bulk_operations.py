@@ -0,0 +1,162 @@
+"""
+Unit tests for Azure DevOps bulk operations.
+
+Tests the worker pool, rate limiting, the resumable operation journal and
+the dry-run planner, against a fake Azure CLI wrapper.
+"""
+import threading
+import time
+
+import pytest
+
+from adapters.azure_devops.bulk_operations import AzureBulkOps, RateLimiter
+
+
+class FakeAzure:
+    """Records update calls; fails for IDs in ``failing``."""
+
+    def __init__(self, delay=0.0, failing=()):
+        self.delay = delay
+        self.failing = set(failing)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def update_work_item(self, work_item_id, **kwargs):
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls.append(work_item_id)
+        if work_item_id in self.failing:
+            raise RuntimeError(f"update of {work_item_id} failed")
+        return {"id": work_item_id, "fields": {"System.State": kwargs.get("state")}}
+
+
+def _updates(*ids):
+    return [{"work_item_id": work_item_id, "state": "Closed"} for work_item_id in ids]
+
+
+@pytest.mark.unit
+class TestBatchUpdates:
+    """Test suite for AzureBulkOps.batch_update_work_items."""
+
+    def test_updates_run_concurrently_in_order(self, tmp_path):
+        """Test updates overlap on the pool and results keep input order."""
+        azure = FakeAzure(delay=0.1)
+        bulk = AzureBulkOps(concurrency=4, requests_per_second=0, journal_dir=tmp_path, azure=azure)
+
+        start = time.monotonic()
+        results = bulk.batch_update_work_items(_updates(1, 2, 3, 4), show_progress=False)
+
+        assert time.monotonic() - start < 0.3
+        assert [r["work_item_id"] for r in results] == [1, 2, 3, 4]
+        assert all(r["success"] for r in results)
+
+    def test_rerun_resumes_unfinished_operations(self, tmp_path):
+        """Test a rerun of the same batch only retries what didn't succeed."""
+        updates = _updates(1, 2, 3)
+        first = AzureBulkOps(requests_per_second=0, journal_dir=tmp_path, azure=FakeAzure(failing={2}))
+        results = first.batch_update_work_items(updates, show_progress=False)
+        assert [r["success"] for r in results] == [True, False, True]
+        assert len(list(tmp_path.glob("*.jsonl"))) == 1
+
+        azure = FakeAzure()
+        second = AzureBulkOps(requests_per_second=0, journal_dir=tmp_path, azure=azure)
+        results = second.batch_update_work_items(updates, show_progress=False)
+
+        assert azure.calls == [2]
+        assert [r["success"] for r in results] == [True, True, True]
+        assert results[0]["resumed"] and not results[1].get("resumed")
+        # A finished batch starts afresh next time
+        assert [p.name.endswith(".completed.jsonl") for p in tmp_path.iterdir()] == [True]
+
+    def test_different_batches_have_separate_journals(self, tmp_path):
+        """Test journals are keyed by the planned operations."""
+        bulk = AzureBulkOps(requests_per_second=0, journal_dir=tmp_path, azure=FakeAzure(failing={1, 2}))
+        bulk.batch_update_work_items(_updates(1), show_progress=False)
+        bulk.batch_update_work_items(_updates(2), show_progress=False)
+        assert len(list(tmp_path.glob("*.jsonl"))) == 2
+
+    def test_no_journal_outside_project(self, tmp_path, monkeypatch):
+        """Test batches aren't journaled without a .claude directory."""
+        monkeypatch.chdir(tmp_path)
+        bulk = AzureBulkOps(requests_per_second=0, azure=FakeAzure(failing={1}))
+        bulk.batch_update_work_items(_updates(1), show_progress=False)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_dry_run_plans_without_updating(self, tmp_path, capsys):
+        """Test a dry run prints the plan and makes no requests."""
+        azure = FakeAzure()
+        bulk = AzureBulkOps(concurrency=2, requests_per_second=4, journal_dir=tmp_path, azure=azure)
+
+        assert bulk.batch_close_work_items([1, 2, 3, 4], dry_run=True) == []
+        assert azure.calls == []
+        output = capsys.readouterr().out
+        assert "Requests: 8" in output
+        assert "Estimated time: 2.0s" in output
+
+
+@pytest.mark.unit
+class TestPlanUpdates:
+    """Test suite for AzureBulkOps.plan_updates."""
+
+    def test_plan_counts_requests(self, tmp_path):
+        """Test verification doubles the request count."""
+        bulk = AzureBulkOps(concurrency=4, requests_per_second=0, journal_dir=tmp_path, azure=FakeAzure())
+
+        assert bulk.plan_updates(_updates(1, 2, 3), verify=True).requests == 6
+        plan = bulk.plan_updates(_updates(1, 2, 3), verify=False)
+        assert plan.requests == 3
+        assert plan.estimated_seconds == pytest.approx(0.5)  # One round of 4 workers
+
+    def test_plan_excludes_finished_operations(self, tmp_path):
+        """Test the plan for an interrupted batch only counts what's left."""
+        bulk = AzureBulkOps(requests_per_second=0, journal_dir=tmp_path, azure=FakeAzure(failing={3}))
+        bulk.batch_update_work_items(_updates(1, 2, 3), verify=False, show_progress=False)
+
+        plan = bulk.plan_updates(_updates(1, 2, 3), verify=False)
+        assert (plan.operations, plan.pending, plan.requests) == (3, 1, 1)
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    """Test suite for RateLimiter."""
+
+    def test_limits_sustained_rate(self):
+        """Test requests beyond the burst wait for the bucket to refill."""
+        limiter = RateLimiter(requests_per_second=20, burst=1)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire()
+        assert time.monotonic() - start >= 0.18
+
+    def test_request_larger_than_bucket(self):
+        """Test acquiring more than the bucket holds borrows instead of hanging."""
+        limiter = RateLimiter(requests_per_second=10, burst=1)
+        start = time.monotonic()
+        limiter.acquire(2)
+        limiter.acquire(1)
+        # The second call waits out the borrowed token, then its own
+        assert 0.15 <= time.monotonic() - start < 1.0
+
+    def test_slow_rate_with_verification(self, tmp_path):
+        """Test --rate 1 with verification (two requests per update) completes."""
+        bulk = AzureBulkOps(requests_per_second=1, journal_dir=tmp_path, azure=FakeAzure())
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.extend(
+                bulk.batch_update_work_items(_updates(1), verify=True, show_progress=False)
+            ),
+            daemon=True
+        )
+        worker.start()
+        worker.join(timeout=5)
+
+        assert not worker.is_alive()
+        assert [r["success"] for r in results] == [True]
+
+    def test_unlimited(self):
+        """Test a non-positive rate never waits."""
+        limiter = RateLimiter(requests_per_second=0)
+        start = time.monotonic()
+        for _ in range(1000):
+            limiter.acquire()
+        assert time.monotonic() - start < 0.1
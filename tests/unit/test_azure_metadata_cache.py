@@ -0,0 +1,197 @@
+"""
+Unit tests for the Azure DevOps metadata cache.
+
+Tests TTL expiry, persistence under .claude/cache, per-project scoping,
+invalidation hooks and refresh, and the wrapper lookups that go through
+the cache.
+"""
+from pathlib import Path
+
+import pytest
+from unittest.mock import patch
+
+from skills.azure_devops import cli_wrapper
+from skills.azure_devops.cli_wrapper import AzureCLI, MetadataCache
+
+
+class FakeTime:
+    """Stands in for the time module so entries can be aged."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the wrapper's clock."""
+    fake = FakeTime()
+    monkeypatch.setattr(cli_wrapper, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Run from an initialized project, so the cache is persisted."""
+    (tmp_path / ".claude").mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cli_wrapper, "METADATA_CACHE_PATH", Path(".claude") / "cache" / "azure-devops-metadata.json")
+    return tmp_path
+
+
+def _cli(project_name="TestProject", **kwargs):
+    with patch.object(AzureCLI, '_load_configuration') as mock_config:
+        mock_config.return_value = {
+            'organization': 'https://dev.azure.com/testorg',
+            'project': project_name
+        }
+        cli = AzureCLI(**kwargs)
+        cli._cached_token = 'test-token'
+        return cli
+
+
+@pytest.mark.unit
+class TestMetadataCache:
+    """Test suite for MetadataCache."""
+
+    def test_entries_expire_after_ttl(self, clock):
+        """Test an entry is served until its kind's TTL passes."""
+        cache = MetadataCache(None, "org/project", ttls={"repository_ids": 60})
+        cache.set("repository_ids", "repo", "abc")
+
+        clock.now += 59
+        assert cache.get("repository_ids", "repo") == "abc"
+        clock.now += 2
+        assert cache.get("repository_ids", "repo") is None
+
+    def test_values_are_copies(self):
+        """Test callers can't change cached values in place."""
+        cache = MetadataCache(None, "org/project")
+        cache.set("iterations", "p", [{"name": "Sprint 1"}])
+
+        cache.get("iterations", "p")[0]["name"] = "changed"
+
+        assert cache.get("iterations", "p") == [{"name": "Sprint 1"}]
+
+    def test_persisted_per_scope(self, tmp_path):
+        """Test entries survive a new instance and stay within their project."""
+        path = tmp_path / "metadata.json"
+        MetadataCache(path, "org/a").set("repository_ids", "repo", "id-a")
+        MetadataCache(path, "org/b").set("repository_ids", "repo", "id-b")
+
+        assert MetadataCache(path, "org/a").get("repository_ids", "repo") == "id-a"
+        assert MetadataCache(path, "org/b").get("repository_ids", "repo") == "id-b"
+
+    def test_invalidate(self):
+        """Test invalidating a key, a kind, or everything."""
+        cache = MetadataCache(None, "org/project")
+        cache.update("pipeline_ids", {"CI": 1, "CD": 2})
+        cache.set("repository_ids", "repo", "abc")
+
+        cache.invalidate("pipeline_ids", "CI")
+        assert cache.get("pipeline_ids", "CI") is None
+        assert cache.get("pipeline_ids", "CD") == 2
+
+        cache.invalidate("pipeline_ids")
+        assert cache.get("pipeline_ids", "CD") is None
+        assert cache.get("repository_ids", "repo") == "abc"
+
+        cache.invalidate()
+        assert cache.get("repository_ids", "repo") is None
+
+    def test_corrupt_file_ignored(self, tmp_path):
+        """Test an unreadable cache file is treated as empty."""
+        path = tmp_path / "metadata.json"
+        path.write_text("{not json")
+
+        cache = MetadataCache(path, "org/project")
+        assert cache.get("repository_ids", "repo") is None
+        cache.set("repository_ids", "repo", "abc")
+        assert MetadataCache(path, "org/project").get("repository_ids", "repo") == "abc"
+
+
+@pytest.mark.unit
+class TestCachedLookups:
+    """Test suite for AzureCLI lookups served from the metadata cache."""
+
+    def test_repository_id_shared_across_instances(self, project):
+        """Test a repository ID is fetched once per project."""
+        with patch.object(AzureCLI, '_make_request', return_value={"id": "repo-guid"}) as mock_request:
+            assert _cli()._get_repository_id("MyRepo") == "repo-guid"
+            assert _cli()._get_repository_id("MyRepo") == "repo-guid"
+            assert mock_request.call_count == 1
+
+            _cli("OtherProject")._get_repository_id("MyRepo")
+            assert mock_request.call_count == 2
+
+        assert (project / ".claude" / "cache" / "azure-devops-metadata.json").exists()
+
+    def test_nothing_written_outside_project(self, tmp_path, monkeypatch):
+        """Test the cache stays in memory without a .claude directory."""
+        monkeypatch.chdir(tmp_path)
+        with patch.object(AzureCLI, '_make_request', return_value={"id": "repo-guid"}):
+            _cli()._get_repository_id("MyRepo")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_current_user_keyed_by_token(self, project):
+        """Test switching PATs looks the user up again."""
+        responses = [{"authenticatedUser": {"id": "user-1"}}, {"authenticatedUser": {"id": "user-2"}}]
+
+        cli = _cli()
+
+        with patch.object(AzureCLI, '_make_request', side_effect=responses) as mock_request:
+            with patch.object(cli, '_get_auth_token', return_value='token-1'):
+                assert cli._get_current_user_id() == "user-1"
+                assert cli._get_current_user_id() == "user-1"
+            with patch.object(cli, '_get_auth_token', return_value='token-2'):
+                assert cli._get_current_user_id() == "user-2"
+            assert mock_request.call_count == 2
+
+    def test_iterations_invalidated_by_changes(self, project):
+        """Test creating an iteration drops the cached iteration list."""
+        tree = {"children": [{"name": "Sprint 1", "hasChildren": True, "children": [{"name": "Sub"}]}]}
+        cli = _cli()
+
+        with patch.object(cli, '_make_request', return_value=tree) as mock_request:
+            assert [i["name"] for i in cli.list_iterations()] == ["Sprint 1", "Sub"]
+            assert [i["name"] for i in cli.list_iterations()] == ["Sprint 1", "Sub"]
+            assert mock_request.call_count == 1
+
+            cli.create_iteration("Sprint 2")
+            cli.list_iterations()
+            assert mock_request.call_count == 3
+
+    def test_refresh_discards_cache(self, project):
+        """Test refresh_metadata fetches everything again."""
+        with patch.object(AzureCLI, '_make_request', return_value={"value": [{"name": "Bug"}]}) as mock_request:
+            _cli().list_work_item_types()
+            _cli().list_work_item_types()
+            assert mock_request.call_count == 1
+
+            _cli(refresh_metadata=True).list_work_item_types()
+            assert mock_request.call_count == 2
+
+    def test_stale_pipeline_name_dropped_on_404(self, project):
+        """Test a cached pipeline ID that no longer exists is looked up again."""
+        cli = _cli()
+        cli._metadata.set("pipeline_ids", "CI-Pipeline", 42)
+
+        with patch.object(cli, '_make_request', side_effect=Exception("404 Not Found")):
+            with pytest.raises(Exception, match="Pipeline 42 not found"):
+                cli.trigger_pipeline("CI-Pipeline", branch="main")
+
+        assert cli._metadata.get("pipeline_ids", "CI-Pipeline") is None
+
+    def test_work_item_fields(self, project):
+        """Test field definitions are cached per project."""
+        fields = {"value": [{"referenceName": "System.Title", "type": "string"}]}
+
+        with patch.object(AzureCLI, '_make_request', return_value=fields) as mock_request:
+            assert _cli().list_work_item_fields()[0]["referenceName"] == "System.Title"
+            _cli().list_work_item_fields()
+            mock_request.assert_called_once_with(
+                "GET", "TestProject/_apis/wit/fields", params={"api-version": "7.1"}
+            )
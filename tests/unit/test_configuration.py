@@ -15,8 +15,11 @@ from config.schema import (
     WorkflowConfig,
     DeploymentConfig,
     FrameworkConfig,
+    FrozenConfigError,
+)
+from config.loader import (
+    ConfigLoader, load_config, create_default_config, save_config, invalidate_config_cache
 )
-from config.loader import ConfigLoader, load_config, create_default_config, save_config
 from pydantic import ValidationError
 
 
@@ -322,3 +325,83 @@ class TestConfigurationConvenienceFunctions:
         # Compare
         assert loaded_config.project.name == sample_framework_config.project.name
         assert loaded_config.work_tracking.platform == sample_framework_config.work_tracking.platform
+
+
+CACHED_CONFIG_YAML = """
+project:
+  name: "Cached"
+  type: "api"
+  tech_stack:
+    languages: ["Python"]
+
+work_tracking:
+  organization: "https://dev.azure.com/${CACHE_TEST_ORG:-default}"
+  project: "Test"
+"""
+
+
+@pytest.mark.unit
+class TestConfigCache:
+    """Test the process-level configuration cache."""
+
+    @pytest.fixture
+    def cached_config_path(self, temp_dir, monkeypatch):
+        """Config file referencing an environment variable."""
+        monkeypatch.delenv("CACHE_TEST_ORG", raising=False)
+        config_path = temp_dir / "config.yaml"
+        config_path.write_text(CACHED_CONFIG_YAML)
+        yield config_path
+        invalidate_config_cache()
+
+    def test_repeated_loads_share_one_instance(self, cached_config_path):
+        """Test the file is parsed once while unchanged."""
+        assert load_config(cached_config_path) is load_config(cached_config_path)
+
+    def test_shared_config_is_frozen(self, cached_config_path):
+        """Test fields and nested containers of the shared config can't be modified."""
+        config = load_config(cached_config_path)
+
+        with pytest.raises(FrozenConfigError):
+            config.project.name = "Changed"
+        with pytest.raises(FrozenConfigError):
+            config.agent_config.enabled_agents.append("engineer")
+        with pytest.raises(FrozenConfigError):
+            config.project.tech_stack["languages"] = []
+
+    def test_file_change_reloads(self, cached_config_path):
+        """Test editing the file invalidates the cached config."""
+        mtime_ns = cached_config_path.stat().st_mtime_ns
+        assert load_config(cached_config_path).project.name == "Cached"
+
+        cached_config_path.write_text(CACHED_CONFIG_YAML.replace("Cached", "Edited"))
+        os.utime(cached_config_path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+        assert load_config(cached_config_path).project.name == "Edited"
+
+    def test_env_var_change_reloads(self, cached_config_path, monkeypatch):
+        """Test changing a referenced environment variable reloads the config."""
+        assert load_config(cached_config_path).work_tracking.organization.endswith("/default")
+
+        monkeypatch.setenv("CACHE_TEST_ORG", "other-org")
+        assert load_config(cached_config_path).work_tracking.organization.endswith("/other-org")
+
+    def test_explicit_invalidation(self, cached_config_path):
+        """Test invalidate_config_cache forces a reload."""
+        before = load_config(cached_config_path)
+        invalidate_config_cache(cached_config_path)
+        assert load_config(cached_config_path) is not before
+
+    def test_mutable_copy_saved_and_reloaded(self, cached_config_path):
+        """Test editing a mutable copy leaves the shared config alone until saved."""
+        shared = load_config(cached_config_path)
+        editable = load_config(cached_config_path, mutable=True)
+
+        editable.agent_config.enabled_agents.append("security-specialist")
+        editable.project.name = "Renamed"
+        assert shared.project.name == "Cached"
+
+        save_config(editable, cached_config_path)
+        reloaded = load_config(cached_config_path)
+        assert reloaded.project.name == "Renamed"
+        assert "security-specialist" in reloaded.agent_config.enabled_agents
+        assert reloaded.is_frozen
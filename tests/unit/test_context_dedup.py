@@ -0,0 +1,130 @@
+"""
+Unit tests for context deduplication.
+
+Tests exact and near-duplicate detection in core.context_dedup and its use
+by load_hierarchical_context and DirectedContextLoader.
+"""
+
+import pytest
+from pathlib import Path
+
+from core.context_dedup import ContentDeduplicator
+from core.context_loader import load_hierarchical_context
+from core.directed_loader import DirectedContextLoader
+
+
+TECH_STACK = (
+    "This project uses Python 3.11 with Click for the command line interface, "
+    "Pydantic for configuration validation, Jinja2 for rendering agent templates "
+    "and pytest for unit and integration testing."
+)
+
+# Same paragraph with a couple of words changed
+TECH_STACK_EDITED = TECH_STACK.replace("Python 3.11", "Python 3.12")
+
+UNRELATED = (
+    "Adapters translate work items between the framework and Azure DevOps, "
+    "including iteration paths, custom fields and parent-child relationships."
+)
+
+
+@pytest.mark.unit
+class TestContentDeduplicator:
+    """Test suite for ContentDeduplicator."""
+
+    def test_exact_duplicate_ignores_whitespace_and_case(self):
+        """Test exact repeats are detected after normalization."""
+        dedup = ContentDeduplicator()
+        dedup.add(TECH_STACK)
+        assert dedup.is_duplicate("  " + TECH_STACK.upper().replace(" ", "\n"))
+
+    def test_near_duplicate_detected(self):
+        """Test a lightly edited copy is a near-duplicate."""
+        dedup = ContentDeduplicator()
+        dedup.add(TECH_STACK)
+        assert dedup.is_duplicate(TECH_STACK_EDITED)
+
+    def test_unrelated_paragraph_kept(self):
+        """Test a different paragraph is not a duplicate."""
+        dedup = ContentDeduplicator()
+        dedup.add(TECH_STACK)
+        assert not dedup.is_duplicate(UNRELATED)
+
+    def test_short_paragraphs_never_deduplicated(self):
+        """Test separators and short labels are always kept."""
+        dedup = ContentDeduplicator()
+        assert dedup.filter("---\n\n## Notes\n\n---\n\n## Notes") == "---\n\n## Notes\n\n---\n\n## Notes"
+
+    def test_filter_reports_tokens_saved(self):
+        """Test filter drops duplicates and counts savings."""
+        dedup = ContentDeduplicator()
+        assert dedup.filter(f"# Root\n\n{TECH_STACK}") == f"# Root\n\n{TECH_STACK}"
+
+        filtered = dedup.filter(f"# Child\n\n{TECH_STACK_EDITED}\n\n{UNRELATED}")
+        assert filtered == f"# Child\n\n{UNRELATED}"
+        assert dedup.duplicates_removed == 1
+        assert dedup.tokens_saved > 40
+
+    def test_dedupe_does_not_record(self):
+        """Test dedupe leaves state unchanged until record is called."""
+        dedup = ContentDeduplicator()
+        kept, removed = dedup.dedupe(f"{TECH_STACK}\n\n{TECH_STACK}")
+
+        assert kept == [TECH_STACK]
+        assert removed == [TECH_STACK]
+        assert not dedup.is_duplicate(TECH_STACK)
+
+        dedup.record(kept, removed)
+        assert dedup.is_duplicate(TECH_STACK)
+        assert dedup.duplicates_removed == 1
+
+    def test_invalid_bands_rejected(self):
+        """Test bands must divide the signature length."""
+        with pytest.raises(ValueError):
+            ContentDeduplicator(num_permutations=64, bands=10)
+
+
+@pytest.mark.unit
+class TestLoaderDeduplication:
+    """Test suite for deduplication in the context loaders."""
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch) -> Path:
+        """Root and child CLAUDE.md files repeating the tech stack."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "CLAUDE.md").write_text(
+            "---\ncontext:\n  priority: high\n  children:\n    - path: src/CLAUDE.md\n"
+            "      when: [src]\n---\n"
+            f"# Project\n\n{TECH_STACK}\n"
+        )
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "CLAUDE.md").write_text(f"# Source\n\n{TECH_STACK_EDITED}\n\n{UNRELATED}\n")
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    def test_hierarchical_context_drops_repeats(self, project):
+        """Test the child's copy of a root paragraph is dropped."""
+        context = load_hierarchical_context(project / "src")
+
+        assert "Python 3.11" in context
+        assert "Python 3.12" not in context
+        assert UNRELATED in context
+        assert "tokens saved" in context
+
+    def test_hierarchical_context_without_dedup(self, project):
+        """Test deduplication can be turned off."""
+        context = load_hierarchical_context(project / "src", deduplicate=False)
+        assert "Python 3.12" in context
+
+    def test_directed_loader_reports_tokens_saved(self, project):
+        """Test directed loading drops repeats and reports savings."""
+        result = DirectedContextLoader(project).load_for_task(keywords=["src"])
+
+        assert len(result["files_loaded"]) == 2
+        assert "Python 3.12" not in result["content"]
+        assert UNRELATED in result["content"]
+        assert result["tokens_saved"] > 0
+
+        result = DirectedContextLoader(project).load_for_task(keywords=["src"], deduplicate=False)
+        assert "Python 3.12" in result["content"]
+        assert result["tokens_saved"] == 0
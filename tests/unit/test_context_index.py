@@ -0,0 +1,167 @@
+"""
+Unit tests for the context search index.
+
+Tests tokenization, BM25 ranking, phrase queries, incremental updates and
+persistence of core.context_index.ContextIndex.
+"""
+
+import os
+import pytest
+from pathlib import Path
+
+from core.context_index import ContextIndex, load_context_index, tokenize
+
+
+@pytest.fixture
+def index() -> ContextIndex:
+    """Index over a few small context files."""
+    index = ContextIndex()
+    index.add_document("CLAUDE.md", "# Project overview\nPython framework for workflows.")
+    index.add_document("tests/CLAUDE.md", "# Tests\nUnit tests and integration tests with pytest fixtures.")
+    index.add_document("adapters/CLAUDE.md", "# Adapters\nAzure DevOps work item adapter. Each work item is synced.")
+    index.add_document("docs/README.md", "# Docs\nHow to test the item model.", doc_type="readme")
+    return index
+
+
+@pytest.mark.unit
+class TestTokenize:
+    """Test suite for tokenize."""
+
+    def test_tokenize_drops_stop_words_and_short_tokens(self):
+        """Test stop words and short tokens are removed."""
+        assert tokenize("Fix the DB connection in an API") == ["fix", "connection", "api"]
+
+    def test_tokenize_preserves_order(self):
+        """Test tokens are returned in document order."""
+        assert tokenize("work item work") == ["work", "item", "work"]
+
+
+@pytest.mark.unit
+class TestContextIndexSearch:
+    """Test suite for BM25 search."""
+
+    def test_search_ranks_most_relevant_first(self, index):
+        """Test the file with the most term occurrences ranks first."""
+        results = index.search("write unit tests")
+        assert results[0][0] == "tests/CLAUDE.md"
+
+    def test_search_no_match_returns_empty(self, index):
+        """Test unknown terms return no results."""
+        assert index.search("kubernetes helm") == []
+
+    def test_search_limit(self, index):
+        """Test limit caps the number of results."""
+        assert len(index.search("tests item", limit=1)) == 1
+
+    def test_search_filters_by_doc_type(self, index):
+        """Test doc_type restricts results."""
+        results = index.search("item", doc_type="claude_md")
+        assert [path for path, _ in results] == ["adapters/CLAUDE.md"]
+
+    def test_phrase_requires_consecutive_terms(self, index):
+        """Test quoted phrases only match consecutive terms."""
+        results = index.search('"work item"')
+        assert [path for path, _ in results] == ["adapters/CLAUDE.md"]
+
+        assert index.search('"item work"') == []
+
+    def test_phrase_combined_with_terms(self, index):
+        """Test phrases filter results while bare terms add score."""
+        results = index.search('"integration tests" pytest')
+        assert [path for path, _ in results] == ["tests/CLAUDE.md"]
+
+
+@pytest.mark.unit
+class TestContextIndexUpdates:
+    """Test suite for incremental updates and persistence."""
+
+    def test_add_document_replaces_existing(self, index):
+        """Test re-adding a document replaces its postings."""
+        index.add_document("tests/CLAUDE.md", "# Tests\nEnd-to-end browser checks.")
+
+        assert index.search("pytest") == []
+        assert index.search("browser")[0][0] == "tests/CLAUDE.md"
+        assert len(index) == 4
+
+    def test_remove_document(self, index):
+        """Test removing a document drops it and its unique terms."""
+        assert index.remove_document("tests/CLAUDE.md") is True
+        assert "tests/CLAUDE.md" not in index
+        assert "pytest" not in index.postings
+        assert index.remove_document("tests/CLAUDE.md") is False
+
+    def test_save_and_load_round_trip(self, index, tmp_path):
+        """Test the index survives a save/load cycle."""
+        path = tmp_path / "index.json"
+        index.save(path)
+
+        loaded = ContextIndex.load(path)
+        assert len(loaded) == len(index)
+        assert loaded.average_length == index.average_length
+        assert loaded.search("write unit tests") == index.search("write unit tests")
+
+    def test_load_missing_file_returns_empty_index(self, tmp_path):
+        """Test loading a missing index yields an empty index."""
+        assert len(ContextIndex.load(tmp_path / "missing.json")) == 0
+
+    def test_load_context_index_from_project_root(self, index, tmp_path):
+        """Test the project index is found under .claude/."""
+        assert load_context_index(tmp_path) is None
+
+        index.save(tmp_path / ".claude" / "context-search-index.json")
+        loaded = load_context_index(tmp_path)
+        assert loaded is not None
+        assert len(loaded) == 4
+        assert load_context_index(tmp_path) is loaded
+
+
+@pytest.mark.unit
+class TestContextIndexSync:
+    """Test suite for incremental sync against files on disk."""
+
+    def test_sync_only_rereads_changed_files(self, tmp_path):
+        """Test unchanged files are skipped and removed files are dropped."""
+        (tmp_path / "CLAUDE.md").write_text("# Root\nProject overview")
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "CLAUDE.md").write_text("# Tests\npytest fixtures")
+        files = [(tmp_path / "CLAUDE.md", "claude_md"), (tmp_path / "tests" / "CLAUDE.md", "claude_md")]
+
+        index = ContextIndex()
+        changes = index.sync(tmp_path, files)
+        assert sorted(changes["added"]) == ["CLAUDE.md", str(Path("tests/CLAUDE.md"))]
+
+        changes = index.sync(tmp_path, files)
+        assert changes["added"] == changes["updated"] == changes["removed"] == []
+        assert len(changes["unchanged"]) == 2
+
+        (tmp_path / "tests" / "CLAUDE.md").write_text("# Tests\nbrowser end-to-end checks")
+        changes = index.sync(tmp_path, files)
+        assert changes["updated"] == [str(Path("tests/CLAUDE.md"))]
+        assert index.search("browser")[0][0] == str(Path("tests/CLAUDE.md"))
+
+        changes = index.sync(tmp_path, files[:1])
+        assert changes["removed"] == [str(Path("tests/CLAUDE.md"))]
+        assert index.search("browser") == []
+
+    def test_sync_touched_file_with_same_content_is_refreshed(self, tmp_path):
+        """Test a new mtime with identical content only refreshes the signature."""
+        path = tmp_path / "CLAUDE.md"
+        path.write_text("# Root")
+        index = ContextIndex()
+        index.sync(tmp_path, [(path, "claude_md")])
+
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        changes = index.sync(tmp_path, [(path, "claude_md")])
+        assert changes["refreshed"] == ["CLAUDE.md"]
+        assert changes["updated"] == []
+        assert index.documents["CLAUDE.md"]["mtime_ns"] == stat.st_mtime_ns + 10**9
+
+        changes = index.sync(tmp_path, [(path, "claude_md")])
+        assert changes["unchanged"] == ["CLAUDE.md"]
+        assert changes["refreshed"] == []
+
+    def test_top_terms_orders_by_frequency(self, index):
+        """Test top_terms returns the most frequent terms first."""
+        assert index.top_terms("tests/CLAUDE.md", 1) == ["tests"]
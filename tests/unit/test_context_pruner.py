@@ -0,0 +1,287 @@
+"""
+Unit tests for context pruning and usage analytics.
+
+Tests core.context_pruner.ContextPruner (sections, code elision, cross-file
+dedup, budgets) and core.usage_analytics.UsageAnalytics (persistence, hit
+rates, suggestions), plus their use by OptimizedContextLoader.
+"""
+
+import gc
+import weakref
+
+import pytest
+import yaml
+from pathlib import Path
+
+from core.context_dedup import ContentDeduplicator
+from core.context_pruner import ContextPruner, split_paragraphs
+from core.optimized_loader import OptimizedContextLoader
+from core import usage_analytics
+from core.usage_analytics import UsageAnalytics
+
+
+BOILERPLATE = "All code must be reviewed by a second engineer before it is merged to main."
+
+ROOT_CONTEXT = f"""---
+context:
+  priority: high
+---
+# Project
+
+Workflow framework.
+
+## Conventions
+
+{BOILERPLATE}
+
+## History
+
+Long story about how the project started.
+"""
+
+TESTS_CONTEXT = f"""# Tests
+
+Unit and integration tests.
+
+## Details
+
+{BOILERPLATE}
+
+```python
+""" + "\n".join(f"line_{i} = {i}" for i in range(40)) + """
+```
+"""
+
+
+@pytest.fixture
+def project(tmp_path) -> Path:
+    """Project with two context files sharing a boilerplate paragraph."""
+    (tmp_path / "CLAUDE.md").write_text(ROOT_CONTEXT)
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "CLAUDE.md").write_text(TESTS_CONTEXT)
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestContextPruner:
+    """Test suite for ContextPruner."""
+
+    def test_split_paragraphs_keeps_code_blocks_whole(self):
+        """Test blank lines inside code fences don't split paragraphs."""
+        text = "Intro\n\n```\na = 1\n\nb = 2\n```\n\nOutro"
+        assert split_paragraphs(text) == ["Intro", "```\na = 1\n\nb = 2\n```", "Outro"]
+
+    def test_prune_removes_front_matter(self):
+        """Test loader directives are not passed to agents."""
+        pruned = ContextPruner().prune_content(ROOT_CONTEXT)
+        assert "priority" not in pruned
+        assert pruned.startswith("# Project")
+
+    def test_essential_only_keeps_essential_sections(self):
+        """Test essential-only keeps the title and essential headings."""
+        pruned = ContextPruner().prune_content(ROOT_CONTEXT, essential_only=True)
+        assert "## Conventions" in pruned
+        assert "## History" not in pruned
+        assert "Workflow framework." in pruned
+
+    def test_long_code_blocks_are_elided(self):
+        """Test code blocks are cut to their first lines."""
+        pruned = ContextPruner(max_code_block_lines=5).prune_content(TESTS_CONTEXT)
+        assert "line_4 = 4" in pruned
+        assert "line_5 = 5" not in pruned
+        assert "(35 more lines)" in pruned
+        assert pruned.rstrip().endswith("```")
+
+    def test_max_tokens_truncates_at_paragraph(self):
+        """Test the per-file cap cuts at a paragraph boundary."""
+        pruner = ContextPruner()
+        pruned = pruner.prune_content(ROOT_CONTEXT, max_tokens=25)
+        assert pruned.startswith("# Project")
+        assert "truncated" in pruned
+        assert BOILERPLATE not in pruned
+
+    def test_prune_multiple_dedupes_across_files(self, project):
+        """Test a paragraph repeated in a later file is dropped."""
+        pruner = ContextPruner()
+        content = pruner.prune_multiple_contexts([
+            {"name": "root", "path": project / "CLAUDE.md"},
+            {"name": "tests", "path": project / "tests" / "CLAUDE.md"},
+        ], max_tokens=4000)
+
+        assert content.count(BOILERPLATE) == 1
+        assert "# Context: tests" in content
+        assert pruner.last_stats["included"] == ["root", "tests"]
+        assert pruner.last_stats["tokens_saved"] > 0
+
+    def test_truncated_paragraphs_are_not_marked_seen(self):
+        """Test a paragraph cut by the budget is still included from a later file."""
+        pruner = ContextPruner()
+        seen = ContentDeduplicator()
+        pruner.prune_content(ROOT_CONTEXT, max_tokens=25, seen=seen)
+
+        assert BOILERPLATE in pruner.prune_content(TESTS_CONTEXT, seen=seen)
+
+    def test_prune_multiple_respects_total_budget(self, project):
+        """Test files beyond the total budget are left out."""
+        pruner = ContextPruner()
+        pruner.prune_multiple_contexts([
+            {"name": "root", "path": project / "CLAUDE.md"},
+            {"name": "tests", "path": project / "tests" / "CLAUDE.md"},
+        ], max_tokens=30)
+
+        assert pruner.last_stats["tokens_after"] <= 30
+        assert pruner.last_stats["included"] == ["root"]
+        root_tokens = pruner._estimate_tokens((project / "CLAUDE.md").read_text())
+        assert pruner.last_stats["tokens_before"] == root_tokens
+
+    def test_analyze_context_usage(self, project):
+        """Test analysis reports sections, code cost and savings."""
+        analysis = ContextPruner(max_code_block_lines=5).analyze_context_usage(project / "tests" / "CLAUDE.md")
+
+        assert analysis["code_blocks"] == 1
+        assert analysis["pruned_tokens"] < analysis["total_tokens"]
+        assert [s["title"] for s in analysis["sections"]] == ["Tests", "Details"]
+        assert any("Code blocks" in s for s in analysis["suggestions"])
+
+    def test_analyze_missing_file(self, tmp_path):
+        """Test analysis of a missing file returns an error."""
+        assert "error" in ContextPruner().analyze_context_usage(tmp_path / "missing.md")
+
+
+@pytest.mark.unit
+class TestUsageAnalytics:
+    """Test suite for UsageAnalytics."""
+
+    def _log(self, analytics, task="implement feature", contexts=("root",), template=None, cache_hit=False):
+        analytics.log_usage(
+            task=task,
+            task_hash="hash",
+            contexts_loaded=list(contexts),
+            template_used=template,
+            tokens_used=100,
+            cache_hit=cache_hit,
+            execution_time_ms=5,
+        )
+
+    def test_statistics_persist(self, tmp_path):
+        """Test statistics survive a new instance."""
+        path = tmp_path / "analytics.json"
+        for cache_hit in (False, True):
+            analytics = UsageAnalytics(path)
+            self._log(analytics, cache_hit=cache_hit)
+            analytics.flush()
+
+        rates = UsageAnalytics(path).hit_rates()
+        assert rates["cache"] == 0.5
+        assert rates["contexts"] == {"root": 1.0}
+
+    def test_events_are_bounded(self, tmp_path):
+        """Test only the most recent events are kept."""
+        analytics = UsageAnalytics(tmp_path / "analytics.json", max_events=3)
+        for _ in range(5):
+            self._log(analytics)
+        assert len(analytics.data["events"]) == 3
+        assert analytics.data["totals"]["requests"] == 5
+
+    def test_writes_are_batched(self, tmp_path):
+        """Test the file is only written every flush_every loads."""
+        path = tmp_path / "analytics.json"
+        analytics = UsageAnalytics(path, flush_every=3)
+        self._log(analytics)
+        self._log(analytics)
+        assert not path.exists()
+
+        self._log(analytics)
+        assert UsageAnalytics(path).data["totals"]["requests"] == 3
+
+        self._log(analytics)
+        analytics.flush()
+        assert UsageAnalytics(path).data["totals"]["requests"] == 4
+
+    def test_exit_hook_flushes_live_instances(self, tmp_path, monkeypatch):
+        """Test one exit hook writes every live instance's buffered loads."""
+        monkeypatch.setattr(usage_analytics, "_live_instances", weakref.WeakSet())
+        registered = []
+        monkeypatch.setattr(usage_analytics.atexit, "register", registered.append)
+        first = UsageAnalytics(tmp_path / "first.json", flush_every=10)
+        second = UsageAnalytics(tmp_path / "second.json", flush_every=10)
+        self._log(first)
+        self._log(second)
+
+        usage_analytics._flush_at_exit()
+
+        assert registered == []
+        assert UsageAnalytics(tmp_path / "first.json").data["totals"]["requests"] == 1
+        assert UsageAnalytics(tmp_path / "second.json").data["totals"]["requests"] == 1
+
+    def test_collected_instances_leave_exit_hook(self, tmp_path, monkeypatch):
+        """Test instances aren't kept alive by the exit hook."""
+        monkeypatch.setattr(usage_analytics, "_live_instances", weakref.WeakSet())
+        analytics = UsageAnalytics(tmp_path / "analytics.json")
+        assert len(usage_analytics._live_instances) == 1
+
+        del analytics
+        gc.collect()
+
+        assert len(usage_analytics._live_instances) == 0
+
+    def test_untemplated_keywords_are_bounded(self, tmp_path, monkeypatch):
+        """Test the least frequent untemplated keywords are pruned."""
+        monkeypatch.setattr(UsageAnalytics, "MAX_UNTEMPLATED_KEYWORDS", 4)
+        analytics = UsageAnalytics(tmp_path / "analytics.json")
+        self._log(analytics, task="rotate kubernetes secrets")
+        self._log(analytics, task="rotate kubernetes certificates")
+        self._log(analytics, task="upgrade helm charts")
+
+        keywords = analytics.data["untemplated_keywords"]
+        assert len(keywords) <= 4
+        assert {"rotate", "kubernetes"} <= set(keywords)
+
+    def test_suggestions_need_enough_requests(self, tmp_path):
+        """Test no suggestions are made from a handful of requests."""
+        analytics = UsageAnalytics(tmp_path / "analytics.json")
+        self._log(analytics)
+        assert analytics.get_optimization_suggestions() == []
+
+    def test_suggestions_for_untemplated_tasks_and_cache(self, tmp_path):
+        """Test low cache hit rates and untemplated tasks are reported."""
+        analytics = UsageAnalytics(tmp_path / "analytics.json")
+        for _ in range(10):
+            self._log(analytics, task="rotate kubernetes secrets")
+
+        types = {s["type"] for s in analytics.get_optimization_suggestions()}
+        assert {"cache", "template", "context"} <= types
+        template = next(s for s in analytics.get_optimization_suggestions() if s["type"] == "template")
+        assert "kubernetes" in template["keywords"]
+        assert "Suggestions" in analytics.generate_report()
+
+    def test_report_without_data(self, tmp_path):
+        """Test the report for an empty store."""
+        assert "No context usage" in UsageAnalytics(tmp_path / "analytics.json").generate_report()
+
+
+@pytest.mark.unit
+class TestOptimizedLoaderPruning:
+    """Test suite for OptimizedContextLoader with the pruner and analytics."""
+
+    def test_loader_prunes_and_records_usage(self, project):
+        """Test the optimized path prunes content and logs analytics."""
+        index = {
+            "contexts": {
+                "root": {"path": "CLAUDE.md", "priority": "high"},
+                "tests": {"path": "tests/CLAUDE.md", "priority": "medium", "tags": ["pytest"]},
+            },
+            "keyword_mappings": {"pytest": ["root", "tests"]},
+        }
+        (project / ".claude").mkdir()
+        (project / ".claude" / "context-index.yaml").write_text(yaml.safe_dump(index))
+
+        loader = OptimizedContextLoader(project)
+        result = loader.get_context_for_task("pytest layout")
+
+        assert sorted(result["contexts_used"]) == ["root", "tests"]
+        assert result["content"].count(BOILERPLATE) == 1
+        assert result["tokens_saved"] > 0
+        loader.analytics.flush()
+        assert (project / ".claude" / "context-analytics.json").exists()
+        assert loader.analytics.hit_rates()["contexts"]["tests"] == 1.0
@@ -0,0 +1,127 @@
+"""
+Unit tests for the context server.
+
+Tests ContextService loading and invalidation, the HTTP round trip through
+ContextServer, and ContextClient's in-process fallback.
+"""
+
+import json
+import os
+import threading
+import pytest
+from pathlib import Path
+
+from core.context_index import ContextIndex
+from core.context_server import ContextClient, ContextServer, ContextService, SERVER_INFO_PATH
+
+
+@pytest.fixture
+def project(tmp_path) -> Path:
+    """Project with a few CLAUDE.md files and a search index."""
+    (tmp_path / "CLAUDE.md").write_text("# Project\nPython framework for workflows.")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "CLAUDE.md").write_text("# Tests\nUnit tests with pytest fixtures.")
+
+    index = ContextIndex()
+    index.sync(tmp_path, [(tmp_path / "CLAUDE.md", "claude_md"), (tmp_path / "tests" / "CLAUDE.md", "claude_md")])
+    index.save(tmp_path / ".claude" / "context-search-index.json")
+    return tmp_path
+
+
+@pytest.fixture
+def server(project):
+    """Running context server for the project."""
+    server = ContextServer(project, poll_interval=0.05)
+    server.start()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.stop()
+
+
+@pytest.mark.unit
+class TestContextService:
+    """Test suite for ContextService."""
+
+    def test_load_for_description_returns_ranked_files(self, project):
+        """Test the best match is loaded first with its content."""
+        result = ContextService(project).load_for_description("pytest fixtures")
+
+        assert result["files"][0]["path"] == str(Path("tests/CLAUDE.md"))
+        assert "pytest" in result["files"][0]["content"]
+        assert result["tokens_used"] == sum(f["tokens"] for f in result["files"])
+
+    def test_load_for_description_respects_token_budget(self, project):
+        """Test files that don't fit the budget are skipped."""
+        result = ContextService(project).load_for_description("pytest fixtures", max_tokens=1)
+        assert result["files"] == []
+
+    def test_load_for_task_is_json_serializable(self, project):
+        """Test directed results can be sent over the wire."""
+        result = ContextService(project).load_for_task(keywords=["tests"])
+
+        assert result["files_loaded"]
+        json.dumps(result)
+
+    def test_refresh_invalidates_changed_files(self, project):
+        """Test refresh drops only files changed since they were loaded."""
+        service = ContextService(project)
+        service.load_for_task(keywords=["tests"])
+        assert service.refresh() == []
+
+        path = project / "CLAUDE.md"
+        path.write_text("# Project\nRewritten overview with more text.")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert service.refresh() == [path.resolve()]
+        assert path.resolve() not in service.loader.cached_paths()
+
+    def test_read_file_rereads_after_change(self, project):
+        """Test cached file content follows changes on disk."""
+        service = ContextService(project)
+        assert "Python" in service.read_file("CLAUDE.md")
+
+        (project / "CLAUDE.md").write_text("# Project\nRewritten overview with more text.")
+        assert "Rewritten" in service.read_file("CLAUDE.md")
+
+
+@pytest.mark.unit
+class TestContextServer:
+    """Test suite for ContextServer and ContextClient."""
+
+    def test_client_uses_running_server(self, project, server):
+        """Test requests are answered by the server when it is running."""
+        client = ContextClient(project)
+        result = client.load_for_description("pytest fixtures")
+
+        assert client.last_source == "server"
+        assert result["files"][0]["path"] == str(Path("tests/CLAUDE.md"))
+        assert client.rank("pytest")[0][0] == str(Path("tests/CLAUDE.md"))
+
+    def test_client_falls_back_without_server(self, project):
+        """Test requests are served in-process when no server is running."""
+        client = ContextClient(project)
+        result = client.load_for_description("pytest fixtures")
+
+        assert client.last_source == "in-process"
+        assert result["files"][0]["path"] == str(Path("tests/CLAUDE.md"))
+
+    def test_client_falls_back_when_server_unreachable(self, project):
+        """Test a stale server address does not break loading."""
+        info_path = project / SERVER_INFO_PATH
+        info_path.write_text(json.dumps({"url": "http://127.0.0.1:9", "pid": 0}))
+
+        client = ContextClient(project, timeout=0.5)
+        client.load_for_task(keywords=["tests"])
+        assert client.last_source == "in-process"
+
+    def test_stop_removes_server_info(self, project):
+        """Test the published address is removed on shutdown."""
+        server = ContextServer(project)
+        server.start()
+        assert (project / SERVER_INFO_PATH).exists()
+
+        server.stop()
+        assert not (project / SERVER_INFO_PATH).exists()
@@ -0,0 +1,155 @@
+"""
+Unit tests for coordination dependency scheduling.
+
+Tests DependencyGraph ordering, cycle detection and the ready set, and
+the scheduling API of CoordinationSkill.
+"""
+import threading
+
+import pytest
+
+from skills.coordination import CoordinationSkill
+from skills.coordination.dependency_graph import DependencyCycleError, DependencyGraph
+
+
+@pytest.fixture
+def skill(tmp_path):
+    """Initialized coordination skill in a temporary directory."""
+    skill = CoordinationSkill({"coordination_dir": str(tmp_path / "coordination")})
+    assert skill.initialize()
+    return skill
+
+
+@pytest.mark.unit
+class TestDependencyGraph:
+    """Test suite for DependencyGraph."""
+
+    def test_order_puts_dependencies_first(self):
+        """Test the order is fixed up as edges arrive out of order."""
+        graph = DependencyGraph()
+        for node in ["web", "api", "schema", "docs"]:
+            graph.add_node(node)
+        graph.add_dependency("web", "api", "blocks")
+        graph.add_dependency("api", "schema", "blocks")
+        graph.add_dependency("docs", "web", "blocks")
+
+        order = graph.order()
+        assert order.index("schema") < order.index("api") < order.index("web") < order.index("docs")
+
+    def test_cycle_rejected_with_path(self):
+        """Test an edge closing a cycle is refused and names the cycle."""
+        graph = DependencyGraph()
+        graph.add_dependency("web", "api", "blocks")
+        graph.add_dependency("api", "schema", "blocks")
+
+        with pytest.raises(DependencyCycleError) as error:
+            graph.add_dependency("schema", "web", "blocks")
+        assert error.value.cycle == ["schema", "web", "api", "schema"]
+        assert graph.pending("schema") == [graph.dependencies[("api", "schema")]]
+
+    def test_ready_set_follows_completion(self):
+        """Test completing work resolves its dependencies and reports newly ready nodes."""
+        graph = DependencyGraph()
+        graph.add_dependency("web", "api", "blocks")
+        graph.add_dependency("web", "auth", "blocks")
+
+        assert graph.ready() == ["api", "auth"]
+        assert graph.complete("api") == []
+        assert graph.blocked_by("web") == ["auth"]
+        assert graph.complete("auth") == ["web"]
+        assert graph.dependencies[("web", "auth")]["resolution"] == {"completed": "auth"}
+
+    def test_claims_are_exclusive(self):
+        """Test claimed nodes leave the ready set until released."""
+        graph = DependencyGraph()
+        for node in ["a", "b", "c"]:
+            graph.add_node(node)
+
+        assert graph.claim("agent-1", limit=2) == ["a", "b"]
+        assert graph.claim("agent-2", limit=2) == ["c"]
+        assert graph.claim("agent-3") == []
+        graph.release("a")
+        assert graph.ready() == ["a"]
+
+    def test_round_trip(self):
+        """Test a saved graph reloads with the same order, statuses and ready set."""
+        graph = DependencyGraph()
+        graph.add_dependency("web", "api", "blocks")
+        graph.add_dependency("docs", "api", "blocks")
+        graph.claim("agent-1")
+
+        reloaded = DependencyGraph.from_dict(graph.to_dict())
+        assert reloaded.order() == graph.order()
+        assert reloaded.nodes["api"]["claimed_by"] == "agent-1"
+        assert reloaded.complete("api") == ["web", "docs"]
+
+
+@pytest.mark.unit
+class TestCoordinationScheduling:
+    """Test suite for CoordinationSkill dependency scheduling."""
+
+    def test_dependencies_persist(self, skill, tmp_path):
+        """Test dependencies survive a new skill instance."""
+        session_id = skill.start_session("sprint", ["api", "web"])
+        skill.register_dependency(session_id, "web", "api", "blocks")
+
+        other = CoordinationSkill({"coordination_dir": str(tmp_path / "coordination")})
+        assert other.initialize()
+        assert [d["source"] for d in other.get_pending_dependencies(session_id, "api")] == ["web"]
+        assert other.get_execution_order(session_id) == ["api", "web"]
+
+        other.resolve_dependency(session_id, "web", "api", {"pr": 1})
+        assert skill.get_pending_dependencies(session_id) == []
+        assert skill.get_session(session_id)["dependencies"][0]["status"] == "resolved"
+
+    def test_cycle_rejected(self, skill):
+        """Test registering a cyclic dependency raises and leaves the graph unchanged."""
+        session_id = skill.start_session("sprint", ["api", "web"])
+        skill.register_dependency(session_id, "web", "api", "blocks")
+
+        with pytest.raises(ValueError, match="cycle"):
+            skill.register_dependency(session_id, "api", "web", "blocks")
+        assert len(skill.get_pending_dependencies(session_id)) == 1
+
+    def test_parallel_agents_get_distinct_work(self, skill):
+        """Test agents claiming concurrently never receive the same work."""
+        session_id = skill.start_session("sprint", ["team"])
+        skill.add_work(session_id, [f"task-{i}" for i in range(20)])
+        claims = []
+
+        def work(agent):
+            while True:
+                claimed = skill.claim_work(session_id, agent)
+                if not claimed:
+                    return
+                claims.extend(claimed)
+
+        threads = [threading.Thread(target=work, args=(f"agent-{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(claims) == sorted(f"task-{i}" for i in range(20))
+
+    def test_complete_unblocks_dependents(self, skill):
+        """Test completing work hands its dependents to the next claim."""
+        session_id = skill.start_session("sprint", ["team"])
+        skill.register_dependency(session_id, "deploy", "build", "blocks")
+        skill.register_dependency(session_id, "deploy", "test", "blocks")
+
+        assert skill.claim_work(session_id, "agent-1", limit=5) == ["build", "test"]
+        assert skill.complete_work(session_id, "build") == []
+        assert skill.complete_work(session_id, "test", {"passed": True}) == ["deploy"]
+        assert skill.get_ready_work(session_id) == ["deploy"]
+
+    def test_dependencies_from_session_metadata_load(self, skill, tmp_path):
+        """Test dependencies stored in session.json by older versions are read."""
+        session_id = skill.start_session("sprint", ["api", "web"])
+        with skill._locked_metadata(session_id) as session:
+            session["dependencies"] = [{
+                "source": "web", "target": "api", "type": "blocks", "metadata": {},
+                "status": "pending", "created_at": "2025-01-01",
+            }]
+
+        assert skill.get_ready_work(session_id) == ["api"]
@@ -0,0 +1,131 @@
+"""
+Unit tests for coordination session storage.
+
+Tests per-session metadata files, append-only event logs and their
+type/participant indexes.
+"""
+import json
+import threading
+
+import pytest
+import yaml
+
+from skills.coordination import CoordinationSkill
+from skills.coordination.event_log import SessionEventLog
+
+
+@pytest.fixture
+def skill(tmp_path):
+    """Initialized coordination skill in a temporary directory."""
+    skill = CoordinationSkill({"coordination_dir": str(tmp_path / "coordination")})
+    assert skill.initialize()
+    return skill
+
+
+@pytest.mark.unit
+class TestCoordinationEvents:
+    """Test suite for CoordinationSkill event logs."""
+
+    def test_events_appended_without_rewriting_metadata(self, skill, tmp_path):
+        """Test recording an event appends a line and leaves session.json alone."""
+        session_id = skill.start_session("sprint", ["api", "web"])
+        session_dir = tmp_path / "coordination" / "sessions" / session_id
+        metadata_before = (session_dir / "session.json").read_text()
+
+        skill.record_event(session_id, "work_item_created", "api", {"id": 1})
+        skill.record_event(session_id, "work_item_created", "web", {"id": 2})
+
+        assert (session_dir / "session.json").read_text() == metadata_before
+        lines = (session_dir / "events.jsonl").read_text().splitlines()
+        assert [json.loads(line)["data"]["id"] for line in lines] == [1, 2]
+        assert len(skill.get_session(session_id)["events"]) == 2
+
+    def test_filters_by_type_and_participant(self, skill):
+        """Test get_events filters with the indexes, keeping recording order."""
+        session_id = skill.start_session("sprint", ["api", "web"])
+        for i, (event_type, participant) in enumerate([
+            ("created", "api"), ("resolved", "api"), ("created", "web"), ("created", "api"),
+        ]):
+            skill.record_event(session_id, event_type, participant, {"n": i})
+
+        assert [e["data"]["n"] for e in skill.get_events(session_id, event_type="created")] == [0, 2, 3]
+        assert [e["data"]["n"] for e in skill.get_events(session_id, participant="api")] == [0, 1, 3]
+        assert [e["data"]["n"] for e in skill.get_events(session_id, "created", "api")] == [0, 3]
+        assert skill.get_events(session_id, "missing") == []
+
+    def test_sees_events_from_other_instances(self, skill, tmp_path):
+        """Test a second skill instance's events show up in the first's queries."""
+        session_id = skill.start_session("sprint", ["api"])
+        skill.record_event(session_id, "created", "api", {})
+
+        other = CoordinationSkill({"coordination_dir": str(tmp_path / "coordination")})
+        assert other.initialize()
+        other.record_event(session_id, "created", "api", {})
+
+        assert len(skill.get_events(session_id, "created")) == 2
+
+    def test_concurrent_writers_keep_every_event(self, tmp_path):
+        """Test events appended from several threads are all recorded intact."""
+        path = tmp_path / "events.jsonl"
+        logs = [SessionEventLog(path) for _ in range(4)]
+
+        def write(log, worker):
+            for i in range(50):
+                log.append({"type": "tick", "participant": f"w{worker}", "data": {"i": i}})
+
+        threads = [threading.Thread(target=write, args=(log, n)) for n, log in enumerate(logs)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        reader = SessionEventLog(path)
+        assert len(reader) == 200
+        assert len(reader.events(participant="w3")) == 50
+
+    def test_partial_line_is_read_once_complete(self, tmp_path):
+        """Test a line still being written is skipped until its newline arrives."""
+        path = tmp_path / "events.jsonl"
+        path.write_text('{"type": "a"}\n{"type": ')
+        log = SessionEventLog(path)
+        assert len(log) == 1
+
+        with open(path, "a") as f:
+            f.write('"b"}\n')
+        assert [e["type"] for e in log.events()] == ["a", "b"]
+
+    def test_update_and_end_session(self, skill, tmp_path):
+        """Test metadata updates persist and ended sessions move to the archive."""
+        session_id = skill.start_session("sprint", ["api"], {"sprint": 1})
+        skill.record_event(session_id, "created", "api", {})
+        assert skill.update_session(session_id, {"goal": "ship"})["context"] == {"sprint": 1, "goal": "ship"}
+
+        completed = skill.end_session(session_id, {"ok": True})
+
+        assert completed["status"] == "completed"
+        assert len(completed["events"]) == 1
+        assert skill.get_session(session_id) is None
+        assert skill.list_active_sessions() == []
+        archived = tmp_path / "coordination" / "archive" / session_id
+        assert (archived / "events.jsonl").exists()
+        with pytest.raises(ValueError):
+            skill.record_event(session_id, "created", "api", {})
+
+    def test_migrates_sessions_yaml(self, tmp_path):
+        """Test sessions from the single sessions.yaml are split into per-session files."""
+        coordination_dir = tmp_path / "coordination"
+        coordination_dir.mkdir()
+        (coordination_dir / "sessions.yaml").write_text(yaml.dump({
+            "old-1": {
+                "id": "old-1", "name": "old", "participants": ["api"], "context": {},
+                "status": "active", "created_at": "2025-01-01", "updated_at": "2025-01-01",
+                "events": [{"type": "created", "participant": "api", "data": {}, "timestamp": "2025-01-02"}],
+            }
+        }))
+
+        skill = CoordinationSkill({"coordination_dir": str(coordination_dir)})
+        assert skill.initialize()
+
+        assert [s["id"] for s in skill.list_active_sessions()] == ["old-1"]
+        assert len(skill.get_events("old-1", "created")) == 1
+        assert not (coordination_dir / "sessions.yaml").exists()
@@ -0,0 +1,160 @@
+"""
+Unit tests for learnings search.
+
+Tests the persistent full-text index used by LearningsSkill.search.
+"""
+from datetime import datetime
+
+import pytest
+
+from skills.learnings import LearningsSkill
+from skills.learnings.search_index import make_snippet
+from skills.learnings.storage import LearningsStore
+
+
+@pytest.fixture
+def skill(tmp_path, monkeypatch):
+    """Initialized learnings skill with a few learnings."""
+    # Capture IDs have one-second resolution; give each clock read its own second
+    clock = iter(datetime(2025, 1, 1, 12, 0, second) for second in range(60))
+    fake_datetime = type("FakeDatetime", (datetime,), {"now": classmethod(lambda cls: next(clock))})
+    monkeypatch.setattr("skills.learnings.datetime", fake_datetime)
+
+    skill = LearningsSkill({"learnings_dir": str(tmp_path / "learnings")})
+    assert skill.initialize()
+
+    skill.capture("Iteration path format", "Use Project\\\\SprintName for iteration paths in work items.",
+                  "azure-devops", ["iterations"])
+    skill.capture("Pipeline variables", "Variable groups must be linked before the pipeline runs.",
+                  "azure-devops", ["pipelines"])
+    skill.capture("Test isolation", "Integration tests need a separate database per test run.",
+                  "testing", ["database"])
+    return skill
+
+
+@pytest.mark.unit
+class TestLearningsSearch:
+    """Test suite for indexed learnings search."""
+
+    def test_ranked_results_with_snippets(self, skill):
+        """Test query results are ranked and carry snippets."""
+        results = skill.search("iteration paths")
+
+        assert [r["title"] for r in results] == ["Iteration path format"]
+        assert results[0]["score"] > 0
+        assert "**iteration**" in results[0]["snippet"]
+
+    def test_every_term_required(self, skill):
+        """Test learnings must contain all query terms."""
+        assert skill.search("pipeline database") == []
+        assert [r["id"] for r in skill.search("pipeline variable")] == ["azure-devops-20250101120003"]
+
+    def test_category_and_tag_filters(self, skill):
+        """Test filters are answered from the index."""
+        assert [r["id"] for r in skill.search(category="azure-devops")] == ["azure-devops-20250101120000", "azure-devops-20250101120003"]
+        assert [r["id"] for r in skill.search(tags=["database", "pipelines"])] == ["azure-devops-20250101120003", "testing-20250101120006"]
+        assert skill.search("separate database", category="azure-devops") == []
+
+    def test_tags_and_category_are_searchable(self, skill):
+        """Test tags and category text match queries."""
+        assert [r["id"] for r in skill.search("pipelines")] == ["azure-devops-20250101120003"]
+        assert {r["id"] for r in skill.search("azure-devops")} == {"azure-devops-20250101120000", "azure-devops-20250101120003"}
+
+    def test_short_query_matches_word_starts(self, skill):
+        """Test queries without indexable terms still match."""
+        assert [r["id"] for r in skill.search("db")] == []
+        assert [r["id"] for r in skill.search("be")] == ["azure-devops-20250101120003"]
+
+    def test_unindexed_words_are_still_required(self, skill):
+        """Test short words in a query filter results instead of being dropped."""
+        assert skill.search("ci pipeline") == []
+        assert [r["id"] for r in skill.search("pipeline be")] == ["azure-devops-20250101120003"]
+
+    def test_prefix_matches(self, skill):
+        """Test a partial word matches the words it starts."""
+        assert [r["id"] for r in skill.search("iter")] == ["azure-devops-20250101120000"]
+        assert skill.search("ration") == []
+
+    def test_index_persists_and_resyncs(self, skill, tmp_path):
+        """Test a new instance reuses the index and picks up edited learnings."""
+        store = LearningsStore(tmp_path / "learnings")
+        learning = store.get("testing-20250101120006")
+        learning["content"] = "Flaky tests usually share global state."
+        learning["updated_at"] = "2025-01-02T00:00:00"
+        store.put(learning)
+
+        reopened = LearningsSkill({"learnings_dir": str(tmp_path / "learnings")})
+        assert reopened.initialize()
+        assert [r["id"] for r in reopened.search("flaky")] == ["testing-20250101120006"]
+        assert reopened.search("separate database") == []
+
+    def test_get_recent_reads_each_learning_once(self, skill, monkeypatch):
+        """Test get_recent loads each learning once."""
+        reads = []
+        original = skill._store.get
+        monkeypatch.setattr(skill._store, "get", lambda learning_id: reads.append(learning_id) or original(learning_id))
+
+        assert len(skill.get_recent(2)) == 2
+        assert len(reads) == 2
+
+
+@pytest.mark.unit
+class TestSnippets:
+    """Test suite for make_snippet."""
+
+    def test_snippet_centres_on_match(self):
+        """Test long content is cut around the first match."""
+        content = "filler " * 50 + "the iteration path matters" + " filler" * 50
+        snippet = make_snippet(content, "iteration", width=60)
+
+        assert snippet.startswith("...") and snippet.endswith("...")
+        assert "**iteration**" in snippet
+
+
+@pytest.mark.unit
+class TestContextExport:
+    """Test suite for task-ranked, budgeted export_for_context."""
+
+    def test_ranks_by_task_relevance(self, skill):
+        """Test the learnings relevant to the task come first and others are left out."""
+        context = skill.export_for_context(task="fix the flaky database integration tests")
+
+        assert "Test isolation" in context
+        assert "Pipeline variables" not in context
+
+    def test_respects_token_budget(self, skill):
+        """Test entries stop once the budget is used."""
+        full = skill.export_for_context(task="iteration pipeline database paths variable")
+        small = skill.export_for_context(task="iteration pipeline database paths variable", max_tokens=30)
+
+        assert len(full) / 4 > 30
+        assert len(small) / 4 <= 30
+        assert small.count("- **") == 1
+
+    def test_long_content_falls_back_to_summary(self, skill):
+        """Test a learning too long for the budget is shortened to its summary."""
+        skill.capture("Long read", "pipeline " * 200, "azure-devops")
+        context = skill.export_for_context(task="pipeline", max_tokens=120)
+
+        assert "Long read" in context
+        assert context.count("pipeline") < 200
+
+    def test_near_duplicates_included_once(self, skill):
+        """Test a reworded copy of an included learning is skipped."""
+        content = "Variable groups must be linked to the pipeline before the pipeline runs, or secrets are empty."
+        skill.capture("Variable groups", content, "azure-devops")
+        skill.capture("Variable groups again", content.replace("empty", "blank"), "azure-devops")
+
+        context = skill.export_for_context(task="variable groups pipeline secrets", max_tokens=1000)
+        assert "**Variable groups**" in context
+        assert "Variable groups again" not in context
+
+    def test_cached_until_learnings_change(self, skill, monkeypatch):
+        """Test repeated exports come from the cache until a learning is captured."""
+        first = skill.export_for_context(task="database", max_tokens=200)
+        monkeypatch.setattr(skill._search_index, "rank", lambda *args: pytest.fail("not cached"))
+        assert skill.export_for_context(task="database", max_tokens=200) == first
+
+        monkeypatch.undo()
+        skill.capture("Database fixtures", "Use factories for database fixtures.", "testing")
+        assert "Database fixtures" in skill.export_for_context(task="database", max_tokens=200)
@@ -0,0 +1,197 @@
+"""
+Unit tests for segmented learnings storage.
+
+Tests LearningsStore appends, lazy content loading, compaction and
+migration from the per-file YAML layout.
+"""
+import json
+
+import pytest
+import yaml
+
+from skills.learnings import LearningsSkill
+from skills.learnings import storage
+from skills.learnings.storage import INDEX_FILE, LearningsStore, segment_name
+
+
+def _learning(learning_id, content="Some content", category="testing", created_at="2025-01-01T12:00:00"):
+    return {
+        "id": learning_id,
+        "title": f"Title {learning_id}",
+        "content": content,
+        "category": category,
+        "tags": ["tag"],
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+
+
+@pytest.mark.unit
+class TestLearningsStore:
+    """Test suite for LearningsStore."""
+
+    def test_put_appends_without_rewriting_index(self, tmp_path):
+        """Test captures append to a segment and leave the offset index alone."""
+        store = LearningsStore(tmp_path)
+        store.put(_learning("a"))
+        store.put(_learning("b"))
+
+        segment = tmp_path / "segments" / segment_name(1)
+        assert len(segment.read_text().splitlines()) == 2
+        assert not (tmp_path / INDEX_FILE).exists()
+
+        reopened = LearningsStore(tmp_path)
+        assert sorted(reopened.ids()) == ["a", "b"]
+        assert reopened.get("b")["content"] == "Some content"
+
+    def test_metadata_has_summary_not_content(self, tmp_path):
+        """Test listings come from metadata without the content body."""
+        store = LearningsStore(tmp_path)
+        store.put(_learning("a", content="x" * 500))
+
+        meta = store.entries()[0]
+        assert "content" not in meta
+        assert meta["summary"] == "x" * 200
+        assert meta["content_chars"] == 500
+        assert store.categories() == {"testing": 1}
+
+    def test_index_saved_after_threshold(self, tmp_path, monkeypatch):
+        """Test the offset index is written once enough records are unindexed."""
+        monkeypatch.setattr(storage, "INDEX_SAVE_THRESHOLD", 3)
+        store = LearningsStore(tmp_path)
+        for learning_id in "abc":
+            store.put(_learning(learning_id))
+
+        data = json.loads((tmp_path / INDEX_FILE).read_text())
+        assert set(data["entries"]) == {"a", "b", "c"}
+
+    def test_replace_and_delete(self, tmp_path):
+        """Test later records supersede earlier ones across reopen."""
+        store = LearningsStore(tmp_path)
+        store.put(_learning("a"))
+        store.put(_learning("a", content="Updated"))
+        store.put(_learning("b"))
+        assert store.delete("b")
+        assert not store.delete("missing")
+
+        reopened = LearningsStore(tmp_path)
+        assert reopened.ids() == ["a"]
+        assert reopened.get("a")["content"] == "Updated"
+        assert reopened.get("b") is None
+
+    def test_sees_appends_from_other_writers(self, tmp_path):
+        """Test records appended by another store are replayed, not overwritten."""
+        first = LearningsStore(tmp_path)
+        second = LearningsStore(tmp_path)
+        first.put(_learning("a"))
+        second.put(_learning("b"))
+        first.put(_learning("c"))
+
+        assert sorted(first.ids()) == ["a", "b", "c"]
+        assert sorted(LearningsStore(tmp_path).ids()) == ["a", "b", "c"]
+
+    def test_torn_tail_is_dropped(self, tmp_path):
+        """Test a partially written last line doesn't corrupt the next append."""
+        store = LearningsStore(tmp_path)
+        store.put(_learning("a"))
+        segment = tmp_path / "segments" / segment_name(1)
+        with open(segment, "a") as f:
+            f.write('{"op": "put", "id": "tor')
+
+        reopened = LearningsStore(tmp_path)
+        reopened.put(_learning("b"))
+        assert sorted(LearningsStore(tmp_path).ids()) == ["a", "b"]
+
+    def test_segments_roll_over(self, tmp_path):
+        """Test a new segment starts once the active one is full."""
+        store = LearningsStore(tmp_path, segment_max_bytes=200)
+        for learning_id in "abc":
+            store.put(_learning(learning_id))
+
+        assert len(list((tmp_path / "segments").glob("*.jsonl"))) == 3
+        assert sorted(LearningsStore(tmp_path).ids()) == ["a", "b", "c"]
+
+    def test_compaction_drops_dead_records(self, tmp_path):
+        """Test compaction keeps only live records and survives reopen."""
+        store = LearningsStore(tmp_path, background_compaction=False)
+        for revision in range(5):
+            store.put(_learning("a", content=f"Revision {revision}"))
+        store.put(_learning("b"))
+        store.delete("b")
+
+        assert store.dead_bytes() > 0
+        assert store.compact() > 0
+        assert store.dead_bytes() == 0
+        assert store.get("a")["content"] == "Revision 4"
+
+        store.put(_learning("c"))
+        reopened = LearningsStore(tmp_path)
+        assert sorted(reopened.ids()) == ["a", "c"]
+        assert reopened.get("a")["content"] == "Revision 4"
+
+    def test_background_compaction(self, tmp_path, monkeypatch):
+        """Test compaction starts in the background once most of the store is dead."""
+        monkeypatch.setattr(storage, "COMPACT_MIN_DEAD_BYTES", 500)
+        store = LearningsStore(tmp_path)
+        for revision in range(10):
+            store.put(_learning("a", content=f"Revision {revision}"))
+        store.wait_for_compaction()
+
+        assert store.dead_bytes() < 500
+        assert store.get("a")["content"] == "Revision 9"
+
+    def test_interrupted_compaction_leftovers_removed(self, tmp_path):
+        """Test an unindexed compaction output below the indexed segments is discarded."""
+        store = LearningsStore(tmp_path, background_compaction=False)
+        store.put(_learning("a"))
+        store.compact()
+        store.put(_learning("b"))
+        store.flush()
+
+        leftover = tmp_path / "segments" / segment_name(0, 5)
+        leftover.write_text(json.dumps({"op": "put", "id": "stale", "learning": _learning("stale")}) + "\n")
+
+        reopened = LearningsStore(tmp_path)
+        assert sorted(reopened.ids()) == ["a", "b"]
+        assert not leftover.exists()
+
+    def test_migrates_yaml_layout(self, tmp_path):
+        """Test per-file YAML learnings are imported and moved aside."""
+        for learning in (_learning("old-1"), _learning("old-2", category="azure-devops")):
+            (tmp_path / f"{learning['id']}.yaml").write_text(yaml.dump(learning))
+        (tmp_path / "index.yaml").write_text(yaml.dump({"learnings": []}))
+
+        store = LearningsStore(tmp_path)
+        assert store.migrate_legacy() == 2
+        assert store.migrate_legacy() == 0
+
+        assert store.categories() == {"testing": 1, "azure-devops": 1}
+        assert store.get("old-2")["content"] == "Some content"
+        assert not list(tmp_path.glob("*.yaml"))
+        assert (tmp_path / "legacy-yaml" / "index.yaml").exists()
+
+
+@pytest.mark.unit
+class TestLearningsSkillStorage:
+    """Test suite for LearningsSkill on segmented storage."""
+
+    def test_skill_migrates_and_lists_from_metadata(self, tmp_path, monkeypatch):
+        """Test the skill migrates old learnings and lists them without reading content."""
+        (tmp_path / "old-1.yaml").write_text(yaml.dump(_learning("old-1", content="Legacy iteration notes")))
+
+        skill = LearningsSkill({"learnings_dir": str(tmp_path)})
+        assert skill.initialize()
+        skill.capture("New", "Fresh content", "testing")
+
+        monkeypatch.setattr(skill._store, "get", lambda learning_id: pytest.fail("content read"))
+        assert [entry["id"] for entry in skill.list_learnings()][1:] == ["old-1"]
+        assert skill.category_counts() == {"testing": 2}
+        assert "Legacy iteration notes" in skill.export_for_context()
+
+    def test_search_finds_migrated_learnings(self, tmp_path):
+        """Test migrated learnings are indexed for search."""
+        (tmp_path / "old-1.yaml").write_text(yaml.dump(_learning("old-1", content="Legacy iteration notes")))
+
+        skill = LearningsSkill({"learnings_dir": str(tmp_path)})
+        assert skill.initialize()
+        assert [r["id"] for r in skill.search("legacy")] == ["old-1"]
@@ -0,0 +1,88 @@
+"""
+Unit tests for compiled permission matching.
+
+Tests the Aho-Corasick KeywordMatcher and PermissionRules rule resolution.
+"""
+
+import random
+
+import pytest
+
+from cli.permission_matcher import KeywordMatcher, PermissionRules, dangerous_matcher, keyword_matcher
+from cli.platform_detector import PlatformDetector
+
+
+@pytest.mark.unit
+class TestKeywordMatcher:
+    """Test suite for KeywordMatcher."""
+
+    def test_first_follows_keyword_order(self):
+        """Test first returns the earliest-listed keyword, not the leftmost occurrence."""
+        matcher = KeywordMatcher(["rm -rf", "sudo", "su"])
+
+        assert matcher.first("Bash(sudo rm -rf:*)") == "rm -rf"
+        assert matcher.first("Bash(sudo:*)") == "sudo"
+        assert matcher.first("Bash(ls:*)") is None
+
+    def test_overlapping_keywords(self):
+        """Test keywords inside other keywords are all found."""
+        matcher = KeywordMatcher(["git push", "push", "sh"])
+
+        assert matcher.matches("git push --force") == ["git push", "push", "sh"]
+
+    def test_matches_naive_scan(self):
+        """Test the automaton agrees with substring checks on random input."""
+        rng = random.Random(7)
+        for _ in range(200):
+            keywords = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(6)]
+            text = "".join(rng.choice("abc") for _ in range(30))
+            matcher = KeywordMatcher(keywords)
+
+            expected = next((k for k in keywords if k in text), None)
+            assert matcher.first(text) == expected
+            assert set(matcher.matches(text)) == {k for k in keywords if k in text}
+
+    def test_matchers_are_cached(self):
+        """Test a keyword list is compiled once."""
+        assert keyword_matcher(("curl", "wget")) is keyword_matcher(("curl", "wget"))
+        detector = PlatformDetector()
+        assert dangerous_matcher(detector) is dangerous_matcher(detector)
+
+
+@pytest.mark.unit
+class TestPermissionRules:
+    """Test suite for PermissionRules.decide."""
+
+    @pytest.fixture
+    def rules(self):
+        return PermissionRules({
+            "allow": ["Bash(git:*)", "Bash(git status:*)", "Bash(ls)", "Bash(npm run * --watch:*)"],
+            "deny": ["Bash(git push --force:*)"],
+            "ask": ["Bash(git push:*)"],
+        })
+
+    def test_deny_beats_ask_beats_allow(self, rules):
+        """Test the stricter list wins when several rules match."""
+        assert rules.decide("git push --force origin").decision == "deny"
+        assert rules.decide("git push origin main").rule == "Bash(git push:*)"
+        assert rules.decide("git log").decision == "allow"
+
+    def test_longest_prefix_wins_within_a_list(self, rules):
+        """Test the most specific rule of a list is reported."""
+        assert rules.decide("git status --short").rule == "Bash(git status:*)"
+
+    def test_exact_rules(self, rules):
+        """Test rules without ':*' only match the whole command."""
+        assert rules.decide("ls").rule == "Bash(ls)"
+        assert rules.decide("ls -la") is None
+
+    def test_wildcard_rules(self, rules):
+        """Test rules with inner wildcards are matched."""
+        assert rules.decide("npm run test --watch").rule == "Bash(npm run * --watch:*)"
+        assert rules.decide("npm run test") is None
+
+    def test_invalid_rules_ignored(self):
+        """Test non-Bash and non-string rules don't break compilation."""
+        rules = PermissionRules({"allow": ["Read(*)", 42, "Bash(pwd:*)"], "deny": [], "ask": []})
+        assert rules.decide("pwd").decision == "allow"
+        assert rules.decide("cat x") is None
@@ -6,6 +6,7 @@ instead of subprocess calls, with comprehensive error handling and parameter sup
 """
 import pytest
 from unittest.mock import Mock, patch, MagicMock
+from skills.azure_devops import cli_wrapper
 from skills.azure_devops.cli_wrapper import AzureCLI, AuthenticationError
 
 
@@ -370,3 +371,205 @@ class TestPipelineOperationsIntegration:
 
             # Verify call count
             assert mock_request.call_count == 3
+
+
+class FakeClock:
+    """Stands in for the time module so polling runs instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _stage(name, state, result=None, order=1, start="2025-12-17T10:00:00.1234567Z", finish=None):
+    return {
+        "type": "Stage", "name": name, "state": state, "result": result, "order": order,
+        "startTime": None if state == "pending" else start, "finishTime": finish
+    }
+
+
+@pytest.mark.unit
+class TestPipelineIdCache:
+    """Test suite for the cached pipeline name→id map."""
+
+    @pytest.fixture
+    def mock_cli(self):
+        """Create AzureCLI instance with mocked config."""
+        with patch.object(AzureCLI, '_load_configuration') as mock_config:
+            mock_config.return_value = {
+                'organization': 'https://dev.azure.com/testorg',
+                'project': 'TestProject'
+            }
+            cli = AzureCLI()
+            cli._cached_token = 'test-token'
+            return cli
+
+    def test_pipelines_listed_once(self, mock_cli):
+        """Test repeated lookups reuse a single pipeline listing."""
+        listing = {"value": [{"id": 1, "name": "CI-Pipeline"}, {"id": 2, "name": "CD-Pipeline"}]}
+
+        with patch.object(mock_cli, '_make_request', return_value=listing) as mock_request:
+            assert mock_cli._get_pipeline_id("CI-Pipeline") == 1
+            assert mock_cli._get_pipeline_id("CD-Pipeline") == 2
+            assert mock_cli._get_pipeline_id("CI-Pipeline") == 1
+            assert mock_request.call_count == 1
+
+    def test_unknown_name_refreshes_listing(self, mock_cli):
+        """Test a pipeline created after the listing is still found."""
+        listings = [
+            {"value": [{"id": 1, "name": "CI-Pipeline"}]},
+            {"value": [{"id": 1, "name": "CI-Pipeline"}, {"id": 7, "name": "New-Pipeline"}]},
+        ]
+
+        with patch.object(mock_cli, '_make_request', side_effect=listings):
+            assert mock_cli._get_pipeline_id("CI-Pipeline") == 1
+            assert mock_cli._get_pipeline_id("New-Pipeline") == 7
+
+    def test_trigger_pipeline_by_name(self, mock_cli):
+        """Test triggering by name resolves the ID through the map."""
+        responses = [{"value": [{"id": 42, "name": "CI-Pipeline"}]}, {"id": 1}, {"id": 2}]
+
+        with patch.object(mock_cli, '_make_request', side_effect=responses) as mock_request:
+            mock_cli.trigger_pipeline("CI-Pipeline", branch="main")
+            mock_cli.trigger_pipeline("CI-Pipeline", branch="main")
+
+            endpoints = [call[0][1] for call in mock_request.call_args_list]
+            assert endpoints == [
+                "TestProject/_apis/pipelines",
+                "TestProject/_apis/pipelines/42/runs",
+                "TestProject/_apis/pipelines/42/runs",
+            ]
+
+
+@pytest.mark.unit
+class TestWatchRuns:
+    """Test suite for wait_for_pipeline_run() and watch_runs()."""
+
+    @pytest.fixture
+    def mock_cli(self):
+        """Create AzureCLI instance with mocked config."""
+        with patch.object(AzureCLI, '_load_configuration') as mock_config:
+            mock_config.return_value = {
+                'organization': 'https://dev.azure.com/testorg',
+                'project': 'TestProject'
+            }
+            cli = AzureCLI()
+            cli._cached_token = 'test-token'
+            return cli
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the wrapper's clock and sleep."""
+        fake = FakeClock()
+        monkeypatch.setattr(cli_wrapper, "time", fake)
+        return fake
+
+    @staticmethod
+    def _script(mock_cli, runs, timelines):
+        """Serve scripted run and timeline responses; the last one repeats."""
+        def respond(method, endpoint, data=None, params=None):
+            run_id = int(endpoint.rstrip("/timeline").rsplit("/", 1)[1])
+            queue = timelines[run_id] if endpoint.endswith("/timeline") else runs[run_id]
+            return queue.pop(0) if len(queue) > 1 else queue[0]
+        return patch.object(mock_cli, '_make_request', side_effect=respond)
+
+    def test_emits_stage_events(self, mock_cli, clock):
+        """Test stage started/finished events are reported in order."""
+        runs = {5: [{"id": 5, "state": "inProgress"}, {"id": 5, "state": "inProgress"},
+                    {"id": 5, "state": "completed", "result": "succeeded"}]}
+        timelines = {5: [
+            {"records": [_stage("Build", "inProgress"), _stage("Test", "pending", order=2)]},
+            {"records": [_stage("Build", "completed", "succeeded", finish="2025-12-17T10:02:00Z"),
+                         _stage("Test", "inProgress", order=2)]},
+            {"records": [_stage("Build", "completed", "succeeded"),
+                         _stage("Test", "completed", "succeeded", order=2)]},
+        ]}
+        events = []
+
+        with self._script(mock_cli, runs, timelines):
+            run = mock_cli.wait_for_pipeline_run(42, 5, on_event=events.append)
+
+        assert run["result"] == "succeeded"
+        assert [(e.kind, e.stage) for e in events] == [
+            ("stage_started", "Build"),
+            ("stage_finished", "Build"),
+            ("stage_started", "Test"),
+            ("stage_finished", "Test"),
+            ("run_finished", None),
+        ]
+        assert mock_cli._stage_durations[(42, "Build")] == pytest.approx(119.88, abs=0.01)
+
+    def test_backs_off_while_nothing_changes(self, mock_cli, clock):
+        """Test the poll interval doubles up to the maximum without changes."""
+        runs = {5: [{"id": 5, "state": "inProgress"}] * 6 + [{"id": 5, "state": "completed"}]}
+        timelines = {5: [{"records": [_stage("Build", "inProgress")]}]}
+
+        with self._script(mock_cli, runs, timelines):
+            mock_cli.wait_for_pipeline_run(42, 5, min_interval=5, max_interval=30)
+
+        assert clock.sleeps == [5, 10, 20, 30, 30, 30]
+
+    def test_polls_near_expected_stage_end(self, mock_cli, clock, monkeypatch):
+        """Test a stage with a known typical duration is polled when it should finish."""
+        mock_cli._stage_durations[(42, "Build")] = 300.0
+        now = cli_wrapper.datetime(2025, 12, 17, 10, 1, 0, tzinfo=cli_wrapper.timezone.utc)
+        monkeypatch.setattr(cli_wrapper, "datetime", Mock(
+            now=Mock(return_value=now), fromisoformat=cli_wrapper.datetime.fromisoformat
+        ))
+        runs = {5: [{"id": 5, "state": "inProgress"}] * 2 + [{"id": 5, "state": "completed"}]}
+        timelines = {5: [{"records": [_stage("Build", "inProgress", start="2025-12-17T10:00:00Z")]}]}
+
+        with self._script(mock_cli, runs, timelines):
+            mock_cli.wait_for_pipeline_run(42, 5, min_interval=5, max_interval=600)
+
+        # Stage just started, then ~240s of its typical 300s remain
+        assert clock.sleeps == [5, 240]
+
+    def test_watches_many_runs_from_one_loop(self, mock_cli, clock):
+        """Test several runs are watched together, each on its own schedule."""
+        runs = {
+            1: [{"id": 1, "state": "completed", "result": "succeeded"}],
+            2: [{"id": 2, "state": "inProgress"}, {"id": 2, "state": "completed", "result": "failed"}],
+        }
+        timelines = {1: [{"records": []}], 2: [{"records": []}]}
+
+        with self._script(mock_cli, runs, timelines):
+            results = mock_cli.watch_runs([(42, 1), (43, 2)])
+
+        assert results[1]["result"] == "succeeded"
+        assert results[2]["result"] == "failed"
+        assert clock.sleeps == [cli_wrapper.PIPELINE_POLL_MIN_SECONDS]
+
+    def test_timeout(self, mock_cli, clock):
+        """Test waiting gives up once the timeout would be exceeded."""
+        runs = {5: [{"id": 5, "state": "inProgress"}]}
+        timelines = {5: [{"records": []}]}
+
+        with self._script(mock_cli, runs, timelines):
+            with pytest.raises(TimeoutError, match="did not complete within 60"):
+                mock_cli.wait_for_pipeline_run(42, 5, timeout=60)
+            assert clock.now <= 60
+
+    def test_timeout_before_first_poll(self, mock_cli, clock):
+        """Test a timeout that elapses before the first poll raises TimeoutError."""
+        def slow_lookup(name):
+            clock.now += 10
+            return 42
+
+        with patch.object(mock_cli, '_get_pipeline_id', side_effect=slow_lookup):
+            with patch.object(mock_cli, '_make_request') as mock_request:
+                with pytest.raises(TimeoutError, match="did not complete within 5s"):
+                    mock_cli.wait_for_pipeline_run("CI-Pipeline", 5, timeout=5)
+                mock_request.assert_not_called()
+
+    def test_missing_timeline(self, mock_cli):
+        """Test a run without a timeline yet has no stages."""
+        with patch.object(mock_cli, '_make_request', side_effect=Exception("404 Not Found")):
+            assert mock_cli.get_pipeline_run_stages(5) == []
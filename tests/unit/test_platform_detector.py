@@ -9,6 +9,7 @@ from pathlib import Path
 from unittest.mock import Mock, mock_open, patch
 import platform
 
+from cli import platform_detector
 from cli.platform_detector import PlatformDetector
 
 
@@ -627,3 +628,65 @@ class TestEdgeCases:
             assert isinstance(dangerous, dict)
             for category, commands in dangerous.items():
                 assert isinstance(commands, list)
+
+
+@pytest.mark.unit
+class TestPlatformSnapshot:
+    """Test cached platform snapshots and pattern memoization."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_snapshots(self, monkeypatch):
+        monkeypatch.setattr(platform_detector, "_snapshots", {})
+
+    def test_cached_probes_once_per_process(self, tmp_path):
+        """Test detectors from cached() share one probe."""
+        with patch.object(PlatformDetector, "_probe", wraps=PlatformDetector()._probe) as probe:
+            first = PlatformDetector.cached(tmp_path)
+            second = PlatformDetector.cached(tmp_path)
+
+        assert probe.call_count == 1
+        assert first.detect_platform() == second.detect_platform()
+        # Each detector gets its own copy
+        first.detect_platform()["os"] = "Changed"
+        assert second.detect_platform()["os"] != "Changed"
+
+    def test_snapshot_stored_in_project_cache(self, tmp_path, monkeypatch):
+        """Test the snapshot is reused from .claude/cache by later processes."""
+        (tmp_path / ".claude").mkdir()
+        info = PlatformDetector.cached(tmp_path).detect_platform()
+        assert (tmp_path / ".claude" / "cache" / "platform.json").exists()
+
+        monkeypatch.setattr(platform_detector, "_snapshots", {})
+        with patch.object(PlatformDetector, "_probe", side_effect=AssertionError("probed")):
+            assert PlatformDetector.cached(tmp_path).detect_platform() == info
+
+    def test_no_cache_file_outside_project(self, tmp_path):
+        """Test nothing is written without a .claude directory."""
+        PlatformDetector.cached(tmp_path)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_environment_change_misses_snapshot(self, tmp_path, monkeypatch):
+        """Test a changed fingerprint input triggers a new probe."""
+        (tmp_path / ".claude").mkdir()
+        monkeypatch.setenv("SHELL", "/bin/bash")
+        assert PlatformDetector.cached(tmp_path).detect_platform()["shell"] == "bash"
+
+        monkeypatch.setenv("SHELL", "/usr/bin/zsh")
+        with patch("platform.system", return_value="Linux"):
+            assert PlatformDetector.cached(tmp_path).detect_platform()["shell"] == "zsh"
+
+    def test_patterns_memoized_per_platform(self):
+        """Test patterns are built once per platform and handed out as copies."""
+        detector = PlatformDetector()
+        detector._platform_info = {"os": "Linux", "is_wsl": False, "shell": "bash"}
+        PlatformDetector._pattern_cache.clear()
+
+        with patch.object(PlatformDetector, "_get_git_patterns", wraps=detector._get_git_patterns) as build:
+            patterns = detector.get_command_patterns()
+            patterns["git"].append("git push --force")
+            assert "git push --force" not in detector.get_command_patterns()["git"]
+            assert build.call_count == 1
+
+            detector._platform_info = {"os": "Windows", "is_wsl": False, "shell": "powershell"}
+            detector.get_command_patterns()
+            assert build.call_count == 2
@@ -0,0 +1,174 @@
+"""
+Unit tests for incremental template rendering.
+
+Tests manifest-based skipping, dependency tracking and change detection in
+core.render_manifest and the registries' batch save methods.
+"""
+import os
+import pytest
+from functools import partial
+from pathlib import Path
+
+from jinja2 import DictLoader, Environment
+
+from agents.registry import AgentRegistry
+from core import template_env
+from core.render_manifest import (
+    FAILED, SKIPPED, UNCHANGED, WRITTEN, RenderJob, RenderManifest, TemplateHasher, render_all
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_template_caches():
+    """Isolate tests from environments cached by other tests."""
+    template_env.clear_caches()
+    yield
+    template_env.clear_caches()
+
+
+@pytest.fixture
+def templates() -> dict:
+    """Template sources, editable by tests."""
+    return {
+        "page.j2": "{% include 'header.j2' %}Body {{ value }}",
+        "header.j2": "Header\n",
+        "plain.j2": "Plain {{ value }}",
+    }
+
+
+def make_jobs(env, out_dir: Path, context: dict):
+    """One job per top-level template."""
+    def render(name):
+        return env.get_template(name).render(**context)
+
+    return [
+        RenderJob(name, name, out_dir / f"{name}.md", partial(render, name))
+        for name in ("page.j2", "plain.j2")
+    ]
+
+
+def statuses(results):
+    return [result.status for result in results]
+
+
+@pytest.mark.unit
+class TestRenderAll:
+    """Test suite for render_all."""
+
+    def test_second_run_skips(self, templates, tmp_path):
+        """Test unchanged inputs are not rendered again."""
+        env = Environment(loader=DictLoader(templates))
+        manifest_path = tmp_path / "manifest.json"
+        jobs = make_jobs(env, tmp_path / "out", {"value": 1})
+
+        assert statuses(render_all(jobs, env, "cfg", RenderManifest(manifest_path))) == [WRITTEN, WRITTEN]
+        assert (tmp_path / "out" / "page.j2.md").read_text() == "HeaderBody 1"
+        assert statuses(render_all(jobs, env, "cfg", RenderManifest(manifest_path))) == [SKIPPED, SKIPPED]
+
+    def test_included_template_change_rerenders_dependents(self, templates, tmp_path):
+        """Test editing an include re-renders only templates that use it."""
+        env = Environment(loader=DictLoader(templates))
+        manifest_path = tmp_path / "manifest.json"
+        render_all(make_jobs(env, tmp_path / "out", {"value": 1}), env, "cfg", RenderManifest(manifest_path))
+
+        templates["header.j2"] = "New header\n"
+        env = Environment(loader=DictLoader(templates))
+        results = render_all(make_jobs(env, tmp_path / "out", {"value": 1}), env, "cfg", RenderManifest(manifest_path))
+
+        assert statuses(results) == [WRITTEN, SKIPPED]
+        assert (tmp_path / "out" / "page.j2.md").read_text() == "New headerBody 1"
+
+    def test_context_change_rerenders(self, templates, tmp_path):
+        """Test a different context key invalidates every output."""
+        env = Environment(loader=DictLoader(templates))
+        manifest_path = tmp_path / "manifest.json"
+        render_all(make_jobs(env, tmp_path / "out", {"value": 1}), env, "cfg-1", RenderManifest(manifest_path))
+
+        results = render_all(make_jobs(env, tmp_path / "out", {"value": 2}), env, "cfg-2", RenderManifest(manifest_path))
+        assert statuses(results) == [WRITTEN, WRITTEN]
+        assert (tmp_path / "out" / "plain.j2.md").read_text() == "Plain 2"
+
+    def test_edited_or_deleted_output_regenerated(self, templates, tmp_path):
+        """Test outputs changed on disk are rendered again."""
+        env = Environment(loader=DictLoader(templates))
+        manifest_path = tmp_path / "manifest.json"
+        jobs = make_jobs(env, tmp_path / "out", {"value": 1})
+        render_all(jobs, env, "cfg", RenderManifest(manifest_path))
+
+        (tmp_path / "out" / "page.j2.md").write_text("hand edited")
+        (tmp_path / "out" / "plain.j2.md").unlink()
+
+        assert statuses(render_all(jobs, env, "cfg", RenderManifest(manifest_path))) == [WRITTEN, WRITTEN]
+        assert (tmp_path / "out" / "page.j2.md").read_text() == "HeaderBody 1"
+
+    def test_identical_content_not_rewritten(self, templates, tmp_path):
+        """Test forced renders with identical output keep the file's mtime."""
+        env = Environment(loader=DictLoader(templates))
+        manifest_path = tmp_path / "manifest.json"
+        jobs = make_jobs(env, tmp_path / "out", {"value": 1})
+        render_all(jobs, env, "cfg", RenderManifest(manifest_path))
+
+        output = tmp_path / "out" / "plain.j2.md"
+        os.utime(output, (0, 0))
+        results = render_all(jobs, env, "cfg", RenderManifest(manifest_path), force=True)
+
+        assert statuses(results) == [UNCHANGED, UNCHANGED]
+        assert output.stat().st_mtime == 0
+
+    def test_failures_reported_and_not_recorded(self, tmp_path):
+        """Test a failing render is reported without aborting the others."""
+        env = Environment(loader=DictLoader({"ok.j2": "ok"}))
+        manifest = RenderManifest(tmp_path / "manifest.json")
+
+        def fail():
+            raise ValueError("boom")
+
+        jobs = [
+            RenderJob("bad", "missing.j2", tmp_path / "bad.md", fail),
+            RenderJob("ok", "ok.j2", tmp_path / "ok.md", lambda: "ok"),
+        ]
+        results = render_all(jobs, env, "cfg", manifest)
+
+        assert statuses(results) == [FAILED, WRITTEN]
+        assert isinstance(results[0].error, ValueError)
+        assert str(tmp_path / "bad.md") not in manifest.entries
+
+    def test_dynamic_include_depends_on_everything(self, templates):
+        """Test a non-literal include makes every template a dependency."""
+        templates["dynamic.j2"] = "{% include name %}"
+        hasher = TemplateHasher(Environment(loader=DictLoader(templates)))
+
+        assert hasher.dependencies("page.j2") == {"page.j2", "header.j2"}
+        assert hasher.dependencies("dynamic.j2") == set(templates)
+
+
+@pytest.mark.unit
+class TestRegistryBatchRendering:
+    """Test suite for the registries' incremental save methods."""
+
+    def test_agents_skip_when_unchanged(self, sample_framework_config, tmp_path, monkeypatch):
+        """Test a second render of the same agents writes nothing."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".claude").mkdir()
+        registry = AgentRegistry(sample_framework_config)
+        names = ["engineer", "tester"]
+
+        first = registry.save_rendered_agents(names, tmp_path / "agents")
+        assert statuses(first) == [WRITTEN, WRITTEN]
+        assert (tmp_path / ".claude" / "render-manifest.json").exists()
+
+        second = AgentRegistry(sample_framework_config).save_rendered_agents(names, tmp_path / "agents")
+        assert statuses(second) == [SKIPPED, SKIPPED]
+
+        sample_framework_config.project.name = "Renamed Project"
+        third = AgentRegistry(sample_framework_config).save_rendered_agents(names, tmp_path / "agents")
+        assert SKIPPED not in statuses(third)
+
+    def test_no_manifest_outside_initialized_project(self, sample_framework_config, tmp_path, monkeypatch):
+        """Test rendering without .claude leaves no manifest behind."""
+        monkeypatch.chdir(tmp_path)
+        registry = AgentRegistry(sample_framework_config)
+
+        results = registry.save_agent_slash_commands(["engineer"], tmp_path / "commands")
+        assert statuses(results) == [WRITTEN]
+        assert not (tmp_path / ".claude").exists()
@@ -0,0 +1,162 @@
+"""
+Unit tests for the repository scanner.
+
+Tests .gitignore handling, directory pruning and tree scanning in
+core.repo_scanner.
+"""
+
+import pytest
+from pathlib import Path
+
+from core.repo_scanner import IgnoreRules, find_files, scan_tree
+
+
+def _write(path: Path, content: str = "# Context") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.mark.unit
+class TestIgnoreRules:
+    """Test suite for IgnoreRules."""
+
+    def test_skip_dirs_are_ignored(self, tmp_path):
+        """Test default skip directories are ignored, including glob patterns."""
+        rules = IgnoreRules(tmp_path)
+        assert rules.is_ignored("node_modules", is_dir=True)
+        assert rules.is_ignored("pkg/trustable_ai.egg-info", is_dir=True)
+        assert not rules.is_ignored("src", is_dir=True)
+
+    def test_gitignore_patterns(self, tmp_path):
+        """Test unanchored, anchored, directory-only and negated patterns."""
+        _write(tmp_path / ".gitignore", "*.log\n/generated\ncache/\n!keep.log\n")
+        rules = IgnoreRules(tmp_path)
+
+        assert rules.is_ignored("debug.log")
+        assert rules.is_ignored("src/deep/debug.log")
+        assert not rules.is_ignored("src/keep.log")
+        assert rules.is_ignored("generated", is_dir=True)
+        assert not rules.is_ignored("src/generated", is_dir=True)
+        assert rules.is_ignored("src/cache", is_dir=True)
+        assert not rules.is_ignored("src/cache")
+
+    def test_double_star_pattern(self, tmp_path):
+        """Test ** matches across directories."""
+        _write(tmp_path / ".gitignore", "docs/**/draft.md\n")
+        rules = IgnoreRules(tmp_path)
+
+        assert rules.is_ignored("docs/draft.md")
+        assert rules.is_ignored("docs/a/b/draft.md")
+        assert not rules.is_ignored("src/draft.md")
+
+    def test_gitignore_disabled(self, tmp_path):
+        """Test .gitignore is not read when disabled."""
+        _write(tmp_path / ".gitignore", "*.md\n")
+        rules = IgnoreRules(tmp_path, use_gitignore=False)
+        assert not rules.is_ignored("CLAUDE.md")
+
+
+@pytest.mark.unit
+class TestFindFiles:
+    """Test suite for find_files."""
+
+    def test_finds_named_files_and_prunes_ignored_dirs(self, tmp_path):
+        """Test matching files are found outside ignored directories only."""
+        _write(tmp_path / "CLAUDE.md")
+        _write(tmp_path / "src" / "CLAUDE.md")
+        _write(tmp_path / "node_modules" / "pkg" / "CLAUDE.md")
+        _write(tmp_path / "out" / "CLAUDE.md")
+        _write(tmp_path / ".gitignore", "out/\n")
+
+        found = sorted(p.relative_to(tmp_path).as_posix() for p in find_files(tmp_path, {"CLAUDE.md"}))
+        assert found == ["CLAUDE.md", "src/CLAUDE.md"]
+
+    def test_rules_reused_across_scans(self, tmp_path):
+        """Test rescanning with the same rules doesn't load a .gitignore twice."""
+        _write(tmp_path / "CLAUDE.md")
+        _write(tmp_path / "pkg" / ".gitignore", "vendor/\n")
+        rules = IgnoreRules(tmp_path)
+
+        list(find_files(tmp_path, {"CLAUDE.md"}, rules))
+        list(find_files(tmp_path, {"CLAUDE.md"}, rules))
+
+        assert len(rules._rules) == 1
+        assert not rules.is_stale()
+
+    def test_is_stale_when_gitignore_changes(self, tmp_path):
+        """Test changed, created and deleted .gitignore files make rules stale."""
+        _write(tmp_path / "pkg" / ".gitignore", "vendor/\n")
+        rules = IgnoreRules(tmp_path)
+        list(find_files(tmp_path, {"CLAUDE.md"}, rules))
+        assert not rules.is_stale()
+
+        _write(tmp_path / ".gitignore", "*.log\n")
+        assert rules.is_stale()
+
+        rules = IgnoreRules(tmp_path)
+        list(find_files(tmp_path, {"CLAUDE.md"}, rules))
+        (tmp_path / "pkg" / ".gitignore").unlink()
+        assert rules.is_stale()
+
+    def test_nested_gitignore_applies_below_its_directory(self, tmp_path):
+        """Test a nested .gitignore only affects its own subtree."""
+        _write(tmp_path / "a" / ".gitignore", "README.md\n")
+        _write(tmp_path / "a" / "README.md")
+        _write(tmp_path / "b" / "README.md")
+
+        found = [p.relative_to(tmp_path).as_posix() for p in find_files(tmp_path, {"README.md"})]
+        assert found == ["b/README.md"]
+
+
+@pytest.mark.unit
+class TestScanTree:
+    """Test suite for scan_tree."""
+
+    def test_scan_counts_extensions_per_directory(self, tmp_path):
+        """Test each directory reports its files and extension counts."""
+        _write(tmp_path / "setup.py")
+        _write(tmp_path / "src" / "app.py")
+        _write(tmp_path / "src" / "models.py")
+        _write(tmp_path / "src" / "index.TS")
+        _write(tmp_path / "src" / "api" / "routes.py")
+
+        scanned = {d.relative_path: d for d in scan_tree(tmp_path)}
+
+        assert list(scanned) == [".", "src", "src/api"]
+        assert scanned["."].files == ["setup.py"]
+        assert scanned["."].subdirs == ["src"]
+        assert scanned["src"].count(".py") == 2
+        assert scanned["src"].count(".ts") == 1
+        assert scanned["src/api"].depth == 2
+
+    def test_scan_prunes_ignored_directories(self, tmp_path):
+        """Test ignored directories are neither listed nor descended into."""
+        _write(tmp_path / "src" / "app.py")
+        _write(tmp_path / "node_modules" / "pkg" / "index.js")
+        _write(tmp_path / ".gitignore", "generated/\n")
+        _write(tmp_path / "generated" / "out.py")
+
+        scanned = scan_tree(tmp_path)
+
+        assert [d.relative_path for d in scanned] == [".", "src"]
+        assert scanned[0].subdirs == ["src"]
+
+    def test_concurrent_gitignore_loading(self, tmp_path):
+        """Test sibling .gitignore files loaded by worker threads all apply."""
+        for i in range(40):
+            _write(tmp_path / f"pkg{i}" / ".gitignore", "generated/\n")
+            _write(tmp_path / f"pkg{i}" / "generated" / "CLAUDE.md")
+            _write(tmp_path / f"pkg{i}" / "CLAUDE.md")
+
+        found = list(find_files(tmp_path, {"CLAUDE.md"}, IgnoreRules(tmp_path)))
+        assert len(found) == 40
+        assert all("generated" not in p.parts for p in found)
+
+    def test_scan_respects_max_depth(self, tmp_path):
+        """Test directories below max_depth are not scanned."""
+        _write(tmp_path / "a" / "b" / "c" / "file.py")
+
+        scanned = scan_tree(tmp_path, max_depth=2)
+
+        assert [d.relative_path for d in scanned] == [".", "a", "a/b"]
+        assert scanned[-1].subdirs == ["c"]
@@ -0,0 +1,138 @@
+"""
+Unit tests for the skill manifest.
+
+Tests import-free skill discovery, deferred loading and third-party skills
+registered through entry points.
+"""
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+
+from skills.manifest import (
+    ENTRY_POINT_GROUP, build_builtin_specs, load_builtin_specs, load_entry_point_specs, load_specs
+)
+from skills.registry import SkillRegistry
+
+
+PROJECT_ROOT = Path(__file__).parents[2]
+
+THIRD_PARTY_MODULE = '''
+from skills.base import BaseSkill
+
+
+class GreeterSkill(BaseSkill):
+    @property
+    def name(self):
+        return "greeter"
+
+    @property
+    def description(self):
+        return "Says hello"
+
+    def greet(self):
+        return f"Hello {self.config.get('who', 'world')}"
+'''
+
+
+@pytest.fixture
+def third_party_skill(tmp_path, monkeypatch):
+    """An installed distribution registering a skill via entry points."""
+    (tmp_path / "greeter_skill.py").write_text(THIRD_PARTY_MODULE)
+    dist_info = tmp_path / "greeter_skill-2.1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: greeter-skill\nVersion: 2.1.0\nSummary: Greets people\n"
+    )
+    (dist_info / "entry_points.txt").write_text(
+        f"[{ENTRY_POINT_GROUP}]\ngreeter = greeter_skill:GreeterSkill\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    sys.modules.pop("greeter_skill", None)
+
+
+def loaded_modules(code: str) -> set:
+    """Run code in a fresh interpreter and return the skills modules it imported."""
+    result = subprocess.run(
+        [sys.executable, "-c", code + "\nimport sys\nprint(' '.join(m for m in sys.modules if m.startswith('skills.')))"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return set(result.stdout.split())
+
+
+@pytest.mark.unit
+class TestSkillManifest:
+    """Test suite for the generated built-in manifest."""
+
+    def test_manifest_in_sync_with_packages(self):
+        """Test _builtin_manifest.py matches the skill packages (run `python -m skills.manifest`)."""
+        assert load_builtin_specs() == build_builtin_specs()
+
+    def test_builtin_skills_listed(self):
+        """Test every built-in skill is discovered."""
+        assert {"azure_devops", "context", "coordination", "learnings", "workflow"} <= set(load_specs())
+
+    def test_discovery_imports_no_skills(self):
+        """Test listing skills and reading their info imports no skill module."""
+        code = (
+            "from skills.registry import get_registry\n"
+            "registry = get_registry()\n"
+            "assert 'learnings' in registry.list_skills()\n"
+            "assert registry.get_skill_info('learnings')['version']\n"
+        )
+        modules = loaded_modules(code)
+
+        assert modules <= {"skills.base", "skills.registry", "skills.manifest", "skills._builtin_manifest"}
+
+    def test_generation_reads_skills_without_importing(self):
+        """Test regenerating the manifest doesn't import skills (importing azure_devops needs Azure config)."""
+        modules = loaded_modules("from skills.manifest import build_builtin_specs\nbuild_builtin_specs()\n")
+
+        assert not {name for name in modules if name.split(".")[1] in {"azure_devops", "learnings", "context"}}
+
+    def test_get_skill_imports_on_demand(self, tmp_path):
+        """Test get_skill loads the skill from its manifest entry."""
+        registry = SkillRegistry()
+        skill = registry.get_skill("learnings", {"learnings_dir": str(tmp_path)})
+
+        assert skill.name == "learnings"
+        assert registry.get_skill_info("learnings")["module"] == "skills.learnings"
+
+    def test_unknown_skill(self):
+        """Test unknown skills return None."""
+        registry = SkillRegistry()
+        assert registry.get_skill_info("no_such_skill") is None
+
+
+@pytest.mark.unit
+class TestThirdPartySkills:
+    """Test suite for skills registered by other distributions."""
+
+    def test_entry_point_skill_discovered_without_import(self, third_party_skill):
+        """Test metadata comes from the distribution, not the module."""
+        registry = SkillRegistry()
+        assert "greeter" in registry.list_skills()
+
+        info = registry.get_skill_info("greeter")
+        assert info["description"] == "Greets people"
+        assert info["version"] == "2.1.0"
+        assert info["source"] == "greeter-skill"
+        assert "greeter_skill" not in sys.modules
+
+    def test_entry_point_listed_once_per_distribution(self, third_party_skill, tmp_path, monkeypatch):
+        """Test a distribution found on two sys.path entries yields one spec."""
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        assert [spec.name for spec in load_entry_point_specs()].count("greeter") == 1
+
+    def test_entry_point_skill_loaded_with_config(self, third_party_skill):
+        """Test get_skill instantiates the entry point with the config."""
+        skill = SkillRegistry().get_skill("greeter", {"who": "team"})
+        assert skill.greet() == "Hello team"
+
+    def test_prerequisites_loaded_on_request(self, third_party_skill):
+        """Test get_skill_info loads the skill only when asked for prerequisites."""
+        info = SkillRegistry().get_skill_info("greeter", check_prerequisites=True)
+        assert info["prerequisites"]["satisfied"]
@@ -0,0 +1,136 @@
+"""
+Unit tests for the shared template environment.
+
+Tests environment sharing, the bytecode cache, precompiled templates and
+memoized render contexts in core.template_env.
+"""
+import shutil
+import pytest
+from pathlib import Path
+
+from agents.registry import AgentRegistry
+from core import template_env
+from core.template_env import (
+    COMPILED_DIR_NAME, cached_render_context, compile_templates, config_hash, get_environment
+)
+from workflows.registry import WorkflowRegistry
+
+
+@pytest.fixture(autouse=True)
+def clear_template_caches():
+    """Isolate tests from environments cached by other tests."""
+    template_env.clear_caches()
+    yield
+    template_env.clear_caches()
+
+
+@pytest.fixture
+def templates_dir(tmp_path) -> Path:
+    """Directory with a single template."""
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "greeting.j2").write_text("Hello {{ name }}!\n")
+    return templates
+
+
+@pytest.mark.unit
+class TestTemplateEnvironment:
+    """Test suite for get_environment and compile_templates."""
+
+    def test_environment_is_shared(self, templates_dir, tmp_path):
+        """Test one environment is reused per templates directory."""
+        assert get_environment(templates_dir, tmp_path) is get_environment(templates_dir, tmp_path)
+
+    def test_registries_share_environment(self, sample_framework_config):
+        """Test registries over the same templates reuse one environment."""
+        assert AgentRegistry(sample_framework_config).env is AgentRegistry(sample_framework_config).env
+
+    def test_bytecode_cache_only_in_initialized_project(self, templates_dir, tmp_path):
+        """Test the bytecode cache is written under .claude only when it exists."""
+        env = get_environment(templates_dir, tmp_path)
+        env.get_template("greeting.j2")
+        assert env.bytecode_cache is None
+        assert not (tmp_path / ".claude").exists()
+
+        (tmp_path / ".claude").mkdir()
+        env = get_environment(templates_dir, tmp_path)
+        assert env.get_template("greeting.j2").render(name="cache") == "Hello cache!"
+        assert list((tmp_path / ".claude" / "cache" / "jinja2").iterdir())
+
+    def test_precompiled_templates_used_while_fresh(self, templates_dir, tmp_path):
+        """Test compiled modules are used until the source changes."""
+        assert compile_templates(templates_dir) == 1
+        assert (templates_dir / COMPILED_DIR_NAME / "manifest.json").exists()
+
+        template = get_environment(templates_dir, tmp_path).get_template("greeting.j2")
+        assert template.render(name="compiled") == "Hello compiled!"
+        assert COMPILED_DIR_NAME in template.filename
+
+        (templates_dir / "greeting.j2").write_text("Goodbye {{ name }}!\n")
+        template_env.clear_caches()
+        template = get_environment(templates_dir, tmp_path).get_template("greeting.j2")
+        assert template.render(name="source") == "Goodbye source!"
+        assert COMPILED_DIR_NAME not in template.filename
+
+    def test_precompiled_template_reloads_after_edit(self, templates_dir, tmp_path):
+        """Test a shared environment notices an edited template without clearing caches."""
+        import os
+
+        compile_templates(templates_dir)
+        env = get_environment(templates_dir, tmp_path)
+        assert env.get_template("greeting.j2").render(name="compiled") == "Hello compiled!"
+
+        source = templates_dir / "greeting.j2"
+        source.write_text("Goodbye {{ name }}!\n")
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert env.get_template("greeting.j2").render(name="source") == "Goodbye source!"
+
+    def test_precompiled_matches_source_rendering(self, tmp_path, sample_framework_config):
+        """Test bundled templates render identically when precompiled."""
+        agents_dir = Path(__file__).parents[2] / "agents" / "templates"
+        compiled_dir = tmp_path / "templates"
+        shutil.copytree(agents_dir, compiled_dir)
+        compile_templates(compiled_dir)
+
+        expected = AgentRegistry(sample_framework_config).render_agent("engineer")
+        assert AgentRegistry(sample_framework_config, compiled_dir).render_agent("engineer") == expected
+
+
+@pytest.mark.unit
+class TestRenderContextCache:
+    """Test suite for memoized render contexts."""
+
+    def test_context_built_once_per_config(self, sample_framework_config):
+        """Test the builder only runs on a cache miss."""
+        calls = []
+
+        def build():
+            calls.append(1)
+            return {"value": 1}
+
+        cached_render_context(sample_framework_config, "agents", build)
+        context = cached_render_context(sample_framework_config, "agents", build)
+        assert len(calls) == 1
+
+        context["value"] = 2
+        assert cached_render_context(sample_framework_config, "agents", build)["value"] == 1
+
+    def test_config_change_rebuilds_context(self, sample_framework_config):
+        """Test a changed configuration gets a fresh context."""
+        registry = WorkflowRegistry(sample_framework_config)
+        before = config_hash(sample_framework_config)
+        assert registry._build_context()["project"]["name"] == sample_framework_config.project.name
+
+        sample_framework_config.project.name = "Renamed Project"
+        assert config_hash(sample_framework_config) != before
+        assert registry._build_context()["project"]["name"] == "Renamed Project"
+
+    def test_contexts_are_separate_per_kind(self, sample_framework_config):
+        """Test agent and workflow contexts don't collide."""
+        agent_context = AgentRegistry(sample_framework_config)._build_context()
+        workflow_context = WorkflowRegistry(sample_framework_config)._build_context()
+
+        assert "config" in workflow_context
+        assert "config" not in agent_context
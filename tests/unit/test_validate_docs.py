@@ -0,0 +1,160 @@
+"""
+Unit tests for CLAUDE.md documentation validation.
+
+Tests discovery through the pruned scanner, the per-file result cache,
+process pool validation, freshness checks and --changed-since.
+"""
+import os
+import subprocess
+
+import pytest
+
+from cli.commands import validate_docs
+from cli.commands.validate_docs import DocumentationValidator
+
+
+VALID_DOC = """---
+context:
+  purpose: Keep things working
+  problem_solved: Things broke
+  keywords: [things]
+  task_types: [fixing]
+---
+# Module
+
+## Purpose
+
+Solves the problem of things breaking.
+"""
+
+INVALID_DOC = """# No front matter
+"""
+
+
+def _write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def _git(root, *args):
+    subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=Test", *args],
+        cwd=root, check=True, capture_output=True
+    )
+
+
+@pytest.mark.unit
+class TestDocumentationValidator:
+    """Test suite for DocumentationValidator.validate_all."""
+
+    def test_skips_ignored_directories(self, tmp_path):
+        """Test CLAUDE.md files under dependency directories aren't validated."""
+        _write(tmp_path / "core" / "CLAUDE.md", VALID_DOC)
+        _write(tmp_path / "node_modules" / "pkg" / "CLAUDE.md", INVALID_DOC)
+        _write(tmp_path / ".git" / "CLAUDE.md", INVALID_DOC)
+
+        results = DocumentationValidator(tmp_path).validate_all()
+
+        assert [r.file_path for r in results] == [tmp_path / "core" / "CLAUDE.md"]
+        assert results[0].passed
+
+    def test_reports_errors(self, tmp_path):
+        """Test a file without front matter fails."""
+        _write(tmp_path / "CLAUDE.md", INVALID_DOC)
+
+        result, = DocumentationValidator(tmp_path).validate_all()
+
+        assert not result.passed
+        assert result.errors == ["Missing or malformed YAML front matter"]
+
+    def test_freshness_warning(self, tmp_path):
+        """Test a Python sibling much newer than CLAUDE.md is flagged."""
+        doc = _write(tmp_path / "core" / "CLAUDE.md", VALID_DOC)
+        _write(tmp_path / "core" / "old.py", "")
+        _write(tmp_path / "core" / "new.py", "")
+        os.utime(doc, (1_000_000, 1_000_000))
+        os.utime(tmp_path / "core" / "old.py", (1_000_000, 1_000_000))
+
+        result, = DocumentationValidator(tmp_path).validate_all()
+
+        assert result.passed
+        assert len(result.warnings) == 1
+        assert result.warnings[0].startswith("Potentially stale: new.py modified")
+
+    def test_unchanged_files_served_from_cache(self, tmp_path, monkeypatch):
+        """Test a second run reuses results without validating again."""
+        (tmp_path / ".claude").mkdir()
+        _write(tmp_path / "a" / "CLAUDE.md", VALID_DOC)
+        _write(tmp_path / "b" / "CLAUDE.md", INVALID_DOC)
+        first = DocumentationValidator(tmp_path).validate_all()
+
+        monkeypatch.setattr(
+            DocumentationValidator, "validate_file", lambda *args: pytest.fail("validated again")
+        )
+        validator = DocumentationValidator(tmp_path)
+        second = validator.validate_all()
+
+        assert validator.cache_hits == 2
+        assert [(r.file_path, r.passed, r.errors) for r in second] == [
+            (r.file_path, r.passed, r.errors) for r in first
+        ]
+
+    def test_cache_invalidated_by_content_and_siblings(self, tmp_path):
+        """Test editing the file or touching a Python sibling revalidates it."""
+        (tmp_path / ".claude").mkdir()
+        doc = _write(tmp_path / "a" / "CLAUDE.md", VALID_DOC)
+        DocumentationValidator(tmp_path).validate_all()
+
+        doc.write_text(INVALID_DOC)
+        validator = DocumentationValidator(tmp_path)
+        result, = validator.validate_all()
+        assert validator.cache_hits == 0
+        assert not result.passed
+
+        _write(tmp_path / "a" / "module.py", "")
+        validator = DocumentationValidator(tmp_path)
+        validator.validate_all()
+        assert validator.cache_hits == 0
+
+    def test_no_cache_written_outside_project(self, tmp_path):
+        """Test nothing is cached without a .claude directory."""
+        _write(tmp_path / "CLAUDE.md", VALID_DOC)
+        DocumentationValidator(tmp_path).validate_all()
+        assert not (tmp_path / ".claude").exists()
+
+    def test_process_pool_matches_serial(self, tmp_path, monkeypatch):
+        """Test validating on a process pool gives the same results."""
+        for index in range(4):
+            _write(tmp_path / f"m{index}" / "CLAUDE.md", VALID_DOC if index % 2 else INVALID_DOC)
+        serial = DocumentationValidator(tmp_path, max_workers=1).validate_all()
+
+        monkeypatch.setattr(validate_docs, "PARALLEL_THRESHOLD", 2)
+        parallel = DocumentationValidator(tmp_path, max_workers=2).validate_all()
+
+        assert [(r.file_path, r.passed, r.errors) for r in parallel] == [
+            (r.file_path, r.passed, r.errors) for r in serial
+        ]
+
+    def test_changed_since(self, tmp_path):
+        """Test only docs whose file or Python siblings changed are validated."""
+        _write(tmp_path / "a" / "CLAUDE.md", VALID_DOC)
+        _write(tmp_path / "b" / "CLAUDE.md", VALID_DOC)
+        _write(tmp_path / "c" / "CLAUDE.md", VALID_DOC)
+        _write(tmp_path / "b" / "module.py", "")
+        _git(tmp_path, "init", "-q")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-q", "-m", "initial")
+
+        _write(tmp_path / "a" / "CLAUDE.md", INVALID_DOC)
+        _write(tmp_path / "b" / "module.py", "x = 1\n")
+
+        results = DocumentationValidator(tmp_path).validate_all(changed_since="HEAD")
+
+        assert [r.file_path.parent.name for r in results] == ["a", "b"]
+
+    def test_changed_since_unknown_ref(self, tmp_path):
+        """Test an unknown ref is reported as an error."""
+        _git(tmp_path, "init", "-q")
+        with pytest.raises(RuntimeError):
+            DocumentationValidator(tmp_path).validate_all(changed_since="no-such-ref")
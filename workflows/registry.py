@@ -3,11 +3,14 @@ Workflow registry and template rendering system.
 
 Loads and renders workflow templates with project-specific configuration.
 """
+from functools import partial
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
+from jinja2 import Template, TemplateNotFound
 
 from config import FrameworkConfig
+from core.render_manifest import RenderJob, RenderResult, render_all
+from core.template_env import cached_render_context, config_hash, get_environment
 
 
 class WorkflowRegistry:
@@ -29,20 +32,23 @@ class WorkflowRegistry:
 
         self.templates_dir = Path(templates_dir)
 
-        # Setup Jinja2 environment
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        # Shared Jinja2 environment (bytecode-cached, precompiled templates)
+        self.env = get_environment(self.templates_dir)
 
     def _build_context(self) -> Dict[str, Any]:
         """
         Build template context from configuration.
 
+        Memoized by configuration hash, so rendering many templates builds
+        the context once.
+
         Returns:
             Dictionary of context variables for template rendering
         """
+        return cached_render_context(self.config, "workflows", self._compute_context)
+
+    def _compute_context(self) -> Dict[str, Any]:
+        """Build the template context (uncached)."""
         # Build tech stack context text (same as agents)
         tech_stack_parts = []
         tech_stack_parts.append(f"**Project Type**: {self.config.project.type}")
@@ -187,6 +193,29 @@ class WorkflowRegistry:
 
         return output_file
 
+    def save_rendered_workflows(
+        self,
+        workflow_names: List[str],
+        output_dir: Path,
+        force: bool = False
+    ) -> List[RenderResult]:
+        """
+        Render and save several workflows, skipping those whose inputs are unchanged.
+
+        Args:
+            workflow_names: Workflows to render
+            output_dir: Directory to save rendered workflows
+            force: Re-render even if the render manifest says it's current
+
+        Returns:
+            One RenderResult per workflow, in order
+        """
+        jobs = [
+            RenderJob(name, f"{name}.j2", Path(output_dir) / f"{name}.md", partial(self.render_workflow, name))
+            for name in workflow_names
+        ]
+        return render_all(jobs, self.env, config_hash(self.config), force=force)
+
 
 # Convenience functions
 